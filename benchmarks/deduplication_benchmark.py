@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to write a Document with a large number of (different) objects that have the same keys,
+    half of which are identical (and only written once).
+    Run it from the root of the repository: python -m benchmarks.deduplication_benchmark
+"""
+import io
+import time
+
+from borb.io.read.types import Decimal, Dictionary, List, Name
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+NUMBER_OF_OBJECTS: int = 20000
+
+
+def benchmark_write_objects_with_the_same_keys() -> None:
+    """
+    This function measures how long it takes to write NUMBER_OF_OBJECTS objects with the same keys
+    """
+    doc: Document = Document()
+    page: Page = Page()
+    doc.append_page(page)
+    values: List = List()
+    for i in range(0, NUMBER_OF_OBJECTS):
+        d: Dictionary = Dictionary()
+        d[Name("Value")] = Decimal(i % (NUMBER_OF_OBJECTS // 2))
+        values.append(d)
+    page[Name("Values")] = values
+
+    out: io.BytesIO = io.BytesIO()
+    delta: float = time.time()
+    PDF.dumps(out, doc)
+    delta = time.time() - delta
+    print("objects: %d, save time: %f s" % (NUMBER_OF_OBJECTS, delta))
+
+
+if __name__ == "__main__":
+    benchmark_write_objects_with_the_same_keys()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to extract the text of a (text-heavy) Document,
+    processing the content of its Page(s) using Decimal objects, and using floats (see PDF.loads).
+    Run it from the root of the repository: python -m benchmarks.float_mode_benchmark
+"""
+import time
+from pathlib import Path
+
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+def benchmark_float_mode() -> None:
+    """
+    This function measures how long it takes to extract the text of a Document, in Decimal mode and in float mode
+    """
+    input_file: Path = (
+        Path(__file__).parent.parent / "tests" / "pdf" / "trailer" / "input_001.pdf"
+    )
+    with open(input_file, "rb") as pdf_file_handle:
+        doc = PDF.loads(pdf_file_handle)
+    for float_mode in [False, True]:
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        delta: float = time.time()
+        for i in range(0, int(doc.get_document_info().get_number_of_pages())):
+            doc.get_page(i).process([l], float_mode=float_mode, page_number=i)
+        delta = time.time() - delta
+        print(
+            "float_mode=%s: %d characters, processing time: %f s"
+            % (float_mode, sum([len(x) for x in l._text_per_page.values()]), delta)
+        )
+
+
+if __name__ == "__main__":
+    benchmark_float_mode()
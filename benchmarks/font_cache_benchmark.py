@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to create a StandardType1Font,
+    when its AFM file is parsed, and when it is taken from the FontCache.
+    Run it from the root of the repository: python -m benchmarks.font_cache_benchmark
+"""
+import time
+
+from borb.pdf.canvas.font.font_cache import FontCache
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+
+
+def benchmark_font_cache() -> None:
+    """
+    This function measures how long it takes to create a StandardType1Font (parsed and cached)
+    """
+    FontCache.clear()
+
+    # first StandardType1Font parses the AFM file
+    delta_001: float = time.time()
+    StandardType1Font("Helvetica")
+    delta_001 = time.time() - delta_001
+
+    # all others are taken from the cache
+    delta_002: float = time.time()
+    for _ in range(0, 100):
+        StandardType1Font("Helvetica")
+    delta_002 = (time.time() - delta_002) / 100
+    print(
+        "StandardType1Font: %f s (parsed), %f s (cached), hit ratio: %f"
+        % (delta_001, delta_002, FontCache.get_hit_ratio())
+    )
+
+
+if __name__ == "__main__":
+    benchmark_font_cache()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to measure (the width of) a line of text,
+    using GlyphLine.measure, and using GlyphLine.from_str(...).get_width_in_text_space()
+    Run it from the root of the repository: python -m benchmarks.glyph_line_measure_benchmark
+"""
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.glyph_line import GlyphLine
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+from tests.pdf.canvas.font.test_glyph_line_measure import TestGlyphLineMeasure
+
+
+def benchmark_glyph_line_measure(font: Font) -> None:
+    """
+    This function measures how long it takes to measure a line of text (100 times) in the given Font
+    """
+    delta_001: float = time.time()
+    for _ in range(0, 100):
+        GlyphLine.from_str(
+            TestGlyphLineMeasure.TEXT, font, Decimal(12)
+        ).get_width_in_text_space()
+    delta_001 = time.time() - delta_001
+    delta_002: float = time.time()
+    for _ in range(0, 100):
+        GlyphLine.measure(TestGlyphLineMeasure.TEXT, font, Decimal(12))
+    delta_002 = time.time() - delta_002
+    print(
+        "%s: %f s (GlyphLine.from_str), %f s (GlyphLine.measure)"
+        % (font.get_font_name(), delta_001, delta_002)
+    )
+
+
+if __name__ == "__main__":
+    benchmark_glyph_line_measure(StandardType1Font("Helvetica"))
+    benchmark_glyph_line_measure(
+        TrueTypeFont.true_type_font_from_file(
+            Path(__file__).parent.parent
+            / "tests"
+            / "pdf"
+            / "canvas"
+            / "font"
+            / "Ubuntu-Light.ttf"
+        )
+    )
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to process a content stream with a large number of q/Q (push/pop) pairs,
+    and compares it to the time it takes to (only) deepcopy the CanvasGraphicsState as often.
+    Run it from the root of the repository: python -m benchmarks.graphics_state_benchmark
+"""
+import copy
+import io
+import time
+
+from borb.io.read.types import Dictionary, Name
+from borb.pdf.canvas.canvas import Canvas
+from borb.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.page.page import Page
+
+NUMBER_OF_PAIRS: int = 10000
+
+
+def benchmark_push_and_pop_graphics_state() -> None:
+    """
+    This function measures how long it takes to process NUMBER_OF_PAIRS q/Q pairs
+    """
+    page: Page = Page()
+    page[Name("Resources")] = Dictionary()
+    canvas: Canvas = Canvas()
+    canvas.graphics_state.font = StandardType1Font("Helvetica")
+    content: bytes = b"q 1 0 0 1 10 20 cm 0.5 g Q\n" * NUMBER_OF_PAIRS
+
+    # copy-on-write
+    delta: float = time.time()
+    CanvasStreamProcessor(page, canvas, []).read(io.BytesIO(content))
+    delta = time.time() - delta
+
+    # deepcopy (for reference)
+    delta_deepcopy: float = time.time()
+    for _ in range(0, NUMBER_OF_PAIRS):
+        copy.deepcopy(canvas.graphics_state)
+    delta_deepcopy = time.time() - delta_deepcopy
+
+    print(
+        "q/Q pairs: %d, processing time: %f s, deepcopy (only) time: %f s"
+        % (NUMBER_OF_PAIRS, delta, delta_deepcopy)
+    )
+
+
+if __name__ == "__main__":
+    benchmark_push_and_pop_graphics_state()
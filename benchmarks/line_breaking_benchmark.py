@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to break (100 pages worth of) body text into lines,
+    using both the first-fit and the optimal-fit (Knuth-Plass) line breaking algorithm.
+    Run it from the root of the repository: python -m benchmarks.line_breaking_benchmark
+"""
+import time
+import typing
+
+from borb.io.read.types import Decimal
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.layout_element import Alignment
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from tests.pdf.canvas.layout.paragraph.test_write_paragraph_line_breaking import (
+    TestWriteParagraphLineBreaking,
+)
+
+
+def benchmark_line_breaking() -> None:
+    """
+    This function measures how long it takes to break 550 Paragraph objects (of 100 words each) into lines
+    """
+    # the width of a SingleColumnLayout on an A4 Page
+    bounding_box: Rectangle = Rectangle(
+        Decimal(0), Decimal(0), Decimal(595 * 0.8), Decimal(842 * 0.8)
+    )
+    number_of_lines_per_page: int = int(bounding_box.height / Decimal(12 * 1.3))
+
+    texts: typing.List[str] = TestWriteParagraphLineBreaking._get_texts(550)
+    for optimal_line_breaking in [False, True]:
+        delta: float = time.time()
+        paragraphs: typing.List[typing.List[str]] = [
+            Paragraph(
+                t,
+                text_alignment=Alignment.JUSTIFIED,
+                optimal_line_breaking=optimal_line_breaking,
+            )._split_text(bounding_box)
+            for t in texts
+        ]
+        delta = time.time() - delta
+        number_of_lines: int = sum([len(x) for x in paragraphs])
+        print(
+            "optimal_line_breaking=%s: %d lines (%d pages), line breaking time: %f s"
+            % (
+                optimal_line_breaking,
+                number_of_lines,
+                number_of_lines // number_of_lines_per_page,
+                delta,
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_line_breaking()
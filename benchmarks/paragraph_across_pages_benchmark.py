@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This script measures how long it takes to lay out a Paragraph that is split across Pages,
+layout time should scale (roughly) linearly with the number of words.
+Run it from the root of the repository: python -m benchmarks.paragraph_across_pages_benchmark
+"""
+import time
+
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from tests.pdf.canvas.layout.paragraph.test_write_paragraph_across_pages import (
+    TestWriteParagraphAcrossPages,
+)
+
+
+def benchmark_paragraph_across_pages() -> None:
+    """
+    This function measures how long it takes to lay out a Paragraph of 5000 and 20000 words
+    """
+    for number_of_words in [5000, 20000]:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        p: Paragraph = Paragraph(
+            TestWriteParagraphAcrossPages._get_text(number_of_words)
+        )
+        delta: float = time.time()
+        SingleColumnLayout(page).add(p)
+        delta = time.time() - delta
+        print(
+            "%d words, %d pages: %f s"
+            % (
+                number_of_words,
+                int(doc.get_document_info().get_number_of_pages()),
+                delta,
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_paragraph_across_pages()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures the size of (and the time it takes to write) a Document that uses a TrueType font,
+    with and without subsetting the font (see PDF.dumps).
+    Run it from the root of the repository: python -m benchmarks.subset_font_benchmark
+"""
+import io
+import time
+from pathlib import Path
+
+from borb.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+
+def benchmark_subset_font() -> None:
+    """
+    This function measures the size of (and the time it takes to write) a Document, with and without subsetting its fonts
+    """
+    for font_file in ["Ubuntu-Light.ttf", "Jsfont-Regular.ttf"]:
+        for subset_fonts in [False, True]:
+            doc: Document = Document()
+            page: Page = Page()
+            doc.append_page(page)
+            SingleColumnLayout(page).add(
+                Paragraph(
+                    "Hello World!",
+                    font=TrueTypeFont.true_type_font_from_file(
+                        Path(__file__).parent.parent
+                        / "tests"
+                        / "pdf"
+                        / "canvas"
+                        / "font"
+                        / font_file
+                    ),
+                )
+            )
+            out: io.BytesIO = io.BytesIO()
+            delta: float = time.time()
+            PDF.dumps(out, doc, subset_fonts=subset_fonts)
+            delta = time.time() - delta
+            print(
+                "%s, subset_fonts=%s: %d bytes, save time: %f s"
+                % (font_file, subset_fonts, len(out.getvalue()), delta)
+            )
+
+
+if __name__ == "__main__":
+    benchmark_subset_font()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This script measures how long it takes to lay out a Table that is split across Pages,
+layout time should scale (roughly) linearly with the number of rows.
+Run it from the root of the repository: python -m benchmarks.table_across_pages_benchmark
+"""
+import time
+
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.table import Table
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from tests.pdf.canvas.layout.table.test_write_table_across_pages import (
+    TestWriteTableAcrossPages,
+)
+
+
+def benchmark_table_across_pages() -> None:
+    """
+    This function measures how long it takes to lay out a Table of 250 and 1000 rows
+    """
+    for number_of_rows in [250, 1000]:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        t: Table = TestWriteTableAcrossPages._build_table(
+            FlexibleColumnWidthTable, number_of_rows
+        )
+        delta: float = time.time()
+        SingleColumnLayout(page).add(t)
+        delta = time.time() - delta
+        print(
+            "%d rows, %d pages: %f s"
+            % (
+                number_of_rows,
+                int(doc.get_document_info().get_number_of_pages()),
+                delta,
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_table_across_pages()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to tokenize the content streams of all input documents of the test suite,
+    using LowLevelTokenizer (which reads its io_source in blocks),
+    and using the (previous) implementation that reads one character at a time.
+    Run it from the root of the repository: python -m benchmarks.tokenizer_benchmark
+"""
+import io
+import time
+import typing
+from pathlib import Path
+
+from borb.io.read.tokenize.low_level_tokenizer import LowLevelTokenizer
+from borb.pdf.pdf import PDF
+from tests.misc.tokenize.test_buffered_tokenizer import (
+    CharByCharLowLevelTokenizer,
+    TestBufferedTokenizer,
+)
+
+
+def _get_content_streams() -> typing.List[bytes]:
+    content_streams: typing.List[bytes] = []
+    for pdf_path in sorted(
+        [
+            x
+            for x in (Path(__file__).parent.parent / "tests").glob("**/input_*.pdf")
+            if "output" not in x.parts
+        ]
+    ):
+        with open(pdf_path, "rb") as pdf_file_handle:
+            doc = PDF.loads(pdf_file_handle)
+        for i in range(0, int(doc.get_document_info().get_number_of_pages())):
+            content_streams.append(doc.get_page(i)["Contents"]["DecodedBytes"])
+    return content_streams
+
+
+def benchmark_tokenizer() -> None:
+    """
+    This function measures how long it takes to tokenize the content streams of all input documents of the test suite
+    """
+    content_streams: typing.List[bytes] = _get_content_streams()
+
+    # time previous implementation
+    delta_001: float = time.time()
+    number_of_tokens: int = 0
+    for c in content_streams:
+        number_of_tokens += len(
+            TestBufferedTokenizer._tokenize(CharByCharLowLevelTokenizer(io.BytesIO(c)))
+        )
+    delta_001 = time.time() - delta_001
+
+    # time current implementation
+    delta_002: float = time.time()
+    for c in content_streams:
+        TestBufferedTokenizer._tokenize(LowLevelTokenizer(io.BytesIO(c)))
+    delta_002 = time.time() - delta_002
+
+    print(
+        "tokens: %d, bytes: %d, char-by-char: %f s, buffered: %f s, speedup: %f"
+        % (
+            number_of_tokens,
+            sum([len(x) for x in content_streams]),
+            delta_001,
+            delta_002,
+            delta_001 / max(delta_002, 10**-6),
+        )
+    )
+
+
+if __name__ == "__main__":
+    benchmark_tokenizer()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to write a Document with a large Stream,
+    when that Stream is new (and needs to be compressed), and when it was read (and not modified).
+    Run it from the root of the repository: python -m benchmarks.unmodified_streams_benchmark
+"""
+import io
+import time
+import zlib
+
+from borb.io.read.types import Decimal, Name, Stream
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+
+def benchmark_write_unmodified_stream() -> None:
+    """
+    This function measures how long it takes to write a (large) new Stream, and a (large) unmodified Stream
+    """
+    doc: Document = Document()
+    page: Page = Page()
+    doc.append_page(page)
+    data_stream: Stream = Stream()
+    data_stream[Name("DecodedBytes")] = b"".join(
+        [b"%d %d %d\n" % (i, i * i, i % 7) for i in range(0, 1000000)]
+    )
+    data_stream[Name("Bytes")] = zlib.compress(data_stream["DecodedBytes"], 9)
+    data_stream[Name("Filter")] = Name("FlateDecode")
+    data_stream[Name("Length")] = Decimal(len(data_stream["Bytes"]))
+    page[Name("Data")] = data_stream
+
+    # write (new)
+    out_001: io.BytesIO = io.BytesIO()
+    delta_001: float = time.time()
+    PDF.dumps(out_001, doc)
+    delta_001 = time.time() - delta_001
+
+    # write (unmodified)
+    out_001.seek(0)
+    doc = PDF.loads(out_001)
+    out_002: io.BytesIO = io.BytesIO()
+    delta_002: float = time.time()
+    PDF.dumps(out_002, doc)
+    delta_002 = time.time() - delta_002
+    print("save time: %f s (new), %f s (unmodified)" % (delta_001, delta_002))
+
+
+if __name__ == "__main__":
+    benchmark_write_unmodified_stream()
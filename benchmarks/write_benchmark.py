@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This script measures how long it takes to write a Document with a large number of (tiny) indirect objects,
+the time needed should scale (roughly) linearly with the number of objects.
+Run it from the root of the repository: python -m benchmarks.write_benchmark
+"""
+import io
+import time
+
+from borb.pdf.document.document import Document
+from borb.pdf.pdf import PDF
+from tests.misc.write.test_write_object_numbers import TestWriteObjectNumbers
+
+
+def benchmark_write_document() -> None:
+    """
+    This function measures how long it takes to write a Document with 10000, 50000 and 100000 objects
+    """
+    for number_of_objects in [10000, 50000, 100000]:
+        doc: Document = TestWriteObjectNumbers._build_document(number_of_objects)
+        out: io.BytesIO = io.BytesIO()
+        delta: float = time.time()
+        PDF.dumps(out, doc)
+        delta = time.time() - delta
+        print("objects: %d, save time: %f s" % (number_of_objects, delta))
+
+
+if __name__ == "__main__":
+    benchmark_write_document()
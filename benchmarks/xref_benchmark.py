@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to read a (synthetic) PDF with a large number of (tiny) objects,
+    to merge two large XREF objects, and to look up objects in the XREF.
+    Run it from the root of the repository: python -m benchmarks.xref_benchmark
+"""
+import io
+import random
+import time
+import typing
+
+from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from borb.io.read.types import Reference
+from borb.pdf.pdf import PDF
+from borb.pdf.xref.plaintext_xref import PlainTextXREF
+from borb.pdf.xref.xref import XREF
+from tests.misc.xref.test_xref_index import TestXREFIndex
+
+NUMBER_OF_OBJECTS: int = 100000
+
+
+def benchmark_read_document() -> None:
+    """
+    This function measures how long it takes to read a PDF with NUMBER_OF_OBJECTS objects
+    """
+    pdf_bytes: bytes = TestXREFIndex._build_pdf(NUMBER_OF_OBJECTS)
+    delta: float = time.time()
+    PDF.loads(io.BytesIO(pdf_bytes))
+    delta = time.time() - delta
+    print(
+        "objects: %d, bytes: %d, load time: %f s"
+        % (NUMBER_OF_OBJECTS, len(pdf_bytes), delta)
+    )
+
+
+def benchmark_merge_xref() -> None:
+    """
+    This function measures how long it takes to merge two XREF objects (of NUMBER_OF_OBJECTS entries each)
+    """
+    xref_001: XREF = XREF()
+    xref_002: XREF = XREF()
+    for i in range(0, NUMBER_OF_OBJECTS):
+        xref_001.append(Reference(object_number=i, byte_offset=i))
+        xref_002.append(
+            Reference(object_number=i + NUMBER_OF_OBJECTS // 2, byte_offset=-i)
+        )
+    delta: float = time.time()
+    xref_001.merge(xref_002)
+    delta = time.time() - delta
+    print("entries: %d, merge time: %f s" % (NUMBER_OF_OBJECTS * 2, delta))
+
+
+def benchmark_get_object() -> None:
+    """
+    This function measures how long it takes to look up (random) objects in an XREF of NUMBER_OF_OBJECTS entries
+    """
+    src = io.BytesIO(TestXREFIndex._build_pdf(NUMBER_OF_OBJECTS))
+    tok = HighLevelTokenizer(src)
+    xref: XREF = PlainTextXREF().read(src, tok)
+    random.seed(2021)
+    object_numbers: typing.List[int] = [
+        random.randint(6, NUMBER_OF_OBJECTS + 5) for _ in range(0, 1000)
+    ]
+    delta: float = time.time()
+    for i in object_numbers:
+        xref.get_object(i, src, tok)
+        xref.get_object(Reference(object_number=i), src, tok)
+    delta = time.time() - delta
+    print(
+        "objects: %d, lookups: %d, lookup time: %f s"
+        % (NUMBER_OF_OBJECTS, len(object_numbers) * 2, delta)
+    )
+
+
+if __name__ == "__main__":
+    benchmark_read_document()
+    benchmark_merge_xref()
+    benchmark_get_object()
@@ -78,7 +78,10 @@ def decode_stream(s: Stream) -> Stream:
         assert False, "Unknown /Filter %s" % filter_name
 
     # set DecodedBytes
+    # /Bytes, /Filter and /DecodeParms still match /DecodedBytes, decoding does not modify the Stream
+    is_modified: bool = s.is_modified()
     s[Name("DecodedBytes")] = transformed_bytes
+    s.set_is_modified(is_modified)
 
     # set Type if not yet set
     # if "Type" not in s:
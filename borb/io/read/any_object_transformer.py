@@ -6,6 +6,7 @@ This implementation of ReadBaseTransformer aggregates all
 other implementations of ReadBaseTransformer
 """
 import io
+import mmap
 import typing
 from typing import Any, Optional, Union
 
@@ -71,12 +72,15 @@ class AnyObjectTransformer(Transformer):
         self.add_child_transformer(ArrayTransformer())
 
     def can_be_transformed(
-        self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
+        self,
+        object: Union[
+            io.BufferedIOBase, io.RawIOBase, io.BytesIO, mmap.mmap, AnyPDFType
+        ],
     ) -> bool:
         """
         This function returns True if the object to be transformed can be transformed by this ReadAnyObjectTransformer
         """
-        return isinstance(object, io.IOBase)
+        return isinstance(object, io.IOBase) or isinstance(object, mmap.mmap)
 
     def transform(
         self,
@@ -42,6 +42,12 @@ class FontDictionaryTransformer(Transformer):
             and object["Type"] == "Font"
         )
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (dict,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
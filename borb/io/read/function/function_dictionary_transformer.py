@@ -36,6 +36,12 @@ class FunctionDictionaryTransformer(Transformer):
             and int(object["FunctionType"]) in [0, 2, 3, 4]
         )
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (dict,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -83,5 +89,8 @@ class FunctionDictionaryTransformer(Transformer):
         # linkage
         transformed_object.set_parent(parent_object)  # type: ignore [attr-defined]
 
+        # a Function that was (just) read is not modified
+        transformed_object.set_is_modified(False)
+
         # return
         return transformed_object
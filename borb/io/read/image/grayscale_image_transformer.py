@@ -45,6 +45,12 @@ class GrayscaleImageTransformer(Transformer):
             and object.get("ColorSpace", None) == "DeviceGray"
         )
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (Stream,)
+
     def transform(
         self,
         object_to_transform: Union["io.IOBase", AnyPDFType],
@@ -9,7 +9,7 @@ import typing
 from typing import Any, Optional, Union
 
 from borb.io.read.transformer import ReadTransformerState, Transformer
-from borb.io.read.types import AnyPDFType, List
+from borb.io.read.types import AnyPDFType, LazyList, List, Reference
 from borb.pdf.canvas.event.event_listener import EventListener
 
 
@@ -26,6 +26,12 @@ class ArrayTransformer(Transformer):
         """
         return isinstance(object, List)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (List,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -38,14 +44,31 @@ class ArrayTransformer(Transformer):
         """
 
         # create root object
+        # when reading lazily, Reference(s) are resolved when they are first accessed (see LazyList)
         assert isinstance(object_to_transform, List)
+        lazy: bool = (
+            context is not None and context.lazy and type(object_to_transform) is List
+        )
+        if lazy:
+            assert context is not None
+            assert context.lazy_reference_resolver is not None
+            lazy_list: LazyList = LazyList(context.lazy_reference_resolver)
+            lazy_list.set_reference(object_to_transform.get_reference())  # type: ignore [attr-defined]
+            list.extend(lazy_list, object_to_transform)
+            object_to_transform = lazy_list
         object_to_transform.set_parent(parent_object)  # type: ignore [attr-defined]
 
         # transform child(ren)
         for i in range(0, len(object_to_transform)):
+            v = list.__getitem__(object_to_transform, i)
+            if lazy and isinstance(v, Reference):
+                continue
             object_to_transform[i] = self.get_root_transformer().transform(
-                object_to_transform[i], object_to_transform, context, event_listeners
+                v, object_to_transform, context, event_listeners
             )
 
+        # a List that was (just) read is not modified
+        object_to_transform.set_is_modified(False)
+
         # return
         return object_to_transform
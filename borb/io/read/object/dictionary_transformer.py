@@ -9,7 +9,7 @@ import typing
 from typing import Any, Optional, Union
 
 from borb.io.read.transformer import ReadTransformerState, Transformer
-from borb.io.read.types import AnyPDFType, Dictionary
+from borb.io.read.types import AnyPDFType, Dictionary, LazyDictionary, Reference
 from borb.pdf.canvas.event.event_listener import EventListener
 
 
@@ -26,6 +26,12 @@ class DictionaryTransformer(Transformer):
         """
         return isinstance(object, Dictionary)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (Dictionary,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -38,16 +44,36 @@ class DictionaryTransformer(Transformer):
         """
 
         # create root object
+        # when reading lazily, Reference(s) are resolved when they are first accessed (see LazyDictionary)
         assert isinstance(object_to_transform, Dictionary)
+        lazy: bool = (
+            context is not None
+            and context.lazy
+            and type(object_to_transform) is Dictionary
+        )
+        if lazy:
+            assert context is not None
+            assert context.lazy_reference_resolver is not None
+            lazy_dictionary: LazyDictionary = LazyDictionary(
+                context.lazy_reference_resolver
+            )
+            lazy_dictionary.set_reference(object_to_transform.get_reference())  # type: ignore [attr-defined]
+            dict.update(lazy_dictionary, object_to_transform)
+            object_to_transform = lazy_dictionary
         object_to_transform.set_parent(parent_object)  # type: ignore [attr-defined]
 
         # transform key/value pair(s)
-        for k, v in object_to_transform.items():
+        for k, v in dict.items(object_to_transform):
+            if lazy and isinstance(v, Reference):
+                continue
             v = self.get_root_transformer().transform(
                 v, object_to_transform, context, event_listeners
             )
             if v is not None:
                 object_to_transform[k] = v
 
+        # a Dictionary that was (just) read is not modified
+        object_to_transform.set_is_modified(False)
+
         # return
         return object_to_transform
@@ -27,6 +27,12 @@ class StreamTransformer(Transformer):
         """
         return isinstance(object, Stream)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (Stream,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -61,6 +67,9 @@ class StreamTransformer(Transformer):
                 if v is not None:
                     object_to_transform[k] = v
 
+        # a Stream that was (just) read is not modified
+        object_to_transform.set_is_modified(False)
+
         # linkage
         object_to_transform.set_parent(parent_object)  # type: ignore [attr-defined]
 
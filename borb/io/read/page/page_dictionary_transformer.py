@@ -13,10 +13,6 @@ from borb.io.read.transformer import ReadTransformerState, Transformer
 from borb.io.read.types import AnyPDFType
 from borb.io.read.types import Decimal as bDecimal
 from borb.io.read.types import Dictionary, List, Name, Stream
-from borb.pdf.canvas.canvas import Canvas
-from borb.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
-from borb.pdf.canvas.event.begin_page_event import BeginPageEvent
-from borb.pdf.canvas.event.end_page_event import EndPageEvent
 from borb.pdf.canvas.event.event_listener import EventListener
 from borb.pdf.page.page import Page
 
@@ -36,6 +32,12 @@ class PageDictionaryTransformer(Transformer):
             isinstance(object, Dict) and "Type" in object and object["Type"] == "Page"
         )
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (dict,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -54,6 +56,7 @@ class PageDictionaryTransformer(Transformer):
         page_out = Page().set_parent(parent_object)  # type: ignore [attr-defined]
 
         # convert key/value pairs
+        # when reading lazily, the Page is only read when it is first accessed, its (direct) values are read along with it
         assert isinstance(object_to_transform, Dictionary)
         for k, v in object_to_transform.items():
             # avoid circular reference
@@ -65,10 +68,6 @@ class PageDictionaryTransformer(Transformer):
             if v is not None:
                 page_out[k] = v
 
-        # send out BeginPageEvent
-        for l in event_listeners:
-            l._event_occurred(BeginPageEvent(page_out))
-
         # check whether `Contents` exists
         if "Contents" not in page_out:
             return
@@ -90,20 +89,5 @@ class PageDictionaryTransformer(Transformer):
             contents = page_out["Contents"]
             contents.set_parent(page_out)  # type: ignore [attr-defined]
 
-        # create Canvas
-        canvas = Canvas().set_parent(page_out)  # type: ignore [attr-defined]
-
-        # If there are no event listeners, processing the page has no effect
-        # we may as well skip it (cause it is very labour-intensive).
-        if len(event_listeners) > 0:
-            # create CanvasStreamProcessor
-            CanvasStreamProcessor(page_out, canvas, []).read(
-                io.BytesIO(contents["DecodedBytes"]), event_listeners
-            )
-
-        # send out EndPageEvent
-        for l in event_listeners:
-            l._event_occurred(EndPageEvent(page_out))
-
         # return
         return page_out
@@ -10,9 +10,9 @@ from typing import Any, Dict, List, Optional, Union
 
 from borb.io.read.object.dictionary_transformer import DictionaryTransformer
 from borb.io.read.transformer import ReadTransformerState, Transformer
-from borb.io.read.types import AnyPDFType, Decimal, Dictionary
+from borb.io.read.types import AnyPDFType, Decimal, Dictionary, LazyList
 from borb.io.read.types import List as bList
-from borb.io.read.types import Name
+from borb.io.read.types import Name, Reference
 from borb.pdf.canvas.event.event_listener import EventListener
 from borb.pdf.page.page import Page
 
@@ -34,6 +34,12 @@ class RootDictionaryTransformer(Transformer):
             and object["Type"] == "Catalog"
         )
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (dict,)
+
     def _re_order_pages(self, root_dictionary: dict) -> None:
 
         # list to hold Page objects (in order)
@@ -60,10 +66,87 @@ class RootDictionaryTransformer(Transformer):
                     stack_to_handle.append(k)
 
         # change
-        root_dictionary["Pages"][Name("Kids")] = bList()
+        kids: bList = bList()
         for p in pages_in_order:
-            root_dictionary["Pages"]["Kids"].append(p)
-        root_dictionary["Pages"][Name("Count")] = Decimal(len(pages_in_order))
+            kids.append(p)
+        RootDictionaryTransformer._set_kids(root_dictionary["Pages"], kids)
+
+    def _get_page_references(
+        self, root_dictionary: Dictionary, context: ReadTransformerState
+    ) -> typing.List[AnyPDFType]:
+        """
+        This function returns the (References to) /Page objects in the order in which they appear in the /Pages tree.
+        Only the (untransformed) objects in the tree are read, the /Page objects are not transformed.
+        """
+        assert context.root_object is not None
+        xref = context.root_object["XRef"]
+
+        # list to hold (References to) Page objects (in order)
+        pages_in_order: typing.List[AnyPDFType] = []
+
+        # stack to explore Page(s) DFS
+        stack_to_handle: typing.List[AnyPDFType] = []
+        stack_to_handle.append(root_dictionary["Pages"])
+        references_handled: typing.Set[Reference] = set()
+
+        # DFS
+        while len(stack_to_handle) > 0:
+            obj = stack_to_handle.pop(0)
+            untransformed_obj = obj
+            if isinstance(obj, Reference):
+                if obj in references_handled:
+                    continue
+                references_handled.add(obj)
+                untransformed_obj = xref.get_object(
+                    obj, context.source, context.tokenizer
+                )
+            if not isinstance(untransformed_obj, Dictionary):
+                continue
+            # /Page
+            if (
+                "Type" in untransformed_obj
+                and untransformed_obj["Type"] == "Page"
+                and "Contents" in untransformed_obj
+            ):
+                pages_in_order.append(obj)
+            # /Pages
+            if (
+                "Type" in untransformed_obj
+                and untransformed_obj["Type"] == "Pages"
+                and "Kids" in untransformed_obj
+            ):
+                kids = untransformed_obj["Kids"]
+                if isinstance(kids, Reference):
+                    kids = xref.get_object(kids, context.source, context.tokenizer)
+                if isinstance(kids, List):
+                    for k in kids:
+                        stack_to_handle.append(k)
+
+        # return
+        return pages_in_order
+
+    @staticmethod
+    def _set_kids(pages: Dictionary, kids: bList) -> None:
+        """
+        This function sets the /Kids (and /Count) of the /Pages Dictionary.
+        The /Pages Dictionary is left untouched (and is thus not modified) if it already holds the same /Kids.
+        """
+        kids_before = dict.get(pages, "Kids")
+        if (
+            isinstance(kids_before, bList)
+            and kids_before.get_reference() is None
+            and len(kids_before) == len(kids)
+            and all(
+                [
+                    a is b or (isinstance(a, Reference) and a == b)
+                    for a, b in zip(list.__iter__(kids_before), list.__iter__(kids))
+                ]
+            )
+            and dict.get(pages, "Count") == len(kids)
+        ):
+            return
+        pages[Name("Kids")] = kids
+        pages[Name("Count")] = Decimal(len(kids))
 
     def transform(
         self,
@@ -77,6 +160,11 @@ class RootDictionaryTransformer(Transformer):
         """
         assert isinstance(object_to_transform, Dictionary)
 
+        # when reading lazily, the /Pages tree is flattened without transforming the /Page objects
+        page_references: typing.List[AnyPDFType] = []
+        if context is not None and context.lazy:
+            page_references = self._get_page_references(object_to_transform, context)
+
         # convert using Dictionary transformer
         transformed_root_dictionary: Optional[Dictionary] = None
         for t in self.get_root_transformer().get_children():
@@ -92,7 +180,19 @@ class RootDictionaryTransformer(Transformer):
         #
         # rebuild /Pages if needed
         #
-        self._re_order_pages(transformed_root_dictionary)
+        if context is not None and context.lazy:
+            assert context.lazy_reference_resolver is not None
+            pages = transformed_root_dictionary["Pages"]
+            kids = LazyList(context.lazy_reference_resolver).set_parent(pages)  # type: ignore [attr-defined]
+            for p in page_references:
+                if not isinstance(p, Reference):
+                    p = self.get_root_transformer().transform(
+                        p, kids, context, event_listeners
+                    )
+                kids.append(p)
+            RootDictionaryTransformer._set_kids(pages, kids)
+        else:
+            self._re_order_pages(transformed_root_dictionary)
 
         # return
         return transformed_root_dictionary
@@ -11,7 +11,7 @@ import typing
 from typing import Any, Optional, Union
 
 from borb.io.read.transformer import ReadTransformerState, Transformer
-from borb.io.read.types import AnyPDFType, Reference
+from borb.io.read.types import AnyPDFType, Dictionary, List, Reference
 from borb.pdf.canvas.event.event_listener import EventListener
 from borb.pdf.xref.xref import XREF
 
@@ -38,6 +38,12 @@ class ReferenceTransformer(Transformer):
         """
         return isinstance(object, Reference)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (Reference,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -119,5 +125,9 @@ class ReferenceTransformer(Transformer):
             )
             pass
 
+        # an (indirect) object that was (just) read is not modified
+        if isinstance(transformed_referenced_object, (Dictionary, List)):
+            transformed_referenced_object.set_is_modified(False)
+
         # return
         return transformed_referenced_object
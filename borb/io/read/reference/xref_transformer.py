@@ -5,6 +5,7 @@
 This implementation of ReadBaseTransformer is responsible for reading the XRef object
 """
 import io
+import mmap
 import os
 import typing
 from decimal import Decimal
@@ -13,7 +14,7 @@ from typing import Any, Optional, Union
 from borb.io.read.encryption.standard_security_handler import StandardSecurityHandler
 from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
 from borb.io.read.transformer import ReadTransformerState, Transformer
-from borb.io.read.types import AnyPDFType, Dictionary, Name
+from borb.io.read.types import AnyPDFType, Dictionary, Name, Reference
 from borb.pdf.canvas.event.event_listener import Event, EventListener
 from borb.pdf.document.document import Document
 from borb.pdf.xref.plaintext_xref import PlainTextXREF
@@ -44,16 +45,27 @@ class XREFTransformer(Transformer):
     """
 
     def can_be_transformed(
-        self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
+        self,
+        object: Union[
+            io.BufferedIOBase, io.RawIOBase, io.BytesIO, mmap.mmap, AnyPDFType
+        ],
     ) -> bool:
         """
         This function returns True if the object to be converted represents a cross-reference table
         """
-        return isinstance(object, io.IOBase)
+        return isinstance(object, io.IOBase) or isinstance(object, mmap.mmap)
+
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform
+        """
+        return (io.IOBase, mmap.mmap)
 
     def transform(
         self,
-        object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
+        object_to_transform: Union[
+            io.BufferedIOBase, io.RawIOBase, mmap.mmap, AnyPDFType
+        ],
         parent_object: Any,
         context: Optional[ReadTransformerState] = None,
         event_listeners: typing.List[EventListener] = [],
@@ -64,13 +76,26 @@ class XREFTransformer(Transformer):
 
         # update context
         assert context is not None
-        assert isinstance(object_to_transform, io.BufferedIOBase) or isinstance(
-            object_to_transform, io.RawIOBase
+        assert (
+            isinstance(object_to_transform, io.BufferedIOBase)
+            or isinstance(object_to_transform, io.RawIOBase)
+            or isinstance(object_to_transform, mmap.mmap)
         )
         context.root_object = Document()
         context.source = object_to_transform
         context.tokenizer = HighLevelTokenizer(context.source)
 
+        # when reading lazily, Reference(s) are resolved when they are first accessed
+        if context.lazy:
+
+            def _resolve_lazy_reference(parent: Any, reference: Reference) -> Any:
+                assert context is not None
+                return self._resolve_lazy_reference(
+                    parent, reference, context, event_listeners
+                )
+
+            context.lazy_reference_resolver = _resolve_lazy_reference
+
         # add listener(s)
         for l in event_listeners:
             l._event_occurred(BeginDocumentEvent())  # type: ignore [attr-defined]
@@ -151,6 +176,13 @@ class XREFTransformer(Transformer):
             if k in xref["Trailer"]:
                 xref["Trailer"].pop(k)
 
+        # objects that have been transformed no longer need to be tracked
+        context.transformed_objects_by_id.clear()
+
+        # process Page(s)
+        if len(event_listeners) > 0:
+            self._process_pages(context, event_listeners)
+
         # notify
         for l in event_listeners:
             l._event_occurred(EndDocumentEvent())  # type: ignore [attr-defined]
@@ -158,6 +190,70 @@ class XREFTransformer(Transformer):
         # return
         return context.root_object
 
+    @staticmethod
+    def _process_pages(
+        context: ReadTransformerState, event_listeners: typing.List[EventListener]
+    ) -> None:
+        """
+        This function processes the Page(s) of the Document (in order), sending out events to the given EventListener(s).
+        If the context specifies which pages should be processed, only those Page(s) are processed (in the given order).
+        """
+        assert context is not None
+        assert context.root_object is not None
+        doc = context.root_object
+        root = doc["XRef"]["Trailer"].get("Root")
+        if not isinstance(root, Dictionary) or not isinstance(
+            root.get("Pages"), Dictionary
+        ):
+            return
+        number_of_pages: int = len(root["Pages"].get("Kids", []))
+        pages: typing.Iterable[int] = (
+            context.pages if context.pages is not None else range(0, number_of_pages)
+        )
+        for page_number in pages:
+            if 0 <= page_number < number_of_pages:
+                doc.get_page(page_number).process(
+                    event_listeners,
+                    float_mode=context.float_mode,
+                    page_number=page_number,
+                )
+
+    def _resolve_lazy_reference(
+        self,
+        parent_object: Any,
+        reference: Reference,
+        context: ReadTransformerState,
+        event_listeners: typing.List[EventListener],
+    ) -> Any:
+        """
+        This function resolves a Reference (in a Document that is read lazily) when it is first accessed.
+        The Reference(s) of all (parent) objects up to the Document are considered to be part of the indirect reference chain,
+        as they would have been, had the Document been read eagerly.
+        """
+        indirect_reference_chain_before: typing.Set[Reference] = (
+            context.indirect_reference_chain
+        )
+        context.indirect_reference_chain = set(indirect_reference_chain_before)
+        transformed_objects_by_id_before: typing.Dict[int, typing.Any] = (
+            context.transformed_objects_by_id
+        )
+        context.transformed_objects_by_id = {}
+        parents_handled: typing.Set[int] = set()
+        p = parent_object
+        while p is not None and id(p) not in parents_handled:
+            parents_handled.add(id(p))
+            r = p.get_reference()
+            if r is not None:
+                context.indirect_reference_chain.add(r)
+            p = p.get_parent()
+        try:
+            return self.get_root_transformer().transform(
+                reference, parent_object, context, event_listeners
+            )
+        finally:
+            context.indirect_reference_chain = indirect_reference_chain_before
+            context.transformed_objects_by_id = transformed_objects_by_id_before
+
     @staticmethod
     def _remove_prefix(context: ReadTransformerState) -> None:
 
@@ -272,6 +368,9 @@ class XREFTransformer(Transformer):
                     doc[Name("XRef")] = doc["XRef"].merge(most_recent_xref)
                 else:
                     doc[Name("XRef")] = most_recent_xref
+                # a rebuilt XREF does not match any cross-reference section in the file,
+                # so no incremental update can refer to it (by means of /Prev)
+                doc["XRef"]._start_of_xref = None
             except Exception as ex0:
                 most_recent_xref = None
                 exceptions_to_rethrow.append(ex0)
@@ -35,6 +35,12 @@ class HighLevelTokenizer(LowLevelTokenizer):
     and so forth.
     """
 
+    def __init__(self, io_source, float_mode: bool = False):
+        super(HighLevelTokenizer, self).__init__(io_source)
+        # In float mode, every number is returned as a (native) float.
+        # This is only meant for content streams, which never contain references, streams or indirect objects.
+        self._float_mode: bool = float_mode
+
     def read_array(self) -> List:
         """
         This function processes the next tokens and returns a List.
@@ -199,6 +205,10 @@ class HighLevelTokenizer(LowLevelTokenizer):
             self.seek(token.get_byte_offset())  # go to start of array
             return self.read_array()
 
+        # float mode (content streams)
+        if self._float_mode and token.get_token_type() == TokenType.NUMBER:
+            return float(token.get_text())
+
         # <number> <number> "R"
         if token.get_token_type() == TokenType.NUMBER:
             self.seek(token.get_byte_offset())  # go to start of indirect reference
@@ -227,7 +237,7 @@ class HighLevelTokenizer(LowLevelTokenizer):
         # numbers
         if token.get_token_type() == TokenType.NUMBER:
             self.seek(self.tell() + len(token.get_text()))
-            return Decimal(Decimal(token.get_text()))
+            return Decimal(token.get_text())
 
         # boolean
         if token.get_token_type() == TokenType.OTHER and token.get_text() in [
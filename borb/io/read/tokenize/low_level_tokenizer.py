@@ -8,6 +8,8 @@ The high-level tokenizer will use this first pass to then build complex objects
 """
 import enum
 import io
+import re
+import typing
 from typing import Optional
 
 
@@ -93,13 +95,51 @@ class LowLevelTokenizer:
     although scanner is also a term for the first stage of a lexer.
     A lexer is generally combined with a parser, which together analyze the syntax of programming languages, web pages,
     and so forth.
+
+    This LowLevelTokenizer does not read its io_source one character at a time.
+    Sources that expose their bytes (io.BytesIO, mmap.mmap) are scanned in-place,
+    other sources (e.g. files) are scanned through a read-ahead buffer.
+    Each Token is matched as a whole (using precompiled byte-class regular expressions).
+    The position of the io_source is kept in sync with the tokenizer, so callers can still seek on the io_source directly.
     """
 
+    MAX_NUMBER_OF_RECENT_TOKENS: int = 256
+    READ_AHEAD_SIZE: int = 2**16
+
+    # fmt: off
+    _TOKEN: typing.Pattern = re.compile(
+        b"[\\x00\\t\\n\\x0c\\r ]*"
+        b"(?:"
+        b"(?P<START_ARRAY>\\[)"
+        b"|(?P<END_ARRAY>\\])"
+        b"|(?P<NAME>/[^\\x00\\t\\n\\x0c\\r %()/<>\\[\\]]*)"
+        b"|(?P<END_DICT>>>)"
+        b"|(?P<COMMENT>%[^\\r\\n]*)"
+        b"|(?P<START_DICT><<)"
+        b"|(?P<HEX_STRING><[^>]*>?)"
+        b"|(?P<NUMBER>[-+.0-9]+)"
+        b"|(?P<STRING>\\()"
+        b"|(?P<OTHER>[^\\x00\\t\\n\\x0c\\r %()/<>\\[\\]]*)"
+        b")"
+    )
+    # fmt: on
+    _TOKEN_TYPE_PER_GROUP: typing.Dict[int, TokenType] = {
+        v: TokenType[k] for k, v in _TOKEN.groupindex.items()
+    }
+    _STRING_GROUP: int = _TOKEN.groupindex["STRING"]
+    _OTHER_GROUP: int = _TOKEN.groupindex["OTHER"]
+    _STRING_SPECIAL_CHAR: typing.Pattern = re.compile(b"[()\\\\]")
+
     def __init__(self, io_source):
         self._io_source = io_source
-        self._is_pseudo_digit = set("0123456789+-.").__contains__
-        self._is_delimiter = set("\x00\t\n\x0c\r %()/<>[]").__contains__
-        self._is_whitespace = set("\x00\t\n\x0c\r ").__contains__
+
+        # read-ahead buffer
+        self._buffer: typing.Any = b""
+        self._buffer_byte_offset: int = 0
+        self._buffer_holds_io_source: bool = False
+        self._buffer_holds_end_of_io_source: bool = False
+        self._buffer_io_source: typing.Any = None
+        self._recent_tokens: typing.Dict[int, typing.Tuple[Token, int]] = {}
 
     def next_non_comment_token(self) -> Optional[Token]:
         """
@@ -116,124 +156,30 @@ class LowLevelTokenizer:
         This function retrieves the next Token.
         It returns None if no such Token exists (end of stream/file)
         """
-        ch = self._next_char()
-        if len(ch) == 0:
-            return None
-
-        while len(ch) > 0 and self._is_whitespace(ch):
-            ch = self._next_char()
-
-        # START_ARRAY
-        if ch == "[":
-            return Token(self._io_source.tell() - 1, TokenType.START_ARRAY, "[")
-
-        # END ARRAY
-        if ch == "]":
-            return Token(self._io_source.tell() - 1, TokenType.END_ARRAY, "]")
-
-        # NAME
-        if ch == "/":
-            out_str = "/"
-            out_pos = self._io_source.tell() - 1
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                if self._is_delimiter(ch):
-                    break
-                out_str += ch
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.NAME, out_str)
-
-        # END_DICT
-        if ch == ">":
-            out_pos = self._io_source.tell() - 1
-            ch = self._next_char()
-            # CHECK UNEXPECTED CHARACTER AFTER >
-            assert ch == ">"
-            return Token(out_pos, TokenType.END_DICT, ">>")
-
-        # COMMENT
-        if ch == "%":
-            out_str = ""
-            out_pos = self._io_source.tell() - 1
-            while len(ch) != 0 and ch != "\r" and ch != "\n":
-                out_str += ch
-                ch = self._next_char()
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.COMMENT, out_str)
-
-        # HEX_STRING OR DICT
-        if ch == "<":
-            out_pos = self._io_source.tell() - 1
-            ch = self._next_char()
-
-            # DICT
-            if ch == "<":
-                return Token(out_pos, TokenType.START_DICT, "<<")
-
-            # empty hex string
-            if ch == ">":
-                return Token(out_pos, TokenType.HEX_STRING, "<>")
-
-            # HEX_STRING
-            out_str = "<" + ch
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                out_str += ch
-                if ch == ">":
-                    break
-
-            return Token(out_pos, TokenType.HEX_STRING, out_str)
-
-        # NUMBER
-        if ch in "-+.0123456789":
-            out_str = ""
-            out_pos = self._io_source.tell() - 1
-            while len(ch) != 0 and ch in "-+.0123456789":
-                out_str += ch
-                ch = self._next_char()
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.NUMBER, out_str)
-
-        # STRING
-        if ch == "(":
-            bracket_nesting_level = 1
-            out_str = "("
-            out_pos = self._io_source.tell() - 1
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                if ch == "\\":
-                    ch = self._next_char()
-                    out_str += "\\" + ch
-                    continue
-                if ch == "(":
-                    bracket_nesting_level += 1
-                if ch == ")":
-                    bracket_nesting_level -= 1
-                out_str += ch
-                if bracket_nesting_level == 0:
-                    break
-            assert len(ch) != 0
-            assert not out_str.endswith("\\")
-            return Token(out_pos, TokenType.STRING, out_str)
-
-        # OTHER
-        out_str = ""
-        out_pos = self._io_source.tell() - 1
-        while len(ch) != 0 and not self._is_delimiter(ch):
-            out_str += ch
-            ch = self._next_char()
-        if len(ch) != 0:
-            self._prev_char()
-        return Token(out_pos, TokenType.OTHER, out_str)
+        io_source = self._io_source
+        pos: int = io_source.tell()
+
+        # the HighLevelTokenizer often backtracks,
+        # so the most recently read Token objects are kept (by byte offset)
+        if self._buffer_io_source is io_source:
+            token_and_end: typing.Optional[typing.Tuple[Token, int]] = (
+                self._recent_tokens.get(pos)
+            )
+            if token_and_end is not None:
+                io_source.seek(token_and_end[1])
+                return token_and_end[0]
+
+        # read Token
+        token, end = self._read_token(pos)
+        io_source.seek(end)
+        if token is not None:
+            if (
+                len(self._recent_tokens)
+                >= LowLevelTokenizer.MAX_NUMBER_OF_RECENT_TOKENS
+            ):
+                self._recent_tokens.clear()
+            self._recent_tokens[pos] = (token, end)
+        return token
 
     def seek(self, pos: int, whence: int = io.SEEK_SET):
         """
@@ -252,6 +198,171 @@ class LowLevelTokenizer:
         """
         return self._io_source.tell()
 
+    #
+    # PRIVATE
+    #
+
+    def _byte_at(self, byte_offset: int) -> int:
+        """
+        This function returns the byte at the given offset, or -1 if the offset is past the end of the io_source
+        """
+        i: int = self._ensure_buffer(byte_offset) - self._buffer_byte_offset
+        if 0 <= i < len(self._buffer):
+            return self._buffer[i]
+        return -1
+
+    def _ensure_buffer(self, byte_offset: int, length: int = 1) -> int:
+        """
+        This function (re)fills the read-ahead buffer so that (if possible) it holds
+        the bytes in the range [byte_offset, byte_offset + length).
+        It returns byte_offset.
+        """
+        # the io_source (may) have changed
+        if self._buffer_io_source is not self._io_source:
+            self._buffer_io_source = self._io_source
+            self._recent_tokens = {}
+            self._buffer = LowLevelTokenizer._get_bytes_of_io_source(self._io_source)
+            self._buffer_byte_offset = 0
+            self._buffer_holds_io_source = self._buffer is not None
+            self._buffer_holds_end_of_io_source = self._buffer is not None
+            if self._buffer is None:
+                self._buffer = b""
+
+        # the buffer already holds everything there is
+        if self._buffer_holds_io_source:
+            return byte_offset
+
+        # the buffer already holds the requested range
+        i: int = byte_offset - self._buffer_byte_offset
+        if 0 <= i and i + length <= len(self._buffer):
+            return byte_offset
+
+        # read ahead
+        size: int = max(length, LowLevelTokenizer.READ_AHEAD_SIZE)
+        self._io_source.seek(byte_offset)
+        self._buffer = self._io_source.read(size)
+        self._buffer_byte_offset = byte_offset
+        self._buffer_holds_end_of_io_source = len(self._buffer) < size
+        return byte_offset
+
+    @staticmethod
+    def _get_bytes_of_io_source(io_source) -> typing.Any:
+        """
+        This function returns the bytes of the io_source (without copying them) if the io_source exposes them,
+        None otherwise
+        """
+        if isinstance(io_source, io.BytesIO):
+            return io_source.getvalue()
+        if isinstance(io_source, io.IOBase):
+            return None
+        try:
+            return memoryview(io_source).cast("B")
+        except TypeError:
+            return None
+
+    def _match(self, pattern: typing.Pattern, byte_offset: int) -> typing.Match:
+        """
+        This function matches the given (precompiled) pattern at the given byte offset.
+        It (re)fills the read-ahead buffer until the match ends (at least) 2 bytes before the end of the buffer
+        (so that 2-byte delimiters are never split), or the buffer holds the end of the io_source.
+        """
+        self._ensure_buffer(byte_offset)
+        while True:
+            i: int = byte_offset - self._buffer_byte_offset
+            m = pattern.match(self._buffer, i)
+            assert m is not None
+            if m.end() + 2 <= len(self._buffer) or self._buffer_holds_end_of_io_source:
+                return m
+            self._ensure_buffer(byte_offset, 2 * (len(self._buffer) - i) + 1)
+
+    def _read_token(self, pos: int) -> typing.Tuple[Optional[Token], int]:
+        """
+        This function reads the Token at the given byte offset.
+        It returns the Token (or None at the end of the io_source) and the byte offset right after it.
+        """
+        # match (using the read-ahead buffer)
+        buffer = self._buffer
+        m: typing.Optional[typing.Match] = None
+        i: int = pos - self._buffer_byte_offset
+        if self._buffer_io_source is self._io_source and 0 <= i < len(buffer):
+            m = LowLevelTokenizer._TOKEN.match(buffer, i)
+            if m.end() + 2 > len(buffer) and not self._buffer_holds_end_of_io_source:  # type: ignore[union-attr]
+                m = None
+        if m is None:
+            m = self._match(LowLevelTokenizer._TOKEN, pos)
+        k: int = m.lastindex  # type: ignore[assignment]
+        start, end = m.span(k)
+        start += self._buffer_byte_offset
+        end += self._buffer_byte_offset
+
+        # START_ARRAY, END_ARRAY, NAME, END_DICT, COMMENT, START_DICT, HEX_STRING, NUMBER, OTHER
+        if start != end and k != LowLevelTokenizer._STRING_GROUP:
+            return (
+                Token(
+                    start,
+                    LowLevelTokenizer._TOKEN_TYPE_PER_GROUP[k],
+                    m.group(k).decode("latin-1"),
+                ),
+                end,
+            )
+
+        # STRING
+        if k == LowLevelTokenizer._STRING_GROUP:
+            bracket_nesting_level: int = 0
+            end = start
+            while True:
+                end = self._search(LowLevelTokenizer._STRING_SPECIAL_CHAR, end)
+                assert end != -1
+                ch: int = self._byte_at(end)
+                if ch == 92:  # \
+                    assert self._byte_at(end + 1) != -1
+                    end += 2
+                    continue
+                end += 1
+                bracket_nesting_level += 1 if ch == 40 else -1  # (
+                if bracket_nesting_level == 0:
+                    break
+            i = self._ensure_buffer(start, end - start) - self._buffer_byte_offset
+            return (
+                Token(
+                    start,
+                    TokenType.STRING,
+                    str(self._buffer[i : i + end - start], "latin-1"),
+                ),
+                end,
+            )
+
+        # end of stream/file
+        ch = self._byte_at(start)
+        if ch == -1 and start == pos:
+            return None, start
+
+        # whitespace until end of stream/file (the empty NUMBER Token is kept for backwards compatibility)
+        if ch == -1:
+            return Token(start - 1, TokenType.NUMBER, ""), start
+
+        # CHECK UNEXPECTED CHARACTER AFTER >
+        assert ch != 62  # >
+
+        # OTHER (unexpected delimiter)
+        return Token(start, TokenType.OTHER, ""), start
+
+    def _search(self, pattern: typing.Pattern, byte_offset: int) -> int:
+        """
+        This function searches the given (precompiled) pattern, starting at the given byte offset.
+        It returns the byte offset at which the match starts, or -1 if no such match exists.
+        """
+        self._ensure_buffer(byte_offset)
+        while True:
+            i: int = byte_offset - self._buffer_byte_offset
+            m = pattern.search(self._buffer, i)
+            if m is not None:
+                return m.start() + self._buffer_byte_offset
+            if self._buffer_holds_end_of_io_source:
+                return -1
+            byte_offset = self._buffer_byte_offset + len(self._buffer)
+            self._ensure_buffer(byte_offset)
+
     def _next_char(self):
         return self._io_source.read(1).decode("latin-1")
 
@@ -6,6 +6,7 @@ Base Transformer implementation.
 Add children to handle specific cases (transforming dictionaries, arrays, xref, etc)
 """
 import io
+import mmap
 import typing
 from typing import Any, Optional, Union
 
@@ -21,15 +22,24 @@ class ReadTransformerState:
     - the root object (the Document itself)
     - the tokenizer
     - references that have been resolved (to avoid endless loops)
+    - whether (indirect) objects should be resolved lazily (on first access)
+    - which pages should be processed (by the EventListener objects)
+    - whether the content of those pages should be processed using floats (rather than Decimal objects)
+    - objects that have already been transformed, or are being transformed (to avoid endless loops)
     - etc
     """
 
     def __init__(
         self,
-        source: Optional[Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO]] = None,
+        source: Optional[
+            Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, mmap.mmap]
+        ] = None,
         tokenizer: Optional[HighLevelTokenizer] = None,
         root_object: Optional[Any] = None,
         password: typing.Optional[str] = None,
+        lazy: bool = False,
+        pages: typing.Optional[typing.Iterable[int]] = None,
+        float_mode: bool = False,
     ):
         self.source = source
         self.tokenizer = tokenizer
@@ -37,6 +47,15 @@ class ReadTransformerState:
         self.indirect_reference_chain: typing.Set[Reference] = set()
         self.password: typing.Optional[str] = password
         self.security_handler: typing.Optional[typing.Any] = None
+        self.lazy: bool = lazy
+        self.lazy_reference_resolver: typing.Optional[
+            typing.Callable[[typing.Any, Reference], typing.Any]
+        ] = None
+        self.pages: typing.Optional[typing.Iterable[int]] = pages
+        self.float_mode: bool = float_mode
+        # objects that have been transformed in place, or are being transformed (by id)
+        # these objects are part of the Document that is being read, so their id can not be re-used
+        self.transformed_objects_by_id: typing.Dict[int, typing.Any] = {}
 
 
 class Transformer:
@@ -47,6 +66,7 @@ class Transformer:
 
     def __init__(self):
         self._children = []
+        self._children_by_type: typing.Dict[type, typing.List["Transformer"]] = {}
         self._parent = None
         self._level = 0
         self._invocation_count = 0
@@ -66,6 +86,7 @@ class Transformer:
         :type handler:  Transformer
         """
         self._children.append(child_transformer)
+        self._children_by_type.clear()
         child_transformer._parent = self
         return self
 
@@ -89,6 +110,31 @@ class Transformer:
         """
         return False
 
+    def get_transformable_types(self) -> typing.Optional[typing.Tuple[type, ...]]:
+        """
+        This function returns the type(s) of object(s) this ReadBaseTransformer may be able to transform,
+        or None if this ReadBaseTransformer may be able to transform objects of any type.
+        can_be_transformed is only called for objects of (a subclass of) these type(s).
+        """
+        return None
+
+    def _get_children_for_type(self, t: type) -> typing.List["Transformer"]:
+        """
+        This function returns the child ReadBaseTransformer(s) that may be able to transform an object of the given type,
+        in the order in which they were added
+        """
+        children: typing.Optional[typing.List["Transformer"]] = (
+            self._children_by_type.get(t)
+        )
+        if children is None:
+            children = []
+            for c in self._children:
+                transformable_types = c.get_transformable_types()
+                if transformable_types is None or issubclass(t, transformable_types):
+                    children.append(c)
+            self._children_by_type[t] = children
+        return children
+
     def _is_recursive_object(self, object_to_transform) -> bool:
         try:
             p = object_to_transform
@@ -113,20 +159,34 @@ class Transformer:
         This function reads an object from a byte stream.
         The object being read depends on the implementation of ReadBaseTransformer.
         """
-        if self._is_recursive_object(object_to_transform):
+        # objects that have been transformed in place (or are being transformed) are returned as-is
+        if context is not None:
+            if id(object_to_transform) in context.transformed_objects_by_id:
+                return object_to_transform
+            context.transformed_objects_by_id[id(object_to_transform)] = (
+                object_to_transform
+            )
+        elif self._is_recursive_object(object_to_transform):
             return object_to_transform
-        for h in self._children:
-            if h.can_be_transformed(object_to_transform):
-                # print("%s<%s level='%d' invocation='%d'>" % ("   " * self.level, h.__class__.__name__, self.level, self.invocation_count), flush=True)
-                self._level += 1
-                self._invocation_count += 1
-                out = h.transform(
-                    object_to_transform,
-                    parent_object=parent_object,
-                    context=context,
-                    event_listeners=event_listeners,
-                )
-                self._level -= 1
-                # print("%s</%s>" % ("   " * self.level, h.__class__.__name__))
-                return out
-        return None
+        out: Any = None
+        try:
+            for h in self._get_children_for_type(type(object_to_transform)):
+                if h.can_be_transformed(object_to_transform):
+                    # print("%s<%s level='%d' invocation='%d'>" % ("   " * self.level, h.__class__.__name__, self.level, self.invocation_count), flush=True)
+                    self._level += 1
+                    self._invocation_count += 1
+                    out = h.transform(
+                        object_to_transform,
+                        parent_object=parent_object,
+                        context=context,
+                        event_listeners=event_listeners,
+                    )
+                    self._level -= 1
+                    # print("%s</%s>" % ("   " * self.level, h.__class__.__name__))
+                    return out
+            return None
+        finally:
+            # an object that was transformed into another object (or could not be transformed) is not kept,
+            # it is transformed again should it be encountered again
+            if context is not None and out is not object_to_transform:
+                context.transformed_objects_by_id.pop(id(object_to_transform), None)
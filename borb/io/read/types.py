@@ -295,6 +295,7 @@ class Dictionary(dict):
     def __init__(self):
         super(Dictionary, self).__init__()
         add_base_methods(self)
+        self._is_modified: bool = True
 
     def __hash__(self):
         hashcode: int = 1
@@ -305,6 +306,11 @@ class Dictionary(dict):
     def __setitem__(self, key, value):
         assert isinstance(key, Name)
         super(Dictionary, self).__setitem__(key, value)
+        self._is_modified = True
+
+    def __delitem__(self, key):
+        super(Dictionary, self).__delitem__(key)
+        self._is_modified = True
 
     def __deepcopy__(self, memodict={}):
         out = Dictionary()
@@ -312,6 +318,64 @@ class Dictionary(dict):
             out[copy.deepcopy(k, memodict)] = copy.deepcopy(v, memodict)
         return out
 
+    def __ior__(self, other):
+        super(Dictionary, self).__ior__(other)
+        self._is_modified = True
+        return self
+
+    def clear(self) -> None:
+        """
+        This function removes all entries from this Dictionary
+        """
+        super(Dictionary, self).clear()
+        self._is_modified = True
+
+    def is_modified(self) -> bool:
+        """
+        This function returns True if this Dictionary was modified since it was read.
+        A Dictionary that was not read (e.g. because it was built programmatically) is always considered to be modified.
+        """
+        return getattr(self, "_is_modified", True)
+
+    def pop(self, key, *args):
+        """
+        This function removes key from the Dictionary, and returns its value (or default, if key is not in the Dictionary)
+        """
+        if key in self:
+            self._is_modified = True
+        return super(Dictionary, self).pop(key, *args)
+
+    def popitem(self):
+        """
+        This function removes (and returns) the (key, value) pair that was last inserted into the Dictionary
+        """
+        self._is_modified = True
+        return super(Dictionary, self).popitem()
+
+    def set_is_modified(self, a_flag: bool) -> "Dictionary":
+        """
+        This function sets whether or not this Dictionary was modified since it was read.
+        This function returns self.
+        """
+        self._is_modified = a_flag
+        return self
+
+    def setdefault(self, key, default=None):
+        """
+        This function returns the value for key if key is in the Dictionary,
+        otherwise it inserts key with a value of default and returns default
+        """
+        if key not in self:
+            self._is_modified = True
+        return super(Dictionary, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        This function updates the Dictionary with the (key, value) pairs from other, overwriting existing keys
+        """
+        super(Dictionary, self).update(*args, **kwargs)
+        self._is_modified = True
+
 
 class Element(ET.Element):
     """
@@ -679,6 +743,11 @@ class List(list):
     def __init__(self):
         super(List, self).__init__()
         add_base_methods(self)
+        self._is_modified: bool = True
+
+    def __delitem__(self, index):
+        super(List, self).__delitem__(index)
+        self._is_modified = True
 
     def __hash__(self):
         hashcode: int = 1
@@ -686,6 +755,91 @@ class List(list):
             hashcode = 31 * hashcode + (0 if e is None else hash(e))
         return hashcode
 
+    def __iadd__(self, values):
+        super(List, self).__iadd__(values)
+        self._is_modified = True
+        return self
+
+    def __imul__(self, n):
+        super(List, self).__imul__(n)
+        self._is_modified = True
+        return self
+
+    def __setitem__(self, index, value):
+        super(List, self).__setitem__(index, value)
+        self._is_modified = True
+
+    def append(self, value) -> None:
+        """
+        This function appends value to the end of this List
+        """
+        super(List, self).append(value)
+        self._is_modified = True
+
+    def clear(self) -> None:
+        """
+        This function removes all values from this List
+        """
+        super(List, self).clear()
+        self._is_modified = True
+
+    def extend(self, values) -> None:
+        """
+        This function appends all values (of the given iterable) to the end of this List
+        """
+        super(List, self).extend(values)
+        self._is_modified = True
+
+    def insert(self, index, value) -> None:
+        """
+        This function inserts value before index
+        """
+        super(List, self).insert(index, value)
+        self._is_modified = True
+
+    def is_modified(self) -> bool:
+        """
+        This function returns True if this List was modified since it was read.
+        A List that was not read (e.g. because it was built programmatically) is always considered to be modified.
+        """
+        return getattr(self, "_is_modified", True)
+
+    def pop(self, *args):
+        """
+        This function removes (and returns) the value at index (default last)
+        """
+        self._is_modified = True
+        return super(List, self).pop(*args)
+
+    def remove(self, value) -> None:
+        """
+        This function removes the first occurrence of value
+        """
+        super(List, self).remove(value)
+        self._is_modified = True
+
+    def reverse(self) -> None:
+        """
+        This function reverses the values of this List (in place)
+        """
+        super(List, self).reverse()
+        self._is_modified = True
+
+    def set_is_modified(self, a_flag: bool) -> "List":
+        """
+        This function sets whether or not this List was modified since it was read.
+        This function returns self.
+        """
+        self._is_modified = a_flag
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        """
+        This function sorts the values of this List (in place)
+        """
+        super(List, self).sort(*args, **kwargs)
+        self._is_modified = True
+
 
 class Reference:
     """
@@ -767,6 +921,246 @@ class Reference:
         )
 
 
+class LazyDictionary(Dictionary):
+    """
+    When a Document is read lazily, its Dictionary objects keep their (indirect) Reference values.
+    These are resolved (and replaced) when they are first accessed, using the given function.
+    Every way of reading a value (including dict(...), update(...) and iteration over its items) resolves it,
+    objects that were read eagerly are plain Dictionary objects, and do not pay for these checks.
+    """
+
+    _lazy_reference_resolver: typing.Optional[
+        typing.Callable[[typing.Any, "Reference"], typing.Any]
+    ] = None
+
+    def __init__(
+        self,
+        lazy_reference_resolver: typing.Optional[
+            typing.Callable[[typing.Any, "Reference"], typing.Any]
+        ] = None,
+    ):
+        super(LazyDictionary, self).__init__()
+        self._lazy_reference_resolver = lazy_reference_resolver
+
+    def __eq__(self, other):
+        self._resolve_lazy_references()
+        return super(LazyDictionary, self).__eq__(other)
+
+    def __getitem__(self, key):
+        value = super(LazyDictionary, self).__getitem__(key)
+        if (
+            isinstance(value, Reference)
+            and key != "Parent"
+            and self._lazy_reference_resolver is not None
+        ):
+            resolved_value = self._lazy_reference_resolver(self, value)
+            if resolved_value is not None:
+                dict.__setitem__(self, key, resolved_value)
+                return resolved_value
+        return value
+
+    def __getstate__(self):
+        # the function that resolves Reference(s) can not be copied (or pickled),
+        # all Reference(s) are resolved instead
+        self._resolve_lazy_references()
+        state = self.__dict__.copy()
+        state["_lazy_reference_resolver"] = None
+        return state
+
+    __hash__ = Dictionary.__hash__
+
+    def __iter__(self):
+        # overriding __iter__ ensures dict(...) and update(...) read the values using __getitem__
+        return super(LazyDictionary, self).__iter__()
+
+    def __or__(self, other):
+        self._resolve_lazy_references()
+        return super(LazyDictionary, self).__or__(other)
+
+    def __ror__(self, other):
+        self._resolve_lazy_references()
+        return super(LazyDictionary, self).__ror__(other)
+
+    def _resolve_lazy_references(self) -> None:
+        for k in [x for x in dict.keys(self)]:
+            self[k]
+
+    def copy(self):
+        """
+        This function returns a shallow copy of this Dictionary
+        """
+        self._resolve_lazy_references()
+        return super(LazyDictionary, self).copy()
+
+    def get(self, key, default=None):
+        """
+        This function returns the value for key if key is in the Dictionary, else default
+        """
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        """
+        This function returns a view of the (key, value) pairs in this Dictionary
+        """
+        self._resolve_lazy_references()
+        return super(LazyDictionary, self).items()
+
+    def pop(self, key, *args):
+        """
+        This function removes key from the Dictionary, and returns its value (or default, if key is not in the Dictionary)
+        """
+        if key in self:
+            self[key]
+        return super(LazyDictionary, self).pop(key, *args)
+
+    def popitem(self):
+        """
+        This function removes (and returns) the (key, value) pair that was last inserted into the Dictionary
+        """
+        if len(self) > 0:
+            self[next(reversed(dict.keys(self)))]
+        return super(LazyDictionary, self).popitem()
+
+    def setdefault(self, key, default=None):
+        """
+        This function returns the value for key if key is in the Dictionary,
+        otherwise it inserts key with a value of default and returns default
+        """
+        if key in self:
+            return self[key]
+        return super(LazyDictionary, self).setdefault(key, default)
+
+    def values(self):
+        """
+        This function returns a view of the values in this Dictionary
+        """
+        self._resolve_lazy_references()
+        return super(LazyDictionary, self).values()
+
+
+class LazyList(List):
+    """
+    When a Document is read lazily, its List objects keep their (indirect) Reference values.
+    These are resolved (and replaced) when they are first accessed, using the given function.
+    Every way of reading a value (including iteration, in, index and slicing) resolves it,
+    objects that were read eagerly are plain List objects, and do not pay for these checks.
+    """
+
+    _lazy_reference_resolver: typing.Optional[
+        typing.Callable[[typing.Any, "Reference"], typing.Any]
+    ] = None
+
+    def __init__(
+        self,
+        lazy_reference_resolver: typing.Optional[
+            typing.Callable[[typing.Any, "Reference"], typing.Any]
+        ] = None,
+    ):
+        super(LazyList, self).__init__()
+        self._lazy_reference_resolver = lazy_reference_resolver
+
+    def __add__(self, other):
+        self._resolve_lazy_references()
+        return super(LazyList, self).__add__(other)
+
+    def __contains__(self, value):
+        self._resolve_lazy_references()
+        return super(LazyList, self).__contains__(value)
+
+    def __eq__(self, other):
+        self._resolve_lazy_references()
+        return super(LazyList, self).__eq__(other)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._resolve_lazy_references()
+            return super(LazyList, self).__getitem__(index)
+        value = super(LazyList, self).__getitem__(index)
+        if isinstance(value, Reference) and self._lazy_reference_resolver is not None:
+            resolved_value = self._lazy_reference_resolver(self, value)
+            if resolved_value is not None:
+                list.__setitem__(self, index, resolved_value)
+                return resolved_value
+        return value
+
+    def __getstate__(self):
+        # the function that resolves Reference(s) can not be copied (or pickled),
+        # all Reference(s) are resolved instead
+        self._resolve_lazy_references()
+        state = self.__dict__.copy()
+        state["_lazy_reference_resolver"] = None
+        return state
+
+    __hash__ = List.__hash__
+
+    def __iter__(self):
+        self._resolve_lazy_references()
+        return super(LazyList, self).__iter__()
+
+    def __mul__(self, n):
+        self._resolve_lazy_references()
+        return super(LazyList, self).__mul__(n)
+
+    def __radd__(self, other):
+        self._resolve_lazy_references()
+        return list.__add__(other, self)
+
+    def __reversed__(self):
+        self._resolve_lazy_references()
+        return super(LazyList, self).__reversed__()
+
+    __rmul__ = __mul__
+
+    def _resolve_lazy_references(self) -> None:
+        for i in range(0, len(self)):
+            self[i]
+
+    def copy(self):
+        """
+        This function returns a shallow copy of this List
+        """
+        self._resolve_lazy_references()
+        return super(LazyList, self).copy()
+
+    def count(self, value) -> int:
+        """
+        This function returns the number of occurrences of value
+        """
+        self._resolve_lazy_references()
+        return super(LazyList, self).count(value)
+
+    def index(self, value, *args) -> int:
+        """
+        This function returns the index of the first occurrence of value
+        """
+        self._resolve_lazy_references()
+        return super(LazyList, self).index(value, *args)
+
+    def pop(self, *args):
+        """
+        This function removes (and returns) the value at index (default last)
+        """
+        if len(self) > 0:
+            self[args[0] if len(args) > 0 else -1]
+        return super(LazyList, self).pop(*args)
+
+    def remove(self, value) -> None:
+        """
+        This function removes the first occurrence of value
+        """
+        self._resolve_lazy_references()
+        super(LazyList, self).remove(value)
+
+    def sort(self, *args, **kwargs) -> None:
+        """
+        This function sorts the values of this List (in place)
+        """
+        self._resolve_lazy_references()
+        super(LazyList, self).sort(*args, **kwargs)
+
+
 AnyPDFType = Union[
     Boolean,
     CanvasOperatorName,
@@ -15,6 +15,7 @@ from borb.io.write.document.document_transformer import DocumentTransformer
 from borb.io.write.document.information_dictionary_transformer import (
     InformationDictionaryTransformer,
 )
+from borb.io.write.font.font_transformer import FontTransformer
 from borb.io.write.image.image_transformer import ImageTransformer
 from borb.io.write.object.array_transformer import ArrayTransformer
 from borb.io.write.object.dictionary_transformer import DictionaryTransformer
@@ -48,6 +49,7 @@ class AnyObjectTransformer(Transformer):
         self.add_child_transformer(PagesTransformer())
         self.add_child_transformer(PageTransformer())
         self.add_child_transformer(InformationDictionaryTransformer())
+        self.add_child_transformer(FontTransformer())
         # object types
         self.add_child_transformer(ArrayTransformer())
         self.add_child_transformer(StreamTransformer())
@@ -4,6 +4,7 @@
 """
 This implementation of WriteBaseTransformer is responsible for writing ASCII art in every PDF
 """
+import typing
 from pathlib import Path
 from typing import Optional
 
@@ -27,6 +28,12 @@ class ASCIIArtTransformer(Transformer):
         """
         return isinstance(any, Stream) and not self._has_been_used
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Stream,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
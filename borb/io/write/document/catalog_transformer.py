@@ -5,6 +5,7 @@
 This implementation of WriteBaseTransformer is responsible for writing /Catalog Dictionary objects
 """
 import logging
+import typing
 import zlib
 from pathlib import Path
 from typing import Optional
@@ -41,6 +42,12 @@ class CatalogTransformer(DictionaryTransformer):
     # /OutputIntents
     #
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Dictionary,)
+
     def _build_rgb_outputintent_dictionary(self, root_dictionary: dict) -> None:
 
         # TODO check if exists already
@@ -27,9 +27,14 @@ class DocumentTransformer(Transformer):
         """
         return isinstance(any, Document)
 
-    def _build_empty_document_info_dictionary(
-        self, object_to_transform: Dictionary
-    ) -> None:
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Document,)
+
+    @staticmethod
+    def _build_empty_document_info_dictionary(object_to_transform: Dictionary) -> None:
         # create Info dictionary if needed
         if "Info" not in object_to_transform["XRef"]["Trailer"]:
             object_to_transform["XRef"]["Trailer"][Name("Info")] = Dictionary()
@@ -49,14 +54,46 @@ class DocumentTransformer(Transformer):
         assert context is not None
         assert context.destination is not None
 
+        # an incremental update is appended to the original bytes (which already have a header)
+        # objects that were read keep their Reference(s), (lazy) Reference(s) that were never accessed need not be resolved
+        # an incremental update refers to the (most recent) cross-reference section that was read (by means of /Prev)
+        if context.incremental_update:
+            assert (
+                "XRef" in object_to_transform
+                and object_to_transform["XRef"]._start_of_xref is not None
+            ), "An incremental update can only be written for a Document that was read with a valid cross-reference section, write this Document in full instead."
+            context.destination.write(b"\n")
+        else:
+            DocumentTransformer.write_header(context)
+
+            # a Document that was read lazily may still contain Reference(s) that were never accessed
+            DocumentTransformer._resolve_all_references(object_to_transform)
+
+            # invalidate all references
+            DocumentTransformer._invalidate_all_references(object_to_transform)
+
+        # set /ID, /Info
+        DocumentTransformer.build_trailer(object_to_transform)
+
+        # transform XREF
+        self.get_root_transformer().transform(object_to_transform["XRef"], context)
+
+    @staticmethod
+    def write_header(context: WriteTransformerState) -> None:
+        """
+        This function writes the PDF header (the version and a comment with binary characters) to the destination
+        """
+        assert context.destination is not None
         context.destination.write(b"%PDF-1.7\n")
         context.destination.write(b"%")
         context.destination.write(bytes([226, 227, 207, 211]))
         context.destination.write(b"\n")
 
-        # invalidate all references
-        DocumentTransformer._invalidate_all_references(object_to_transform)
-
+    @staticmethod
+    def build_trailer(object_to_transform: Dictionary) -> None:
+        """
+        This function sets the /ID and (if needed) an empty /Info Dictionary in the trailer of a Document
+        """
         # set /ID
         random_id = HexadecimalString("%032x" % random.randrange(16 ** 32))
         if "ID" not in object_to_transform["XRef"]["Trailer"]:
@@ -70,20 +107,36 @@ class DocumentTransformer(Transformer):
         object_to_transform["XRef"]["Trailer"]["ID"].set_can_be_referenced(False)
 
         # /Info
-        self._build_empty_document_info_dictionary(object_to_transform)
+        DocumentTransformer._build_empty_document_info_dictionary(object_to_transform)
 
-        # transform XREF
-        self.get_root_transformer().transform(object_to_transform["XRef"], context)
+    @staticmethod
+    def _resolve_all_references(object: AnyPDFType) -> None:
+        # iterating over a List or Dictionary resolves its (lazy) Reference(s)
+        # this needs to happen before any Reference is invalidated
+        objects_done: typing.Set[int] = set()
+        objects_todo: typing.List[AnyPDFType] = [object]
+        while len(objects_todo) > 0:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done:
+                continue
+            objects_done.add(id(obj))
+            if isinstance(obj, List):
+                objects_todo.extend([v for v in obj])
+                continue
+            if isinstance(obj, Dictionary):
+                objects_todo.extend([v for v in obj.values()])
+                continue
 
     @staticmethod
     def _invalidate_all_references(object: AnyPDFType) -> None:
-        objects_done: typing.List[AnyPDFType] = []
+        # objects are tracked by id, (deep) comparing every object to all objects seen so far is quadratic
+        objects_done: typing.Set[int] = set()
         objects_todo: typing.List[AnyPDFType] = [object]
         while len(objects_todo) > 0:
-            obj = objects_todo.pop(0)
-            if obj in objects_done:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done:
                 continue
-            objects_done.append(obj)
+            objects_done.add(id(obj))
             try:
                 obj.set_reference(None)  # type: ignore [union-attr]
             except Exception as ex:
@@ -46,6 +46,12 @@ class InformationDictionaryTransformer(Transformer):
     # XMP
     #
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Dictionary,)
+
     def _consolidate_xmp_and_info_dictionary(self, document: Document) -> Dictionary:
         new_info_dictionary: Dictionary = Dictionary()
 
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This implementation of WriteBaseTransformer is responsible for writing Font objects
+that keep track of the characters that are used (e.g. those built by TrueTypeFont.true_type_font_from_file).
+These are subset (to the characters that are used) when they are written.
+"""
+import logging
+import typing
+from typing import Optional
+
+from borb.io.read.types import AnyPDFType, Dictionary, Reference
+from borb.io.write.object.dictionary_transformer import DictionaryTransformer
+from borb.io.write.transformer import WriteTransformerState
+from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+
+logger = logging.getLogger(__name__)
+
+
+class FontTransformer(DictionaryTransformer):
+    """
+    This implementation of WriteBaseTransformer is responsible for writing Font objects
+    that keep track of the characters that are used (e.g. those built by TrueTypeFont.true_type_font_from_file).
+    These are subset (to the characters that are used) when they are written.
+    """
+
+    def can_be_transformed(self, any: AnyPDFType):
+        """
+        This function returns True if the object to be converted represents a Font that keeps track of the characters that are used
+        """
+        return isinstance(any, Font) and any._used_character_identifiers is not None
+
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Font,)
+
+    def transform(
+        self,
+        object_to_transform: AnyPDFType,
+        context: Optional[WriteTransformerState] = None,
+    ):
+        """
+        This method writes a (subset) Font to a byte stream
+        """
+        assert isinstance(object_to_transform, Font)
+        assert (
+            context is not None
+        ), "A WriteTransformerState must be defined in order to write Font objects."
+
+        # avoid subsetting fonts twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if (
+            not context.subset_fonts
+            or object_ref is not None
+            and object_ref in context.resolved_references
+        ):
+            return super(FontTransformer, self).transform(object_to_transform, context)
+
+        # build subset
+        # the subset takes the place (Reference) of the Font
+        subset_font: Dictionary = TrueTypeFont._get_subset_font(object_to_transform)
+        subset_font.set_reference(object_ref)  # type: ignore [attr-defined]
+        logger.debug(
+            "subset font %s to %d character(s)"
+            % (
+                object_to_transform.get_font_name(),
+                len(object_to_transform._used_character_identifiers or []),
+            )
+        )
+
+        # delegate to super
+        return super(FontTransformer, self).transform(subset_font, context)
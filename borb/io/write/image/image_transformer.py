@@ -27,6 +27,12 @@ class ImageTransformer(Transformer):
         """
         return isinstance(any, PILImage.Image)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (PILImage.Image,)
+
     def _convert_to_rgb_mode(self, image: PILImage.Image) -> PILImage.Image:
 
         # build image_out
@@ -65,6 +71,11 @@ class ImageTransformer(Transformer):
         assert context.destination is not None
         assert isinstance(object_to_transform, PILImage.Image)
 
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if object_ref is not None and object_ref in context.resolved_references:
+            return
+
         # get image bytes
         contents: typing.Optional[bytes] = None
         filter_name: Optional[Name] = None
@@ -27,6 +27,12 @@ class ArrayTransformer(Transformer):
         """
         return isinstance(any, List)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (List,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -77,7 +83,7 @@ class ArrayTransformer(Transformer):
             if object_ref.object_number is not None and object_ref.byte_offset is None:
                 started_object = True
                 self._start_object(object_to_transform, context)
-            context.resolved_references.append(object_ref)
+            context.resolved_references.add(object_ref)
 
         # write dictionary at current location
         context.destination.write(bytes("[", "latin1"))
@@ -28,6 +28,12 @@ class StreamTransformer(Transformer):
         """
         return isinstance(any, Stream)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Stream,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -60,16 +66,27 @@ class StreamTransformer(Transformer):
             if object_ref.object_number is not None and object_ref.byte_offset is None:
                 started_object = True
                 self._start_object(object_to_transform, context)
-            context.resolved_references.append(object_ref)
+            context.resolved_references.add(object_ref)
 
         # build stream dictionary
         stream_dictionary = Dictionary()
 
+        # a Stream that was not modified (since it was read) still has valid /Bytes,
+        # these are written as-is (along with its /Filter and /DecodeParms)
+        # other Streams (and Streams that were never compressed) are (re-)compressed from their /DecodedBytes
+        is_recompressed: bool = "DecodedBytes" in object_to_transform and (
+            object_to_transform.is_modified()
+            or context.compression_level == 0
+            or "Bytes" not in object_to_transform
+        )
+
         # objects to turn into reference
         queue: typing.List[AnyPDFType] = []
         for k, v in object_to_transform.items():
             if k in ["Bytes", "DecodedBytes"]:
                 continue
+            if k == "DecodeParms" and is_recompressed:
+                continue
             if (
                 isinstance(v, Dictionary)
                 or isinstance(v, List)
@@ -85,17 +102,18 @@ class StreamTransformer(Transformer):
             stream_dictionary.pop(Name("Filter"))
 
         # handle compression
-        if "DecodedBytes" in object_to_transform:
+        if is_recompressed:
             if context.compression_level == 0:
                 bts = object_to_transform["DecodedBytes"]
             else:
                 bts = zlib.compress(
                     object_to_transform["DecodedBytes"], context.compression_level
                 )
-            stream_dictionary[Name("Length")] = bDecimal(len(bts))
+                stream_dictionary[Name("Filter")] = Name("FlateDecode")
         else:
             assert "Bytes" in object_to_transform
             bts = object_to_transform["Bytes"]
+        stream_dictionary[Name("Length")] = bDecimal(len(bts))
 
         # write stream dictionary
         self.get_root_transformer().transform(stream_dictionary, context)
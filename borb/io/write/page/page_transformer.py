@@ -6,6 +6,7 @@ This implementation of WriteBaseTransformer is responsible
 for writing Dictionary objects of /Type /Page
 """
 import logging
+import typing
 from typing import Optional
 
 from borb.io.read.types import AnyPDFType, Dictionary, Name
@@ -28,6 +29,12 @@ class PageTransformer(DictionaryTransformer):
         """
         return isinstance(any, Dictionary) and "Type" in any and any["Type"] == "Page"
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Dictionary,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -28,6 +28,12 @@ class PagesTransformer(DictionaryTransformer):
         """
         return isinstance(any, Dictionary) and "Type" in any and any["Type"] == "Pages"
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Dictionary,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -45,9 +51,12 @@ class PagesTransformer(DictionaryTransformer):
         object_to_transform[Name("Kids")].set_can_be_referenced(False)  # type: ignore [attr-defined]
 
         # queue writing of /Page objects
-        queue: typing.List[AnyPDFType] = []
+        # /Page objects that were written already (e.g. by a StreamingPDFWriter) are kept as a Reference
+        queue: typing.List[typing.Tuple[int, AnyPDFType]] = []
         for i, k in enumerate(object_to_transform["Kids"]):
-            queue.append(k)
+            if isinstance(k, Reference):
+                continue
+            queue.append((i, k))
             ref: Reference = self.get_reference(k, context)
             object_to_transform["Kids"][i] = ref
 
@@ -55,9 +64,9 @@ class PagesTransformer(DictionaryTransformer):
         super(PagesTransformer, self).transform(object_to_transform, context)
 
         # write /Page objects
-        for p in queue:
+        for _, p in queue:
             self.get_root_transformer().transform(p, context)
 
         # restore /Kids
-        for i, k in enumerate(queue):
+        for i, k in queue:
             object_to_transform["Kids"][i] = k
@@ -4,6 +4,7 @@
 """
 This implementation of WriteBaseTransformer is responsible for writing Name objects
 """
+import typing
 from typing import Optional
 
 from borb.io.read.types import AnyPDFType, Name
@@ -21,6 +22,12 @@ class NameTransformer(Transformer):
         """
         return isinstance(any, Name)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Name,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -4,6 +4,7 @@
 """
 This implementation of WriteBaseTransformer is responsible for writing Decimal objects
 """
+import typing
 from typing import Optional
 
 from borb.io.read.types import AnyPDFType, Decimal
@@ -21,6 +22,12 @@ class NumberTransformer(Transformer):
         """
         return isinstance(any, Decimal)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Decimal,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -4,6 +4,7 @@
 """
 This implementation of WriteBaseTransformer is responsible for writing String objects
 """
+import typing
 from typing import Optional
 
 from borb.io.read.types import AnyPDFType, HexadecimalString, String
@@ -21,6 +22,12 @@ class StringTransformer(Transformer):
         """
         return isinstance(any, String) or isinstance(any, HexadecimalString)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (String, HexadecimalString)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
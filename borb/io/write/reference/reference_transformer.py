@@ -4,6 +4,7 @@
 """
 This implementation of WriteBaseTransformer is responsible for writing References
 """
+import typing
 from typing import Optional
 
 from borb.io.read.types import AnyPDFType, Reference
@@ -21,6 +22,12 @@ class ReferenceTransform(Transformer):
         """
         return isinstance(any, Reference)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (Reference,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
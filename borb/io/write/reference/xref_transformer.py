@@ -5,9 +5,21 @@
 This implementation of WriteBaseTransformer is responsible for writing XREF objects
 """
 import typing
+import weakref
+import xml.etree.ElementTree as ET
 from typing import Optional
 
-from borb.io.read.types import AnyPDFType, Decimal, Dictionary, Name, Reference
+from PIL.Image import Image  # type: ignore [import]
+
+from borb.io.read.types import (
+    AnyPDFType,
+    Decimal,
+    Dictionary,
+    List,
+    Name,
+    Reference,
+    Stream,
+)
 from borb.io.write.transformer import Transformer, WriteTransformerState
 from borb.pdf.xref.xref import XREF
 
@@ -23,6 +35,12 @@ class XREFTransformer(Transformer):
         """
         return isinstance(any, XREF)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (XREF,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -39,6 +57,13 @@ class XREFTransformer(Transformer):
         ), "A WriteTransformerState must be defined in order to write XREF objects."
         assert context.destination is not None
 
+        # determine which objects need to be written in an incremental update
+        modified_objects: typing.List[AnyPDFType] = []
+        if context.incremental_update:
+            modified_objects = self._prepare_incremental_update(
+                object_to_transform, context
+            )
+
         # Transform the Trailer dictionary (replacing objects by references)
         # we do this upfront because the normal write_dictionary_transformer will write the dictionary first,
         # and the references afterwards. This would cause the /Trailer dictionary to not be the last.
@@ -70,6 +95,10 @@ class XREFTransformer(Transformer):
         if "ID" in object_to_transform["Trailer"]:
             trailer_out[Name("ID")] = object_to_transform["Trailer"]["ID"]
 
+        # /Prev
+        if context.incremental_update:
+            trailer_out[Name("Prev")] = Decimal(object_to_transform._start_of_xref)
+
         # write /Info object
         if "Info" in object_to_transform["Trailer"]:
             self.get_root_transformer().transform(
@@ -81,6 +110,147 @@ class XREFTransformer(Transformer):
             object_to_transform["Trailer"]["Root"], context
         )
 
+        # write (other) modified objects
+        for obj in modified_objects:
+            self.get_root_transformer().transform(obj, context)
+
+        # write /XRef stream (rather than /XREF and /Trailer)
+        start_of_xref: int = 0
+        if context.use_object_streams:
+            start_of_xref = self._write_xref_stream(trailer_out, context)
+        else:
+            start_of_xref = self._write_xref_table(trailer_out, context)
+
+        # (later) incremental updates build on this one
+        if context.incremental_update:
+            self._end_incremental_update(
+                object_to_transform, trailer_out, start_of_xref, context
+            )
+
+    def _end_incremental_update(
+        self,
+        xref: XREF,
+        trailer_out: Dictionary,
+        start_of_xref: int,
+        context: WriteTransformerState,
+    ) -> None:
+        """
+        This function updates the Document after an incremental update was written,
+        so that it matches the bytes that were written. All objects that were written are no longer modified.
+        """
+        xref._start_of_xref = start_of_xref
+        xref["Trailer"][Name("Size")] = trailer_out["Size"]
+        objects_done: typing.Set[int] = set()
+        objects_todo: typing.List[AnyPDFType] = [
+            x for x in context.indirect_objects_by_id.values()
+        ]
+        while len(objects_todo) > 0:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done:
+                continue
+            objects_done.add(id(obj))
+            if not isinstance(obj, (Dictionary, List)):
+                continue
+            obj.set_is_modified(False)
+            children = (
+                dict.values(obj) if isinstance(obj, Dictionary) else list.__iter__(obj)
+            )
+            objects_todo.extend(
+                [
+                    x
+                    for x in children
+                    if isinstance(x, (Dictionary, List))
+                    and x.get_reference() is None  # type: ignore [attr-defined]
+                ]
+            )
+
+    def _prepare_incremental_update(
+        self, xref: XREF, context: WriteTransformerState
+    ) -> typing.List[AnyPDFType]:
+        """
+        This function prepares the WriteTransformerState to write an incremental update,
+        and returns the (indirect) objects that need to be written.
+        An (indirect) object needs to be written if it (or any of its direct objects) was modified since it was read.
+        It is then written under its original object number. All other objects that were read keep their Reference,
+        and are not written. New objects are numbered from /Size onwards.
+        """
+        trailer: Dictionary = xref["Trailer"]
+        info: typing.Optional[AnyPDFType] = trailer.get("Info")
+        root: typing.Optional[AnyPDFType] = trailer.get("Root")
+        context.next_object_number = max(
+            context.next_object_number, int(trailer.get("Size", Decimal(0)))
+        )
+
+        # traverse all objects that were read (without resolving lazy Reference(s)),
+        # keeping track of the (indirect) object that every (direct) object belongs to
+        objects_done: typing.Set[int] = set()
+        objects_todo: typing.List[typing.Tuple[AnyPDFType, AnyPDFType]] = [
+            (trailer, None)
+        ]
+        indirect_objects: typing.List[AnyPDFType] = []
+        modified_objects: typing.Dict[int, AnyPDFType] = {}
+        while len(objects_todo) > 0:
+            obj, owner = objects_todo.pop()
+            if id(obj) in objects_done:
+                continue
+            objects_done.add(id(obj))
+            if not isinstance(obj, (Dictionary, List, Image, ET.Element)):
+                continue
+            if obj.get_reference() is not None:  # type: ignore [union-attr]
+                indirect_objects.append(obj)
+                owner = obj
+            if not isinstance(obj, (Dictionary, List)):
+                continue
+            if obj.is_modified() and owner is not None:
+                modified_objects[id(owner)] = owner
+            if isinstance(obj, Dictionary):
+                objects_todo.extend([(v, owner) for v in dict.values(obj)])
+            else:
+                objects_todo.extend([(v, owner) for v in list.__iter__(obj)])
+
+        # the /Info Dictionary is always written (its /ModDate changes),
+        # the /Catalog is written if it needs to refer to new XMP /Metadata or /OutputIntents
+        if isinstance(info, Dictionary) and info.get_reference() is not None:  # type: ignore [attr-defined]
+            modified_objects[id(info)] = info
+        if (
+            isinstance(root, Dictionary)
+            and root.get_reference() is not None  # type: ignore [attr-defined]
+            and ("Metadata" in root or context.conformance_level is not None)
+        ):
+            modified_objects[id(root)] = root
+
+        # modified objects are written under their original object number,
+        # unmodified objects are considered to have been written already
+        for obj in indirect_objects:
+            ref: Reference = obj.get_reference()  # type: ignore [union-attr]
+            context.structural_digests_by_id[id(obj)] = (
+                weakref.ref(obj),
+                Transformer._get_leaf_bytes(ref),
+            )
+            if id(obj) in modified_objects:
+                obj.set_reference(  # type: ignore [union-attr]
+                    Reference(
+                        object_number=ref.object_number,
+                        generation_number=ref.generation_number,
+                    )
+                )
+                context.indirect_objects_by_id[id(obj)] = obj
+            else:
+                context.resolved_references.add(ref)
+
+        # return
+        # the /Info Dictionary and the /Catalog are (always) written separately
+        return [x for x in modified_objects.values() if x is not info and x is not root]
+
+    def _write_xref_table(
+        self, trailer_out: Dictionary, context: WriteTransformerState
+    ) -> int:
+        """
+        This function writes a cross-reference table (and the trailer),
+        it returns the byte offset of the cross-reference table
+        """
+        assert context.destination is not None
+
         # write /XREF
         start_of_xref = context.destination.tell()
         context.destination.write(bytes("xref\n", "latin1"))
@@ -91,7 +261,12 @@ class XREFTransformer(Transformer):
             for r in section:
                 if r.is_in_use:
                     context.destination.write(
-                        bytes("{0:010d} 00000 n\r\n".format(r.byte_offset), "latin1")
+                        bytes(
+                            "{0:010d} {1:05d} n\r\n".format(
+                                r.byte_offset, r.generation_number or 0
+                            ),
+                            "latin1",
+                        )
                     )
                 else:
                     context.destination.write(
@@ -99,9 +274,7 @@ class XREFTransformer(Transformer):
                     )
 
         # update /Size
-        trailer_out[Name("Size")] = Decimal(
-            sum([len(v) for k, v in context.indirect_objects_by_hash.items()]) + 1
-        )
+        trailer_out[Name("Size")] = Decimal(context.next_object_number)
 
         # write /Trailer
         context.destination.write(bytes("trailer\n", "latin1"))
@@ -114,6 +287,93 @@ class XREFTransformer(Transformer):
         # write EOF
         context.destination.write(bytes("%%EOF", "latin1"))
 
+        # return
+        return start_of_xref
+
+    def _write_xref_stream(
+        self, trailer_out: Dictionary, context: WriteTransformerState
+    ) -> int:
+        """
+        This function writes a cross-reference stream (/Type /XRef),
+        which takes the place of both the cross-reference table and the trailer,
+        it returns the byte offset of the cross-reference stream
+        """
+        assert context.destination is not None
+
+        # write the remaining objects in an object stream
+        self._write_object_stream(context)
+
+        # the cross-reference stream is an indirect object itself
+        xref_stream: Stream = Stream()
+        xref_stream_reference: Reference = Reference(
+            object_number=context.next_object_number
+        )
+        context.next_object_number += 1
+        xref_stream.set_reference(xref_stream_reference)  # type: ignore [attr-defined]
+        context.indirect_objects_by_id[id(xref_stream)] = xref_stream
+        start_of_xref: int = context.destination.tell()
+
+        # build entries (type, field 2, field 3)
+        sections = self._section_xref(context)
+        entries: typing.List[typing.Tuple[int, int, int]] = []
+        for section in sections:
+            for r in section:
+                if not r.is_in_use:
+                    entries.append((0, 0, r.generation_number or 0))
+                elif r.parent_stream_object_number is not None:
+                    assert r.index_in_parent_stream is not None
+                    entries.append(
+                        (2, r.parent_stream_object_number, r.index_in_parent_stream)
+                    )
+                elif r is xref_stream_reference:
+                    entries.append((1, start_of_xref, 0))
+                else:
+                    assert r.byte_offset is not None
+                    entries.append((1, r.byte_offset, r.generation_number or 0))
+
+        # determine /W
+        field_2_width: int = max(
+            1, (max([x[1] for x in entries]).bit_length() + 7) // 8
+        )
+        widths: typing.List[int] = [1, field_2_width, 2]
+
+        # build stream
+        xref_stream[Name("Type")] = Name("XRef")
+        xref_stream[Name("Size")] = Decimal(context.next_object_number)
+        trailer_out[Name("Size")] = xref_stream["Size"]
+        xref_stream[Name("Index")] = List().set_can_be_referenced(False)  # type: ignore [attr-defined]
+        for section in sections:
+            assert section[0].object_number is not None
+            xref_stream["Index"].append(Decimal(section[0].object_number))
+            xref_stream["Index"].append(Decimal(len(section)))
+        xref_stream[Name("W")] = List().set_can_be_referenced(False)  # type: ignore [attr-defined]
+        for w in widths:
+            xref_stream["W"].append(Decimal(w))
+        for k in ["Root", "Info", "ID", "Prev"]:
+            if k in trailer_out:
+                xref_stream[Name(k)] = trailer_out[k]
+        xref_stream[Name("DecodedBytes")] = b"".join(
+            [
+                t.to_bytes(widths[0], "big")
+                + f2.to_bytes(widths[1], "big")
+                + f3.to_bytes(widths[2], "big")
+                for t, f2, f3 in entries
+            ]
+        )
+
+        # write /XRef stream
+        self.get_root_transformer().transform(xref_stream, context)
+        context.destination.write(bytes("startxref\n", "latin1"))
+
+        # write byte offset of the cross-reference stream
+        context.destination.write(bytes(str(start_of_xref) + "\n", "latin1"))
+
+        # write EOF
+        context.destination.write(bytes("%%EOF", "latin1"))
+
+        # return
+        return start_of_xref
+
     def _section_xref(self, context: Optional[WriteTransformerState] = None):
         assert (
             context is not None
@@ -121,11 +381,9 @@ class XREFTransformer(Transformer):
 
         # get all references
         indirect_objects: typing.List[AnyPDFType] = [
-            item
-            for sublist in [v for k, v in context.indirect_objects_by_hash.items()]
-            for item in sublist
+            v for v in context.indirect_objects_by_id.values()
         ]
-        references: typing.List[Reference] = []
+        references: typing.List[Reference] = [x for x in context.released_references]
         for obj in indirect_objects:
             ref = obj.get_reference()  # type: ignore [union-attr]
             if ref is not None:
@@ -4,12 +4,30 @@
 This class is the base implementation of a transformer pattern.
 It reads bytes from a PDF document, and converts it to JSON-like datastructures.
 """
+import hashlib
 import io
 import typing
+import weakref
+import xml.etree.ElementTree as ET
+from decimal import Decimal
 from typing import Optional
 
-from borb.io.read.types import AnyPDFType, Reference
+from PIL.Image import Image  # type: ignore [import]
+
+from borb.io.read.types import (
+    AnyPDFType,
+    Boolean,
+    CanvasOperatorName,
+    Dictionary,
+    List,
+    Name,
+    Reference,
+    Stream,
+    String,
+)
+from borb.io.read.types import Decimal as bDecimal
 from borb.io.write.conformance_level import ConformanceLevel
+from borb.pdf.canvas.font.font import Font
 
 
 class WriteTransformerState:
@@ -17,26 +35,42 @@ class WriteTransformerState:
     This class represents all the meta-information used in the process of persisting a PDF document.
     This includes:
     - the root object (the Document itself)
-    - a cache of indirect objects (by id and hash)
+    - a cache of indirect objects (by id, hash and structural digest)
     - references that have been resolved (to avoid endless loops)
     - the default compression level
     - etc
     """
 
+    # this is the maximum number of objects that is written in a single object stream
+    MAX_NUMBER_OF_OBJECTS_IN_OBJECT_STREAM: int = 100
+
     def __init__(
         self,
         destination: Optional[typing.Union[io.BufferedIOBase, io.RawIOBase]] = None,
         root_object: Optional[AnyPDFType] = None,
         conformance_level: typing.Optional[ConformanceLevel] = None,
+        use_object_streams: bool = False,
+        incremental_update: bool = False,
+        subset_fonts: bool = True,
     ):
         # fmt: off
         self.destination = destination                                                      # this is the destination to write to (file, byte-buffer, etc)
         self.root_object: Optional[AnyPDFType] = root_object                                # this is the root object (PDF)
         self.indirect_objects_by_id: typing.Dict[int, AnyPDFType] = {}                      # these are the indirect objects (by id)
         self.indirect_objects_by_hash: typing.Dict[int, typing.List[AnyPDFType]] = {}       # these are the indirect objects (by hash)
-        self.resolved_references: typing.List[Reference] = []                               # these references have already been written
+        self.indirect_objects_by_digest: typing.Dict[bytes, Reference] = {}                 # these are the References of the indirect objects (by structural digest)
+        self.structural_digests_by_id: typing.Dict[int, typing.Tuple[weakref.ReferenceType, typing.Optional[bytes]]] = {}   # these are the (memoized) structural digests (by id), along with a weak reference to check the id still refers to the same object
+        self.next_object_number: int = 1                                                    # this is the object number of the next (new) indirect object
+        self.resolved_references: typing.Set[Reference] = set()                             # these references have already been written
         self.compression_level: int = 9                                                     # default compression level
         self.conformance_level: typing.Optional[ConformanceLevel] = conformance_level       # default conformance level
+        self.use_object_streams: bool = use_object_streams                                  # whether (non-stream) objects are written in (compressed) object streams
+        self.object_stream_reference: typing.Optional[Reference] = None                     # this is the Reference of the object stream that is being built
+        self.object_stream_objects: typing.List[typing.Tuple[int, bytes]] = []              # these are the (object number, bytes) of the objects in that object stream
+        self.object_stream_destination = None                                               # this is the destination to restore once an object has been written to the object stream
+        self.incremental_update: bool = incremental_update                                  # whether only the objects that were added (or modified) since the Document was read are written
+        self.released_references: typing.List[Reference] = []                               # these are the References of indirect objects that were written, and are no longer kept in indirect_objects_by_id
+        self.subset_fonts: bool = subset_fonts                                              # whether fonts that keep track of the characters that are used are subset (to those characters)
         # fmt: on
 
 
@@ -47,8 +81,13 @@ class Transformer:
     such as persisting Image objects, or Dictionary objects, etc.
     """
 
+    # this is the structural digest of an object that never shares a Reference with another (identical) object
+    # (e.g. an annotation) or that refers to such an object (e.g. the /Annots of a /Page)
+    NEVER_SHARED_DIGEST: bytes = b""
+
     def __init__(self):
         self._handlers: typing.List["Transformer"] = []
+        self._handlers_by_type: typing.Dict[type, typing.List["Transformer"]] = {}
         self._parent: typing.Optional["Transformer"] = None
 
     def add_child_transformer(
@@ -63,6 +102,7 @@ class Transformer:
         This function returns self.
         """
         self._handlers.append(handler)
+        self._handlers_by_type.clear()
         handler._parent = self
         return self
 
@@ -85,6 +125,31 @@ class Transformer:
         """
         return False
 
+    def get_transformable_types(self) -> typing.Optional[typing.Tuple[type, ...]]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform,
+        or None if this WriteBaseTransformer may be able to transform objects of any type.
+        can_be_transformed is only called for objects of (a subclass of) these type(s).
+        """
+        return None
+
+    def _get_handlers_for_type(self, t: type) -> typing.List["Transformer"]:
+        """
+        This function returns the child WriteBaseTransformer(s) that may be able to transform an object of the given type,
+        in the order in which they were added
+        """
+        handlers: typing.Optional[typing.List["Transformer"]] = (
+            self._handlers_by_type.get(t)
+        )
+        if handlers is None:
+            handlers = []
+            for h in self._handlers:
+                transformable_types = h.get_transformable_types()
+                if transformable_types is None or issubclass(t, transformable_types):
+                    handlers.append(h)
+            self._handlers_by_type[t] = handlers
+        return handlers
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -95,7 +160,7 @@ class Transformer:
         """
         # transform object
         return_value = None
-        for h in self._handlers:
+        for h in self._get_handlers_for_type(type(object_to_transform)):
             if h.can_be_transformed(object_to_transform):
                 return_value = h.transform(
                     object_to_transform,
@@ -125,6 +190,25 @@ class Transformer:
         ref = object_to_transform.get_reference()  # type: ignore [union-attr]
         assert ref is not None
         assert isinstance(ref, Reference)
+
+        # write object in object stream
+        if self._can_be_written_in_object_stream(object_to_transform, context):
+            if context.object_stream_reference is None:
+                context.object_stream_reference = Reference(
+                    object_number=context.next_object_number
+                )
+                context.next_object_number += 1
+                context.object_stream_objects = []
+            # the byte offset of an object in an object stream is its offset in the (decoded) object stream
+            ref.byte_offset = sum([len(x[1]) for x in context.object_stream_objects])
+            ref.parent_stream_object_number = (
+                context.object_stream_reference.object_number
+            )
+            ref.index_in_parent_stream = len(context.object_stream_objects)
+            context.object_stream_destination = context.destination
+            context.destination = io.BytesIO()
+            return
+
         ref.byte_offset = byte_offset
 
         # write <object number> <generation number> obj
@@ -144,11 +228,88 @@ class Transformer:
         """
         This function writes the "endobj" bytes whenever a direct object needs to be closed
         """
-        # write endobj
         assert context is not None
         assert context.destination is not None
+
+        # end object in object stream
+        ref = object_to_transform.get_reference()  # type: ignore [union-attr]
+        if (
+            context.object_stream_destination is not None
+            and ref is not None
+            and context.object_stream_reference is not None
+            and ref.parent_stream_object_number
+            == context.object_stream_reference.object_number
+        ):
+            assert isinstance(context.destination, io.BytesIO)
+            assert ref.object_number is not None
+            context.object_stream_objects.append(
+                (ref.object_number, context.destination.getvalue())
+            )
+            context.destination = context.object_stream_destination
+            context.object_stream_destination = None
+            if (
+                len(context.object_stream_objects)
+                >= WriteTransformerState.MAX_NUMBER_OF_OBJECTS_IN_OBJECT_STREAM
+            ):
+                self._write_object_stream(context)
+            return
+
+        # write endobj
         context.destination.write(bytes("endobj\n\n", "latin1"))
 
+    @staticmethod
+    def _can_be_written_in_object_stream(
+        object_to_transform: AnyPDFType, context: WriteTransformerState
+    ) -> bool:
+        """
+        This function returns True if the given object can be written in an object stream, False otherwise.
+        Streams (and objects with a generation number other than 0) can not be stored in object streams.
+        """
+        if not context.use_object_streams:
+            return False
+        if context.object_stream_destination is not None:
+            return False
+        if isinstance(object_to_transform, Stream):
+            return False
+        if not isinstance(object_to_transform, (Dictionary, List)):
+            return False
+        ref = object_to_transform.get_reference()  # type: ignore [union-attr]
+        return ref is not None and (ref.generation_number or 0) == 0
+
+    def _write_object_stream(self, context: WriteTransformerState) -> None:
+        """
+        This function writes the objects that were gathered (so far) as an object stream (/Type /ObjStm)
+        """
+        if context.object_stream_reference is None:
+            return
+        if len(context.object_stream_objects) == 0:
+            return
+
+        # build header (pairs of object number and byte offset) and content
+        header: bytes = b""
+        byte_offset: int = 0
+        for object_number, object_bytes in context.object_stream_objects:
+            header += b"%d %d " % (object_number, byte_offset)
+            byte_offset += len(object_bytes)
+
+        # build stream
+        object_stream: Stream = Stream()
+        object_stream[Name("Type")] = Name("ObjStm")
+        object_stream[Name("N")] = bDecimal(len(context.object_stream_objects))
+        object_stream[Name("First")] = bDecimal(len(header))
+        object_stream[Name("DecodedBytes")] = header + b"".join(
+            [x[1] for x in context.object_stream_objects]
+        )
+        object_stream.set_reference(context.object_stream_reference)  # type: ignore [attr-defined]
+
+        # the object stream is an indirect object itself
+        context.indirect_objects_by_id[id(object_stream)] = object_stream
+        context.object_stream_reference = None
+        context.object_stream_objects = []
+
+        # write stream
+        self.get_root_transformer().transform(object_stream, context)
+
     @staticmethod
     def _hash(obj: typing.Any) -> int:
         h: Optional[int] = None
@@ -166,6 +327,185 @@ class Transformer:
             raise TypeError("unhashable type: %s" % obj.__class__.__name__)
         return h
 
+    @staticmethod
+    def _get_leaf_bytes(obj: typing.Any) -> typing.Optional[bytes]:
+        """
+        This function returns the bytes that identify a primitive (leaf) object,
+        or None if the object is not a primitive (leaf) object
+        """
+        if obj is None:
+            return b"null"
+        if isinstance(obj, bytes):
+            return obj
+        if isinstance(obj, bytearray):
+            return bytes(obj)
+        if isinstance(obj, Reference):
+            return bytes(
+                "%s %s %s %s"
+                % (
+                    obj.object_number,
+                    obj.generation_number,
+                    obj.parent_stream_object_number,
+                    obj.index_in_parent_stream,
+                ),
+                "latin1",
+            )
+        if isinstance(
+            obj,
+            (Boolean, CanvasOperatorName, Decimal, Name, String, str, bool, int, float),
+        ):
+            return str(obj).encode("utf8", "surrogatepass")
+        return None
+
+    @staticmethod
+    def _get_structural_children(
+        obj: typing.Any,
+    ) -> typing.List[typing.Tuple[bytes, typing.Any]]:
+        """
+        This function returns the (labelled) children of a (composite) object, in a canonical order
+        """
+        if isinstance(obj, Dictionary):
+            keys: typing.List[Name] = sorted([k for k in obj.keys()], key=str)
+            # /Bytes is (re)calculated from /DecodedBytes when a Stream is written
+            if isinstance(obj, Stream) and "DecodedBytes" in obj:
+                keys = [k for k in keys if k != "Bytes"]
+            children: typing.List[typing.Tuple[bytes, typing.Any]] = [
+                (bytes(str(k), "utf8", "surrogatepass"), obj[k]) for k in keys
+            ]
+            # a Font that is subset (when it is written) depends on the characters that are used
+            if isinstance(obj, Font) and obj._used_character_identifiers is not None:
+                children.append(
+                    (
+                        b"(UsedCharacterIdentifiers)",
+                        bytes(str(sorted(obj._used_character_identifiers)), "latin1"),
+                    )
+                )
+            return children
+        if isinstance(obj, List):
+            return [(b"", v) for v in obj]
+        if isinstance(obj, Image):
+            return [
+                (b"Mode", obj.mode),
+                (b"Size", str(obj.size)),
+                (b"Pixels", obj.tobytes()),
+            ]
+        if isinstance(obj, ET.Element):
+            return [(b"XML", ET.tostring(obj))]
+        return []
+
+    @staticmethod
+    def _has_memoized_structural_digest(
+        obj: typing.Any,
+        digests: typing.Dict[
+            int, typing.Tuple[weakref.ReferenceType, typing.Optional[bytes]]
+        ],
+    ) -> bool:
+        """
+        This function returns True if a structural digest was memoized for the given object, False otherwise.
+        Memoized digests are keyed by id, an entry is only valid if its (weak) reference still refers to the object itself
+        (the id of an object that no longer exists may be re-used by another object)
+        """
+        entry = digests.get(id(obj))
+        return entry is not None and entry[0]() is obj
+
+    @staticmethod
+    def _is_never_shared(obj: typing.Any) -> bool:
+        """
+        This function returns True if the given object must never share a Reference with another (identical) object.
+        A /Page is part of the page tree (through its /Parent), an annotation belongs to a single /Page,
+        and a form field is a separate entry in the /AcroForm (even if it is identical to another form field)
+        """
+        if not isinstance(obj, Dictionary):
+            return False
+        if obj.get("Type") in ["Page", "Annot"]:
+            return True
+        if obj.get("Subtype") == "Widget":
+            return True
+        return "FT" in obj or ("T" in obj and "Kids" in obj)
+
+    def _get_structural_digest(
+        self, object: AnyPDFType, context: WriteTransformerState
+    ) -> typing.Optional[bytes]:
+        """
+        This function returns a digest of the content of a (composite) object.
+        Objects with the same structural digest are written identically, and can thus share a Reference.
+        Digests are memoized (by id) in the WriteTransformerState, so every object is only hashed once.
+        This function returns NEVER_SHARED_DIGEST if the object is (or refers to) a /Page, an annotation or a form field.
+        This function returns None if the object (or any of its descendants) can not be digested,
+        or if the object is part of a cycle (e.g. /Outlines -> /First -> /Parent).
+        """
+        composite_types = (Dictionary, List, Image, ET.Element)
+        digests: typing.Dict[
+            int, typing.Tuple[weakref.ReferenceType, typing.Optional[bytes]]
+        ] = context.structural_digests_by_id
+
+        # depth-first traversal (iterative, deep structures should not exhaust the stack)
+        # objects are marked None while they are being digested, a cycle thus (correctly) yields None
+        stack: typing.List[typing.Tuple[typing.Any, typing.Optional[typing.List]]] = [
+            (object, None)
+        ]
+        while len(stack) > 0:
+            obj, children = stack.pop()
+
+            # push children
+            if children is None:
+                if Transformer._has_memoized_structural_digest(obj, digests):
+                    continue
+                digests[id(obj)] = (weakref.ref(obj), None)
+                # a /Page, an annotation or a form field is never shared, even if it is identical to another one
+                # its children (e.g. the /Kids of the /Parent of a /Page) need not be digested either
+                if Transformer._is_never_shared(obj):
+                    digests[id(obj)] = (
+                        weakref.ref(obj),
+                        Transformer.NEVER_SHARED_DIGEST,
+                    )
+                    continue
+                children = Transformer._get_structural_children(obj)
+                stack.append((obj, children))
+                for _, c in children:
+                    if isinstance(
+                        c, composite_types
+                    ) and not Transformer._has_memoized_structural_digest(c, digests):
+                        stack.append((c, None))
+                continue
+
+            # an object that refers to an object that is never shared, is never shared either
+            if any(
+                [
+                    digests[id(c)][1] == Transformer.NEVER_SHARED_DIGEST
+                    for _, c in children
+                    if isinstance(c, composite_types)
+                ]
+            ):
+                digests[id(obj)] = (weakref.ref(obj), Transformer.NEVER_SHARED_DIGEST)
+                continue
+
+            # digest (all children have been digested)
+            h = hashlib.blake2b(bytes(obj.__class__.__name__, "latin1"), digest_size=16)
+            for label, c in children:
+                h.update(b"%d:" % len(label))
+                h.update(label)
+                if isinstance(c, composite_types):
+                    child_digest: typing.Optional[bytes] = digests[id(c)][1]
+                    if child_digest is None:
+                        break
+                    h.update(b":%d:" % len(child_digest))
+                    h.update(child_digest)
+                    continue
+                leaf_bytes: typing.Optional[bytes] = Transformer._get_leaf_bytes(c)
+                if leaf_bytes is None:
+                    break
+                h.update(
+                    b":%s:%d:"
+                    % (bytes(c.__class__.__name__, "latin1"), len(leaf_bytes))
+                )
+                h.update(leaf_bytes)
+            else:
+                digests[id(obj)] = (weakref.ref(obj), h.digest())
+
+        # return
+        return digests[id(object)][1]
+
     def get_reference(
         self, object: AnyPDFType, context: WriteTransformerState
     ) -> Reference:
@@ -179,10 +519,32 @@ class Transformer:
             assert not isinstance(cached_indirect_object, Reference)
             return cached_indirect_object.get_reference()  # type: ignore [union-attr]
 
+        # when writing an incremental update, objects that were read keep their (original) Reference
+        # unless they were modified, these objects need not be written (again)
+        if context.incremental_update and object.get_reference() is not None:  # type: ignore [union-attr]
+            context.resolved_references.add(object.get_reference())  # type: ignore [union-attr]
+            return object.get_reference()  # type: ignore [union-attr]
+
+        # objects that were written already keep their Reference
+        # (even if they are no longer kept in context.indirect_objects_by_id)
+        if object.get_reference() in context.resolved_references:  # type: ignore [union-attr]
+            return object.get_reference()  # type: ignore [union-attr]
+
+        # look through existing indirect object digests
+        obj_digest: typing.Optional[bytes] = self._get_structural_digest(
+            object, context
+        )
+        if obj_digest is not None and obj_digest in context.indirect_objects_by_digest:
+            ref = context.indirect_objects_by_digest[obj_digest]
+            object.set_reference(ref)  # type: ignore [union-attr]
+            return ref
+
         # look through existing indirect object hashes
-        obj_hash: int = self._hash(object)
-        if obj_hash in context.indirect_objects_by_hash:
-            for obj in context.indirect_objects_by_hash[obj_hash]:
+        # this is only needed for objects that do not have a structural digest
+        obj_hash: int = 0
+        if obj_digest is None:
+            obj_hash = self._hash(object)
+            for obj in context.indirect_objects_by_hash.get(obj_hash, []):
                 if obj == object:
                     ref = obj.get_reference()  # type: ignore [union-attr]
                     assert ref is not None
@@ -191,23 +553,21 @@ class Transformer:
                     return ref
 
         # generate new object number
-        existing_obj_numbers = set(
-            [
-                item.get_reference().object_number  # type: ignore [union-attr]
-                for sublist in [v for k, v in context.indirect_objects_by_hash.items()]
-                for item in sublist
-            ]
-        )
-        obj_number = len(existing_obj_numbers) + 1
-        while obj_number in existing_obj_numbers:  # type: ignore [union-attr]
-            obj_number += 1
+        # object numbers are handed out in increasing order (1, 2, 3, ..)
+        obj_number: int = context.next_object_number
+        context.next_object_number += 1
 
         # build reference
         ref = Reference(object_number=obj_number)
         object.set_reference(ref)  # type: ignore [union-attr]
 
-        # insert into context.indirect_objects_by_hash
-        if obj_hash in context.indirect_objects_by_hash:
+        # insert into context.indirect_objects_by_digest (or context.indirect_objects_by_hash)
+        # an object that is never shared is inserted in neither
+        if obj_digest == Transformer.NEVER_SHARED_DIGEST:
+            pass
+        elif obj_digest is not None:
+            context.indirect_objects_by_digest[obj_digest] = ref
+        elif obj_hash in context.indirect_objects_by_hash:
             context.indirect_objects_by_hash[obj_hash].append(object)
         else:
             context.indirect_objects_by_hash[obj_hash] = [object]
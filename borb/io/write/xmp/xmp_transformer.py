@@ -6,6 +6,7 @@ This implementation of WriteBaseTransformer
 is responsible for writing XMP meta-data information
 """
 import logging
+import typing
 import xml.etree.ElementTree as ET
 from typing import Optional
 
@@ -28,6 +29,12 @@ class XMPTransformer(Transformer):
         """
         return isinstance(any, ET.Element)
 
+    def get_transformable_types(self) -> typing.Tuple[type, ...]:
+        """
+        This function returns the type(s) of object(s) this WriteBaseTransformer may be able to transform
+        """
+        return (ET.Element,)
+
     def transform(
         self,
         object_to_transform: AnyPDFType,
@@ -43,6 +50,11 @@ class XMPTransformer(Transformer):
         assert context.destination is not None
         assert context.destination
 
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if object_ref is not None and object_ref in context.resolved_references:
+            return
+
         # build stream
         out_value = Stream()
         out_value[Name("Type")] = Name("Metadata")
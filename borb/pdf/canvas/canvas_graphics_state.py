@@ -33,27 +33,32 @@ class CanvasGraphicsState:
     independent should not be written to modify these parameters.
     """
 
-    def __init__(self):
-        self.ctm: Matrix = Matrix.identity_matrix()
-        self.text_matrix: Matrix = Matrix.identity_matrix()
-        self.text_line_matrix: Matrix = Matrix.identity_matrix()
-        self.text_rise: Decimal = Decimal(0)
-        self.character_spacing: Decimal = Decimal(0)
-        self.word_spacing: Decimal = Decimal(0)
-        self.horizontal_scaling: Decimal = Decimal(100)
-        self.leading: Decimal = Decimal(0)
+    def __init__(self, float_mode: bool = False):
+        # In float mode, all numeric values (matrices, spacing, font size, etc) are (native) floats.
+        # This is much faster than Decimal arithmetic, and precise enough for extracting content.
+        self.float_mode: bool = float_mode
+        number: typing.Callable[[int], Decimal] = float if float_mode else Decimal  # type: ignore [assignment]
+        self.ctm: Matrix = Matrix.identity_matrix(float_mode)
+        self.text_matrix: Matrix = Matrix.identity_matrix(float_mode)
+        self._text_matrix_is_shared: bool = False
+        self.text_line_matrix: Matrix = Matrix.identity_matrix(float_mode)
+        self.text_rise: Decimal = number(0)
+        self.character_spacing: Decimal = number(0)
+        self.word_spacing: Decimal = number(0)
+        self.horizontal_scaling: Decimal = number(100)
+        self.leading: Decimal = number(0)
         self.font: typing.Optional[typing.Union["Name", "Font"]] = None
-        self.font_size: Decimal = Decimal(0)
+        self.font_size: Decimal = number(0)
         self.path: typing.List["LineSegment"] = []
         self.clipping_path: typing.List["LineSegment"] = []
         self.non_stroke_color_space = None
         self.non_stroke_color = RGBColor(Decimal(0), Decimal(0), Decimal(0))
         self.stroke_color_space = None
         self.stroke_color = RGBColor(Decimal(0), Decimal(0), Decimal(0))
-        self.line_width = Decimal(1)
+        self.line_width = number(1)
         self.line_cap = None
         self.line_join = None
-        self.miter_limit = Decimal(10)
+        self.miter_limit = number(10)
         self.dash_pattern = None
         self.rendering_intent = None
         self.stroke_adjustment = None
@@ -62,8 +67,34 @@ class CanvasGraphicsState:
         self.alpha_constant = None
         self.alpha_source = None
 
+    def __copy__(self):
+        """
+        This function returns a (shallow) copy of this CanvasGraphicsState, as needed by the q operator.
+        All values (numbers, matrices, Font, colors, color spaces) are shared by reference,
+        since the operators replace them rather than modifying them.
+        The only exception is the text matrix (which is updated in-place when showing text),
+        it is copied on write, by a call to get_writable_text_matrix.
+        """
+        out = CanvasGraphicsState.__new__(CanvasGraphicsState)
+        out.__dict__.update(self.__dict__)
+        out.path = []
+        out.clipping_path = []
+        out._text_matrix_is_shared = True
+        self._text_matrix_is_shared = True
+        return out
+
+    def get_writable_text_matrix(self) -> Matrix:
+        """
+        This function returns the text matrix of this CanvasGraphicsState, so it can be modified in-place.
+        If the text matrix is (still) shared with another CanvasGraphicsState (see __copy__), it is copied first.
+        """
+        if self._text_matrix_is_shared:
+            self.text_matrix = copy.deepcopy(self.text_matrix)
+            self._text_matrix_is_shared = False
+        return self.text_matrix
+
     def __deepcopy__(self, memodict={}):
-        out = CanvasGraphicsState()
+        out = CanvasGraphicsState(self.float_mode)
 
         # ctm
         out.ctm = copy.deepcopy(self.ctm, memodict)
@@ -13,6 +13,7 @@ import typing
 
 from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
 from borb.io.read.types import AnyPDFType, CanvasOperatorName, Dictionary
+from borb.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
 from borb.pdf.canvas.operator.canvas_operator import CanvasOperator
 from borb.pdf.canvas.operator.color.set_cmyk_non_stroking import SetCMYKNonStroking
 from borb.pdf.canvas.operator.color.set_cmyk_stroking import SetCMYKStroking
@@ -105,11 +106,19 @@ class CanvasStreamProcessor:
         page: "Page",  # type: ignore[name-defined]
         canvas: "Canvas",  # type: ignore[name-defined]
         resource_dictionaries: typing.List[Dictionary] = [],
+        float_mode: bool = False,
     ):
         self._page: "Page" = page  # type: ignore[name-defined]
         self._canvas: "Canvas" = canvas  # type: ignore[name-defined]
         self._resource_dictionaries: typing.List[Dictionary] = resource_dictionaries
 
+        # In float mode, all numbers in the content stream are read as (native) floats,
+        # and the graphics state of the Canvas performs all of its arithmetic in float.
+        # This is (much) faster than Decimal arithmetic, but should only be used for reading content.
+        self._float_mode: bool = float_mode
+        if float_mode and not canvas.graphics_state.float_mode:
+            canvas.graphics_state = CanvasGraphicsState(float_mode=True)
+
         # initialize operators
         self._canvas_operators: typing.Dict[str, CanvasOperator] = {
             x.get_text(): x
@@ -182,6 +191,7 @@ class CanvasStreamProcessor:
             self._page,
             self._canvas,
             self._resource_dictionaries + resource_dictionaries,
+            self._float_mode,
         )
 
     def get_operator(self, name: str) -> typing.Optional["CanvasOperator"]:  # type: ignore [name-defined]
@@ -235,7 +245,7 @@ class CanvasStreamProcessor:
         length = io_source.tell()
         io_source.seek(0)
 
-        canvas_tokenizer = HighLevelTokenizer(io_source)
+        canvas_tokenizer = HighLevelTokenizer(io_source, float_mode=self._float_mode)
 
         # process content
         operand_stk: typing.List[AnyPDFType] = []
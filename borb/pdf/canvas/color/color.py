@@ -97,10 +97,9 @@ class CMYKColor(Color):
         """
         This method returns the RGB representation of this Color
         """
-        ONE = Decimal(1)
-        r = (ONE - self.cyan) * (ONE - self.key)
-        g = (ONE - self.magenta) * (ONE - self.key)
-        b = (ONE - self.yellow) * (ONE - self.key)
+        r = (1 - self.cyan) * (1 - self.key)
+        g = (1 - self.magenta) * (1 - self.key)
+        b = (1 - self.yellow) * (1 - self.key)
         return RGBColor(r, g, b)
 
     def __deepcopy__(self, memodict={}):
@@ -572,7 +571,9 @@ class Separation(Color):
 
         # run function
         try:
-            ys: typing.List[Decimal] = tint_function.evaluate(self.xs)
+            ys: typing.List[Decimal] = tint_function.evaluate(
+                [Decimal(x) for x in self.xs]
+            )
             assert ys is not None
         except:
             logger.info(
@@ -4,6 +4,8 @@
 """
     This implementation of Event is triggered right before the Canvas is being processed.
 """
+import typing
+
 from borb.pdf.canvas.event.event_listener import Event
 from borb.pdf.page.page import Page
 
@@ -13,11 +15,20 @@ class BeginPageEvent(Event):
     This implementation of Event is triggered right before the Canvas is being processed.
     """
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, page_number: typing.Optional[int] = None):
         self._page: Page = page
+        self._page_number: typing.Optional[int] = page_number
 
     def get_page(self) -> Page:
         """
         This function returns the Page that triggered this BeginPageEvent
         """
         return self._page
+
+    def get_page_number(self) -> typing.Optional[int]:
+        """
+        This function returns the page number of the Page that triggered this BeginPageEvent (if it is known).
+        EventListener(s) store their results under this page number. If it is not known (None),
+        they number the Page(s) in the order in which they are processed.
+        """
+        return self._page_number
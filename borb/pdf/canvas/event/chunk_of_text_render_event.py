@@ -42,12 +42,14 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
         m[1][1] *= graphics_state.font_size
 
         # calculate baseline box
-        p0 = m.cross(Decimal(0), graphics_state.text_rise, Decimal(1))
+        p0 = m.cross(0, graphics_state.text_rise, 1)
         p1 = m.cross(
             self._glyph_line.get_width_in_text_space(),
             graphics_state.text_rise
-            + graphics_state.font.get_ascent() * Decimal(0.001),
-            Decimal(1),
+            + ChunkOfTextRenderEvent._to_text_space(
+                graphics_state, graphics_state.font.get_ascent()
+            ),
+            1,
         )
 
         # set baseline box
@@ -61,16 +63,20 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
         )
         if uses_descent:
             p0 = m.cross(
-                Decimal(0),
+                0,
                 graphics_state.text_rise
-                + graphics_state.font.get_descent() * Decimal(0.001),
-                Decimal(1),
+                + ChunkOfTextRenderEvent._to_text_space(
+                    graphics_state, graphics_state.font.get_descent()
+                ),
+                1,
             )
             p1 = m.cross(
                 self._glyph_line.get_width_in_text_space(),
                 graphics_state.text_rise
-                + graphics_state.font.get_ascent() * Decimal(0.001),
-                Decimal(1),
+                + ChunkOfTextRenderEvent._to_text_space(
+                    graphics_state, graphics_state.font.get_ascent()
+                ),
+                1,
             )
             self.set_bounding_box(
                 Rectangle(
@@ -85,11 +91,16 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
 
         # calculate space character width estimate
         current_font: Font = graphics_state.font
-        self._space_character_width_estimate_in_user_space = (
+        space_character_width_estimate: Decimal = (
             current_font.get_space_character_width_estimate()
+        )
+        if graphics_state.float_mode:
+            space_character_width_estimate = float(space_character_width_estimate)  # type: ignore [assignment]
+        self._space_character_width_estimate_in_user_space = (
+            space_character_width_estimate
             * graphics_state.font_size
             * graphics_state.text_matrix[0][0]
-            * Decimal(0.001)
+            * (0.001 if graphics_state.float_mode else Decimal(0.001))
         )
         assert graphics_state.font_size is not None
         self._font_size: Decimal = (
@@ -99,6 +110,16 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
         # store graphics state
         self._graphics_state = graphics_state
 
+    @staticmethod
+    def _to_text_space(graphics_state: CanvasGraphicsState, value: Decimal) -> Decimal:
+        """
+        This function converts a Font metric (expressed in 1/1000 of text space) to text space,
+        using the numeric type (Decimal or float) of the given CanvasGraphicsState
+        """
+        if graphics_state.float_mode:
+            return float(value) * 0.001  # type: ignore [return-value]
+        return value * Decimal(0.001)
+
     def get_font_size(self) -> Decimal:
         """
         This function returns the font size
@@ -116,9 +137,7 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
         This function returns the width (in text space) of the space-character.
         """
         return (
-            self._space_character_width_estimate_in_user_space
-            * Decimal(1000)
-            / self._font_size
+            self._space_character_width_estimate_in_user_space * 1000 / self._font_size
         )
 
     def get_baseline(self) -> Rectangle:
@@ -133,7 +152,7 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
         This function splits this ChunkOfTextRenderEvent on every Glyph
         """
         chunks_of_text: typing.List[ChunkOfTextRenderEvent] = []
-        x: Decimal = Decimal(0)
+        x: Decimal = 0.0 if self._graphics_state.float_mode else Decimal(0)  # type: ignore [assignment]
         y: Decimal = self._graphics_state.text_rise
         assert isinstance(self._graphics_state.font, Font)
         assert self._graphics_state.font is not None
@@ -153,11 +172,14 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
             # set baseline bounding box
             m = self._graphics_state.text_matrix.mul(self._graphics_state.ctm)
             m[1][1] *= self._graphics_state.font_size
-            p0 = m.cross(x, y, Decimal(1))
+            p0 = m.cross(x, y, 1)
             p1 = m.cross(
                 x + g.get_width_in_text_space(),
-                y + font.get_ascent() * Decimal(0.001),
-                Decimal(1),
+                y
+                + ChunkOfTextRenderEvent._to_text_space(
+                    self._graphics_state, font.get_ascent()
+                ),
+                1,
             )
             e._baseline_bounding_box = Rectangle(
                 p0[0], p0[1], p1[0] - p0[0], p1[1] - p0[1]
@@ -168,13 +190,19 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
             if g.uses_descent():
                 p0 = m.cross(
                     x,
-                    y + font.get_descent() * Decimal(0.001),
-                    Decimal(1),
+                    y
+                    + ChunkOfTextRenderEvent._to_text_space(
+                        self._graphics_state, font.get_descent()
+                    ),
+                    1,
                 )
                 p1 = m.cross(
                     x + g.get_width_in_text_space(),
-                    y + font.get_ascent() * Decimal(0.001),
-                    Decimal(1),
+                    y
+                    + ChunkOfTextRenderEvent._to_text_space(
+                        self._graphics_state, font.get_ascent()
+                    ),
+                    1,
                 )
                 e.bounding_box = Rectangle(
                     min(p0[0], p1[0]),
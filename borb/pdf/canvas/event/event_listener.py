@@ -26,3 +26,13 @@ class EventListener:
         EventListeners can then choose to act on those Event objects.
         """
         pass
+
+    def merge(self, other: "EventListener") -> bool:
+        """
+        This method merges the results of another EventListener (of the same type) into this EventListener,
+        it is used to combine the results of EventListener(s) that processed different Page(s) of the same Document (see ParallelPageProcessor).
+        Those EventListener(s) are copied to (and from) other processes, so they need to be picklable.
+        Anything that is only needed while a Page is being processed (such as the Event objects of that Page) can be left out in __getstate__.
+        This method returns True if the results were merged, False if this EventListener does not support merging.
+        """
+        return False
@@ -21,14 +21,15 @@ class ImageRenderEvent(Event):
         self._image: PILImage = image
 
         # calculate position
-        v = graphics_state.ctm.cross(Decimal(0), Decimal(0), Decimal(1))
+        v = graphics_state.ctm.cross(0, 0, 1)
         self._x: Decimal = v[0]
         self._y: Decimal = v[1]
 
         # calculate display size
-        v = graphics_state.ctm.cross(Decimal(1), Decimal(1), Decimal(0))
-        self._width: Decimal = max(abs(v[0]), Decimal(1))
-        self._height: Decimal = max(abs(v[1]), Decimal(1))
+        one: Decimal = 1.0 if graphics_state.float_mode else Decimal(1)  # type: ignore [assignment]
+        v = graphics_state.ctm.cross(1, 1, 0)
+        self._width: Decimal = max(abs(v[0]), one)
+        self._height: Decimal = max(abs(v[1]), one)
 
     def get_image(self) -> PILImage:
         """
@@ -31,6 +31,50 @@ class Font(Dictionary):
     Today, the font is a digital file.
     """
 
+    def __init__(self):
+        super(Font, self).__init__()
+        # fmt: off
+        self._used_character_identifiers: typing.Optional[typing.Set[int]] = None  # these are the character identifiers that are used (None if this Font does not keep track of them)
+        self._widths_in_text_space: typing.Dict[typing.Tuple[bool, Decimal], typing.Dict[str, Decimal]] = {}    # these are the (calculated) widths (in text space) of characters, by font size
+        # fmt: on
+
+    def _get_widths_in_text_space(
+        self, font_size: Decimal
+    ) -> typing.Dict[str, Decimal]:
+        """
+        This function returns the table of (already calculated) widths (in text space) of characters at the given font size.
+        This table is filled (lazily) by GlyphLine.measure.
+        """
+        key: typing.Tuple[bool, Decimal] = (isinstance(font_size, float), font_size)
+        widths: typing.Optional[
+            typing.Dict[str, Decimal]
+        ] = self._widths_in_text_space.get(key)
+        if widths is None:
+            widths = {}
+            self._widths_in_text_space[key] = widths
+        return widths
+
+    def _mark_all_characters_as_used(self) -> None:
+        """
+        This function marks all characters of this Font as being used (e.g. by a FormField, which may hold any text).
+        A Font of which all characters are used is never subset when it is written.
+        """
+        self._used_character_identifiers = None
+
+    def _mark_characters_as_used(self, text: str) -> None:
+        """
+        This function marks the characters of the given text as being used (e.g. by a ChunkOfText).
+        If this Font keeps track of the characters that are used, it is subset (to those characters) when it is written.
+        """
+        if self._used_character_identifiers is None:
+            return
+        for c in text:
+            character_identifier: typing.Optional[int] = (
+                self.unicode_to_character_identifier(c)
+            )
+            if character_identifier is not None:
+                self._used_character_identifiers.add(character_identifier)
+
     def character_identifier_to_unicode(
         self, character_identifier: int
     ) -> typing.Optional[str]:
@@ -94,9 +138,9 @@ class Font(Dictionary):
         that may be present in the Font. (e.g. the width of 'A' is typically twice that of ' ').
         """
         # 1. if space is defined, and the width of space is defined, return that
-        character_identifier: typing.Optional[
-            int
-        ] = self.unicode_to_character_identifier(" ")
+        character_identifier: typing.Optional[int] = (
+            self.unicode_to_character_identifier(" ")
+        )
         width: typing.Optional[Decimal] = None
         if character_identifier is not None:
             width = self.get_width(character_identifier)
@@ -355,6 +399,11 @@ class Font(Dictionary):
         for k, v in self.items():
             if k not in out:
                 out[k] = copy.deepcopy(v, memodict)
+        # used characters
+        if self._used_character_identifiers is not None:
+            out._used_character_identifiers = {
+                x for x in self._used_character_identifiers
+            }
         return out
 
     def _copy_font_descriptor(self, font_descriptor_to_copy: Dictionary) -> Dictionary:
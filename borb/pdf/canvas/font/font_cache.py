@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This class is a process-wide cache of (parsed) fonts.
+Parsing a font file (e.g. a .ttf or .afm file) is expensive, and the same font is typically used
+by many LayoutElement objects, across many Document objects (e.g. in a long-running service).
+"""
+import collections
+import logging
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+class FontCache:
+    """
+    This class is a process-wide cache of (parsed) fonts.
+    Entries are keyed (e.g. by the path and modification time of a .ttf file, or by the canonical name of a standard 14 font)
+    and are evicted in least-recently-used order once the cache holds more than MAX_NUMBER_OF_FONTS entries.
+    Cached values are shared, and should thus be treated as immutable.
+    """
+
+    # maximum number of (parsed) fonts that is kept in memory
+    MAX_NUMBER_OF_FONTS: int = 32
+
+    _entries: collections.OrderedDict = collections.OrderedDict()
+    _lock: threading.Lock = threading.Lock()
+    _number_of_hits: int = 0
+    _number_of_misses: int = 0
+    _number_of_evictions: int = 0
+
+    @staticmethod
+    def get(key: typing.Hashable, build: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        This function returns the (cached) value for the given key.
+        If the key is not in the cache, the value is built (by calling build) and stored in the cache.
+        """
+        with FontCache._lock:
+            if key in FontCache._entries:
+                FontCache._entries.move_to_end(key)
+                FontCache._number_of_hits += 1
+                return FontCache._entries[key]
+            FontCache._number_of_misses += 1
+
+        # build (outside of the lock, parsing a font file may take a while)
+        value: typing.Any = build()
+
+        # update cache
+        with FontCache._lock:
+            FontCache._entries[key] = value
+            FontCache._entries.move_to_end(key)
+            while len(FontCache._entries) > FontCache.MAX_NUMBER_OF_FONTS:
+                FontCache._entries.popitem(last=False)
+                FontCache._number_of_evictions += 1
+        logger.debug(
+            "font cache hits: %d, misses: %d, evictions: %d, ratio %f"
+            % (
+                FontCache._number_of_hits,
+                FontCache._number_of_misses,
+                FontCache._number_of_evictions,
+                FontCache.get_hit_ratio(),
+            )
+        )
+        return value
+
+    @staticmethod
+    def clear() -> None:
+        """
+        This function removes all entries from the cache, and resets its statistics
+        """
+        with FontCache._lock:
+            FontCache._entries.clear()
+            FontCache._number_of_hits = 0
+            FontCache._number_of_misses = 0
+            FontCache._number_of_evictions = 0
+
+    @staticmethod
+    def get_hit_ratio() -> float:
+        """
+        This function returns the ratio of lookups that were answered from the cache (0 if there were no lookups)
+        """
+        number_of_lookups: int = FontCache._number_of_hits + FontCache._number_of_misses
+        if number_of_lookups == 0:
+            return 0.0
+        return FontCache._number_of_hits / number_of_lookups
+
+    @staticmethod
+    def get_number_of_entries() -> int:
+        """
+        This function returns the number of entries in the cache
+        """
+        return len(FontCache._entries)
+
+    @staticmethod
+    def get_number_of_evictions() -> int:
+        """
+        This function returns the number of entries that were evicted from the cache
+        """
+        return FontCache._number_of_evictions
+
+    @staticmethod
+    def get_number_of_hits() -> int:
+        """
+        This function returns the number of lookups that were answered from the cache
+        """
+        return FontCache._number_of_hits
+
+    @staticmethod
+    def get_number_of_misses() -> int:
+        """
+        This function returns the number of lookups that were not answered from the cache
+        """
+        return FontCache._number_of_misses
@@ -145,6 +145,36 @@ class GlyphLine:
             glyphs, font, font_size, character_spacing, word_spacing, horizontal_scaling
         )
 
+    @staticmethod
+    def measure(text: str, font: Font, font_size: Decimal) -> Decimal:
+        """
+        This function returns the width (in text space) of the given text, without building Glyph objects.
+        It returns the same value as GlyphLine.from_str(text, font, font_size).get_width_in_text_space().
+        The width of every character (at a given font size) is only calculated once (per Font).
+        :param text:                the text to measure
+        :param font:                the font
+        :param font_size:           the font-size
+        :return:                    the width (in text space) of the text
+        """
+        # in float mode (see CanvasGraphicsState) the (Decimal) glyph widths are converted to float
+        float_mode: bool = isinstance(font_size, float)
+        widths: typing.Dict[str, Decimal] = font._get_widths_in_text_space(font_size)
+        w: Decimal = 0.0 if float_mode else Decimal(0)  # type: ignore [assignment]
+        for c in text:
+            character_width: typing.Optional[Decimal] = widths.get(c)
+            if character_width is None:
+                glyph_width: Decimal = font.get_width(
+                    font.unicode_to_character_identifier(c) or 0
+                ) or Decimal(0)
+                if float_mode:
+                    character_width = float(glyph_width) * font_size * 0.001  # type: ignore [assignment]
+                else:
+                    character_width = glyph_width * font_size * Decimal(0.001)
+                assert character_width is not None
+                widths[c] = character_width
+            w += character_width
+        return w
+
     def __init__(
         self,
         glyphs: typing.List[Glyph],
@@ -210,9 +240,18 @@ class GlyphLine:
         """
         This function calculates the width (in text space) of this GlyphLine
         """
-        w: Decimal = Decimal(0)
+        # in float mode (see CanvasGraphicsState) the (Decimal) glyph widths are converted to float
+        float_mode: bool = isinstance(self._font_size, float)
+        w: Decimal = 0.0 if float_mode else Decimal(0)  # type: ignore [assignment]
         for g in self._glyphs:
-            glyph_width_in_text_space = g.get_width() * self._font_size * Decimal(0.001)
+            if float_mode:
+                glyph_width_in_text_space = (
+                    float(g.get_width()) * self._font_size * 0.001
+                )
+            else:
+                glyph_width_in_text_space = (
+                    g.get_width() * self._font_size * Decimal(0.001)
+                )
 
             # add word spacing where applicable
             if len(g.get_unicode_str()) == 1 and GlyphLine._isspace(
@@ -221,7 +260,7 @@ class GlyphLine:
                 glyph_width_in_text_space += self._word_spacing
 
             # horizontal scaling
-            glyph_width_in_text_space *= self._horizontal_scaling / Decimal(100)
+            glyph_width_in_text_space *= self._horizontal_scaling / 100
 
             # add character spacing to character_width
             glyph_width_in_text_space += self._character_spacing
@@ -9,6 +9,7 @@ import copy
 import io
 import logging
 import typing
+from decimal import Decimal
 from pathlib import Path
 
 from fontTools.afmLib import AFM  # type: ignore [import]
@@ -22,6 +23,7 @@ from borb.pdf.canvas.font.adobe_standard_encoding import (
     adobe_standard_encode,
 )
 from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.font_cache import FontCache
 from borb.pdf.canvas.font.simple_font.simple_font import SimpleFont
 from borb.pdf.canvas.font.symbol_encoding import symbol_decode, zapfdingbats_decode
 
@@ -419,6 +421,67 @@ class StandardType1Font(Type1Font):
         """
         return StandardType1Font._canonical_name(font_name) is not None
 
+    @staticmethod
+    def _read_afm(
+        font_name: str,
+    ) -> typing.Tuple[
+        AFM,
+        typing.Dict[int, str],
+        typing.Dict[str, int],
+        typing.Dict[int, bDecimal],
+        typing.Dict[typing.Tuple[bool, Decimal], typing.Dict[str, Decimal]],
+    ]:
+        # assert whether AFM directory exists
+        afm_directory: Path = Path(__file__).parent / "afm"
+        assert afm_directory.exists()
+
+        # assert whether AFM file exists
+        afm_file: Path = afm_directory / (font_name.lower() + ".afm")
+        assert afm_file.exists()
+
+        # build AFM datastructure
+        afm: AFM = AFM(afm_file)
+
+        # build lookup tables
+        # fmt: off
+        character_identifier_to_unicode_lookup: typing.Dict[int, str] = {}
+        if font_name == "Symbol":
+            character_identifier_to_unicode_lookup = {c:symbol_decode(bytes([c])) for c in range(0, 256)}
+        elif font_name == "ZapfDingbats":
+            character_identifier_to_unicode_lookup = {c:zapfdingbats_decode(bytes([c])) for c in range(0, 256)}
+        else:
+            for c in range(0, 256):
+                try:
+                    character_identifier_to_unicode_lookup[c] = bytes([c]).decode("cp1252")
+                except:
+                    character_identifier_to_unicode_lookup[c] = ""
+        unicode_lookup_to_character_identifier: typing.Dict[str, int] = {v:k for k,v in character_identifier_to_unicode_lookup.items()}
+        # fmt: on
+
+        # build width table
+        # a character identifier that occurs more than once (e.g. -1, for glyphs that are not encoded) has width 0
+        character_identifier_to_width_lookup: typing.Dict[int, bDecimal] = {}
+        for v in afm._chars.values():
+            if v[0] in character_identifier_to_width_lookup:
+                character_identifier_to_width_lookup[v[0]] = bDecimal(0)
+            else:
+                character_identifier_to_width_lookup[v[0]] = bDecimal(v[1])
+
+        # the widths (in text space) of characters, by font size
+        # this table is filled (lazily) by GlyphLine.measure
+        widths_in_text_space: typing.Dict[
+            typing.Tuple[bool, Decimal], typing.Dict[str, Decimal]
+        ] = {}
+
+        # return
+        return (
+            afm,
+            character_identifier_to_unicode_lookup,
+            unicode_lookup_to_character_identifier,
+            character_identifier_to_width_lookup,
+            widths_in_text_space,
+        )
+
     # fmt: off
     def __init__(self, font_name: typing.Optional[str] = None):
         super(StandardType1Font, self).__init__()
@@ -427,40 +490,20 @@ class StandardType1Font(Type1Font):
             font_name = StandardType1Font._canonical_name(font_name)
             assert font_name is not None
 
-            # assert whether AFM directory exists
-            afm_directory: Path = Path(__file__).parent / "afm"
-            assert afm_directory.exists()
-
-            # assert whether AFM file exists
-            afm_file: Path = afm_directory / (font_name.lower() + ".afm")
-            assert afm_file.exists()
-
-            # build AFM datastructure
-            self._afm: AFM = AFM(afm_file)
+            # build AFM datastructure (and lookup tables)
+            # these are parsed once (per process), and shared by all StandardType1Font objects with the same name
+            afm_and_lookup_tables: typing.Tuple[AFM, typing.Dict[int, str], typing.Dict[str, int], typing.Dict[int, bDecimal], typing.Dict[typing.Tuple[bool, Decimal], typing.Dict[str, Decimal]]] = FontCache.get(("afm", font_name), lambda: StandardType1Font._read_afm(font_name))
+            self._afm: AFM = afm_and_lookup_tables[0]
+            self._character_identifier_to_unicode_lookup: typing.Dict[int, str] = afm_and_lookup_tables[1]
+            self._unicode_lookup_to_character_identifier: typing.Dict[str, int] = afm_and_lookup_tables[2]
+            self._character_identifier_to_width_lookup: typing.Dict[int, bDecimal] = afm_and_lookup_tables[3]
+            self._widths_in_text_space = afm_and_lookup_tables[4]
 
             self[Name("Type")] = Name("Font")
             self[Name("Subtype")] = Name("Type1")
             self[Name("BaseFont")] = Name(self._afm._attrs["FontName"])
-
-            self._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {}
-            self._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {}
-
-            if font_name == "Symbol":
-                self._character_identifier_to_unicode_lookup  = {c:symbol_decode(bytes([c])) for c in range(0, 256)}
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
-
-            elif font_name == "ZapfDingbats":
-                self._character_identifier_to_unicode_lookup = {c:zapfdingbats_decode(bytes([c])) for c in range(0, 256)}
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
-
-            else:
+            if font_name not in ["Symbol", "ZapfDingbats"]:
                 self[Name("Encoding")] = Name("WinAnsiEncoding")
-                for c in range(0, 256):
-                    try:
-                        self._character_identifier_to_unicode_lookup[c] = bytes([c]).decode("cp1252")
-                    except:
-                        self._character_identifier_to_unicode_lookup[c] = ""
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
 
     # fmt: on
 
@@ -486,14 +529,10 @@ class StandardType1Font(Type1Font):
         If this Font is unable to represent the glyph that corresponds to the character identifier,
         this function returns None
         """
-        widths: typing.List[bDecimal] = [
-            bDecimal(v[1])
-            for k, v in self._afm._chars.items()
-            if v[0] == character_identifier
-        ]
-        if len(widths) == 1:
-            return widths[0]
-        return bDecimal(0)
+        width: typing.Optional[
+            bDecimal
+        ] = self._character_identifier_to_width_lookup.get(character_identifier)
+        return width if width is not None else bDecimal(0)
 
     def get_ascent(self) -> bDecimal:
         """
@@ -523,5 +562,6 @@ class StandardType1Font(Type1Font):
         f_out._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {k: v for k, v in self._character_identifier_to_unicode_lookup.items()}
         f_out._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {k: v for k, v in self._unicode_lookup_to_character_identifier.items()}
         f_out._afm = self._afm
+        f_out._character_identifier_to_width_lookup = self._character_identifier_to_width_lookup
         return f_out
         # fmt: on
@@ -6,6 +6,8 @@ format for the Microsoft Windows operating system. Specifications for the TrueTy
 available in Apple’s TrueType Reference Manual and Microsoft’s TrueType 1.0 Font Files Technical
 Specification (see Bibliography).
 """
+import hashlib
+import io
 import typing
 import zlib
 from decimal import Decimal
@@ -13,12 +15,15 @@ from pathlib import Path
 
 from fontTools.agl import toUnicode  # type: ignore [import]
 from fontTools.pens.boundsPen import BoundsPen  # type: ignore [import]
+from fontTools.subset import Options, Subsetter  # type: ignore [import]
 from fontTools.ttLib import TTFont  # type: ignore [import]
 
 from borb.io.read.types import Decimal as bDecimal
 from borb.io.read.types import Dictionary, List, Name, Stream, String
 from borb.pdf.canvas.font.composite_font.cid_font_type_2 import CIDType2Font
 from borb.pdf.canvas.font.composite_font.font_type_0 import Type0Font
+from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.font_cache import FontCache
 from borb.pdf.canvas.font.simple_font.font_type_1 import Type1Font
 
 
@@ -41,11 +46,55 @@ class TrueTypeFont(Type1Font):
         path_to_font_file: Path,
     ) -> typing.Union["TrueTypeFont", "Type0Font"]:
         """
-        This function returns the PDF TrueTypeFont object for a given TTF file
+        This function returns the PDF TrueTypeFont object for a given TTF file.
+        The TTF file is parsed once (per process, as long as it is not modified), see FontCache.
         """
         assert path_to_font_file.exists()
         assert path_to_font_file.name.endswith(".ttf")
 
+        # every call returns a copy of the cached font
+        # the copy shares its (immutable) widths, metrics and font file bytes with the cached font
+        stat_result = path_to_font_file.stat()
+        font: typing.Union["TrueTypeFont", "Type0Font"] = FontCache.get(
+            (
+                "ttf",
+                str(path_to_font_file.resolve()),
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+            ),
+            lambda: TrueTypeFont._true_type_font_from_file(path_to_font_file),
+        )
+        return TrueTypeFont._copy_cached_object(font)
+
+    @staticmethod
+    def _copy_cached_object(obj: typing.Any) -> typing.Any:
+        # containers (Dictionary, List, Stream, Font) are copied
+        # everything else (Decimal, Name, String, bytes, etc) is shared
+        if isinstance(obj, Dictionary):
+            dictionary_out: Dictionary = obj.__class__()
+            for k, v in obj.items():
+                dictionary_out[k] = TrueTypeFont._copy_cached_object(v)
+            obj_out = dictionary_out
+        elif isinstance(obj, List):
+            list_out: List = obj.__class__()
+            for v in obj:
+                list_out.append(TrueTypeFont._copy_cached_object(v))
+            obj_out = list_out
+        else:
+            return obj
+        if "_can_be_referenced" in vars(obj):
+            obj_out.set_can_be_referenced(obj.can_be_referenced())  # type: ignore [attr-defined]
+        if isinstance(obj, Font) and obj._used_character_identifiers is not None:
+            obj_out._used_character_identifiers = {
+                x for x in obj._used_character_identifiers
+            }
+        return obj_out
+
+    @staticmethod
+    def _true_type_font_from_file(
+        path_to_font_file: Path,
+    ) -> typing.Union["TrueTypeFont", "Type0Font"]:
+
         font_file_bytes: typing.Optional[bytes] = None
         with open(path_to_font_file, "rb") as ffh:
             font_file_bytes = ffh.read()
@@ -72,6 +121,7 @@ class TrueTypeFont(Type1Font):
             # fmt: off
             type_0_font: Type0Font = TrueTypeFont._type_0_font_from_file(ttf_font_file)
             type_0_font["DescendantFonts"][0]["FontDescriptor"][Name("FontFile2")] = TrueTypeFont._get_font_file_stream(font_file_bytes)
+            type_0_font._used_character_identifiers = set()
             return type_0_font
             # fmt: on
 
@@ -113,6 +163,10 @@ class TrueTypeFont(Type1Font):
             font_file_bytes
         )
 
+        # keep track of the characters that are used
+        # this allows the font file to be subset when the font is written
+        font._used_character_identifiers = set()
+
         # return
         return font
 
@@ -128,6 +182,139 @@ class TrueTypeFont(Type1Font):
         font_stream[Name("Bytes")] = zlib.compress(font_file_bytes, 9)
         return font_stream
 
+    @staticmethod
+    def _get_subset_tag(character_identifiers: typing.Set[int]) -> str:
+        # the tag consists of 6 uppercase letters, derived from the characters that are used
+        # the same subset thus always gets the same tag
+        h: bytes = hashlib.md5(
+            bytes(",".join([str(x) for x in sorted(character_identifiers)]), "latin1")
+        ).digest()
+        return "".join([chr(ord("A") + x % 26) for x in h[0:6]])
+
+    @staticmethod
+    def _subset_font_file(
+        ttf_font_file: TTFont,
+        glyph_names: typing.Optional[typing.List[str]] = None,
+        glyph_ids: typing.Optional[typing.Set[int]] = None,
+    ) -> bytes:
+        # glyph ids are retained (e.g. for a /CIDToGIDMap /Identity)
+        # glyph names are retained (e.g. for an /Encoding with /Differences)
+        options: Options = Options()
+        options.glyph_names = True
+        options.notdef_outline = True
+        options.layout_features = []
+        options.retain_gids = glyph_ids is not None
+        subsetter: Subsetter = Subsetter(options=options)
+        if glyph_ids is not None:
+            subsetter.populate(gids=[0] + sorted(glyph_ids))
+        else:
+            subsetter.populate(glyphs=[".notdef"] + (glyph_names or []))
+        subsetter.subset(ttf_font_file)
+        font_file_bytes: io.BytesIO = io.BytesIO()
+        ttf_font_file.save(font_file_bytes)
+        return font_file_bytes.getvalue()
+
+    @staticmethod
+    def _get_subset_font_descriptor(
+        font_descriptor: Dictionary, tag: str, font_file_bytes: bytes
+    ) -> Dictionary:
+        font_descriptor_out: Dictionary = Dictionary()
+        for k, v in font_descriptor.items():
+            font_descriptor_out[k] = v
+        font_descriptor_out[Name("FontName")] = String(
+            tag + "+" + str(font_descriptor["FontName"])
+        )
+        font_descriptor_out[Name("FontFile2")] = TrueTypeFont._get_font_file_stream(
+            font_file_bytes
+        )
+        return font_descriptor_out
+
+    @staticmethod
+    def _get_subset_font(font: Font) -> Dictionary:
+        """
+        This function returns a copy of a Font (built by true_type_font_from_file) that only embeds
+        the glyphs of the characters that were marked as being used. Its /Widths (or /W) and /ToUnicode
+        are rewritten to match, and its /BaseFont is prefixed with a subset tag (e.g. "ABCDEF+Ubuntu-Light").
+        The Font itself is not modified.
+        """
+        character_identifiers: typing.Optional[typing.Set[int]] = (
+            font._used_character_identifiers
+        )
+        assert character_identifiers is not None
+        tag: str = TrueTypeFont._get_subset_tag(character_identifiers)
+        font_out: Dictionary = Dictionary()
+        for k, v in font.items():
+            font_out[k] = v
+        font_out[Name("BaseFont")] = Name(tag + "+" + str(font["BaseFont"]))
+
+        # Type0Font
+        # the character identifiers are glyph ids (/CIDToGIDMap /Identity)
+        if "DescendantFonts" in font:
+            descendant_font: Dictionary = font["DescendantFonts"][0]
+            ttf_font_file: TTFont = TTFont(
+                io.BytesIO(
+                    descendant_font["FontDescriptor"]["FontFile2"]["DecodedBytes"]
+                )
+            )
+            descendant_font_out: Dictionary = Dictionary()
+            for k, v in descendant_font.items():
+                descendant_font_out[k] = v
+            descendant_font_out[Name("BaseFont")] = font_out["BaseFont"]
+            # fmt: off
+            font_out[Name("ToUnicode")] = TrueTypeFont._build_custom_cmap_for_type_0_font(ttf_font_file, character_identifiers)
+            descendant_font_out[Name("W")] = TrueTypeFont._build_custom_widths_array_for_type_0_font(ttf_font_file, character_identifiers)
+            descendant_font_out[Name("FontDescriptor")] = TrueTypeFont._get_subset_font_descriptor(
+                descendant_font["FontDescriptor"],
+                tag,
+                TrueTypeFont._subset_font_file(ttf_font_file, glyph_ids=character_identifiers),
+            )
+            # fmt: on
+            font_out[Name("DescendantFonts")] = List()
+            font_out["DescendantFonts"].append(descendant_font_out)
+            return font_out
+
+        # TrueTypeFont
+        # the character identifiers are mapped to glyph names (by /Differences)
+        first_char: int = int(font["FirstChar"])
+        character_codes: typing.List[int] = sorted(
+            [
+                x
+                for x in character_identifiers
+                if first_char <= x < first_char + len(font["Widths"])
+            ]
+        )
+        if len(character_codes) == 0:
+            character_codes = [first_char]
+        font_out[Name("FirstChar")] = bDecimal(character_codes[0])
+        font_out[Name("LastChar")] = bDecimal(character_codes[-1])
+        font_out[Name("Widths")] = List()
+        for i in range(character_codes[0], character_codes[-1] + 1):
+            font_out["Widths"].append(font["Widths"][i - first_char])
+
+        # the /Encoding (/Differences) is kept as-is
+        # codes that are not listed in /Differences would otherwise map to glyphs of the /BaseEncoding
+        glyph_names: typing.Dict[int, str] = {}
+        character_code: int = 0
+        for x in font["Encoding"]["Differences"]:
+            if isinstance(x, Name):
+                glyph_names[character_code] = str(x)
+                character_code += 1
+            else:
+                character_code = int(x)
+
+        # subset font file
+        font_out[Name("FontDescriptor")] = TrueTypeFont._get_subset_font_descriptor(
+            font["FontDescriptor"],
+            tag,
+            TrueTypeFont._subset_font_file(
+                TTFont(io.BytesIO(font["FontDescriptor"]["FontFile2"]["DecodedBytes"])),
+                glyph_names=[
+                    glyph_names[x] for x in character_codes if x in glyph_names
+                ],
+            ),
+        )
+        return font_out
+
     @staticmethod
     def _get_font_descriptor(ttf_font_file: TTFont) -> Dictionary:
 
@@ -195,7 +382,10 @@ class TrueTypeFont(Type1Font):
         return font_name
 
     @staticmethod
-    def _build_custom_cmap_for_type_0_font(ttf_font_file: TTFont) -> Stream:
+    def _build_custom_cmap_for_type_0_font(
+        ttf_font_file: TTFont,
+        character_identifiers: typing.Optional[typing.Set[int]] = None,
+    ) -> Stream:
         cmap_prefix: str = """
         /CIDInit /ProcSet findresource begin
         12 dict begin
@@ -212,7 +402,9 @@ class TrueTypeFont(Type1Font):
         # <0000> <0000>
         # endbfchar
         pairs: typing.List[typing.Tuple[str, str]] = []
-        for cid, g in enumerate(ttf_font_file.glyphOrder):
+        for cid, g in enumerate(ttf_font_file.getGlyphOrder()):
+            if character_identifiers is not None and cid not in character_identifiers:
+                continue
             g_unicode: str = toUnicode(g)
             if len(g_unicode) == 0:
                 continue
@@ -252,12 +444,17 @@ class TrueTypeFont(Type1Font):
         return to_unicode_stream
 
     @staticmethod
-    def _build_custom_widths_array_for_type_0_font(ttf_font_file: TTFont) -> List:
+    def _build_custom_widths_array_for_type_0_font(
+        ttf_font_file: TTFont,
+        character_identifiers: typing.Optional[typing.Set[int]] = None,
+    ) -> List:
         units_per_em: bDecimal = bDecimal(ttf_font_file["head"].unitsPerEm)
         cmap = ttf_font_file.getBestCmap()
         glyph_set = ttf_font_file.getGlyphSet()
         widths_array: List = List()
-        for cid, g in enumerate(ttf_font_file.glyphOrder):
+        for cid, g in enumerate(ttf_font_file.getGlyphOrder()):
+            if character_identifiers is not None and cid not in character_identifiers:
+                continue
             glyph_width: bDecimal = bDecimal(0)
             try:
                 glyph_width = bDecimal(
@@ -282,9 +479,9 @@ class TrueTypeFont(Type1Font):
         type_0_font[Name("Encoding")] = Name("Identity-H")
 
         # set ToUnicode
-        type_0_font[
-            Name("ToUnicode")
-        ] = TrueTypeFont._build_custom_cmap_for_type_0_font(ttf_font_file)
+        type_0_font[Name("ToUnicode")] = (
+            TrueTypeFont._build_custom_cmap_for_type_0_font(ttf_font_file)
+        )
 
         # build DescendantFont
         descendant_font: CIDType2Font = CIDType2Font()
@@ -297,9 +494,9 @@ class TrueTypeFont(Type1Font):
         descendant_font[Name("DW")] = bDecimal(250)
 
         # build W array
-        descendant_font[
-            Name("W")
-        ] = TrueTypeFont._build_custom_widths_array_for_type_0_font(ttf_font_file)
+        descendant_font[Name("W")] = (
+            TrueTypeFont._build_custom_widths_array_for_type_0_font(ttf_font_file)
+        )
         descendant_font[Name("CIDToGIDMap")] = Name("Identity")
 
         # build CIDSystemInfo
@@ -45,6 +45,6 @@ class LineSegment:
         This function transforms the start and end of this LineSegment by a given Matrix,
         it returns the transformed LineSegment
         """
-        p0 = matrix.cross(self.x0, self.y0, Decimal(1))
-        p1 = matrix.cross(self.x1, self.y1, Decimal(1))
+        p0 = matrix.cross(self.x0, self.y0, 1)
+        p1 = matrix.cross(self.x1, self.y1, 1)
         return LineSegment(p0[0], p0[1], p1[0], p1[1])
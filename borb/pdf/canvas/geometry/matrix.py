@@ -29,11 +29,19 @@ class Matrix:
         self.mtx: typing.List[typing.List[Decimal]] = [[], [], []]
 
     @staticmethod
-    def identity_matrix() -> "Matrix":
+    def identity_matrix(float_mode: bool = False) -> "Matrix":
         """
         The identity matrix In of size n is the n-by-n matrix in which all the elements on the main diagonal are equal to 1 and all other elements are equal to 0.
+        If float_mode is True, the elements of the returned Matrix are (native) floats rather than Decimal objects.
         """
         m = Matrix()
+        if float_mode:
+            m.mtx = [
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, 1.0],
+            ]
+            return m
         m.mtx = [
             [Decimal(1), Decimal(0), Decimal(0)],
             [Decimal(0), Decimal(1), Decimal(0)],
@@ -47,8 +55,12 @@ class Matrix:
     ):
         """
         This method returns the matrix [[a, b, 0], [c, d, 0], [e, f, 1]]
+        The constants 0 and 1 are of the same type (Decimal or float) as the given values.
         """
         m = Matrix()
+        if isinstance(a, float):
+            m.mtx = [[a, b, 0.0], [c, d, 0.0], [e, f, 1.0]]
+            return m
         m.mtx = [[a, b, Decimal(0)], [c, d, Decimal(0)], [e, f, Decimal(1)]]
         return m
 
@@ -57,17 +69,18 @@ class Matrix:
         This function multiplies this Matrix with another Matrix,
         returning the result
         """
-        m_vals = [
-            [Decimal(0), Decimal(0), Decimal(0)],
-            [Decimal(0), Decimal(0), Decimal(0)],
-            [Decimal(0), Decimal(0), Decimal(0)],
-        ]
-        for i in range(3):
-            for j in range(3):
-                for k in range(3):
-                    m_vals[i][j] += self.mtx[i][k] * y.mtx[k][j]
+        # the sums are written out (rather than accumulated on a zero of a given type)
+        # so this works for both Decimal and float matrices
+        a = self.mtx
+        b = y.mtx
         m = Matrix()
-        m.mtx = m_vals
+        m.mtx = [
+            [
+                a[i][0] * b[0][j] + a[i][1] * b[1][j] + a[i][2] * b[2][j]
+                for j in range(3)
+            ]
+            for i in range(3)
+        ]
         return m
 
     def cross(self, x: Decimal, y: Decimal, z: Decimal):
@@ -94,8 +94,8 @@ class Rectangle:
         return Rectangle(
             self.x + amount,
             self.y + amount,
-            self.width - Decimal(2) * amount,
-            self.height - Decimal(2) * amount,
+            self.width - 2 * amount,
+            self.height - 2 * amount,
         )
 
     def grow(self, amount: Decimal) -> "Rectangle":
@@ -107,6 +107,6 @@ class Rectangle:
         return Rectangle(
             self.x - amount,
             self.y - amount,
-            self.width + Decimal(2) * amount,
-            self.height + Decimal(2) * amount,
+            self.width + 2 * amount,
+            self.height + 2 * amount,
         )
@@ -106,6 +106,9 @@ class FreeTextAnnotation(Annotation):
             font_name = "F%d" % font_number
         page["Resources"]["Font"][Name(font_name)] = self._font
 
+        # the text of the annotation may be edited, the Font can not be subset
+        self._font._mark_all_characters_as_used()
+
         # (Required) The default appearance string that shall be used in formatting
         # the text (see 12.7.3.3, “Variable Text”).
         # The annotation dictionary’s AP entry, if present, shall take precedence
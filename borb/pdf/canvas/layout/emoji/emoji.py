@@ -47,6 +47,7 @@ class Emoji(Image):
         """
         self._multiplied_leading = None
         self._fixed_leading = fixed_leading
+        self._clear_layout_box_cache()
         return self
 
     def set_multiplied_leading(self, multiplied_leading: Decimal) -> "Emoji":
@@ -57,6 +58,7 @@ class Emoji(Image):
         """
         self._fixed_leading = None
         self._multiplied_leading = multiplied_leading
+        self._clear_layout_box_cache()
         return self
 
     def set_font_size(self, font_size: Decimal) -> "Emoji":
@@ -68,6 +70,7 @@ class Emoji(Image):
         self._font_size = font_size
         self._width = self._font_size
         self._height = self._font_size
+        self._clear_layout_box_cache()
         return self
 
     def _do_layout_without_padding(
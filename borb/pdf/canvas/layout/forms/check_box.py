@@ -135,17 +135,22 @@ class CheckBox(FormField):
             catalog["AcroForm"][Name("NeedAppearances")] = Boolean(True)
         catalog["AcroForm"]["Fields"].append(self._widget_dictionary)
 
-    def _do_layout(self, page: "Page", layout_box: Rectangle) -> Rectangle:
-
-        # determine layout rectangle
+    def _calculate_layout_box(self, page: "Page", bounding_box: Rectangle) -> Rectangle:
+        # the layout rectangle only depends on the font size
+        # (the widget dictionary is only created when this CheckBox is laid out)
         assert self._font_size is not None
-        layout_rect = Rectangle(
-            layout_box.x,
-            layout_box.y + layout_box.height - self._font_size,
-            max(layout_box.width, Decimal(64)),
+        return Rectangle(
+            bounding_box.x,
+            bounding_box.y + bounding_box.height - self._font_size,
+            max(bounding_box.width, Decimal(64)),
             self._font_size + Decimal(10),
         )
 
+    def _do_layout(self, page: "Page", layout_box: Rectangle) -> Rectangle:
+
+        # determine layout rectangle
+        layout_rect: Rectangle = self._calculate_layout_box(page, layout_box)
+
         # init self._widget_dictionary
         self._init_widget_dictionary(page, layout_rect)
 
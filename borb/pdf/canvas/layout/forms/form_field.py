@@ -50,12 +50,17 @@ class FormField(LayoutElement):
             page["Resources"][Name("Font")] = Dictionary()
 
         # insert font into resources
-        font_resource_name = [
-            k for k, v in page["Resources"]["Font"].items() if v == font
-        ]
-        if len(font_resource_name) > 0:
-            return font_resource_name[0]
-        else:
+        font_resource_name: typing.Optional[Name] = next(
+            iter([k for k, v in page["Resources"]["Font"].items() if v == font]), None
+        )
+        if font_resource_name is None:
             font_index = len(page["Resources"]["Font"]) + 1
-            page["Resources"]["Font"][Name("F%d" % font_index)] = font
-            return Name("F%d" % font_index)
+            font_resource_name = Name("F%d" % font_index)
+            page["Resources"]["Font"][font_resource_name] = font
+
+        # any text may be entered in a form field, the Font can not be subset
+        if isinstance(page["Resources"]["Font"][font_resource_name], Font):
+            page["Resources"]["Font"][font_resource_name]._mark_all_characters_as_used()
+
+        # return
+        return font_resource_name
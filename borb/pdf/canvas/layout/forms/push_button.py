@@ -166,16 +166,9 @@ class PushButton(FormField):
             catalog["AcroForm"][Name("NeedAppearances")] = Boolean(True)
         catalog["AcroForm"]["Fields"].append(self._widget_dictionary)
 
-    def _do_layout(self, page: "Page", layout_box: Rectangle) -> Rectangle:
-
-        # determine layout rectangle
-        assert self._font_size is not None
-
-        # init self._widget_dictionary
-        self._init_widget_dictionary(page)
-
-        # layout text
-        text_layout_box = LineOfText(
+    def _get_line_of_text(self) -> LineOfText:
+        # the text (and border, background) of this PushButton is rendered by a LineOfText
+        return LineOfText(
             self._text,
             background_color=self._background_color,
             border_bottom=self._border_bottom,
@@ -195,7 +188,26 @@ class PushButton(FormField):
             padding_left=self._padding_left,
             padding_right=self._padding_right,
             padding_top=self._padding_top,
-        ).layout(page, layout_box)
+        )
+
+    def _calculate_layout_box(self, page: "Page", bounding_box: Rectangle) -> Rectangle:
+        # the layout rectangle is that of the LineOfText
+        # (the widget dictionary is only created when this PushButton is laid out)
+        assert self._font_size is not None
+        return self._get_line_of_text()._calculate_aligned_layout_box(
+            page, bounding_box
+        )
+
+    def _do_layout(self, page: "Page", layout_box: Rectangle) -> Rectangle:
+
+        # determine layout rectangle
+        assert self._font_size is not None
+
+        # init self._widget_dictionary
+        self._init_widget_dictionary(page)
+
+        # layout text
+        text_layout_box = self._get_line_of_text().layout(page, layout_box)
 
         # set location
         # fmt: off
@@ -143,20 +143,29 @@ class TextField(FormField):
             catalog["AcroForm"][Name("NeedAppearances")] = Boolean(True)
         catalog["AcroForm"]["Fields"].append(self._widget_dictionary)
 
-    def _do_layout_without_padding(
+    def _calculate_layout_box_without_padding(
         self, page: "Page", layout_box: Rectangle
     ) -> Rectangle:
-
-        # determine layout rectangle
+        # the layout rectangle only depends on the font size
+        # (the widget dictionary is only created when this TextField is laid out)
         assert self._font_size is not None
         assert layout_box.height > self._font_size
-        layout_rect = Rectangle(
+        return Rectangle(
             layout_box.x,
             layout_box.y + layout_box.height - self._font_size,
             max(layout_box.width, Decimal(64)),
             self._font_size,
         )
 
+    def _do_layout_without_padding(
+        self, page: "Page", layout_box: Rectangle
+    ) -> Rectangle:
+
+        # determine layout rectangle
+        layout_rect: Rectangle = self._calculate_layout_box_without_padding(
+            page, layout_box
+        )
+
         # init self._widget_dictionary
         self._init_widget_dictionary(page, layout_rect)
 
@@ -140,7 +140,10 @@ class FreeSpaceFinder(EventListener):
 
         # BeginPageEvent
         if isinstance(event, BeginPageEvent):
-            self._page_number += 1
+            page_number: typing.Optional[int] = event.get_page_number()
+            self._page_number = (
+                page_number if page_number is not None else self._page_number + 1
+            )
             self._grid_per_page[self._page_number] = FreeSpaceFinder.Grid(
                 event.get_page().get_page_info().get_width() or Decimal(0),
                 event.get_page().get_page_info().get_height() or Decimal(0),
@@ -90,6 +90,9 @@ class Image(LayoutElement):
         self.set_bounding_box(layout_box)
         return layout_box
 
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        return self._width
+
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
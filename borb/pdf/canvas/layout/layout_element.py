@@ -6,14 +6,13 @@ This file contains all the classes needed to perform layout.
 This includes an Alignment Enum type, and the base implementation of LayoutElement
 """
 import typing
-import zlib
 from decimal import Decimal
 from enum import Enum
 
-from borb.io.read.types import Decimal as bDecimal
 from borb.io.read.types import Dictionary, Name, Stream
 from borb.pdf.canvas.color.color import Color, HexColor
 from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.page.page import Page
 
 
 class Alignment(Enum):
@@ -115,6 +114,11 @@ class LayoutElement:
         # layout
         self.bounding_box: typing.Optional[Rectangle] = None
 
+        # measurement (memoized per available box)
+        self._layout_box_cache: typing.Dict[
+            typing.Tuple[Decimal, Decimal, Decimal, Decimal], Rectangle
+        ] = {}
+
     def get_font_size(self) -> Decimal:
         """
         This function returns the font size of this LayoutElement
@@ -158,17 +162,14 @@ class LayoutElement:
         """
         return self.bounding_box
 
-    def _initialize_page_content_stream(self, page: "Page"):  # type: ignore[name-defined]
+    def _initialize_page_content_stream(self, page: Page):
 
         # build content stream object
+        # its /Bytes (and /Length) are calculated (only once) when the Document is written
         if "Contents" not in page:
             content_stream = Stream()
-            content_stream[Name("DecodedBytes")] = b""
-            content_stream[Name("Bytes")] = zlib.compress(
-                content_stream["DecodedBytes"], 9
-            )
+            content_stream[Name("DecodedBytes")] = bytearray()
             content_stream[Name("Filter")] = Name("FlateDecode")
-            content_stream[Name("Length")] = bDecimal(len(content_stream["Bytes"]))
 
             # set content of page
             page[Name("Contents")] = content_stream
@@ -177,23 +178,69 @@ class LayoutElement:
         if "Resources" not in page:
             page[Name("Resources")] = Dictionary()
 
-    def _append_to_content_stream(self, page: "Page", instructions: str):  # type: ignore[name-defined]
-        self._initialize_page_content_stream(page)
+    @staticmethod
+    def _get_page_content_stream_buffer(page: Page) -> bytearray:
+        """
+        This function returns the (decoded) content stream of the given Page, as an append-only buffer.
+        Any (compressed) /Bytes are dropped, the content stream is compressed when the Document is written.
+        """
         content_stream = page["Contents"]
+        decoded_bytes = content_stream["DecodedBytes"]
+        if not isinstance(decoded_bytes, bytearray):
+            decoded_bytes = bytearray(decoded_bytes)
+            content_stream[Name("DecodedBytes")] = decoded_bytes
+        for k in ["Bytes", "Length"]:
+            if k in content_stream:
+                content_stream.pop(Name(k))
+        content_stream.set_is_modified(True)
+        return decoded_bytes
+
+    @staticmethod
+    def _get_page_content_stream_marker(page: Page) -> int:
+        """
+        This function returns a marker (the current length of the content stream of the given Page).
+        Everything that is added to the content stream after the marker can be rolled back to it.
+        """
+        return len(page["Contents"]["DecodedBytes"])
+
+    @staticmethod
+    def _rollback_page_content_stream(page: Page, marker: int) -> bytes:
+        """
+        This function removes everything that was added to the content stream of the given Page after the marker,
+        and returns the removed content
+        """
+        decoded_bytes: bytearray = LayoutElement._get_page_content_stream_buffer(page)
+        removed_content: bytes = bytes(decoded_bytes[marker:])
+        del decoded_bytes[marker:]
+        return removed_content
+
+    def _append_to_content_stream(self, page: Page, instructions: str):
+        self._initialize_page_content_stream(page)
+        decoded_bytes: bytearray = self._get_page_content_stream_buffer(page)
 
         # prepend whitespace if needed
-        if len(content_stream[Name("DecodedBytes")]) != 0:
+        if len(decoded_bytes) != 0:
             # fmt: off
-            decoded_bytes_last_char: str = str(content_stream["DecodedBytes"][-1:], encoding="latin1")
+            decoded_bytes_last_char: str = str(decoded_bytes[-1:], encoding="latin1")
             if decoded_bytes_last_char not in [" ", "\t", "\n"] and instructions[0] not in [" ", "\t", "\n"]:
                 instructions = " " + instructions
             # fmt: on
 
-        content_stream[Name("DecodedBytes")] += instructions.encode("latin1")
-        content_stream[Name("Bytes")] = zlib.compress(content_stream["DecodedBytes"], 9)
-        content_stream[Name("Length")] = bDecimal(len(content_stream["Bytes"]))
+        decoded_bytes += instructions.encode("latin1")
+
+    def _calculate_layout_box(self, page: Page, bounding_box: Rectangle) -> Rectangle:
 
-    def _calculate_layout_box(self, page: "Page", bounding_box: Rectangle) -> Rectangle:  # type: ignore[name-defined]
+        # check cache
+        key: typing.Tuple[Decimal, Decimal, Decimal, Decimal] = (
+            bounding_box.x,
+            bounding_box.y,
+            bounding_box.width,
+            bounding_box.height,
+        )
+        cached_layout_box: typing.Optional[Rectangle] = self._layout_box_cache.get(key)
+        if cached_layout_box is not None:
+            self.set_bounding_box(cached_layout_box)
+            return cached_layout_box
 
         # modify bounding box (to take into account padding)
         modified_layout_box = Rectangle(
@@ -224,33 +271,62 @@ class LayoutElement:
 
         # set
         self.set_bounding_box(modified_returned_layout_box)
+        self._layout_box_cache[key] = modified_returned_layout_box
 
         # return
         return modified_returned_layout_box
 
     def _calculate_layout_box_without_padding(
-        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
+        self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
+        # LayoutElement implementations that can not be measured (without being rendered)
+        # are laid out, after which the content stream of the Page is rolled back
 
         # store previous contents
         if "Contents" not in page:
             self._initialize_page_content_stream(page)
-        previous_decoded_bytes = page["Contents"]["DecodedBytes"]
+        marker: int = self._get_page_content_stream_marker(page)
 
         # layout without padding
         layout_rect = self._do_layout_without_padding(page, bounding_box)
         assert layout_rect is not None
 
         # restore
-        content_stream = page["Contents"]
-        content_stream[Name("DecodedBytes")] = previous_decoded_bytes
-        content_stream[Name("Bytes")] = zlib.compress(content_stream["DecodedBytes"], 9)
-        content_stream[Name("Length")] = bDecimal(len(content_stream["Bytes"]))
+        self._rollback_page_content_stream(page, marker)
 
         # return
         return layout_rect
 
-    def _do_layout(self, page: "Page", layout_box: Rectangle) -> Rectangle:  # type: ignore[name-defined]
+    def _calculate_aligned_layout_box(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+        layout_box: Rectangle = self._calculate_layout_box(page, bounding_box)
+        aligned_bounding_box: Rectangle = self._get_aligned_bounding_box(
+            bounding_box, layout_box
+        )
+        if aligned_bounding_box is bounding_box:
+            return layout_box
+        return self._calculate_layout_box(page, aligned_bounding_box)
+
+    def _calculate_min_content_width(self) -> typing.Optional[Decimal]:
+        # the min-content width is the smallest width this LayoutElement can be laid out in (without overflowing)
+        min_content_width: typing.Optional[
+            Decimal
+        ] = self._calculate_min_content_width_without_padding()
+        if min_content_width is None:
+            return None
+        return min_content_width + self._padding_left + self._padding_right
+
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        # LayoutElement implementations that can not calculate their min-content width (without being measured)
+        # return None, in which case the min-content width is found by measuring the LayoutElement (repeatedly)
+        return None
+
+    def _clear_layout_box_cache(self) -> None:
+        # this function should be called whenever a LayoutElement is modified in a way that changes its size
+        self._layout_box_cache.clear()
+
+    def _do_layout(self, page: Page, layout_box: Rectangle) -> Rectangle:
 
         # modify bounding box (to take into account padding)
         modified_bounding_box = Rectangle(
@@ -281,7 +357,26 @@ class LayoutElement:
         # return
         return modified_layout_rect
 
-    def layout(self, page: "Page", bounding_box: Rectangle) -> Rectangle:  # type: ignore[name-defined]
+    def measure(self, available_box: Rectangle) -> Rectangle:
+        """
+        This function returns the layout box this LayoutElement would occupy, if it were laid out in the given (available) box.
+        Nothing is rendered, and results are memoized (per available box).
+        LayoutElement implementations that can only be measured by rendering them, are laid out on a scratch Page.
+        """
+        return self._calculate_aligned_layout_box(Page(), available_box)
+
+    def split(
+        self, available_box: Rectangle
+    ) -> typing.Optional[typing.Tuple["LayoutElement", "LayoutElement"]]:
+        """
+        This function splits this LayoutElement into a (first) part that fits in the given (available) box,
+        and a (second) part that holds the remainder of its content.
+        This function returns None if this LayoutElement fits in the available box,
+        or if it can not be split (in a sensible way) to fit in the available box.
+        """
+        return None
+
+    def layout(self, page: Page, bounding_box: Rectangle) -> Rectangle:
         """
         This function calculates the layout box and performs layout for this LayoutElement.
         e.g. for a Paragraph this might involve taking into account the word hyphenation,
@@ -290,7 +385,7 @@ class LayoutElement:
         return self.calculate_layout_box_and_do_layout(page, bounding_box)
 
     def calculate_layout_box_and_do_layout(
-        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
+        self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
         """
         This function calculates the layout box and performs layout for this LayoutElement.
@@ -302,8 +397,37 @@ class LayoutElement:
         self._initialize_page_content_stream(page)
         layout_box = self._calculate_layout_box(page, bounding_box)
 
-        content_stream = page["Contents"]
-        len_decoded_bytes_before = len(content_stream[Name("DecodedBytes")])
+        marker: int = self._get_page_content_stream_marker(page)
+
+        # set the vertical and horizontal alignment
+        bounding_box = self._get_aligned_bounding_box(bounding_box, layout_box)
+
+        # perform layout
+        final_layout_box = self._do_layout(page, bounding_box)
+        self.set_bounding_box(final_layout_box)
+
+        # add background
+        if self._background_color is not None:
+
+            # change content stream to put background before rendering of the content
+            added_content: bytes = self._rollback_page_content_stream(page, marker)
+
+            # add background
+            self._draw_background(page, final_layout_box)
+
+            # re-add content
+            self._get_page_content_stream_buffer(page).extend(added_content)
+
+        return final_layout_box
+
+    def _do_layout_without_padding(
+        self, page: Page, layout_box: Rectangle
+    ) -> Rectangle:
+        return Rectangle(layout_box.x, layout_box.y, Decimal(0), Decimal(0))
+
+    def _get_aligned_bounding_box(
+        self, bounding_box: Rectangle, layout_box: Rectangle
+    ) -> Rectangle:
 
         # set the vertical alignment
         if self._vertical_alignment == Alignment.MIDDLE:
@@ -339,39 +463,10 @@ class LayoutElement:
                 bounding_box.height,
             )
 
-        # perform layout
-        final_layout_box = self._do_layout(page, bounding_box)
-        self.set_bounding_box(final_layout_box)
-
-        # add background
-        if self._background_color is not None:
-
-            # change content stream to put background before rendering of the content
-            added_content = content_stream[Name("DecodedBytes")][
-                len_decoded_bytes_before:
-            ]
-            content_stream[Name("DecodedBytes")] = content_stream[Name("DecodedBytes")][
-                0:len_decoded_bytes_before
-            ]
-
-            # add background
-            self._draw_background(page, final_layout_box)
-
-            # re-add content
-            content_stream[Name("DecodedBytes")] += added_content
-            content_stream[Name("Bytes")] = zlib.compress(
-                content_stream[Name("DecodedBytes")], 9
-            )
-            content_stream[Name("Length")] = len(content_stream[Name("Bytes")])
-
-        return final_layout_box
-
-    def _do_layout_without_padding(
-        self, page: "Page", layout_box: Rectangle  # type: ignore[name-defined]
-    ) -> Rectangle:
-        return Rectangle(layout_box.x, layout_box.y, Decimal(0), Decimal(0))
+        # return
+        return bounding_box
 
-    def _draw_background(self, page: "Page", border_box: Rectangle):  # type: ignore[name-defined]
+    def _draw_background(self, page: Page, border_box: Rectangle):
         if not self._background_color:
             return
         assert self._background_color
@@ -393,7 +488,7 @@ class LayoutElement:
         )
         self._append_to_content_stream(page, content)
 
-    def _draw_border(self, page: "Page", border_box: Rectangle):  # type: ignore[name-defined]
+    def _draw_border(self, page: Page, border_box: Rectangle):
         # border is not wanted on any side
         if (
             self._border_top
@@ -70,6 +70,7 @@ class List(LayoutElement):
             self._margin_bottom = element.get_font_size()
         self._items.append(element)
         element._parent = self
+        self._clear_layout_box_cache()
         return self
 
     def _get_bullet_layout_element(
@@ -82,9 +83,19 @@ class List(LayoutElement):
             font="Zapfdingbats",
         )
 
+    def _calculate_layout_box_without_padding(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+        return self._layout_items(page, bounding_box, do_layout=False)
+
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
+        return self._layout_items(page, bounding_box, do_layout=True)
+
+    def _layout_items(
+        self, page: Page, bounding_box: Rectangle, do_layout: bool
+    ) -> Rectangle:
 
         # calculate the height of each item
         bullet_margin: Decimal = Decimal(20)
@@ -118,6 +129,22 @@ class List(LayoutElement):
             item_height: Decimal = item_bounding_box.get_height()
             # fmt: on
 
+            # content
+            item_content_box: Rectangle = Rectangle(
+                bounding_box.x + bullet_margin + item.get_margin_left(),
+                previous_item_bottom - item_height,
+                bounding_box.width
+                - bullet_margin
+                - item.get_margin_right()
+                - item.get_margin_left(),
+                item_height,
+            )
+
+            # measuring does not need the bullet character
+            if not do_layout:
+                item._calculate_aligned_layout_box(page, item_content_box)
+                continue
+
             # bullet character
             self._get_bullet_layout_element(index, item).layout(
                 page=page,
@@ -129,18 +156,7 @@ class List(LayoutElement):
                 ),
             )
             # content
-            item.layout(
-                page,
-                bounding_box=Rectangle(
-                    bounding_box.x + bullet_margin + item.get_margin_left(),
-                    previous_item_bottom - item_height,
-                    bounding_box.width
-                    - bullet_margin
-                    - item.get_margin_right()
-                    - item.get_margin_left(),
-                    item_height,
-                ),
-            )
+            item.layout(page, bounding_box=item_content_box)
 
         # fmt: off
         layout_rect = Rectangle(
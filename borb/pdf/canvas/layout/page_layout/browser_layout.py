@@ -9,7 +9,6 @@ import typing
 from decimal import Decimal
 from enum import Enum
 
-from borb.io.read.types import Name
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.horizontal_rule import HorizontalRule
 from borb.pdf.canvas.layout.image.image import Image
@@ -149,9 +148,11 @@ class BrowserLayout(PageLayout):
         # fmt: on
 
         # page content
-        self._page_content_stream_restore: bytes = b""
+        self._page_content_stream_marker: int = 0
         if "Contents" in self._page and "DecodedBytes" in self._page["Contents"]:
-            self._page_content_stream_restore = self._page["Contents"]["DecodedBytes"]
+            self._page_content_stream_marker = (
+                LayoutElement._get_page_content_stream_marker(self._page)
+            )
 
         # margins
         if horizontal_margin is None:
@@ -210,14 +211,16 @@ class BrowserLayout(PageLayout):
         pdf_document.append_page(page)
 
         # layout and reset rows
-        self._page["Contents"][Name("DecodedBytes")] = self._page_content_stream_restore
+        LayoutElement._rollback_page_content_stream(
+            self._page, self._page_content_stream_marker
+        )
         for e in self._rows[-1]._layout_elements:
             e.layout(self._page, e.get_bounding_box())  # type: ignore [arg-type]
         self._rows.clear()
 
         # reset layout
         self._page = page
-        self._page_content_stream_restore = b""
+        self._page_content_stream_marker = 0
 
     def _check_layout_element_dimensions(self, layout_element: LayoutElement) -> None:
         # content that is too large for the page should not be attempted to be laid out again
@@ -276,7 +279,9 @@ class BrowserLayout(PageLayout):
 
         # else append to new row
         layout_element.layout(self._page, layout_element.get_bounding_box())  # type: ignore [arg-type]
-        self._page_content_stream_restore = self._page["Contents"][Name("DecodedBytes")]
+        self._page_content_stream_marker = (
+            LayoutElement._get_page_content_stream_marker(self._page)
+        )
         self._rows.append(BrowserLayoutRow(DisplayValue.BLOCK).append(layout_element))
 
     def _add_inline_element(self, layout_element: LayoutElement) -> None:
@@ -336,10 +341,10 @@ class BrowserLayout(PageLayout):
 
             # ensure page content is correct
             # fmt: off
-            self._page["Contents"][Name("DecodedBytes")] = self._page_content_stream_restore
+            LayoutElement._rollback_page_content_stream(self._page, self._page_content_stream_marker)
             for e in self._rows[-1]._layout_elements:
                 e.layout(self._page, e.get_bounding_box())  # type: ignore [arg-type]
-            self._page_content_stream_restore = self._page["Contents"][Name("DecodedBytes")]
+            self._page_content_stream_marker = LayoutElement._get_page_content_stream_marker(self._page)
             # fmt: on
 
             # append new row
@@ -354,7 +359,9 @@ class BrowserLayout(PageLayout):
         self._rows[-1]._align_ys()
 
         # ensure page content is correct
-        self._page["Contents"][Name("DecodedBytes")] = self._page_content_stream_restore
+        LayoutElement._rollback_page_content_stream(
+            self._page, self._page_content_stream_marker
+        )
         for e in self._rows[-1]._layout_elements:
             e.layout(self._page, e.get_bounding_box())  # type: ignore [arg-type]
 
@@ -7,11 +7,8 @@ This module contains various implementations of `PageLayout`.
 having to specify coordinates.
 """
 import typing
-import zlib
 from decimal import Decimal
 
-from borb.io.read.types import Decimal as bDecimal
-from borb.io.read.types import Name
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.layout_element import LayoutElement
 from borb.pdf.canvas.layout.page_layout.page_layout import PageLayout
@@ -185,10 +182,20 @@ class MultiColumnLayout(PageLayout):
         )
         # fmt: on
 
+        # LayoutElement(s) that do not fit in the available space (e.g. a Table with many rows) may be split
+        # the first part is laid out in the current column, the second part (and its remainder) in the next column(s)
+        first_and_second_part: typing.Optional[
+            typing.Tuple[LayoutElement, LayoutElement]
+        ] = layout_element.split(next_available_rect)
+        if first_and_second_part is not None:
+            self.add(first_and_second_part[0])
+            self.switch_to_next_column()
+            return self.add(first_and_second_part[1])
+
         # store previous contents
         if "Contents" not in self._page:
             layout_element._initialize_page_content_stream(self._page)
-        previous_decoded_bytes = self._page["Contents"]["DecodedBytes"]
+        marker: int = layout_element._get_page_content_stream_marker(self._page)
 
         # attempt layout
         layout_rect = layout_element.layout(
@@ -211,12 +218,7 @@ class MultiColumnLayout(PageLayout):
 
         # switch to next column
         if layout_rect.y < self._vertical_margin:
-            content_stream = self._page["Contents"]
-            content_stream[Name("DecodedBytes")] = previous_decoded_bytes
-            content_stream[Name("Bytes")] = zlib.compress(
-                content_stream["DecodedBytes"], 9
-            )
-            content_stream[Name("Length")] = bDecimal(len(content_stream["Bytes"]))
+            layout_element._rollback_page_content_stream(self._page, marker)
             self.switch_to_next_column()
             return self.add(layout_element)
 
@@ -99,6 +99,37 @@ class DisjointShape(LayoutElement):
         ]
         return self
 
+    def _calculate_layout_box_without_padding(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+
+        # scale to fit (without modifying the lines of this DisjointShape)
+        width: Decimal = self.get_width()
+        height: Decimal = self.get_height()
+        w_scale = bounding_box.width / width
+        h_scale = bounding_box.height / height
+        if self._preserve_aspect_ratio:
+            w_scale = min(w_scale, h_scale)
+            h_scale = w_scale
+        if w_scale < 1:
+            width *= w_scale
+        if h_scale < 1:
+            height *= h_scale
+
+        # calculate bounding box
+        layout_rect = Rectangle(
+            bounding_box.x,
+            bounding_box.y + bounding_box.height - height,
+            width,
+            height,
+        )
+
+        # set bounding box
+        self.set_bounding_box(layout_rect)
+
+        # return
+        return layout_rect
+
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
@@ -120,6 +120,27 @@ class Shape(LayoutElement):
         delta_y = lower_left_y - min_y
         self._points = [(x[0] + delta_x, x[1] + delta_y) for x in self._points]
 
+    def _calculate_layout_box_without_padding(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+
+        # calculate bounding box
+        layout_rect = Rectangle(
+            bounding_box.x,
+            bounding_box.y + bounding_box.height - self.get_height(),
+            self.get_width(),
+            self.get_height(),
+        )
+
+        # set bounding box
+        self.set_bounding_box(layout_rect)
+
+        # return
+        return layout_rect
+
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        return self.get_width()
+
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
@@ -5,16 +5,13 @@
 This class represents a Table with columns of fixed width
 """
 import typing
-import zlib
 from decimal import Decimal
 from math import floor
 
-from borb.io.read.types import Name
 from borb.pdf.canvas.color.color import Color, HexColor
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.layout_element import Alignment
 from borb.pdf.canvas.layout.table.table import Table
-from borb.pdf.canvas.layout.text.paragraph import Paragraph
 from borb.pdf.page.page import Page
 
 
@@ -45,6 +42,7 @@ class FixedColumnWidthTable(Table):
         horizontal_alignment: Alignment = Alignment.LEFT,
         vertical_alignment: Alignment = Alignment.TOP,
         background_color: typing.Optional[Color] = None,
+        number_of_header_rows: int = 0,
     ):
         super(FixedColumnWidthTable, self).__init__(
             number_of_rows=number_of_rows,
@@ -66,15 +64,26 @@ class FixedColumnWidthTable(Table):
             background_color=background_color,
             horizontal_alignment=horizontal_alignment,
             vertical_alignment=vertical_alignment,
+            number_of_header_rows=number_of_header_rows,
         )
         if len(column_widths) == 0:
             column_widths = [Decimal(1) for _ in range(0, number_of_columns)]
         assert len(column_widths) == number_of_columns
         self._column_widths: typing.List[Decimal] = column_widths
 
+    def _calculate_layout_box_without_padding(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+        return self._layout_cells(page, bounding_box, do_layout=False)
+
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
+        return self._layout_cells(page, bounding_box, do_layout=True)
+
+    def _layout_cells(
+        self, page: Page, bounding_box: Rectangle, do_layout: bool
+    ) -> Rectangle:
 
         # calculate column_bounds
         column_bounds: typing.List[Decimal] = [bounding_box.get_x()]
@@ -90,20 +99,17 @@ class FixedColumnWidthTable(Table):
             )
 
         # auto fill table
-        number_of_cells: int = self._number_of_rows * self._number_of_columns
-        empty_cells: int = number_of_cells - sum(
-            [(x._row_span * x._col_span) for x in self._content]
-        )
-        for _ in range(0, empty_cells):
-            self.add(Paragraph(" ", respect_spaces_in_text=True))
+        self._auto_fill()
 
         # We are going to store the offset, to ensure we can draw backgrounds and borders later.
         # We want backgrounds and borders to be drawn first, which requires us to mess around
         # with the raw content bytes a bit.
         # This is not exactly an ideal solution, but it is a fast solution.
-        page_content_stream_marker = len(page["Contents"][Name("DecodedBytes")])
+        page_content_stream_marker: int = 0
+        if do_layout:
+            page_content_stream_marker = self._get_page_content_stream_marker(page)
 
-        # lay out content
+        # lay out (or measure) content
         row_bounds: typing.List[Decimal] = [
             Decimal(floor(bounding_box.get_y() + bounding_box.get_height()))
             for _ in range(0, self._number_of_rows + 1)
@@ -116,24 +122,27 @@ class FixedColumnWidthTable(Table):
             x: Decimal = column_bounds[min([p[1] for p in t._table_coordinates])]
             w: Decimal = column_bounds[max([p[1] for p in t._table_coordinates]) + 1] - x
             y: Decimal = Decimal(0)
-            h: Decimal = row_bounds[min([p[0] for p in t._table_coordinates])]
+            h: Decimal = row_bounds[min([self._get_row_index(p[0]) for p in t._table_coordinates])]
             # fmt: on
 
             # layout
-            t.layout(page, Rectangle(x, y, w, h))
+            if do_layout:
+                t.layout(page, Rectangle(x, y, w, h))
+            else:
+                t._calculate_layout_box(page, Rectangle(x, y, w, h))
             tbb: typing.Optional[Rectangle] = t.get_bounding_box()
             assert tbb is not None
 
             # update row_bounds
-            max_row = max([p[0] for p in t._table_coordinates]) + 1
+            max_row = max([self._get_row_index(p[0]) for p in t._table_coordinates]) + 1
             row_bounds[max_row] = min(row_bounds[max_row], Decimal(floor(tbb.get_y())))
 
         # update bounds of content
         for t in self._content:
             x = column_bounds[min([p[1] for p in t._table_coordinates])]
             w = column_bounds[max([p[1] for p in t._table_coordinates]) + 1] - x
-            max_row = max([p[0] for p in t._table_coordinates]) + 1
-            min_row = min([p[0] for p in t._table_coordinates])
+            max_row = max([self._get_row_index(p[0]) for p in t._table_coordinates]) + 1
+            min_row = min([self._get_row_index(p[0]) for p in t._table_coordinates])
             y = row_bounds[max_row]
             h = row_bounds[min_row] - y
             t.bounding_box = Rectangle(x, y, w, h)
@@ -148,13 +157,14 @@ class FixedColumnWidthTable(Table):
         )
         # fmt: on
 
+        # measuring does not need backgrounds and borders
+        if not do_layout:
+            return bounding_box
+
         # change content stream to put background before rendering of the content
-        table_content_bytes = page["Contents"][Name("DecodedBytes")][
-            page_content_stream_marker:
-        ]
-        page["Contents"][Name("DecodedBytes")] = page["Contents"][Name("DecodedBytes")][
-            0:page_content_stream_marker
-        ]
+        table_content_bytes: bytes = self._rollback_page_content_stream(
+            page, page_content_stream_marker
+        )
 
         # draw borders
         for t in self._content:
@@ -167,11 +177,7 @@ class FixedColumnWidthTable(Table):
             t._draw_background_after_layout(page, t.bounding_box)
 
         # re-add content
-        page["Contents"][Name("DecodedBytes")] += table_content_bytes
-        page["Contents"][Name("Bytes")] = zlib.compress(
-            page["Contents"][Name("DecodedBytes")], 9
-        )
-        page["Contents"][Name("Length")] = len(page["Contents"][Name("Bytes")])
+        self._get_page_content_stream_buffer(page).extend(table_content_bytes)
 
         # return
         return bounding_box
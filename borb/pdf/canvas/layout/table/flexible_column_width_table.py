@@ -7,16 +7,13 @@ a width based on their contents. It tries to emulate the behaviour
 of <table> elements in HTML
 """
 import typing
-import zlib
 from decimal import Decimal
 from math import floor
 
-from borb.io.read.types import Name
 from borb.pdf.canvas.color.color import Color, HexColor
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.layout_element import Alignment
 from borb.pdf.canvas.layout.table.table import Table, TableCell
-from borb.pdf.canvas.layout.text.paragraph import Paragraph
 from borb.pdf.page.page import Page
 
 
@@ -48,6 +45,7 @@ class FlexibleColumnWidthTable(Table):
         horizontal_alignment: Alignment = Alignment.LEFT,
         vertical_alignment: Alignment = Alignment.TOP,
         background_color: typing.Optional[Color] = None,
+        number_of_header_rows: int = 0,
     ):
         super(FlexibleColumnWidthTable, self).__init__(
             number_of_rows=number_of_rows,
@@ -69,14 +67,25 @@ class FlexibleColumnWidthTable(Table):
             background_color=background_color,
             horizontal_alignment=horizontal_alignment,
             vertical_alignment=vertical_alignment,
+            number_of_header_rows=number_of_header_rows,
         )
 
-    def _do_layout_without_padding(
+        # column widths
+        # the minimum and maximum column widths are calculated once, the column widths are memoized (per available width)
+        # both are shared by all parts of a FlexibleColumnWidthTable (e.g. when it is split across pages)
+        self._min_and_max_column_widths: typing.Optional[
+            typing.Tuple[typing.List[Decimal], typing.List[Decimal]]
+        ] = None
+        self._column_widths_cache: typing.Dict[Decimal, typing.List[Decimal]] = {}
+
+    def _calculate_min_and_max_column_widths(
         self,
-        page: "Page",
-        bounding_box: Rectangle,  # type: ignore[name-defined]
-        do_layout: bool = False,
-    ) -> Rectangle:
+    ) -> typing.Tuple[typing.List[Decimal], typing.List[Decimal]]:
+
+        # check cache
+        if self._min_and_max_column_widths is not None:
+            return self._min_and_max_column_widths
+
         # 1.    Calculate the minimum content width (MCW) of each cell: the formatted content may span any number of lines but may not overflow the cell box.
         #       If the specified 'width' (W) of the cell is greater than MCW, W is the minimum cell width.
         #       A value of 'auto' means that MCW is the minimum cell width.
@@ -170,6 +179,26 @@ class FlexibleColumnWidthTable(Table):
         #       so that together they are at least as wide as the column group's 'width'.
         #
         # This gives a maximum and minimum width for each column.
+        self._min_and_max_column_widths = (min_column_widths, max_column_widths)
+        return self._min_and_max_column_widths
+
+    def _calculate_column_widths(
+        self, available_width: Decimal
+    ) -> typing.List[Decimal]:
+
+        # check cache
+        cached_column_widths: typing.Optional[
+            typing.List[Decimal]
+        ] = self._column_widths_cache.get(available_width)
+        if cached_column_widths is not None:
+            return cached_column_widths
+
+        # minimum and maximum column widths
+        min_and_max_column_widths: typing.Tuple[
+            typing.List[Decimal], typing.List[Decimal]
+        ] = self._calculate_min_and_max_column_widths()
+        min_column_widths: typing.List[Decimal] = min_and_max_column_widths[0]
+        max_column_widths: typing.List[Decimal] = min_and_max_column_widths[1]
 
         # 5. calculate column width based on min, max and bounding box
         # start by assigning each column its minimum width
@@ -185,7 +214,7 @@ class FlexibleColumnWidthTable(Table):
             ]
         )
         while (
-            sum(column_widths) + number_of_expandable_columns < bounding_box.get_width()
+            sum(column_widths) + number_of_expandable_columns < available_width
             and number_of_expandable_columns > 0
         ):
             for i in range(0, len(column_widths)):
@@ -199,12 +228,59 @@ class FlexibleColumnWidthTable(Table):
                 ]
             )
 
+        # store
+        self._column_widths_cache[available_width] = column_widths
+
+        # return
+        return column_widths
+
+    def _calculate_layout_box_without_padding(
+        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
+    ) -> Rectangle:
+        return self._layout_cells(page, bounding_box, do_layout=False)
+
+    def _clear_layout_box_cache(self) -> None:
+        super(FlexibleColumnWidthTable, self)._clear_layout_box_cache()
+        self._min_and_max_column_widths = None
+        self._column_widths_cache = {}
+
+    def _get_part(
+        self,
+        number_of_header_cells: int,
+        first_cell_index: int,
+        first_row: int,
+        last_cell_index: int,
+        last_row: int,
+    ) -> "Table":
+        # every part has the column widths of the (whole) FlexibleColumnWidthTable
+        self._calculate_min_and_max_column_widths()
+        return super(FlexibleColumnWidthTable, self)._get_part(
+            number_of_header_cells,
+            first_cell_index,
+            first_row,
+            last_cell_index,
+            last_row,
+        )
+
+    def _do_layout_without_padding(
+        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
+    ) -> Rectangle:
+        return self._layout_cells(page, bounding_box, do_layout=True)
+
+    def _layout_cells(
+        self,
+        page: "Page",
+        bounding_box: Rectangle,  # type: ignore[name-defined]
+        do_layout: bool,
+    ) -> Rectangle:
+
         # auto fill table
-        empty_cells: int = self._number_of_rows * self._number_of_columns - sum(
-            [(x._row_span * x._col_span) for x in self._content]
+        self._auto_fill()
+
+        # calculate column widths
+        column_widths: typing.List[Decimal] = self._calculate_column_widths(
+            bounding_box.get_width()
         )
-        for _ in range(0, empty_cells):
-            self.add(Paragraph(" ", respect_spaces_in_text=True))
 
         # calculate column bounds
         column_bounds: typing.List[Decimal] = [bounding_box.get_x()]
@@ -215,9 +291,11 @@ class FlexibleColumnWidthTable(Table):
         # We want backgrounds and borders to be drawn first, which requires us to mess around
         # with the raw content bytes a bit.
         # This is not exactly an ideal solution, but it is a fast solution.
-        page_content_stream_marker = len(page["Contents"][Name("DecodedBytes")])
+        page_content_stream_marker: int = 0
+        if do_layout:
+            page_content_stream_marker = self._get_page_content_stream_marker(page)
 
-        # lay out content
+        # lay out (or measure) content
         row_bounds: typing.List[Decimal] = [
             Decimal(floor(bounding_box.get_y() + bounding_box.get_height()))
             for _ in range(0, self._number_of_rows + 1)
@@ -231,10 +309,15 @@ class FlexibleColumnWidthTable(Table):
                 column_bounds[max([p[1] for p in t._table_coordinates]) + 1] - x
             )
             y: Decimal = Decimal(0)
-            h: Decimal = row_bounds[min([p[0] for p in t._table_coordinates])]
+            h: Decimal = row_bounds[
+                min([self._get_row_index(p[0]) for p in t._table_coordinates])
+            ]
 
             # layout
-            t.layout(page, Rectangle(x, y, w, h))
+            if do_layout:
+                t.layout(page, Rectangle(x, y, w, h))
+            else:
+                t._calculate_layout_box(page, Rectangle(x, y, w, h))
             tbb: typing.Optional[Rectangle] = t.get_bounding_box()
             assert tbb is not None
 
@@ -245,15 +328,15 @@ class FlexibleColumnWidthTable(Table):
                 and t._preferred_height >= tbb.get_height()
                 else tbb.get_y()
             )
-            max_row = max([p[0] for p in t._table_coordinates]) + 1
+            max_row = max([self._get_row_index(p[0]) for p in t._table_coordinates]) + 1
             row_bounds[max_row] = min(row_bounds[max_row], Decimal(floor(preferred_y)))
 
         # update bounds of content
         for t in self._content:
             x = column_bounds[min([p[1] for p in t._table_coordinates])]
             w = column_bounds[max([p[1] for p in t._table_coordinates]) + 1] - x
-            max_row = max([p[0] for p in t._table_coordinates]) + 1
-            min_row = min([p[0] for p in t._table_coordinates])
+            max_row = max([self._get_row_index(p[0]) for p in t._table_coordinates]) + 1
+            min_row = min([self._get_row_index(p[0]) for p in t._table_coordinates])
             y = row_bounds[max_row]
             h = row_bounds[min_row] - y
             t.bounding_box = Rectangle(x, y, w, h)
@@ -268,13 +351,14 @@ class FlexibleColumnWidthTable(Table):
         )
         # fmt: on
 
+        # measuring does not need backgrounds and borders
+        if not do_layout:
+            return bounding_box
+
         # change content stream to put background before rendering of the content
-        table_content_bytes = page["Contents"][Name("DecodedBytes")][
-            page_content_stream_marker:
-        ]
-        page["Contents"][Name("DecodedBytes")] = page["Contents"][Name("DecodedBytes")][
-            0:page_content_stream_marker
-        ]
+        table_content_bytes: bytes = self._rollback_page_content_stream(
+            page, page_content_stream_marker
+        )
 
         # draw backgrounds
         for t in self._content:
@@ -287,11 +371,7 @@ class FlexibleColumnWidthTable(Table):
             t._draw_border_after_layout(page)
 
         # re-add content
-        page["Contents"][Name("DecodedBytes")] += table_content_bytes
-        page["Contents"][Name("Bytes")] = zlib.compress(
-            page["Contents"][Name("DecodedBytes")], 9
-        )
-        page["Contents"][Name("Length")] = len(page["Contents"][Name("Bytes")])
+        self._get_page_content_stream_buffer(page).extend(table_content_bytes)
 
         # return
         return bounding_box
@@ -5,6 +5,7 @@
 This class represents a common base for all LayoutElement implementations
 that attempt to represent tabular data.
 """
+import copy
 import typing
 from decimal import Decimal
 from math import ceil
@@ -12,6 +13,7 @@ from math import ceil
 from borb.pdf.canvas.color.color import Color, HexColor
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.layout_element import Alignment, LayoutElement
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
 from borb.pdf.page.page import Page
 
 
@@ -80,15 +82,35 @@ class TableCell(LayoutElement):
     def calculate_min_and_max_width(self) -> None:
         """
         This method calculates the minimum and maximum width of the content
-        in this TableCell. It uses an iterative process to gradually hone in on the
+        in this TableCell. The maximum width follows from measuring the content in a (very) wide box.
+        The minimum width is calculated from the content (e.g. the widest word of a Paragraph),
+        if the content does not support that, an iterative process is used to gradually hone in on the
         minimum width, which can be quite labour-intensive.
         """
+        page: Page = Page()
         max_bounding_box: Rectangle = self._calculate_layout_box(
-            Page(),
+            page,
             Rectangle(Decimal(0), Decimal(0), Decimal(2048), Decimal(2048)),
         )
         self._max_width = ceil(max_bounding_box.get_width()) + Decimal(1)
         self._min_height = ceil(max_bounding_box.get_height()) + Decimal(1)
+
+        # calculate the minimum width (without measuring)
+        min_content_width: typing.Optional[
+            Decimal
+        ] = self._calculate_min_content_width()
+        if min_content_width is not None:
+            self._min_width = min(
+                max(Decimal(ceil(min_content_width)), Decimal(2)), self._max_width
+            )
+            bb: Rectangle = self._calculate_layout_box(
+                page,
+                Rectangle(Decimal(0), Decimal(0), self._min_width, Decimal(2048)),
+            )
+            self._max_height = ceil(bb.get_height()) + Decimal(1)
+            return
+
+        # binary search the minimum width
         min_width_upper_bound: Decimal = self._max_width
         min_width_lower_bound: Decimal = Decimal(1)
         while (min_width_upper_bound - min_width_lower_bound) > 1:
@@ -99,15 +121,15 @@ class TableCell(LayoutElement):
             try:
                 # attempt layout
                 self._calculate_layout_box(
-                    Page(),
+                    page,
                     Rectangle(Decimal(0), Decimal(0), Decimal(midpoint), Decimal(2048)),
                 )
 
                 # check bounding box to see if layout made it
-                bb: typing.Optional[Rectangle] = self.get_bounding_box()
-                assert bb is not None
-                self._max_height = ceil(bb.get_height()) + Decimal(1)
-                if bb.get_width() > midpoint:
+                midpoint_bb: typing.Optional[Rectangle] = self.get_bounding_box()
+                assert midpoint_bb is not None
+                self._max_height = ceil(midpoint_bb.get_height()) + Decimal(1)
+                if midpoint_bb.get_width() > midpoint:
                     min_width_lower_bound = midpoint
                 else:
                     min_width_upper_bound = midpoint
@@ -120,7 +142,10 @@ class TableCell(LayoutElement):
     def _calculate_layout_box_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
-        return self._layout_element._calculate_layout_box(page, bounding_box)
+        return self._layout_element._calculate_aligned_layout_box(page, bounding_box)
+
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        return self._layout_element._calculate_min_content_width()
 
     def layout(self, page: Page, layout_box: Rectangle) -> Rectangle:
         """
@@ -195,6 +220,7 @@ class Table(LayoutElement):
         horizontal_alignment: Alignment = Alignment.LEFT,
         vertical_alignment: Alignment = Alignment.TOP,
         background_color: typing.Optional[Color] = None,
+        number_of_header_rows: int = 0,
     ):
         super(Table, self).__init__(
             border_top=border_top,
@@ -221,6 +247,19 @@ class Table(LayoutElement):
         self._number_of_columns = number_of_columns
         self._content: typing.List[TableCell] = []
 
+        # grid points taken up by the TableCell objects (by row)
+        self._cells_at_row: typing.Dict[int, typing.List[TableCell]] = {}
+        self._columns_in_use_at_row: typing.Dict[int, typing.List[int]] = {}
+        self._first_non_complete_row: int = 0
+
+        # header rows are repeated when the Table is split (e.g. across pages)
+        assert number_of_header_rows >= 0
+        self._number_of_header_rows: int = number_of_header_rows
+
+        # the (body) rows of a part of a Table that was split keep the row numbers they had in the original Table
+        # this offset converts them to the row numbers in the part
+        self._row_offset: int = 0
+
     def set_background_color_on_all_cells(self, background_color: Color) -> "Table":
         """
         This method sets the background Color on all TableCell objects in this Table
@@ -261,6 +300,8 @@ class Table(LayoutElement):
             e._padding_right = padding_right
             e._padding_bottom = padding_bottom
             e._padding_left = padding_left
+            e._clear_layout_box_cache()
+        self._clear_layout_box_cache()
         return self
 
     def set_borders_on_all_cells(
@@ -347,11 +388,18 @@ class Table(LayoutElement):
         return out
 
     def _get_cells_at_row(self, row: int) -> typing.List[TableCell]:
-        out: typing.List[TableCell] = []
-        for t in self._content:
-            if len([p for p in t._table_coordinates if p[0] == row]) > 0:
-                out.append(t)
-        return out
+        return [x for x in self._cells_at_row.get(row, [])]
+
+    def _get_row_index(self, row: int) -> int:
+        # header rows are the first rows of every part of a Table
+        if row < self._number_of_header_rows:
+            return row
+        return row - self._row_offset
+
+    def _auto_fill(self) -> None:
+        # every grid point that is not taken up by a TableCell is filled with an empty Paragraph
+        while self._first_non_complete_row < self._number_of_rows:
+            self.add(Paragraph(" ", respect_spaces_in_text=True))
 
     def add(self, layout_element: LayoutElement) -> "Table":
         """
@@ -372,20 +420,13 @@ class Table(LayoutElement):
             self._font_size = inner_layout_element.get_font_size()
 
         # determine gridpoints occupied by the new TableCell
-        first_non_complete_row: int = min(
-            [
-                x
-                for x in range(0, self._number_of_rows)
-                if sum([y._col_span for y in self._get_cells_at_row(x)])
-                < self._number_of_columns
-            ]
-        )
+        if self._first_non_complete_row >= self._number_of_rows:
+            raise ValueError("Table is full, TableCell can not be added.")
+        first_non_complete_row: int = self._first_non_complete_row
         # check which columns are already occupied in the current row
-        occupied_cols_in_row: typing.List[int] = []
-        for c in self._get_cells_at_row(first_non_complete_row):
-            occupied_cols_in_row.extend(
-                [x[1] for x in c._table_coordinates if x[0] == first_non_complete_row]
-            )
+        occupied_cols_in_row: typing.List[int] = self._columns_in_use_at_row.get(
+            first_non_complete_row, []
+        )
         # the first empty column is the lowest number that does not appear in occupied_cols_in_row
         first_empty_column: int = min(
             [
@@ -401,6 +442,154 @@ class Table(LayoutElement):
                 layout_element._table_coordinates.append(
                     (first_non_complete_row + i, first_empty_column + j)
                 )
+            self._cells_at_row.setdefault(first_non_complete_row + i, []).append(
+                layout_element
+            )
+            self._columns_in_use_at_row.setdefault(
+                first_non_complete_row + i, []
+            ).extend(
+                [first_empty_column + j for j in range(0, layout_element._col_span)]
+            )
+
+        # rows are filled in order, so the first non-complete row only ever moves down
+        while (
+            self._first_non_complete_row < self._number_of_rows
+            and len(self._columns_in_use_at_row.get(self._first_non_complete_row, []))
+            >= self._number_of_columns
+        ):
+            self._first_non_complete_row += 1
+
+        # the Table (probably) has a new size
+        self._clear_layout_box_cache()
 
         # return
         return self
+
+    def _get_part(
+        self,
+        number_of_header_cells: int,
+        first_cell_index: int,
+        first_row: int,
+        last_cell_index: int,
+        last_row: int,
+    ) -> "Table":
+        # a part of a Table holds (copies of) the header TableCell objects, and the TableCell objects of rows [first_row, last_row)
+        # it shares everything else (e.g. borders, padding, column widths) with this Table
+        # the TableCell objects are copied, so that laying out one part does not change the layout of another part
+        part: Table = copy.copy(self)
+        table_cells: typing.Dict[int, TableCell] = {
+            id(tc): copy.copy(tc)
+            for tc in self._content[0:number_of_header_cells]
+            + self._content[first_cell_index:last_cell_index]
+        }
+        part._content = [x for x in table_cells.values()]
+        part._cells_at_row = {
+            r: [table_cells[id(tc)] for tc in tcs if id(tc) in table_cells]
+            for r, tcs in self._cells_at_row.items()
+        }
+        part._number_of_rows = self._number_of_header_rows + last_row - first_row
+        part._row_offset = first_row - self._number_of_header_rows
+        part._layout_box_cache = {}
+        part.bounding_box = None
+
+        # a part of a Table is complete, TableCell objects can not be added to it
+        part._first_non_complete_row = part._number_of_rows
+        return part
+
+    def split(
+        self, available_box: Rectangle
+    ) -> typing.Optional[typing.Tuple["LayoutElement", "LayoutElement"]]:
+        """
+        This function splits this Table (between two rows) into a Table that fits in the given (available) box,
+        and a Table that holds the remaining rows. Header rows are repeated in both Table objects.
+        Every TableCell in the first Table is measured only once, and column widths are calculated only once.
+        This function returns None if this Table fits in the available box,
+        or if not even a single row (besides the header rows) fits in the available box.
+        """
+        self._auto_fill()
+
+        # the header TableCell objects are the first TableCell objects in this Table
+        number_of_header_cells: int = 0
+        last_spanned_row: int = self._number_of_header_rows - 1
+        while number_of_header_cells < len(self._content) and (
+            min(
+                [p[0] for p in self._content[number_of_header_cells]._table_coordinates]
+            )
+            < self._number_of_header_rows
+        ):
+            last_spanned_row = max(
+                [last_spanned_row]
+                + [
+                    p[0]
+                    for p in self._content[number_of_header_cells]._table_coordinates
+                ]
+            )
+            number_of_header_cells += 1
+        if number_of_header_cells == len(self._content):
+            return None
+
+        # this Table can be split before any row that is not spanned by a TableCell (starting on a previous row)
+        # split points are (first row, index of first TableCell) of the remaining rows,
+        # they are only determined as far as they are needed
+        first_row: int = min(
+            [p[0] for p in self._content[number_of_header_cells]._table_coordinates]
+        )
+        last_row: int = self._number_of_rows + self._row_offset
+        split_points: typing.List[typing.Tuple[int, int]] = []
+        i: int = number_of_header_cells
+
+        # find the largest number of rows that fits in the available box
+        # rows are added one split point at a time, the TableCell objects that were measured before are not measured again
+        # (growing the first Table faster could push its rows below the bottom of the Page, which can not be measured)
+        last_split_point: int = -1
+        while True:
+
+            # determine the next split point
+            while len(split_points) <= last_split_point + 1 and i < len(self._content):
+                tc: TableCell = self._content[i]
+                tc_first_row: int = min([p[0] for p in tc._table_coordinates])
+                if tc_first_row > last_spanned_row and i > number_of_header_cells:
+                    split_points.append((tc_first_row, i))
+                last_spanned_row = max(
+                    [last_spanned_row] + [p[0] for p in tc._table_coordinates]
+                )
+                i += 1
+
+            # measure the rows (up until the next split point, or the end of the Table)
+            j: int = min(last_split_point + 1, len(split_points))
+            bb: Rectangle = self._get_part(
+                number_of_header_cells,
+                number_of_header_cells,
+                first_row,
+                split_points[j][1] if j < len(split_points) else len(self._content),
+                split_points[j][0] if j < len(split_points) else last_row,
+            ).measure(available_box)
+            if bb.get_y() < available_box.get_y():
+                break
+
+            # all rows fit
+            if j == len(split_points):
+                return None
+            last_split_point = j
+
+        # not a single row fits
+        if last_split_point == -1:
+            return None
+
+        # split
+        return (
+            self._get_part(
+                number_of_header_cells,
+                number_of_header_cells,
+                first_row,
+                split_points[last_split_point][1],
+                split_points[last_split_point][0],
+            ),
+            self._get_part(
+                number_of_header_cells,
+                split_points[last_split_point][1],
+                split_points[last_split_point][0],
+                len(self._content),
+                last_row,
+            ),
+        )
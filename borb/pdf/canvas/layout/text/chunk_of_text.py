@@ -102,6 +102,19 @@ class ChunkOfText(LayoutElement):
         """
         return self._font
 
+    def set_font(self, font: typing.Union[Font, str]) -> "ChunkOfText":
+        """
+        This function sets the Font of this LayoutElement.
+        This function returns self.
+        """
+        if isinstance(font, str):
+            self._font = StandardType1Font(font)
+            assert self._font
+        else:
+            self._font = font
+        self._clear_layout_box_cache()
+        return self
+
     def get_font_color(self) -> Color:
         """
         This function returns the font Color of this LayoutElement
@@ -191,6 +204,37 @@ class ChunkOfText(LayoutElement):
         # default
         return "".join(["(", sOut, ") Tj"])
 
+    def _calculate_layout_box_without_padding(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+
+        # line height
+        assert self._font_size is not None
+        line_height: Decimal = self._font_size
+        if self._multiplied_leading is not None:
+            line_height *= self._multiplied_leading
+        if self._fixed_leading is not None:
+            line_height += self._fixed_leading
+
+        # fmt: off
+        layout_rect = Rectangle(
+            bounding_box.x,
+            bounding_box.y + bounding_box.height - line_height,
+            GlyphLine.measure(self._text, self._font, self._font_size),
+            line_height,
+        )
+        # fmt: on
+
+        # set bounding box
+        self.set_bounding_box(layout_rect)
+
+        # return
+        return layout_rect
+
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        # a ChunkOfText is never split
+        return GlyphLine.measure(self._text, self._font, self._font_size)
+
     def _do_layout_without_padding(self, page: Page, bounding_box: Rectangle):
         assert self._font
         rgb_color = self._font_color.to_rgb()
@@ -203,6 +247,13 @@ class ChunkOfText(LayoutElement):
         if self._fixed_leading is not None:
             line_height += self._fixed_leading
 
+        # mark the characters as used (by the Font in the /Resources of the Page)
+        # this allows the Font to be subset when it is written
+        font_resource_name: Name = self._get_font_resource_name(self._font, page)
+        font_resource: Dictionary = page["Resources"]["Font"][font_resource_name]
+        if isinstance(font_resource, Font):
+            font_resource._mark_characters_as_used(self._text)
+
         content = """
             q
             BT
@@ -216,7 +267,7 @@ class ChunkOfText(LayoutElement):
             Decimal(rgb_color.red),  # rg
             Decimal(rgb_color.green),  # rg
             Decimal(rgb_color.blue),  # rg
-            self._get_font_resource_name(self._font, page),  # Tf
+            font_resource_name,  # Tf
             Decimal(1),  # Tf
             float(self._font_size),  # Tm
             float(self._font_size),  # Tm
@@ -230,7 +281,7 @@ class ChunkOfText(LayoutElement):
         layout_rect = Rectangle(
             bounding_box.x,
             bounding_box.y + bounding_box.height - line_height,
-            GlyphLine.from_str(self._text, self._font, self._font_size).get_width_in_text_space(),
+            GlyphLine.measure(self._text, self._font, self._font_size),
             line_height,
         )
         # fmt: on
@@ -5,6 +5,7 @@
 This implementation of LayoutElement represents a heterogeneous Paragraph.
 e.g. a Paragraph where one or more words are in bold (but not all of them)
 """
+import copy
 import typing
 from decimal import Decimal
 
@@ -53,6 +54,8 @@ class Span(Paragraph):
         fixed_leading: typing.Optional[Decimal] = None,
         multiplied_leading: typing.Optional[Decimal] = None,
         background_color: typing.Optional[Color] = None,
+        orphans: int = 1,
+        widows: int = 1,
         parent: typing.Optional["LayoutElement"] = None,  # type: ignore [name-defined]
     ):
 
@@ -90,6 +93,22 @@ class Span(Paragraph):
         self._fixed_leading: typing.Optional[Decimal] = fixed_leading
         self._multiplied_leading: typing.Optional[Decimal] = multiplied_leading
 
+        # measurement (memoized per available box)
+        self._layout_box_cache: typing.Dict[
+            typing.Tuple[Decimal, Decimal, Decimal, Decimal], Rectangle
+        ] = {}
+
+        # lines of ChunkOfText objects (memoized per width)
+        self._lines_of_chunks_cache: typing.Dict[
+            Decimal, typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]]
+        ] = {}
+
+        # widows and orphans
+        assert orphans >= 1
+        assert widows >= 1
+        self._orphans: int = orphans
+        self._widows: int = widows
+
         # store chunks
         self._chunks_of_text: typing.List[ChunkOfText] = []
         for c in chunks_of_text:
@@ -107,6 +126,7 @@ class Span(Paragraph):
         self._chunks_of_text.append(chunk_of_text)
         if self._font_size is None:
             self._font_size = self._chunks_of_text[0].get_font_size()
+        self._clear_layout_box_cache()
         return self
 
     def add_line_break(self) -> "Span":
@@ -116,8 +136,80 @@ class Span(Paragraph):
         """
         return self.add(LineBreakChunk())
 
+    def _clear_layout_box_cache(self) -> None:
+        super(Span, self)._clear_layout_box_cache()
+        self._lines_of_chunks_cache = {}
+
+    def _get_lines_of_chunks(
+        self, available_box: Rectangle
+    ) -> typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]]:
+        # the lines of ChunkOfText objects only depend on the width of the available box (taking into account padding)
+        return self._split_chunks_to_lines(
+            Page(),
+            Rectangle(
+                available_box.x,
+                available_box.y,
+                max(
+                    available_box.width - self._padding_right - self._padding_left,
+                    Decimal(0),
+                ),
+                available_box.height,
+            ),
+        )
+
+    def _get_number_of_lines(self, available_box: Rectangle) -> int:
+        return len(self._get_lines_of_chunks(available_box))
+
+    def _get_part(
+        self, available_box: Rectangle, first_line: int, last_line: int
+    ) -> "Paragraph":
+        # a part of a Span holds the (ChunkOfText objects of the) lines [first_line, last_line)
+        # these lines are not calculated again (as long as the part is laid out in a box of the same width)
+        # the part keeps the (original) LineBreakChunk objects between them, so that it can be broken into lines again
+        all_lines: typing.List[
+            typing.Tuple[typing.List[ChunkOfText], Decimal]
+        ] = self._get_lines_of_chunks(available_box)
+        lines: typing.List[
+            typing.Tuple[typing.List[ChunkOfText], Decimal]
+        ] = all_lines[first_line:last_line]
+        first_chunk: int = sum([len(x[0]) for x in all_lines[0:first_line]])
+        number_of_chunks: int = sum([len(x[0]) for x in lines])
+        part: Span = copy.copy(self)
+        part._chunks_of_text = []
+        i: int = 0
+        for c in self._chunks_of_text:
+            if isinstance(c, LineBreakChunk):
+                if first_chunk < i < first_chunk + number_of_chunks:
+                    part._chunks_of_text.append(c)
+                continue
+            if first_chunk <= i < first_chunk + number_of_chunks:
+                part._chunks_of_text.append(c)
+            i += 1
+        part._lines_of_chunks_cache = {
+            max(
+                available_box.width - self._padding_right - self._padding_left,
+                Decimal(0),
+            ): lines
+        }
+        part._layout_box_cache = {}
+        part.bounding_box = None
+        return part
+
     def _split_chunks_to_lines(
         self, page: Page, bounding_box: Rectangle
+    ) -> typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]]:
+        # the lines of ChunkOfText objects only depend on the width of the bounding box
+        # so they are calculated only once (per width), no matter how often this Span is measured or laid out
+        lines: typing.Optional[
+            typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]]
+        ] = self._lines_of_chunks_cache.get(bounding_box.width)
+        if lines is None:
+            lines = self._split_chunks_to_lines_without_cache(page, bounding_box)
+            self._lines_of_chunks_cache[bounding_box.width] = lines
+        return [x for x in lines]
+
+    def _split_chunks_to_lines_without_cache(
+        self, page: Page, bounding_box: Rectangle
     ) -> typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]]:
         lines: typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]] = []
         previous_line: typing.List[ChunkOfText] = []
@@ -147,7 +239,30 @@ class Span(Paragraph):
             lines.append(([x for x in previous_line], previous_line_width))
         return lines
 
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        # every ChunkOfText that does not fit on a line is put on a line of its own
+        min_content_widths: typing.List[typing.Optional[Decimal]] = [
+            c._calculate_min_content_width_without_padding()
+            for c in self._chunks_of_text
+            if not isinstance(c, LineBreakChunk)
+        ]
+        if any([x is None for x in min_content_widths]):
+            return None
+        return max(
+            [x for x in min_content_widths if x is not None], default=Decimal(0)
+        )
+
+    def _calculate_layout_box_without_padding(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+        return self._layout_lines_of_chunks(page, bounding_box, do_layout=False)
+
     def _do_layout_without_padding(self, page: Page, bounding_box: Rectangle):
+        return self._layout_lines_of_chunks(page, bounding_box, do_layout=True)
+
+    def _layout_lines_of_chunks(
+        self, page: Page, bounding_box: Rectangle, do_layout: bool
+    ) -> Rectangle:
 
         # split text to lines
         lines: typing.List[
@@ -188,17 +303,20 @@ class Span(Paragraph):
                 prev_x = bounding_box.get_x() + (bounding_box.get_width() - line_width) / Decimal(2)
                 # fmt: on
 
-            # layout line
+            # layout (or measure) line
             for chunk_of_text in line_of_chunks:
-                r: Rectangle = chunk_of_text.layout(
-                    page,
-                    Rectangle(
-                        prev_x,
-                        line_y,
-                        bounding_box.get_width(),
-                        chunk_of_text.get_font_size(),
-                    ),
+                chunk_bounding_box: Rectangle = Rectangle(
+                    prev_x,
+                    line_y,
+                    bounding_box.get_width(),
+                    chunk_of_text.get_font_size(),
                 )
+                if do_layout:
+                    r: Rectangle = chunk_of_text.layout(page, chunk_bounding_box)
+                else:
+                    r = chunk_of_text._calculate_aligned_layout_box(
+                        page, chunk_bounding_box
+                    )
 
                 # update prev_x
                 assert r is not None
@@ -262,6 +380,8 @@ class HeterogeneousParagraph(Span):
         fixed_leading: typing.Optional[Decimal] = None,
         multiplied_leading: typing.Optional[Decimal] = None,
         background_color: typing.Optional[Color] = None,
+        orphans: int = 1,
+        widows: int = 1,
         parent: typing.Optional["LayoutElement"] = None,  # type: ignore [name-defined]
     ):
         super(HeterogeneousParagraph, self).__init__(
@@ -285,6 +405,8 @@ class HeterogeneousParagraph(Span):
             fixed_leading=fixed_leading,
             multiplied_leading=multiplied_leading,
             background_color=background_color,
+            orphans=orphans,
+            widows=widows,
             parent=parent,
         )
 
@@ -306,4 +428,5 @@ class HeterogeneousParagraph(Span):
             self._margin_top = self._font_size
         if self._margin_bottom is None:
             self._margin_bottom = self._font_size
+        self._clear_layout_box_cache()
         return self
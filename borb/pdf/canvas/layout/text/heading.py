@@ -12,7 +12,7 @@ from borb.pdf.canvas.color.color import Color, HexColor
 from borb.pdf.canvas.font.font import Font
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.annotation.link_annotation import DestinationType
-from borb.pdf.canvas.layout.layout_element import Alignment
+from borb.pdf.canvas.layout.layout_element import Alignment, LayoutElement
 from borb.pdf.canvas.layout.text.paragraph import Paragraph
 from borb.pdf.document.document import Document
 from borb.pdf.page.page import Page
@@ -99,6 +99,14 @@ class Heading(Paragraph):
         self._outline_level = outline_level
         self._has_added_outline = False
 
+    def split(
+        self, available_box: Rectangle
+    ) -> typing.Optional[typing.Tuple["LayoutElement", "LayoutElement"]]:
+        """
+        This function returns None, a Heading is never split (across columns or pages).
+        """
+        return None
+
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
@@ -5,6 +5,7 @@
 This file contains all the classes needed to perform layout of text-elements.
 This includes; ChunkOfText, LineOfText, Paragraph and Heading
 """
+import copy
 import typing
 from decimal import Decimal
 from typing import Union
@@ -57,6 +58,9 @@ class Paragraph(LineOfText):
         multiplied_leading: typing.Optional[Decimal] = None,
         background_color: typing.Optional[Color] = None,
         hyphenation: typing.Optional[Hyphenation] = None,
+        optimal_line_breaking: bool = False,
+        orphans: int = 1,
+        widows: int = 1,
         parent: typing.Optional["LayoutElement"] = None,
     ):
         super().__init__(
@@ -88,6 +92,20 @@ class Paragraph(LineOfText):
         self._respect_newlines_in_text = respect_newlines_in_text
         self._respect_spaces_in_text = respect_spaces_in_text
         self._hyphenation = hyphenation
+        self._optimal_line_breaking = optimal_line_breaking
+        self._lines_of_text_cache: typing.Dict[Decimal, typing.List[str]] = {}
+
+        # widows and orphans
+        # when this Paragraph is split (e.g. across pages) the first part has at least `orphans` lines of text,
+        # and the second part has at least `widows` lines of text (by default, any number of lines is allowed)
+        assert orphans >= 1
+        assert widows >= 1
+        self._orphans: int = orphans
+        self._widows: int = widows
+
+        # the last line of (the first part of) a Paragraph that was split is not the last line of the Paragraph
+        # (which matters for Alignment.JUSTIFIED)
+        self._justify_last_line: bool = False
 
         # alignment
         assert text_alignment in [
@@ -98,10 +116,156 @@ class Paragraph(LineOfText):
         ]
         self._text_alignment = text_alignment
 
-    def _split_text(self, bounding_box: Rectangle) -> typing.List[str]:
-        # asserts
+    def _clear_layout_box_cache(self) -> None:
+        super(Paragraph, self)._clear_layout_box_cache()
+        self._lines_of_text_cache = {}
+
+    def _get_lines_of_text(self, available_box: Rectangle) -> typing.List[str]:
+        # the lines of text only depend on the width of the available box (taking into account padding)
+        return self._split_text(
+            Rectangle(
+                available_box.x,
+                available_box.y,
+                max(
+                    available_box.width - self._padding_right - self._padding_left,
+                    Decimal(0),
+                ),
+                available_box.height,
+            )
+        )
+
+    def _get_number_of_lines(self, available_box: Rectangle) -> int:
+        return len(self._get_lines_of_text(available_box))
+
+    def _get_part(
+        self, available_box: Rectangle, first_line: int, last_line: int
+    ) -> "Paragraph":
+        # a part of a Paragraph holds the (words of the) lines of text [first_line, last_line)
+        # these lines of text are not calculated again (as long as the part is laid out in a box of the same width)
+        lines_of_text: typing.List[str] = self._get_lines_of_text(available_box)
+        part: Paragraph = copy.copy(self)
+        part._text = self._get_text_of_lines(lines_of_text, first_line, last_line)
+        part._lines_of_text_cache = {
+            max(
+                available_box.width - self._padding_right - self._padding_left,
+                Decimal(0),
+            ): lines_of_text[first_line:last_line]
+        }
+        part._layout_box_cache = {}
+        part.bounding_box = None
+        part._justify_last_line = self._justify_last_line or last_line < len(
+            lines_of_text
+        )
+        return part
+
+    def _get_text_of_lines(
+        self, lines_of_text: typing.List[str], first_line: int, last_line: int
+    ) -> str:
+        # the text of a part of a Paragraph holds the (original) words of the lines of text [first_line, last_line)
+        # so that it can be broken into lines again (e.g. when the part is laid out in a box of a different width)
+        # every position is a (word index, character offset), the character offset is only non-zero in a hyphenated word
+        words: typing.List[str] = self._split_text_into_words()
+        positions: typing.List[typing.Tuple[int, int]] = []
+        i: int = 0
+        j: int = 0
+        for line_of_text in lines_of_text[0:last_line]:
+            # every (preserved) newline starts a new line of text
+            if j == 0 and i < len(words) and words[i] == "\n":
+                i += 1
+            positions.append((i, j))
+            # a line of text (that respects spaces) holds words as-is
+            if self._respect_spaces_in_text:
+                n: int = 0
+                while n < len(line_of_text) and i < len(words):
+                    n += len(words[i])
+                    i += 1
+                continue
+            # a line of text holds words separated by a space, its first and last word may be part of a hyphenated word
+            for w in line_of_text.split(" ") if len(line_of_text) > 0 else []:
+                if i < len(words) and w == words[i][j:]:
+                    i += 1
+                    j = 0
+                else:
+                    j += len(w) - 1
+        positions.append((i, j))
+
+        # build text
+        i, j = positions[first_line]
+        k, l = positions[last_line]
+        if i == k and l > 0:
+            return words[i][j:l] + "-"
+        words_of_part: typing.List[str] = words[i:k]
+        if l > 0:
+            words_of_part.append(words[k][0:l] + "-")
+        if j > 0:
+            words_of_part[0] = words_of_part[0][j:]
+        return ("" if self._respect_spaces_in_text else " ").join(words_of_part)
+
+    def split(
+        self, available_box: Rectangle
+    ) -> typing.Optional[typing.Tuple["LayoutElement", "LayoutElement"]]:
+        """
+        This function splits this Paragraph (between two lines of text) into a Paragraph that fits in the given (available) box,
+        and a Paragraph that holds the remaining lines of text. The first Paragraph has at least `orphans` lines of text,
+        the second Paragraph has at least `widows` lines of text. Both keep their lines of text (rather than breaking the text into lines again),
+        unless they are laid out in a box of a different width, in which case their words are broken into lines again.
+        This function returns None if this Paragraph fits in the available box,
+        or if it can not be split (respecting widows and orphans) to fit in the available box.
+        """
+        # a Paragraph without lines of text is not split
+        number_of_lines: int = self._get_number_of_lines(available_box)
+        if number_of_lines == 0:
+            return None
+
+        # find the largest number of lines that fits in the available box
+        # the first guess is the number of lines (of font_size) that fit in the available box,
+        # after which the number of lines is doubled (until it does not fit) and the range is halved (until it is found)
+        # this avoids measuring (all) the lines of text of a Paragraph that spans many pages
         assert self._font_size is not None
+        lower_bound: int = 0
+        upper_bound: int = number_of_lines + 1
+        j: int = min(int(available_box.height / self._font_size) + 1, number_of_lines)
+        while upper_bound - lower_bound > 1:
+            part: LayoutElement = (
+                self if j == number_of_lines else self._get_part(available_box, 0, j)
+            )
+            if part.measure(available_box).get_y() >= available_box.get_y():
+                lower_bound = j
+            else:
+                upper_bound = j
+            j = (
+                min(2 * lower_bound, number_of_lines)
+                if upper_bound == number_of_lines + 1
+                else (lower_bound + upper_bound) // 2
+            )
+
+        # a Paragraph that fits is not split
+        if lower_bound == number_of_lines:
+            return None
+
+        # widows and orphans
+        lower_bound = min(lower_bound, number_of_lines - self._widows)
+        if lower_bound < self._orphans:
+            return None
 
+        # split
+        return (
+            self._get_part(available_box, 0, lower_bound),
+            self._get_part(available_box, lower_bound, number_of_lines),
+        )
+
+    def _split_text(self, bounding_box: Rectangle) -> typing.List[str]:
+        # the lines of text only depend on the width of the bounding box
+        # so they are calculated only once (per width), no matter how often this Paragraph is measured or laid out
+        lines_of_text: typing.Optional[typing.List[str]] = (
+            self._lines_of_text_cache.get(bounding_box.width)
+        )
+        if lines_of_text is None:
+            lines_of_text = self._split_text_without_cache(bounding_box)
+            self._lines_of_text_cache[bounding_box.width] = lines_of_text
+        return [x for x in lines_of_text]
+
+    def _split_text_into_words(self) -> typing.List[str]:
         # attempt to split into words (preserve space if needed)
         words: typing.List[str] = [""]
         tokens_to_split_on: typing.List[str] = [" ", "\t", "\n"]
@@ -128,89 +292,109 @@ class Paragraph(LineOfText):
             else:
                 # build the word that was already being built
                 words[-1] += c
-        words = [x for x in words if len(x) > 0]
+        return [x for x in words if len(x) > 0]
+
+    def _split_text_without_cache(self, bounding_box: Rectangle) -> typing.List[str]:
+        # asserts
+        assert self._font_size is not None
+
+        # split into words
+        words: typing.List[str] = self._split_text_into_words()
+
+        # Alignment.JUSTIFIED can (optionally) use the Knuth-Plass line breaking algorithm
+        if (
+            self._optimal_line_breaking
+            and self._text_alignment == Alignment.JUSTIFIED
+            and not self._respect_spaces_in_text
+        ):
+            return self._split_words_optimal_fit(words, bounding_box)
+
+        # measure every (distinct) word only once
+        word_widths: typing.Dict[str, Decimal] = {}
+        for w in words:
+            if w not in word_widths:
+                word_widths[w] = GlyphLine.measure(w, self._font, self._font_size)
+        space_width: Decimal = GlyphLine.measure(" ", self._font, self._font_size)
+        hyphen_width: Decimal = GlyphLine.measure("-", self._font, self._font_size)
 
         # build lines using words
-        lines_of_text = []
-        for i, w in enumerate(words):
+        # the width of the line being built is kept up to date (rather than re-measuring the line for every word)
+        lines_of_text: typing.List[str] = []
+        line_width: Decimal = Decimal(0)
+        for w in words:
 
             # split on \n
             if w == "\n" and self._respect_newlines_in_text:
                 lines_of_text.append("")
+                line_width = Decimal(0)
                 continue
 
-            # build line of text to check if it fits the bounding box
-            potential_text = lines_of_text[-1] if len(lines_of_text) > 0 else ""
-            if len(potential_text) != 0 and not self._respect_spaces_in_text:
-                potential_text += " "
-            potential_text += w
+            # calculate the width of the line of text (if this word were to be added)
+            needs_space: bool = (
+                len(lines_of_text) > 0
+                and len(lines_of_text[-1]) != 0
+                and not self._respect_spaces_in_text
+            )
+            potential_width: Decimal = line_width + word_widths[w]
+            if needs_space:
+                potential_width += space_width
 
             # check the remaining space in the box
             # checking with 0 is not a great idea due to rounding errors
             # so, as a pre-emptive measure, we round the number to 2 digits
-            # fmt: off
-            potential_width = GlyphLine.from_str(potential_text, self._font, self._font_size).get_width_in_text_space()
-            remaining_space_in_box: Decimal = round(bounding_box.width - potential_width, 2)
-            # fmt: on
+            remaining_space_in_box: Decimal = round(
+                bounding_box.width - potential_width, 2
+            )
 
             # IF there is space left over, we add the word to the lines of text being built
             if remaining_space_in_box >= Decimal(0):
                 if len(lines_of_text) == 0:
                     lines_of_text.append(w)
                 else:
-                    if len(lines_of_text[-1]) > 0 and not self._respect_spaces_in_text:
+                    if needs_space:
                         lines_of_text[-1] += " "
                     lines_of_text[-1] += w
+                line_width = potential_width
+                continue
 
             # (ELSE) there is no more room in the box for this word,
             # BUT perhaps we can hyphenate the word
-            else:
-                # if no hyphenation class is provided, we can't hyphenate
-                if self._hyphenation is None:
-                    lines_of_text.append(w)
-                    continue
-
-                # if we have to respect the spacing in the text, we don't hyphenate
-                if self._respect_spaces_in_text:
-                    lines_of_text.append(w)
-                    continue
-
-                # calculate potential hyphenation breaks
-                # if the word can not be broken into parts, we can't hyphenate
+            # if no hyphenation class is provided, we can't hyphenate
+            # if we have to respect the spacing in the text, we don't hyphenate
+            hyphenated_word_parts: typing.List[str] = [w]
+            if self._hyphenation is not None and not self._respect_spaces_in_text:
                 hyphenated_word_parts = self._hyphenation.hyphenate(w).split(chr(173))
-                if len(hyphenated_word_parts) == 1:
-                    lines_of_text.append(w)
-                    continue
-
-                potential_text = lines_of_text[-1] if len(lines_of_text) > 0 else ""
-                if len(potential_text) != 0 and not self._respect_spaces_in_text:
-                    potential_text += " "
-
-                # check where the text can be split, in order to fit in the bounding box
-                hyphenation_split_index: int = 0
-                for i in range(1, len(hyphenated_word_parts)):
-                    # fmt: off
-                    potential_text_after_hyphenation = potential_text + "".join([x for x in hyphenated_word_parts[0:i]]) + "-"
-                    potential_width = GlyphLine.from_str(potential_text_after_hyphenation, self._font, self._font_size).get_width_in_text_space()
-                    remaining_space_in_box = round(bounding_box.width - potential_width, 2)
-                    # fmt: on
-                    if remaining_space_in_box > Decimal(0):
-                        hyphenation_split_index = i
-                    else:
-                        break
-
-                # no sensible split was found
-                if hyphenation_split_index == 0:
-                    lines_of_text.append(w)
-                    continue
 
-                # break the text according to the hyphenation
+            # check where the text can be split, in order to fit in the bounding box
+            # if the word can not be broken into parts, we can't hyphenate
+            hyphenation_split_index: int = 0
+            potential_width = line_width + (space_width if needs_space else Decimal(0))
+            for i in range(1, len(hyphenated_word_parts)):
                 # fmt: off
-                if len(lines_of_text[-1]) > 0 and not self._respect_spaces_in_text:
-                    lines_of_text[-1] += " "
-                lines_of_text[-1] += "".join([x for x in hyphenated_word_parts[0:hyphenation_split_index]]) + "-"
-                lines_of_text.append("".join([x for x in hyphenated_word_parts[hyphenation_split_index:]]))
+                potential_width += GlyphLine.measure(hyphenated_word_parts[i - 1], self._font, self._font_size)
+                remaining_space_in_box = round(bounding_box.width - potential_width - hyphen_width, 2)
                 # fmt: on
+                if remaining_space_in_box > Decimal(0):
+                    hyphenation_split_index = i
+                else:
+                    break
+
+            # no sensible split was found
+            if hyphenation_split_index == 0:
+                lines_of_text.append(w)
+                line_width = word_widths[w]
+                continue
+
+            # break the text according to the hyphenation
+            # fmt: off
+            if len(lines_of_text) == 0:
+                lines_of_text.append("")
+            if needs_space:
+                lines_of_text[-1] += " "
+            lines_of_text[-1] += "".join(hyphenated_word_parts[0:hyphenation_split_index]) + "-"
+            lines_of_text.append("".join(hyphenated_word_parts[hyphenation_split_index:]))
+            line_width = GlyphLine.measure(lines_of_text[-1], self._font, self._font_size)
+            # fmt: on
 
         # last-minute cleanup
         while len(lines_of_text) > 0 and lines_of_text[-1] == "":
@@ -219,78 +403,190 @@ class Paragraph(LineOfText):
         # return
         return lines_of_text if len(lines_of_text) > 0 else [""]
 
-    def _do_layout_without_padding(self, page: Page, bounding_box: Rectangle):
-        # easy case
-        if len(self._text) == 0:
-            return Rectangle(bounding_box.x, bounding_box.y, Decimal(0), Decimal(0))
+    def _split_words_optimal_fit(
+        self, words: typing.List[str], bounding_box: Rectangle
+    ) -> typing.List[str]:
+        """
+        This function breaks the given words into lines of text using the (total-fit) algorithm by Knuth and Plass.
+        Rather than filling every line as much as possible, it minimizes the total demerits of the Paragraph,
+        which evens out the space that needs to be divided among the space-characters of every (justified) line.
+        """
+        assert self._font_size is not None
 
-        # other easy cases
-        lines_of_text = self._split_text(bounding_box)
-        if len(lines_of_text) == 0:
-            return Rectangle(bounding_box.x, bounding_box.y, Decimal(0), Decimal(0))
+        # a (forced) newline splits the words into groups that are broken independently
+        groups_of_words: typing.List[typing.List[str]] = [[]]
+        for w in words:
+            if w == "\n":
+                groups_of_words.append([])
+            else:
+                groups_of_words[-1].append(w)
 
-        # separate method for the harder case of Alignment.JUSTIFIED
-        if self._text_alignment == Alignment.JUSTIFIED:
-            return self._do_layout_without_padding_text_alignment_justified(
-                lines_of_text, page, bounding_box
+        # the first group of words adds to the (empty) first line
+        # every other group of words starts a new line
+        lines_of_text: typing.List[str] = self._split_group_of_words_optimal_fit(
+            groups_of_words[0], bounding_box, is_last_group=len(groups_of_words) == 1
+        )
+        for i, g in enumerate(groups_of_words[1:]):
+            is_last_group: bool = i == len(groups_of_words) - 2
+            lines_of_text.extend(
+                self._split_group_of_words_optimal_fit(g, bounding_box, is_last_group)
+                or [""]
             )
 
-        # delegate
-        assert self._font_size is not None
-        min_x: Decimal = Decimal(2048)
-        min_y: Decimal = Decimal(2048)
-        max_x: Decimal = Decimal(0)
-        max_y: Decimal = Decimal(0)
+        # last-minute cleanup
+        while len(lines_of_text) > 0 and lines_of_text[-1] == "":
+            lines_of_text.pop(len(lines_of_text) - 1)
 
-        assert self._font_size is not None
-        line_height: Decimal = self._font_size
-        if self._multiplied_leading is not None:
-            line_height *= self._multiplied_leading
-        if self._fixed_leading is not None:
-            line_height += self._fixed_leading
+        # return
+        return lines_of_text if len(lines_of_text) > 0 else [""]
 
-        for i, l in enumerate(lines_of_text):
-            r = LineOfText(
-                l,
-                font=self._font,
-                font_size=self._font_size,
-                font_color=self._font_color,
-                horizontal_alignment=self._text_alignment,
-                multiplied_leading=self._multiplied_leading,
-                fixed_leading=self._fixed_leading,
-                parent=self,
-            ).layout(
-                page,
-                bounding_box=Rectangle(
-                    bounding_box.x,
-                    bounding_box.y
-                    + bounding_box.height
-                    - line_height * i
-                    - self._font_size,
-                    bounding_box.width,
-                    self._font_size,
-                ),
+    def _split_group_of_words_optimal_fit(
+        self, words: typing.List[str], bounding_box: Rectangle, is_last_group: bool
+    ) -> typing.List[str]:
+        assert self._font_size is not None
+        if len(words) == 0:
+            return []
+
+        # fmt: off
+        LINE_PENALTY: float = 10                # added to the badness of every line (favours fewer lines)
+        HYPHEN_PENALTY: float = 50              # added (squared) to the demerits of a line that ends in a hyphen
+        OVERFULL_BADNESS: float = 10 ** 6       # badness of a (single box) line that does not fit
+        SPACE_STRETCH_RATIO: float = 0.5        # how much a space can (comfortably) be stretched
+        # fmt: on
+
+        # build boxes (words, or parts of words if hyphenation is enabled)
+        # every box is either followed by a space, or (if it is part of a hyphenated word) by a potential hyphen
+        boxes: typing.List[str] = []
+        box_is_end_of_word: typing.List[bool] = []
+        hyphenated_words: typing.Dict[str, typing.List[str]] = {}
+        for w in words:
+            if w not in hyphenated_words:
+                hyphenated_words[w] = [w]
+                if self._hyphenation is not None:
+                    hyphenated_words[w] = [
+                        x
+                        for x in self._hyphenation.hyphenate(w).split(chr(173))
+                        if len(x) > 0
+                    ] or [w]
+            parts: typing.List[str] = hyphenated_words[w]
+            for i, p in enumerate(parts):
+                boxes.append(p)
+                box_is_end_of_word.append(i == len(parts) - 1)
+
+        # measure every (distinct) box only once
+        box_widths: typing.Dict[str, float] = {}
+        for b in boxes:
+            if b not in box_widths:
+                box_widths[b] = float(GlyphLine.measure(b, self._font, self._font_size))
+        space_width: float = float(GlyphLine.measure(" ", self._font, self._font_size))
+        hyphen_width: float = float(GlyphLine.measure("-", self._font, self._font_size))
+        max_width: float = float(bounding_box.width) + 0.005
+
+        # prefix sums allow the width of any line to be calculated in constant time
+        n: int = len(boxes)
+        sum_of_box_widths: typing.List[float] = [0.0]
+        number_of_ends_of_word: typing.List[int] = [0]
+        for i in range(0, n):
+            sum_of_box_widths.append(sum_of_box_widths[-1] + box_widths[boxes[i]])
+            number_of_ends_of_word.append(
+                number_of_ends_of_word[-1] + (1 if box_is_end_of_word[i] else 0)
             )
-            min_x = min(r.x, min_x)
-            min_y = min(r.y, min_y)
-            max_x = max(r.x + r.width, max_x)
-            max_y = max(r.y + r.height, max_y)
-        layout_rect = Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
 
-        # set bounding box
-        self.set_bounding_box(layout_rect)
+        # minimum_demerits[j] holds the minimum total demerits of breaking boxes[0:j] into lines
+        # previous_break[j] holds the start of the last line in that optimal solution
+        minimum_demerits: typing.List[float] = [0.0] + [float("inf")] * n
+        previous_break: typing.List[int] = [0] * (n + 1)
+        for j in range(1, n + 1):
 
-        # return
-        return layout_rect
+            # a line can only end at the end of a word, or at a hyphenation point
+            is_last_line: bool = j == n
+            ends_in_hyphen: bool = not box_is_end_of_word[j - 1]
 
-    def _do_layout_without_padding_text_alignment_justified(
-        self, lines_of_text: typing.List[str], page: Page, bounding_box: Rectangle
+            # consider all lines ending at j (starting with the shortest)
+            for i in range(j - 1, -1, -1):
+
+                # calculate the (natural) width of boxes[i:j]
+                number_of_spaces: int = (
+                    number_of_ends_of_word[j - 1] - number_of_ends_of_word[i]
+                )
+                width: float = (
+                    sum_of_box_widths[j]
+                    - sum_of_box_widths[i]
+                    + number_of_spaces * space_width
+                )
+                if ends_in_hyphen:
+                    width += hyphen_width
+
+                # a line that does not fit is only allowed if it consists of a single box
+                is_overfull: bool = width > max_width
+                if is_overfull and i < j - 1:
+                    break
+
+                # calculate badness (based on how much the spaces need to be stretched)
+                # a line without spaces is treated as if it had a single space
+                badness: float = 0
+                if is_overfull:
+                    badness = OVERFULL_BADNESS
+                elif not (is_last_line and is_last_group):
+                    stretch: float = (
+                        max(number_of_spaces, 1) * space_width * SPACE_STRETCH_RATIO
+                    )
+                    badness = 100 * (max(max_width - width, 0) / stretch) ** 3
+
+                # calculate demerits
+                demerits: float = (LINE_PENALTY + badness) ** 2
+                if ends_in_hyphen:
+                    demerits += HYPHEN_PENALTY**2
+                if minimum_demerits[i] + demerits < minimum_demerits[j]:
+                    minimum_demerits[j] = minimum_demerits[i] + demerits
+                    previous_break[j] = i
+                if is_overfull:
+                    break
+
+        # build lines of text (following the optimal breaks backwards)
+        breaks: typing.List[int] = [n]
+        while breaks[-1] != 0:
+            breaks.append(previous_break[breaks[-1]])
+        breaks.reverse()
+        lines_of_text: typing.List[str] = []
+        for i, j in zip(breaks[:-1], breaks[1:]):
+            line_of_text: str = ""
+            for k in range(i, j):
+                line_of_text += boxes[k]
+                if k < j - 1 and box_is_end_of_word[k]:
+                    line_of_text += " "
+            if not box_is_end_of_word[j - 1]:
+                line_of_text += "-"
+            lines_of_text.append(line_of_text)
+        return lines_of_text
+
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        # hyphenation splits a word (at most) once, depending on the space that is left on the line
+        if self._hyphenation is not None and not self._respect_spaces_in_text:
+            return None
+
+        # every word that does not fit on a line is put on a line of its own
+        # so the min-content width is the width of the widest (unbreakable) word
+        return max(
+            [
+                GlyphLine.measure(w, self._font, self._font_size)
+                for w in set(self._split_text_into_words())
+                if w != "\n"
+            ],
+            default=Decimal(0),
+        )
+
+    def _calculate_layout_box_without_padding(
+        self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
-        min_x: Decimal = Decimal(2048)
-        min_y: Decimal = Decimal(2048)
-        max_x: Decimal = Decimal(0)
-        max_y: Decimal = Decimal(0)
+        return self._layout_lines_of_text(page, bounding_box, do_layout=False)
 
+    def _do_layout_without_padding(self, page: Page, bounding_box: Rectangle):
+        return self._layout_lines_of_text(page, bounding_box, do_layout=True)
+
+    def _get_chunks_of_text_and_bounding_boxes(
+        self, lines_of_text: typing.List[str], bounding_box: Rectangle
+    ) -> typing.List[typing.Tuple[ChunkOfText, Rectangle]]:
         assert self._font_size is not None
         line_height: Decimal = self._font_size
         if self._multiplied_leading is not None:
@@ -298,38 +594,72 @@ class Paragraph(LineOfText):
         if self._fixed_leading is not None:
             line_height += self._fixed_leading
 
+        chunks_of_text_and_bounding_boxes: typing.List[
+            typing.Tuple[ChunkOfText, Rectangle]
+        ] = []
         for i, line_of_text in enumerate(lines_of_text):
 
+            # Alignment.LEFT, Alignment.CENTERED, Alignment.RIGHT
+            if self._text_alignment != Alignment.JUSTIFIED:
+                chunks_of_text_and_bounding_boxes.append(
+                    (
+                        LineOfText(
+                            line_of_text,
+                            font=self._font,
+                            font_size=self._font_size,
+                            font_color=self._font_color,
+                            horizontal_alignment=self._text_alignment,
+                            multiplied_leading=self._multiplied_leading,
+                            fixed_leading=self._fixed_leading,
+                            parent=self,
+                        ),
+                        Rectangle(
+                            bounding_box.x,
+                            bounding_box.y
+                            + bounding_box.height
+                            - line_height * i
+                            - self._font_size,
+                            bounding_box.width,
+                            self._font_size,
+                        ),
+                    )
+                )
+                continue
+
             #  When using justification,
             #  it is customary to treat the last line of a paragraph separately by simply left or right aligning it,
             #  depending on the language direction.
-            if i == len(lines_of_text) - 1 and len(lines_of_text) >= 1:
-                last_line_rectangle: Rectangle = LineOfText(
-                    line_of_text,
-                    font=self._font,
-                    font_size=self._font_size,
-                    font_color=self._font_color,
-                    multiplied_leading=self._multiplied_leading,
-                    fixed_leading=self._fixed_leading,
-                    parent=self,
-                ).layout(
-                    page,
-                    bounding_box=Rectangle(
-                        bounding_box.x,
-                        bounding_box.y + bounding_box.height - line_height * (i + 1),
-                        bounding_box.width,
-                        self._font_size,
-                    ),
+            if (
+                i == len(lines_of_text) - 1
+                and len(lines_of_text) >= 1
+                and not self._justify_last_line
+            ):
+                chunks_of_text_and_bounding_boxes.append(
+                    (
+                        LineOfText(
+                            line_of_text,
+                            font=self._font,
+                            font_size=self._font_size,
+                            font_color=self._font_color,
+                            multiplied_leading=self._multiplied_leading,
+                            fixed_leading=self._fixed_leading,
+                            parent=self,
+                        ),
+                        Rectangle(
+                            bounding_box.x,
+                            bounding_box.y
+                            + bounding_box.height
+                            - line_height * (i + 1),
+                            bounding_box.width,
+                            self._font_size,
+                        ),
+                    )
                 )
-                min_x = min(last_line_rectangle.x, min_x)
-                min_y = min(last_line_rectangle.y, min_y)
-                max_x = max(last_line_rectangle.x + last_line_rectangle.width, max_x)
-                max_y = max(last_line_rectangle.y + last_line_rectangle.height, max_y)
                 continue
 
-            estimated_width: Decimal = GlyphLine.from_str(
+            estimated_width: Decimal = GlyphLine.measure(
                 line_of_text, self._font, self._font_size
-            ).get_width_in_text_space()
+            )
             remaining_space: Decimal = bounding_box.width - estimated_width
 
             # calculate the space that needs to be divided among the space-characters
@@ -342,41 +672,71 @@ class Paragraph(LineOfText):
                 space_per_space = Decimal(0)
             words: typing.List[str] = line_of_text.split(" ")
 
-            # perform layout
+            # every word is a separate ChunkOfText
             x: Decimal = bounding_box.x
             for j, w in enumerate(words):
                 s = w + ("" if j == len(words) - 1 else " ")
-                r: Rectangle = ChunkOfText(
-                    s,
-                    font=self._font,
-                    font_size=self._font_size,
-                    font_color=self._font_color,
-                    multiplied_leading=self._multiplied_leading,
-                    fixed_leading=self._fixed_leading,
-                    parent=self,
-                ).layout(
-                    page,
-                    bounding_box=Rectangle(
-                        x,
-                        bounding_box.y + bounding_box.height - line_height * (i + 1),
-                        bounding_box.width,
-                        self._font_size,
-                    ),
+                chunks_of_text_and_bounding_boxes.append(
+                    (
+                        ChunkOfText(
+                            s,
+                            font=self._font,
+                            font_size=self._font_size,
+                            font_color=self._font_color,
+                            multiplied_leading=self._multiplied_leading,
+                            fixed_leading=self._fixed_leading,
+                            parent=self,
+                        ),
+                        Rectangle(
+                            x,
+                            bounding_box.y
+                            + bounding_box.height
+                            - line_height * (i + 1),
+                            bounding_box.width,
+                            self._font_size,
+                        ),
+                    )
                 )
-                min_x = min(r.x, min_x)
-                min_y = min(r.y, min_y)
-                max_x = max(r.x + r.width, max_x)
-                max_y = max(r.y + r.height, max_y)
 
                 # line up our next x
-                word_size = GlyphLine.from_str(
-                    s, self._font, self._font_size
-                ).get_width_in_text_space()
+                word_size = GlyphLine.measure(s, self._font, self._font_size)
                 x += word_size
                 x += space_per_space
 
-        # set bounding box
+        # return
+        return chunks_of_text_and_bounding_boxes
+
+    def _layout_lines_of_text(
+        self, page: Page, bounding_box: Rectangle, do_layout: bool
+    ) -> Rectangle:
+        # easy case
+        if len(self._text) == 0:
+            return Rectangle(bounding_box.x, bounding_box.y, Decimal(0), Decimal(0))
+
+        # other easy cases
+        lines_of_text = self._split_text(bounding_box)
+        if len(lines_of_text) == 0:
+            return Rectangle(bounding_box.x, bounding_box.y, Decimal(0), Decimal(0))
+
+        # lay out (or measure) every line (or word, in case of Alignment.JUSTIFIED)
+        min_x: Decimal = Decimal(2048)
+        min_y: Decimal = Decimal(2048)
+        max_x: Decimal = Decimal(0)
+        max_y: Decimal = Decimal(0)
+        for c, r in self._get_chunks_of_text_and_bounding_boxes(
+            lines_of_text, bounding_box
+        ):
+            if do_layout:
+                r = c.layout(page, r)
+            else:
+                r = c._calculate_aligned_layout_box(page, r)
+            min_x = min(r.x, min_x)
+            min_y = min(r.y, min_y)
+            max_x = max(r.x + r.width, max_x)
+            max_y = max(r.y + r.height, max_y)
         layout_rect = Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
+
+        # set bounding box
         self.set_bounding_box(layout_rect)
 
         # return
@@ -30,10 +30,10 @@ class SetCMYKNonStroking(CanvasOperator):
         Invoke the k operator
         """
         # fmt: off
-        assert isinstance(operands[0], Decimal), "Operand 0 of k must be a Decimal"
-        assert isinstance(operands[1], Decimal), "Operand 1 of k must be a Decimal"
-        assert isinstance(operands[2], Decimal), "Operand 2 of k must be a Decimal"
-        assert isinstance(operands[3], Decimal), "Operand 3 of k must be a Decimal"
+        assert isinstance(operands[0], (Decimal, float)), "Operand 0 of k must be a number"
+        assert isinstance(operands[1], (Decimal, float)), "Operand 1 of k must be a number"
+        assert isinstance(operands[2], (Decimal, float)), "Operand 2 of k must be a number"
+        assert isinstance(operands[3], (Decimal, float)), "Operand 3 of k must be a number"
         # fmt: on
         c = operands[0]
         m = operands[1]
@@ -40,10 +40,10 @@ class SetCMYKStroking(CanvasOperator):
         Invoke the K operator
         """
         # fmt: off
-        assert isinstance(operands[0], Decimal), "operand 0 of K operator must be of type Decimal"
-        assert isinstance(operands[1], Decimal), "operand 1 of K operator must be of type Decimal"
-        assert isinstance(operands[2], Decimal), "operand 2 of K operator must be of type Decimal"
-        assert isinstance(operands[3], Decimal), "operand 3 of K operator must be of type Decimal"
+        assert isinstance(operands[0], (Decimal, float)), "operand 0 of K operator must be of type Decimal"
+        assert isinstance(operands[1], (Decimal, float)), "operand 1 of K operator must be of type Decimal"
+        assert isinstance(operands[2], (Decimal, float)), "operand 2 of K operator must be of type Decimal"
+        assert isinstance(operands[3], (Decimal, float)), "operand 3 of K operator must be of type Decimal"
         # fmt: on
         c = operands[0]
         m = operands[1]
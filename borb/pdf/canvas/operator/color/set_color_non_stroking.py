@@ -56,10 +56,10 @@ class SetColorNonStroking(CanvasOperator):
         non_stroke_color_space = canvas.graphics_state.non_stroke_color_space
         if non_stroke_color_space == "DeviceCMYK":
             # fmt: off
-            assert isinstance(operands[0], Decimal), "Operand 0 of scn must be a Decimal"
-            assert isinstance(operands[1], Decimal), "Operand 1 of scn must be a Decimal"
-            assert isinstance(operands[2], Decimal), "Operand 2 of scn must be a Decimal"
-            assert isinstance(operands[3], Decimal), "Operand 3 of scn must be a Decimal"
+            assert isinstance(operands[0], (Decimal, float)), "Operand 0 of scn must be a number"
+            assert isinstance(operands[1], (Decimal, float)), "Operand 1 of scn must be a number"
+            assert isinstance(operands[2], (Decimal, float)), "Operand 2 of scn must be a number"
+            assert isinstance(operands[3], (Decimal, float)), "Operand 3 of scn must be a number"
             canvas.graphics_state.non_stroke_color = CMYKColor(
                 operands[0],
                 operands[1],
@@ -71,16 +71,16 @@ class SetColorNonStroking(CanvasOperator):
 
         if non_stroke_color_space == "DeviceGray":
             # fmt: off
-            assert isinstance(operands[0], Decimal), "Operand 0 of scn must be a Decimal"
+            assert isinstance(operands[0], (Decimal, float)), "Operand 0 of scn must be a number"
             canvas.graphics_state.non_stroke_color = GrayColor(operands[0])
             return
             # fmt: on
 
         if non_stroke_color_space == "DeviceRGB":
             # fmt: off
-            assert isinstance(operands[0], Decimal), "Operand 0 of scn must be a Decimal"
-            assert isinstance(operands[1], Decimal), "Operand 1 of scn must be a Decimal"
-            assert isinstance(operands[2], Decimal), "Operand 2 of scn must be a Decimal"
+            assert isinstance(operands[0], (Decimal, float)), "Operand 0 of scn must be a number"
+            assert isinstance(operands[1], (Decimal, float)), "Operand 1 of scn must be a number"
+            assert isinstance(operands[2], (Decimal, float)), "Operand 2 of scn must be a number"
             canvas.graphics_state.non_stroke_color = RGBColor(
                 operands[0],
                 operands[1],
@@ -95,7 +95,7 @@ class SetColorNonStroking(CanvasOperator):
             and non_stroke_color_space[0] == "Separation"
         ):
             # fmt: off
-            assert isinstance(operands[0], Decimal), "Operand 0 of scn must be a Decimal"
+            assert isinstance(operands[0], (Decimal, float)), "Operand 0 of scn must be a number"
             canvas.graphics_state.non_stroke_color = Separation(canvas.graphics_state.non_stroke_color_space, [operands[0]])
             return
             # fmt: on
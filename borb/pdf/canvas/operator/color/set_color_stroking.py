@@ -68,17 +68,17 @@ class SetColorStroking(CanvasOperator):
         stroke_color_space = canvas.graphics_state.stroke_color_space
         if stroke_color_space == "DeviceCMYK":
             assert isinstance(
-                operands[0], Decimal
-            ), "Operand 0 of SCN must be a Decimal"
+                operands[0], (Decimal, float)
+            ), "Operand 0 of SCN must be a number"
             assert isinstance(
-                operands[1], Decimal
-            ), "Operand 1 of SCN must be a Decimal"
+                operands[1], (Decimal, float)
+            ), "Operand 1 of SCN must be a number"
             assert isinstance(
-                operands[2], Decimal
-            ), "Operand 2 of SCN must be a Decimal"
+                operands[2], (Decimal, float)
+            ), "Operand 2 of SCN must be a number"
             assert isinstance(
-                operands[3], Decimal
-            ), "Operand 3 of SCN must be a Decimal"
+                operands[3], (Decimal, float)
+            ), "Operand 3 of SCN must be a number"
             canvas.graphics_state.stroke_color = CMYKColor(
                 operands[0],
                 operands[1],
@@ -89,21 +89,21 @@ class SetColorStroking(CanvasOperator):
 
         if stroke_color_space == "DeviceGray":
             assert isinstance(
-                operands[0], Decimal
-            ), "Operand 0 of SCN must be a Decimal"
+                operands[0], (Decimal, float)
+            ), "Operand 0 of SCN must be a number"
             canvas.graphics_state.stroke_color = GrayColor(operands[0])
             return
 
         if stroke_color_space == "DeviceRGB":
             assert isinstance(
-                operands[0], Decimal
-            ), "Operand 0 of SCN must be a Decimal"
+                operands[0], (Decimal, float)
+            ), "Operand 0 of SCN must be a number"
             assert isinstance(
-                operands[1], Decimal
-            ), "Operand 1 of SCN must be a Decimal"
+                operands[1], (Decimal, float)
+            ), "Operand 1 of SCN must be a number"
             assert isinstance(
-                operands[2], Decimal
-            ), "Operand 2 of SCN must be a Decimal"
+                operands[2], (Decimal, float)
+            ), "Operand 2 of SCN must be a number"
             canvas.graphics_state.stroke_color = RGBColor(
                 operands[0],
                 operands[1],
@@ -117,8 +117,8 @@ class SetColorStroking(CanvasOperator):
             and stroke_color_space[0] == "Separation"
         ):
             assert isinstance(
-                operands[0], Decimal
-            ), "Operand 0 of SCN must be a Decimal"
+                operands[0], (Decimal, float)
+            ), "Operand 0 of SCN must be a number"
             canvas.graphics_state.stroke_color = Separation(
                 canvas.graphics_state.stroke_color_space, [operands[0]]
             )
@@ -29,6 +29,8 @@ class SetGrayNonStroking(CanvasOperator):
         """
         Invoke the g operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of g must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of g must be a number"
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.non_stroke_color = GrayColor(operands[0])
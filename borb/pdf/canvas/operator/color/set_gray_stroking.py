@@ -35,6 +35,8 @@ class SetGrayStroking(CanvasOperator):
         """
         Invoke the G operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of G must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of G must be a number"
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.stroke_color = GrayColor(operands[0])
@@ -36,9 +36,9 @@ class SetRGBStroking(CanvasOperator):
         Invoke the RG operator
         """
         # fmt: off
-        assert isinstance(operands[0], Decimal), "operand 0 of rg operator must be of type Decimal"
-        assert isinstance(operands[1], Decimal), "operand 1 of rg operator must be of type Decimal"
-        assert isinstance(operands[2], Decimal), "operand 2 of rg operator must be of type Decimal"
+        assert isinstance(operands[0], (Decimal, float)), "operand 0 of rg operator must be of type Decimal"
+        assert isinstance(operands[1], (Decimal, float)), "operand 1 of rg operator must be of type Decimal"
+        assert isinstance(operands[2], (Decimal, float)), "operand 2 of rg operator must be of type Decimal"
         # fmt: on
 
         # set stroke_color
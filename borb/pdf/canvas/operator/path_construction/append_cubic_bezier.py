@@ -20,10 +20,10 @@ from borb.pdf.canvas.operator.canvas_operator import CanvasOperator
 
 def _bezier(p0, p1, p2, p3) -> typing.List[LineSegment]:
     pts = []
-    ONE = Decimal(1)
-    for t in [
-        Decimal(x) for x in [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
-    ]:
+    # use the same numeric type (Decimal or float) as the control points
+    number = float if isinstance(p0[0], float) else Decimal
+    ONE = number(1)
+    for t in [number(x) for x in [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]]:
         x = (
             (ONE - t) ** 3 * p0[0]
             + 3 * t * (ONE - t) ** 2 * p1[0]
@@ -69,22 +69,22 @@ class AppendCubicBezierCurve1(CanvasOperator):
         Invokes the c operator
         """
         assert isinstance(
-            operands[0], Decimal
+            operands[0], (Decimal, float)
         ), "operand 0 of c operator must be of type Decimal"
         assert isinstance(
-            operands[1], Decimal
+            operands[1], (Decimal, float)
         ), "operand 1 of c operator must be of type Decimal"
         assert isinstance(
-            operands[2], Decimal
+            operands[2], (Decimal, float)
         ), "operand 2 of c operator must be of type Decimal"
         assert isinstance(
-            operands[3], Decimal
+            operands[3], (Decimal, float)
         ), "operand 3 of c operator must be of type Decimal"
         assert isinstance(
-            operands[4], Decimal
+            operands[4], (Decimal, float)
         ), "operand 4 of c operator must be of type Decimal"
         assert isinstance(
-            operands[5], Decimal
+            operands[5], (Decimal, float)
         ), "operand 5 of c operator must be of type Decimal"
 
         # get graphic state
@@ -127,16 +127,16 @@ class AppendCubicBezierCurve2(CanvasOperator):
         Invokes the v operator
         """
         assert isinstance(
-            operands[0], Decimal
+            operands[0], (Decimal, float)
         ), "operand 0 of v operator must be of type Decimal"
         assert isinstance(
-            operands[1], Decimal
+            operands[1], (Decimal, float)
         ), "operand 1 of v operator must be of type Decimal"
         assert isinstance(
-            operands[2], Decimal
+            operands[2], (Decimal, float)
         ), "operand 2 of v operator must be of type Decimal"
         assert isinstance(
-            operands[3], Decimal
+            operands[3], (Decimal, float)
         ), "operand 3 of v operator must be of type Decimal"
 
         # get graphic state
@@ -178,16 +178,16 @@ class AppendCubicBezierCurve3(CanvasOperator):
         Invokes the y operator
         """
         assert isinstance(
-            operands[0], Decimal
+            operands[0], (Decimal, float)
         ), "operand 0 of y operator must be of type Decimal"
         assert isinstance(
-            operands[1], Decimal
+            operands[1], (Decimal, float)
         ), "operand 1 of y operator must be of type Decimal"
         assert isinstance(
-            operands[2], Decimal
+            operands[2], (Decimal, float)
         ), "operand 2 of y operator must be of type Decimal"
         assert isinstance(
-            operands[3], Decimal
+            operands[3], (Decimal, float)
         ), "operand 3 of y operator must be of type Decimal"
 
         # get graphic state
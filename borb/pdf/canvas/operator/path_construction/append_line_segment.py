@@ -33,10 +33,10 @@ class AppendLineSegment(CanvasOperator):
         Invokes the l operator
         """
         assert isinstance(
-            operands[0], Decimal
+            operands[0], (Decimal, float)
         ), "operand 0 of l operator must be of type Decimal"
         assert isinstance(
-            operands[1], Decimal
+            operands[1], (Decimal, float)
         ), "operand 1 of l operator must be of type Decimal"
 
         # get graphic state
@@ -46,43 +46,46 @@ class AppendRectangle(CanvasOperator):
         """
         Invoke the s operator
         """
-        assert isinstance(operands[0], Decimal)
-        assert isinstance(operands[1], Decimal)
-        assert isinstance(operands[2], Decimal)
-        assert isinstance(operands[3], Decimal)
+        assert isinstance(operands[0], (Decimal, float))
+        assert isinstance(operands[1], (Decimal, float))
+        assert isinstance(operands[2], (Decimal, float))
+        assert isinstance(operands[3], (Decimal, float))
         x: Decimal = operands[0]
         y: Decimal = operands[1]
         width: Decimal = operands[2]
         height: Decimal = operands[3]
 
-        moveto_op: typing.Optional[
-            CanvasOperator
-        ] = canvas_stream_processor.get_operator("m")
+        # use the same numeric type (Decimal or float) as the operands
+        number = float if isinstance(x, float) else bDecimal
+
+        moveto_op: typing.Optional[CanvasOperator] = (
+            canvas_stream_processor.get_operator("m")
+        )
         assert moveto_op is not None
         moveto_op.invoke(
-            canvas_stream_processor, [bDecimal(x), bDecimal(y)], event_listeners
+            canvas_stream_processor, [number(x), number(y)], event_listeners
         )
 
-        line_to_op: typing.Optional[
-            CanvasOperator
-        ] = canvas_stream_processor.get_operator("l")
+        line_to_op: typing.Optional[CanvasOperator] = (
+            canvas_stream_processor.get_operator("l")
+        )
         assert line_to_op is not None
         line_to_op.invoke(
-            canvas_stream_processor, [bDecimal(x + width), bDecimal(y)], event_listeners
+            canvas_stream_processor, [number(x + width), number(y)], event_listeners
         )
         line_to_op.invoke(
             canvas_stream_processor,
-            [bDecimal(x + width), bDecimal(y + height)],
+            [number(x + width), number(y + height)],
             event_listeners,
         )
         line_to_op.invoke(
             canvas_stream_processor,
-            [bDecimal(x), bDecimal(y + height)],
+            [number(x), number(y + height)],
             event_listeners,
         )
 
-        close_subpath_op: typing.Optional[
-            CanvasOperator
-        ] = canvas_stream_processor.get_operator("h")
+        close_subpath_op: typing.Optional[CanvasOperator] = (
+            canvas_stream_processor.get_operator("h")
+        )
         assert close_subpath_op is not None
         close_subpath_op.invoke(canvas_stream_processor, [], event_listeners)
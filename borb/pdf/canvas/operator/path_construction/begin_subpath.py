@@ -38,10 +38,10 @@ class BeginSubpath(CanvasOperator):
         Invoke the m operator
         """
         assert isinstance(
-            operands[0], Decimal
+            operands[0], (Decimal, float)
         ), "operand 0 of m operator must be of type Decimal"
         assert isinstance(
-            operands[1], Decimal
+            operands[1], (Decimal, float)
         ), "operand 1 of m operator must be of type Decimal"
 
         # get graphic state
@@ -35,12 +35,24 @@ class ModifyTransformationMatrix(CanvasOperator):
         """
         Invoke the cm operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of cm must be a Decimal"
-        assert isinstance(operands[1], Decimal), "Operand 1 of cm must be a Decimal"
-        assert isinstance(operands[2], Decimal), "Operand 2 of cm must be a Decimal"
-        assert isinstance(operands[3], Decimal), "Operand 3 of cm must be a Decimal"
-        assert isinstance(operands[4], Decimal), "Operand 4 of cm must be a Decimal"
-        assert isinstance(operands[5], Decimal), "Operand 5 of cm must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of cm must be a number"
+        assert isinstance(
+            operands[1], (Decimal, float)
+        ), "Operand 1 of cm must be a number"
+        assert isinstance(
+            operands[2], (Decimal, float)
+        ), "Operand 2 of cm must be a number"
+        assert isinstance(
+            operands[3], (Decimal, float)
+        ), "Operand 3 of cm must be a number"
+        assert isinstance(
+            operands[4], (Decimal, float)
+        ), "Operand 4 of cm must be a number"
+        assert isinstance(
+            operands[5], (Decimal, float)
+        ), "Operand 5 of cm must be a number"
         mtx = Matrix.matrix_from_six_values(
             operands[0],
             operands[1],
@@ -31,4 +31,5 @@ class PushGraphicsState(CanvasOperator):
         Invoke the q operator
         """
         canvas = canvas_stream_processor.get_canvas()
-        canvas.graphics_state_stack.append(copy.deepcopy(canvas.graphics_state))
+        # this is a (cheap) copy-on-write copy, see CanvasGraphicsState.__copy__
+        canvas.graphics_state_stack.append(copy.copy(canvas.graphics_state))
@@ -28,6 +28,8 @@ class SetLineWidth(CanvasOperator):
         """
         Invoke the w operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of w must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of w must be a number"
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.line_width = operands[0]
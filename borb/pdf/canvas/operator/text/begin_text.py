@@ -35,7 +35,8 @@ class BeginTextObject(CanvasOperator):
         Invoke the BT operator
         """
         canvas = canvas_stream_processor.get_canvas()
-        canvas.graphics_state.text_matrix = Matrix.identity_matrix()
-        canvas.graphics_state.text_line_matrix = Matrix.identity_matrix()
+        float_mode: bool = canvas.graphics_state.float_mode
+        canvas.graphics_state.text_matrix = Matrix.identity_matrix(float_mode)
+        canvas.graphics_state.text_line_matrix = Matrix.identity_matrix(float_mode)
         for l in event_listeners:
             l._event_occurred(BeginTextEvent())
@@ -36,17 +36,21 @@ class MoveTextPosition(CanvasOperator):
         """
         Invoke the Td operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of Td must be a Decimal"
-        assert isinstance(operands[1], Decimal), "Operand 1 of Td must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of Td must be a number"
+        assert isinstance(
+            operands[1], (Decimal, float)
+        ), "Operand 1 of Td must be a number"
 
         tx = operands[0]
         ty = operands[1]
 
-        m = Matrix.identity_matrix()
+        canvas = canvas_stream_processor.get_canvas()
+        m = Matrix.identity_matrix(canvas.graphics_state.float_mode)
         m[2][0] = tx
         m[2][1] = ty
 
-        canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.text_matrix = m.mul(
             canvas.graphics_state.text_line_matrix
         )
@@ -37,22 +37,27 @@ class MoveTextPositionSetLeading(CanvasOperator):
         """
         Invoke the TD operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of TD must be a Decimal"
-        assert isinstance(operands[1], Decimal), "Operand 1 of TD must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of TD must be a number"
+        assert isinstance(
+            operands[1], (Decimal, float)
+        ), "Operand 1 of TD must be a number"
 
-        set_text_leading_op: typing.Optional[
-            CanvasOperator
-        ] = canvas_stream_processor.get_operator("TL")
+        set_text_leading_op: typing.Optional[CanvasOperator] = (
+            canvas_stream_processor.get_operator("TL")
+        )
         assert (
             set_text_leading_op
         ), "Operand TL must be defined for operator TD to function"
-        set_text_leading_op.invoke(
-            canvas_stream_processor, [bDecimal(-operands[1])], event_listeners
+        leading = (
+            -operands[1] if isinstance(operands[1], float) else bDecimal(-operands[1])
         )
+        set_text_leading_op.invoke(canvas_stream_processor, [leading], event_listeners)
 
-        move_text_position_op: typing.Optional[
-            CanvasOperator
-        ] = canvas_stream_processor.get_operator("Td")
+        move_text_position_op: typing.Optional[CanvasOperator] = (
+            canvas_stream_processor.get_operator("Td")
+        )
         assert (
             move_text_position_op
         ), "Operand Td must be defined for operator TD to function"
@@ -40,15 +40,16 @@ class MoveToNextLine(CanvasOperator):
         """
         Invoke the T* operator
         """
-        move_text_position_op: typing.Optional[
-            CanvasOperator
-        ] = canvas_stream_processor.get_operator("Td")
+        move_text_position_op: typing.Optional[CanvasOperator] = (
+            canvas_stream_processor.get_operator("Td")
+        )
         assert (
             move_text_position_op
         ), "Operator Td must be defined for operator T* to function."
         canvas = canvas_stream_processor.get_canvas()
+        zero = 0.0 if canvas.graphics_state.float_mode else bDecimal(0)
         move_text_position_op.invoke(
             canvas_stream_processor,
-            [bDecimal(0), -canvas.graphics_state.leading],
+            [zero, -canvas.graphics_state.leading],
             event_listeners,
         )
@@ -32,6 +32,8 @@ class SetCharacterSpacing(CanvasOperator):
         """
         Invoke the Tc operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of Tc must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of Tc must be a number"
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.character_spacing = operands[0]
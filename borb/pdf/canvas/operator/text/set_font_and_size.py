@@ -45,7 +45,7 @@ class SetFontAndSize(CanvasOperator):
 
         # font size
         font_size = operands[1]
-        assert isinstance(font_size, Decimal)
+        assert isinstance(font_size, (Decimal, float))
 
         # set state
         canvas = canvas_stream_processor.get_canvas()
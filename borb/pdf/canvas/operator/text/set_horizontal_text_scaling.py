@@ -32,6 +32,8 @@ class SetHorizontalScaling(CanvasOperator):
         """
         Invoke the Tz operator
         """
-        assert isinstance(operands[0], Decimal), "Operand 0 of Tz must be a Decimal"
+        assert isinstance(
+            operands[0], (Decimal, float)
+        ), "Operand 0 of Tz must be a number"
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.horizontal_scaling = operands[0]
@@ -32,6 +32,6 @@ class SetTextLeading(CanvasOperator):
         """
         Invoke the TL operator
         """
-        assert isinstance(operands[0], Decimal)
+        assert isinstance(operands[0], (Decimal, float))
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.leading = operands[0]
@@ -41,12 +41,12 @@ class SetTextMatrix(CanvasOperator):
         Invoke the Tm operator
         """
 
-        assert isinstance(operands[0], Decimal)
-        assert isinstance(operands[1], Decimal)
-        assert isinstance(operands[2], Decimal)
-        assert isinstance(operands[3], Decimal)
-        assert isinstance(operands[4], Decimal)
-        assert isinstance(operands[5], Decimal)
+        assert isinstance(operands[0], (Decimal, float))
+        assert isinstance(operands[1], (Decimal, float))
+        assert isinstance(operands[2], (Decimal, float))
+        assert isinstance(operands[3], (Decimal, float))
+        assert isinstance(operands[4], (Decimal, float))
+        assert isinstance(operands[5], (Decimal, float))
 
         mtx = Matrix.matrix_from_six_values(
             operands[0],
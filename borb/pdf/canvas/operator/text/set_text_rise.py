@@ -30,6 +30,6 @@ class SetTextRise(CanvasOperator):
         """
         Invoke the Ts operator
         """
-        assert isinstance(operands[0], Decimal)
+        assert isinstance(operands[0], (Decimal, float))
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.text_rise = operands[0]
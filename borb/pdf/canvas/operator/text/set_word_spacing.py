@@ -32,6 +32,6 @@ class SetWordSpacing(CanvasOperator):
         """
         Invoke the Tw operator
         """
-        assert isinstance(operands[0], Decimal)
+        assert isinstance(operands[0], (Decimal, float))
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.word_spacing = operands[0]
@@ -47,7 +47,8 @@ class ShowText(CanvasOperator):
             l._event_occurred(tri)
 
         # update text rendering location
-        canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().width
+        text_matrix = canvas.graphics_state.get_writable_text_matrix()
+        text_matrix[2][0] += tri.get_baseline().width
 
         # restore
         if font_name is not None:
@@ -65,21 +65,22 @@ class ShowTextWithGlyphPositioning(CanvasOperator):
                 for l in event_listeners:
                     l._event_occurred(tri)
                 # update text rendering location
-                canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().width
+                text_matrix = canvas.graphics_state.get_writable_text_matrix()
+                text_matrix[2][0] += tri.get_baseline().width
                 continue
 
             # adjust
-            if isinstance(obj, Decimal):
-                assert isinstance(obj, Decimal)
+            if isinstance(obj, (Decimal, float)):
+                assert isinstance(obj, (Decimal, float))
                 gs = canvas.graphics_state
                 adjust_unscaled = obj
                 adjust_scaled = (
                     -adjust_unscaled
-                    * Decimal(0.001)
+                    * (0.001 if gs.float_mode else Decimal(0.001))
                     * gs.font_size
                     * (gs.horizontal_scaling / 100)
                 )
-                gs.text_matrix[2][0] -= adjust_scaled
+                gs.get_writable_text_matrix()[2][0] -= adjust_scaled
 
         # restore
         if font_name is not None:
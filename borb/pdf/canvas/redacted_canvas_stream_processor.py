@@ -151,7 +151,7 @@ class ShowTextMod(CanvasOperator):
 
             if letter_should_be_redacted:
                 # update text_matrix
-                graphics_state.text_matrix[2][0] += w
+                graphics_state.get_writable_text_matrix()[2][0] += w
                 # this flag is useful to ensure we only write the Tm command once
                 # it could not hurt to write it several times, but it would be a wasted effort
                 jump_from_redacted = True
@@ -172,7 +172,7 @@ class ShowTextMod(CanvasOperator):
                     canvas_stream_processor, evt.get_text(), evt.get_font()
                 )
                 # update text_matrix
-                graphics_state.text_matrix[2][0] += w
+                graphics_state.get_writable_text_matrix()[2][0] += w
 
         # restore
         if font_name is not None:
@@ -249,7 +249,7 @@ class ShowTextWithGlyphPositioningMod(CanvasOperator):
 
                     if letter_should_be_redacted:
                         # update text_matrix
-                        graphics_state.text_matrix[2][0] += w
+                        graphics_state.get_writable_text_matrix()[2][0] += w
                         # this flag is useful to ensure we only write the Tm command once
                         # it could not hurt to write it several times, but it would be a wasted effort
                         jump_from_redacted = True
@@ -270,7 +270,7 @@ class ShowTextWithGlyphPositioningMod(CanvasOperator):
                             canvas_stream_processor, evt.get_text(), evt.get_font()
                         )
                         # update text_matrix
-                        graphics_state.text_matrix[2][0] += w
+                        graphics_state.get_writable_text_matrix()[2][0] += w
 
             # process Decimal objects
             if isinstance(obj, Decimal):
@@ -285,7 +285,7 @@ class ShowTextWithGlyphPositioningMod(CanvasOperator):
                     * gs.font_size
                     * (gs.horizontal_scaling / 100)
                 )
-                gs.text_matrix[2][0] -= adjust_scaled
+                gs.get_writable_text_matrix()[2][0] -= adjust_scaled
 
                 # write operator
                 canvas_stream_processor._redacted_content += "\n%f %f %f %f %f %f Tm" % (  # type: ignore [attr-defined]
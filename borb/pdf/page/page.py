@@ -52,6 +52,41 @@ class Page(Dictionary):
         """
         return self.get_root()  # type: ignore [attr-defined]
 
+    def process(
+        self,
+        event_listeners: typing.List["EventListener"],  # type: ignore [name-defined]
+        float_mode: bool = False,
+        page_number: typing.Optional[int] = None,
+    ) -> "Page":
+        """
+        This function processes the content stream of this Page, sending out events to the given EventListener(s).
+        This allows a Document to be read once, and then have (for instance) the text extracted of only the Page(s) that are needed.
+        When float_mode is True, all numbers in the content stream are processed as floats (rather than Decimal objects).
+        The EventListener(s) store their results under page_number, by default they number the Page(s) in the order in which they are processed.
+        """
+        from borb.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
+        from borb.pdf.canvas.event.begin_page_event import BeginPageEvent
+        from borb.pdf.canvas.event.end_page_event import EndPageEvent
+
+        # send out BeginPageEvent
+        for l in event_listeners:
+            l._event_occurred(BeginPageEvent(self, page_number))
+
+        # If there are no event listeners, processing the page has no effect
+        # we may as well skip it (cause it is very labour-intensive).
+        if len(event_listeners) > 0 and "Contents" in self:
+            canvas = Canvas().set_parent(self)  # type: ignore [attr-defined]
+            CanvasStreamProcessor(self, canvas, [], float_mode=float_mode).read(
+                io.BytesIO(self["Contents"]["DecodedBytes"]), event_listeners
+            )
+
+        # send out EndPageEvent
+        for l in event_listeners:
+            l._event_occurred(EndPageEvent(self))
+
+        # return
+        return self
+
     #
     # FORMS
     #
@@ -9,6 +9,8 @@
     PDF was standardized as ISO 32000 in 2008, and no longer requires any royalties for its implementation.
 """
 import io
+import mmap
+import pathlib
 import typing
 from typing import List, Union
 
@@ -46,15 +48,57 @@ class PDF:
         file: Union[io.BufferedIOBase, io.RawIOBase],
         event_listeners: List[EventListener] = [],
         password: typing.Optional[str] = None,
+        lazy: bool = False,
+        pages: typing.Optional[typing.Iterable[int]] = None,
+        float_mode: bool = False,
     ) -> Document:
         """
         This function reads a byte-stream input (which may be presented as an io.BufferedIOBase o io.RawIOBase)
         and returns a Document.
+        When lazy is True, (indirect) objects are only read when they are first accessed.
+        The byte-stream input then needs to remain open for as long as the Document is used.
+        The EventListener(s) are sent the events of every Page (in order), or only those of the given pages (in the given order).
+        Either way, the EventListener(s) store their results under the (actual) page number of each Page.
+        Use Page.process to send the events of a Page to EventListener(s) after the Document has been read.
+        When float_mode is True, the content of each Page is processed using floats (rather than Decimal objects),
+        which is a lot faster, and precise enough for extracting text and images.
         """
         return ReadAnyObjectTransformer().transform(
             file,
             parent_object=None,
-            context=ReadTransformerState(password=password),
+            context=ReadTransformerState(
+                password=password, lazy=lazy, pages=pages, float_mode=float_mode
+            ),
+            event_listeners=event_listeners,
+        )
+
+    @staticmethod
+    def loads_mmap(
+        path: Union[str, pathlib.Path],
+        event_listeners: List[EventListener] = [],
+        password: typing.Optional[str] = None,
+        lazy: bool = False,
+        pages: typing.Optional[typing.Iterable[int]] = None,
+        float_mode: bool = False,
+    ) -> Document:
+        """
+        This function memory-maps the file at the given path (read-only) and returns a Document.
+        The tokenizers scan the memory-mapped bytes in-place, so random access to objects does not need any read/seek calls
+        on a file handle, and the OS page cache is shared between all processes that map the same file.
+        When lazy is True, (indirect) objects are only read when they are first accessed (see PDF.loads).
+        The EventListener(s) are sent the events of every Page, or only those of the given pages (see PDF.loads).
+        When float_mode is True, the content of each Page is processed using floats (see PDF.loads).
+        """
+        with open(path, "rb") as file_handle:
+            memory_mapped_file: mmap.mmap = mmap.mmap(
+                file_handle.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        return ReadAnyObjectTransformer().transform(
+            memory_mapped_file,
+            parent_object=None,
+            context=ReadTransformerState(
+                password=password, lazy=lazy, pages=pages, float_mode=float_mode
+            ),
             event_listeners=event_listeners,
         )
 
@@ -63,9 +107,20 @@ class PDF:
         file: Union[io.BufferedIOBase, io.RawIOBase],
         document: Document,
         conformance_level: typing.Optional[ConformanceLevel] = None,
+        use_object_streams: bool = False,
+        incremental_update: bool = False,
+        subset_fonts: bool = True,
     ) -> None:
         """
         This function writes a Document to a byte-stream output (which may be presented as an io.BufferedIOBase o io.RawIOBase)
+        When use_object_streams is True, (non-stream) objects are written in compressed object streams,
+        and the cross-reference table is written as a cross-reference stream (PDF 1.5 and up)
+        When incremental_update is True, only the objects that were added (or modified) since the Document was read are written,
+        followed by a cross-reference section (and trailer) that refers to the original one. The output then needs to hold
+        the original bytes (that the Document was read from) and be positioned at their end, e.g. a file opened in "ab" mode.
+        When subset_fonts is True, fonts built by TrueTypeFont.true_type_font_from_file only embed the glyphs
+        of the characters that are used in the Document.
+        Use a StreamingPDFWriter to write a (very large) Document one Page at a time.
         """
         WriteAnyObjectTransformer().transform(
             object_to_transform=document,
@@ -73,6 +128,9 @@ class PDF:
                 root_object=document,
                 destination=file,
                 conformance_level=conformance_level,
+                use_object_streams=use_object_streams,
+                incremental_update=incremental_update,
+                subset_fonts=subset_fonts,
             ),
             destination=file,
         )
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This class writes a Document to a byte-stream output one Page at a time.
+Every Page (and the objects it uses) is written as soon as it is complete,
+and is then no longer kept in memory. This allows (very) large Documents to be generated using bounded memory.
+"""
+import io
+import typing
+from typing import Union
+
+from PIL.Image import Image  # type: ignore [import]
+
+from borb.io.read.types import AnyPDFType, Dictionary, List, Reference
+from borb.io.write.any_object_transformer import AnyObjectTransformer
+from borb.io.write.conformance_level import ConformanceLevel
+from borb.io.write.document.document_transformer import DocumentTransformer
+from borb.io.write.transformer import WriteTransformerState
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+
+
+class StreamingPDFWriter:
+    """
+    This class writes a Document to a byte-stream output one Page at a time.
+    A Page is written when the next Page is appended (or when this StreamingPDFWriter is closed),
+    so it can still be laid out after having been appended (as is the case with Document.append_page).
+    Once a Page has been written, only the Reference(s) of the objects that were written are kept.
+    Objects that are shared among Page(s) (e.g. a Font) are written only once.
+    """
+
+    def __init__(
+        self,
+        file: Union[io.BufferedIOBase, io.RawIOBase],
+        conformance_level: typing.Optional[ConformanceLevel] = None,
+        use_object_streams: bool = False,
+    ):
+        self._document: Document = Document()
+        self._transformer: AnyObjectTransformer = AnyObjectTransformer()
+        self._context: WriteTransformerState = WriteTransformerState(
+            root_object=self._document,
+            destination=file,
+            conformance_level=conformance_level,
+            use_object_streams=use_object_streams,
+            # a Font is written along with the first Page that uses it
+            # it can not be subset, as later Page(s) may use other characters
+            subset_fonts=False,
+        )
+        self._page_to_write: typing.Optional[Page] = None
+        self._ids_of_released_references: typing.Set[int] = set()
+        self._is_closed: bool = False
+
+        # write header
+        DocumentTransformer.write_header(self._context)
+
+    def __enter__(self) -> "StreamingPDFWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def append_page(self, page: Page) -> "StreamingPDFWriter":
+        """
+        This function appends a Page to the Document that is being written, and returns self.
+        The Page that was appended before it is written (and released).
+        """
+        assert (
+            not self._is_closed
+        ), "A Page can not be appended to a StreamingPDFWriter that was closed."
+        self._write_page()
+        self._document.append_page(page)
+        self._page_to_write = page
+        return self
+
+    def close(self) -> None:
+        """
+        This function writes the last Page, followed by the /Catalog, the /Info Dictionary
+        and the cross-reference table (or stream). The output itself is not closed.
+        """
+        if self._is_closed:
+            return
+        self._write_page()
+        assert "XRef" in self._document, "A Document needs at least one Page."
+
+        # write /Catalog, /Info and /XRef
+        DocumentTransformer.build_trailer(self._document)
+        self._invalidate_references(self._document["XRef"]["Trailer"])
+        self._transformer.transform(self._document["XRef"], self._context)
+        self._is_closed = True
+
+    def get_document(self) -> Document:
+        """
+        This function returns the Document that is being written.
+        Its /Pages only hold the Page that was appended last, all other Page(s) are replaced by their Reference.
+        """
+        return self._document
+
+    def _write_page(self) -> None:
+        page: typing.Optional[Page] = self._page_to_write
+        if page is None:
+            return
+        self._page_to_write = None
+
+        # write /Page (and the objects it uses)
+        # the /Page is replaced by its Reference in /Kids
+        kids: List = self._document["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        index: int = len(kids) - 1
+        assert kids[index] is page
+        self._invalidate_references(page)
+        ref: Reference = self._transformer.get_reference(page, self._context)
+        self._transformer.transform(page, self._context)
+        kids[index] = ref
+
+        # release all objects that were written, keeping only their Reference
+        # objects that are still being written (e.g. /Pages) are kept
+        context: WriteTransformerState = self._context
+        for obj_id, obj in [x for x in context.indirect_objects_by_id.items()]:
+            obj_ref: typing.Optional[Reference] = obj.get_reference()  # type: ignore [union-attr]
+            if obj_ref is None or obj_ref.byte_offset is None:
+                continue
+            context.released_references.append(obj_ref)
+            self._ids_of_released_references.add(id(obj_ref))
+            del context.indirect_objects_by_id[obj_id]
+        context.indirect_objects_by_hash.clear()
+        context.structural_digests_by_id.clear()
+
+    def _invalidate_references(self, object: AnyPDFType) -> None:
+        # objects that were read (from another Document) still have their original Reference,
+        # these need to be invalidated (as PDF.dumps does), except for the objects that were written already
+        # (e.g. a Font that is shared among Pages) or that are still being written (e.g. /Pages)
+        # iterating over a List or Dictionary resolves its (lazy) Reference(s)
+        context: WriteTransformerState = self._context
+        objects_done: typing.Set[int] = set()
+        objects_todo: typing.List[AnyPDFType] = [object]
+        while len(objects_todo) > 0:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done:
+                continue
+            objects_done.add(id(obj))
+            if not isinstance(obj, (Dictionary, List, Image)):
+                continue
+            if id(obj) in context.indirect_objects_by_id:
+                continue
+            if id(obj.get_reference()) in self._ids_of_released_references:  # type: ignore [union-attr]
+                continue
+            obj.set_reference(None)  # type: ignore [union-attr]
+            if isinstance(obj, List):
+                objects_todo.extend([v for v in obj])
+            if isinstance(obj, Dictionary):
+                objects_todo.extend([v for v in obj.values()])
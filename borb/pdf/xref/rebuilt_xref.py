@@ -63,7 +63,7 @@ class RebuiltXREF(PlainTextXREF):
                 and bytes_in_pdf[i + 6] == 106          # 'j'
             ):
                 logger.debug("%d %d obj at %d" % (bytes_in_pdf[i] - 48, bytes_in_pdf[i+1] - 48, i))
-                self._entries.append(
+                self.append(
                     Reference(
                         object_number=bytes_in_pdf[i] - 48,
                         generation_number=bytes_in_pdf[i + 2] - 48,
@@ -85,7 +85,7 @@ class RebuiltXREF(PlainTextXREF):
                 and bytes_in_pdf[i + 7] == 106          # 'j'
             ):
                 logger.debug("%d %d obj at %d" % ((bytes_in_pdf[i] - 48) * 10 + (bytes_in_pdf[i+1] - 48), bytes_in_pdf[i+3] - 48, i))
-                self._entries.append(
+                self.append(
                     Reference(
                         object_number=(bytes_in_pdf[i] - 48) * 10 + (bytes_in_pdf[i+1] - 48),
                         generation_number=bytes_in_pdf[i + 3] - 48,
@@ -109,7 +109,7 @@ class RebuiltXREF(PlainTextXREF):
             ):
                 obj_nr: int = (bytes_in_pdf[i] - 48) * 100 + (bytes_in_pdf[i+1] - 48) * 10 + (bytes_in_pdf[i+2] - 48)
                 logger.debug("%d %d obj at %d" % (obj_nr, bytes_in_pdf[i+4] - 48, i))
-                self._entries.append(
+                self.append(
                     Reference(
                         object_number=obj_nr,
                         generation_number=bytes_in_pdf[i + 4] - 48,
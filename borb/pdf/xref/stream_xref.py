@@ -7,7 +7,7 @@
 """
 import io
 from decimal import Decimal
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 from borb.io.filter.stream_decode_util import decode_stream
 from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
@@ -74,6 +74,9 @@ class StreamXREF(XREF):
                 document=document,
             )
         ]
+        indirect_references_by_object_number: Dict[int, Reference] = {
+            0: indirect_references[0]
+        }
 
         # check size
         assert "Size" in xref_stream
@@ -97,12 +100,13 @@ class StreamXREF(XREF):
         xref_stream = decode_stream(xref_stream)
 
         # read every range specified in /Index
+        # the entries of all ranges are stored one after the other
         xref_stream_decoded_bytes = xref_stream["DecodedBytes"]
+        bptr = 0
         for idx in range(0, len(index), 2):
             start = int(index[idx])
             length = int(index[idx + 1])
 
-            bptr = 0
             for i in range(0, length):
 
                 # object number
@@ -178,16 +182,8 @@ class StreamXREF(XREF):
                 assert pdf_indirect_reference is not None
 
                 # append
-                existing_indirect_ref = next(
-                    iter(
-                        [
-                            x
-                            for x in indirect_references
-                            if x.object_number is not None
-                            and x.object_number == Decimal(object_number)
-                        ]
-                    ),
-                    None,
+                existing_indirect_ref = indirect_references_by_object_number.get(
+                    object_number, None
                 )
                 ref_is_in_reading_state = (
                     existing_indirect_ref is not None
@@ -203,6 +199,9 @@ class StreamXREF(XREF):
                 if ref_is_first_encountered:
                     assert pdf_indirect_reference is not None
                     indirect_references.append(pdf_indirect_reference)
+                    indirect_references_by_object_number.setdefault(
+                        object_number, pdf_indirect_reference
+                    )
                 elif ref_is_in_reading_state:
                     assert existing_indirect_ref is not None
                     assert pdf_indirect_reference is not None
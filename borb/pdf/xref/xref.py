@@ -9,6 +9,7 @@
     and then it loads the objects only when they are needed.
     It does not need to parse or load the whole file.
 """
+import collections
 import io
 import logging
 import typing
@@ -33,10 +34,20 @@ class XREF(Dictionary):
     It does not need to parse or load the whole file.
     """
 
+    # maximum number of (decoded) object streams that are kept in memory
+    OBJECT_STREAM_CACHE_SIZE: int = 64
+
     def __init__(self):
         super(XREF, self).__init__()
         self._entries: typing.List[Reference] = []
+        self._entries_by_object_number: typing.Dict[int, Reference] = {}
+        self._entries_by_parent_stream: typing.Dict[
+            typing.Tuple[int, int], Reference
+        ] = {}
         self._cache: typing.Dict[int, Union[AnyPDFType, None]] = {}
+        self._object_stream_cache: collections.OrderedDict = collections.OrderedDict()
+        # byte offset of the (most recent) cross-reference section, this is needed to write incremental updates
+        self._start_of_xref: typing.Optional[int] = None
 
     ##
     ## LOWLEVEL IO
@@ -63,7 +74,7 @@ class XREF(Dictionary):
         while pos > 0:
             src.seek(pos)
             bytes_near_eof = "".join([tok._next_char() for _ in range(0, str_len)])
-            idx = bytes_near_eof.find(text_to_find)
+            idx = bytes_near_eof.rfind(text_to_find)
             if idx >= 0:
                 return pos + idx
             pos = pos - str_len + len(text_to_find)
@@ -88,6 +99,7 @@ class XREF(Dictionary):
         assert token is not None
         if token.get_text() == "xref":
             src.seek(start_of_xref_token_byte_offset)
+            self._start_of_xref = start_of_xref_token_byte_offset
             return
 
         # if we are at startxref, we are reading the XREF table backwards
@@ -98,6 +110,85 @@ class XREF(Dictionary):
             assert token.get_token_type() == TokenType.NUMBER
             start_of_xref_offset = int(token.get_text())
             src.seek(start_of_xref_offset)
+            self._start_of_xref = start_of_xref_offset
+
+    def _get_object_stream(
+        self,
+        object_number: int,
+        src: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO],
+        tok: HighLevelTokenizer,
+    ) -> typing.Tuple[typing.List[int], bytes]:
+        """
+        This function returns the (decoded) bytes of an object stream,
+        and the byte offset (in those bytes) of each object it contains.
+        The most recently used object streams are cached.
+        """
+        # cache
+        if object_number in self._object_stream_cache:
+            self._object_stream_cache.move_to_end(object_number)
+            return self._object_stream_cache[object_number]
+
+        stream_object = self.get_object(object_number, src, tok)
+        assert isinstance(stream_object, Stream)
+        assert "Length" in stream_object
+        assert "First" in stream_object
+
+        # Length may be Reference
+        if isinstance(stream_object["Length"], Reference):
+            stream_object[Name("Length")] = self.get_object(
+                stream_object["Length"], src=src, tok=tok
+            )
+
+        # First may be Reference
+        if isinstance(stream_object["First"], Reference):
+            stream_object[Name("First")] = self.get_object(
+                stream_object["First"], src=src, tok=tok
+            )
+
+        first_byte = int(stream_object.get("First", 0))
+        if "DecodedBytes" not in stream_object:
+            try:
+                stream_object = decode_stream(stream_object)
+            except Exception as ex:
+                logger.debug("unable to inflate stream for object %d" % object_number)
+                raise ex
+        decoded_bytes: bytes = stream_object["DecodedBytes"]
+
+        # read the header (pairs of object number and byte offset relative to /First)
+        number_of_objects: int = int(stream_object.get("N", 0))
+        header_tok = HighLevelTokenizer(io.BytesIO(decoded_bytes[:first_byte]))
+        header_tokens = [
+            header_tok.next_non_comment_token() for _ in range(0, number_of_objects * 2)
+        ]
+        object_byte_offsets: typing.List[int] = [
+            first_byte + int(t.get_text())
+            for t in header_tokens[1::2]
+            if t is not None and t.get_token_type() == TokenType.NUMBER
+        ]
+
+        # if the header could not be read, read the objects one after another
+        if len(object_byte_offsets) != number_of_objects or number_of_objects == 0:
+            object_byte_offsets = []
+            objects_tok = HighLevelTokenizer(io.BytesIO(decoded_bytes))
+            objects_tok.seek(first_byte)
+            while True:
+                byte_offset: int = objects_tok.tell()
+                try:
+                    if objects_tok.read_object() is None:
+                        break
+                except Exception:
+                    break
+                object_byte_offsets.append(byte_offset)
+
+        # update cache
+        self._object_stream_cache[object_number] = (object_byte_offsets, decoded_bytes)
+        # (the object stream itself is also evicted from self._cache, so that it can be garbage collected)
+        while len(self._object_stream_cache) > XREF.OBJECT_STREAM_CACHE_SIZE:
+            evicted_object_number, _ = self._object_stream_cache.popitem(last=False)
+            self._cache.pop(evicted_object_number, None)
+
+        # return
+        return object_byte_offsets, decoded_bytes
 
     ##
     ## GETTERS AND SETTERS
@@ -108,6 +199,19 @@ class XREF(Dictionary):
         Add a new Reference to this XREF
         """
         self._entries.append(r)
+
+        # update indices
+        # the first Reference (for a given key) is the one that is returned by get_object
+        if r.object_number is not None:
+            self._entries_by_object_number.setdefault(int(r.object_number), r)
+        if (
+            r.parent_stream_object_number is not None
+            and r.index_in_parent_stream is not None
+        ):
+            self._entries_by_parent_stream.setdefault(
+                (int(r.parent_stream_object_number), int(r.index_in_parent_stream)),
+                r,
+            )
         return self
 
     def merge(self, other_xref: "XREF") -> "XREF":
@@ -115,19 +219,18 @@ class XREF(Dictionary):
         Merge this XREF with another XREF
         """
         for r in other_xref._entries:
-            duplicate_entries = []
+            is_duplicate: bool = False
             if r.object_number is not None:
-                duplicate_entries = [
-                    x for x in self._entries if x.object_number == r.object_number
-                ]
-            elif r.parent_stream_object_number is not None:
-                duplicate_entries = [
-                    x
-                    for x in self._entries
-                    if x.parent_stream_object_number == r.parent_stream_object_number
-                    and x.index_in_parent_stream == r.index_in_parent_stream
-                ]
-            if len(duplicate_entries) == 0:
+                is_duplicate = int(r.object_number) in self._entries_by_object_number
+            elif (
+                r.parent_stream_object_number is not None
+                and r.index_in_parent_stream is not None
+            ):
+                is_duplicate = (
+                    int(r.parent_stream_object_number),
+                    int(r.index_in_parent_stream),
+                ) in self._entries_by_parent_stream
+            if not is_duplicate:
                 self.append(r)
         return self
 
@@ -156,23 +259,33 @@ class XREF(Dictionary):
         if isinstance(indirect_reference, int) or isinstance(
             indirect_reference, Decimal
         ):
-            refs = [
-                x for x in self._entries if x.object_number == int(indirect_reference)
-            ]
-            if len(refs) == 0:
+            ref = self._entries_by_object_number.get(int(indirect_reference), None)
+            if ref is None:
                 return None
-            indirect_reference = refs[0]
+            indirect_reference = ref
 
         # lookup Reference (in self) for Reference
         elif isinstance(indirect_reference, Reference):
-            refs = [
-                x
-                for x in self._entries
-                if x.object_number == indirect_reference.object_number
-            ]
-            if len(refs) == 0:
+            if indirect_reference.object_number is not None:
+                ref = self._entries_by_object_number.get(
+                    int(indirect_reference.object_number), None
+                )
+            elif (
+                indirect_reference.parent_stream_object_number is not None
+                and indirect_reference.index_in_parent_stream is not None
+            ):
+                ref = self._entries_by_parent_stream.get(
+                    (
+                        int(indirect_reference.parent_stream_object_number),
+                        int(indirect_reference.index_in_parent_stream),
+                    ),
+                    None,
+                )
+            else:
+                ref = None
+            if ref is None:
                 return None
-            indirect_reference = refs[0]
+            indirect_reference = ref
 
         # reference points to an object that is not in use
         assert isinstance(indirect_reference, Reference)
@@ -193,44 +306,16 @@ class XREF(Dictionary):
             and indirect_reference.index_in_parent_stream is not None
         ):
 
-            stream_object = self.get_object(
-                indirect_reference.parent_stream_object_number, src, tok
+            object_byte_offsets, decoded_bytes = self._get_object_stream(
+                int(indirect_reference.parent_stream_object_number), src, tok
             )
-            assert isinstance(stream_object, Stream)
-            assert "Length" in stream_object
-            assert "First" in stream_object
-
-            # Length may be Reference
-            if isinstance(stream_object["Length"], Reference):
-                stream_object[Name("Length")] = self.get_object(
-                    stream_object["Length"], src=src, tok=tok
-                )
 
-            # First may be Reference
-            if isinstance(stream_object["First"], Reference):
-                stream_object[Name("First")] = self.get_object(
-                    stream_object["First"], src=src, tok=tok
-                )
-
-            first_byte = int(stream_object.get("First", 0))
-            if "DecodedBytes" not in stream_object:
-                try:
-                    stream_object = decode_stream(stream_object)
-                except Exception as ex:
-                    logger.debug(
-                        "unable to inflate stream for object %d"
-                        % indirect_reference.parent_stream_object_number
-                    )
-                    raise ex
-            stream_bytes = stream_object["DecodedBytes"][first_byte:]
-
-            # tokenize parent stream
+            # seek straight to the object
             index = int(indirect_reference.index_in_parent_stream)
-            length = int(stream_object["Length"])
-            if index < length:
-                tok = HighLevelTokenizer(io.BytesIO(stream_bytes))
-                list_of_objs = [tok.read_object() for x in range(0, index + 1)]
-                obj = list_of_objs[-1]
+            if index < len(object_byte_offsets):
+                tok = HighLevelTokenizer(io.BytesIO(decoded_bytes))
+                tok.seek(object_byte_offsets[index])
+                obj = tok.read_object()
             else:
                 obj = None
 
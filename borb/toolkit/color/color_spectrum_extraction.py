@@ -38,14 +38,16 @@ class ColorSpectrumExtraction(EventListener):
 
     def _event_occurred(self, event: Event) -> None:
         if isinstance(event, BeginPageEvent):
-            self._begin_page(event.get_page())
+            self._begin_page(event.get_page(), event.get_page_number())
         if isinstance(event, ChunkOfTextRenderEvent):
             self._render_text(event)
         if isinstance(event, ImageRenderEvent):
             self._render_image(event)
 
-    def _begin_page(self, page: Page):
-        self._current_page += 1
+    def _begin_page(self, page: Page, page_number: typing.Optional[int] = None):
+        self._current_page = (
+            page_number if page_number is not None else self._current_page + 1
+        )
         self._colors_per_page[self._current_page] = {}
 
     def _render_text(self, event: ChunkOfTextRenderEvent):
@@ -61,7 +61,7 @@ class CodeTagTransformer(BaseTagTransformer):
         # change font and background color
         for c in chunks_of_text._chunks_of_text:
             c._background_color = HexColor("#EEEEEE")
-            c._font = StandardType1Font("Courier")
+            c.set_font(StandardType1Font("Courier"))
 
         # correct spacing
         self._correct_spacing_for_chunks_of_text(chunks_of_text)
@@ -13,6 +13,7 @@ from borb.pdf.canvas.layout.table.flexible_column_width_table import (
     FlexibleColumnWidthTable,
 )
 from borb.pdf.canvas.layout.table.table import Table
+from borb.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
 from borb.toolkit.export.markdown_to_pdf.read.transformer import (
     Transformer,
     TransformerState,
@@ -111,7 +112,10 @@ class TableTransformer(Transformer):
 
         # set header row
         for td_table_cell in ul._get_cells_at_row(0):
-            td_table_cell._layout_element._font = StandardType1Font("Helvetica-Bold")  # type: ignore [attr-defined]
+            if isinstance(td_table_cell._layout_element, ChunkOfText):
+                td_table_cell._layout_element.set_font(
+                    StandardType1Font("Helvetica-Bold")
+                )
 
         # set padding and zebra striping
         ul.set_padding_on_all_cells(Decimal(5), Decimal(5), Decimal(5), Decimal(5))
@@ -61,7 +61,7 @@ class IndentedCodeSnippetTransformer(Transformer):
 
         for c in el._chunks_of_text:
             c._background_color = HexColor("f5f7f9")
-            c._font = StandardType1Font("Courier")
+            c.set_font(StandardType1Font("Courier"))
 
         # add
         context.get_parent_layout_element().add(el)  # type: ignore [union-attr]
@@ -52,7 +52,12 @@ class PDFToSVG(EventListener):
     def _event_occurred(self, event: Event) -> None:
         # BeginPageEvent
         if isinstance(event, BeginPageEvent):
-            self._page_nr += Decimal(1)
+            page_number: typing.Optional[int] = event.get_page_number()
+            self._page_nr = (
+                Decimal(page_number)
+                if page_number is not None
+                else self._page_nr + Decimal(1)
+            )
             self._page = event.get_page()
             self._begin_page(
                 self._page_nr,
@@ -4,7 +4,7 @@
 """
 This implementation of EventListener extracts all Image objects on a Page
 """
-from typing import List
+from typing import List, Optional
 
 from PIL import Image  # type: ignore [import]
 
@@ -28,7 +28,7 @@ class SimpleImageExtraction(EventListener):
 
     def _event_occurred(self, event: "Event") -> None:
         if isinstance(event, BeginPageEvent):
-            self._begin_page(event.get_page())
+            self._begin_page(event.get_page(), event.get_page_number())
         if isinstance(event, ImageRenderEvent):
             self._render_image(event)
 
@@ -42,6 +42,16 @@ class SimpleImageExtraction(EventListener):
             else []
         )
 
+    def merge(self, other: "EventListener") -> bool:
+        """
+        This method merges the (per page) results of another SimpleImageExtraction into this SimpleImageExtraction
+        """
+        if not isinstance(other, SimpleImageExtraction):
+            return False
+        self._image_render_info_per_page.update(other._image_render_info_per_page)
+        self._current_page = max(self._current_page, other._current_page)
+        return True
+
     def _render_image(self, image_render_event: "ImageRenderEvent"):
 
         # init if needed
@@ -53,5 +63,7 @@ class SimpleImageExtraction(EventListener):
             image_render_event.get_image()
         )
 
-    def _begin_page(self, page: Page):
-        self._current_page += 1
+    def _begin_page(self, page: Page, page_number: Optional[int] = None):
+        self._current_page = (
+            page_number if page_number is not None else self._current_page + 1
+        )
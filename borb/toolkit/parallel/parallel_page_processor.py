@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This class processes the Page(s) of a PDF Document in parallel (across a pool of processes),
+merging the results of the EventListener(s) back together (in page order)
+"""
+import copy
+import math
+import os
+import pathlib
+import typing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from borb.pdf.canvas.event.event_listener import EventListener
+from borb.pdf.pdf import PDF
+
+
+def _process_pages(
+    path: typing.Union[str, pathlib.Path],
+    pages: typing.List[int],
+    event_listeners: typing.List[EventListener],
+    password: typing.Optional[str],
+    float_mode: bool = False,
+) -> typing.List[EventListener]:
+    """
+    This function (which runs in a worker process) memory-maps the PDF at the given path,
+    reads (only) the given pages, and returns the EventListener(s) that processed them
+    """
+    PDF.loads_mmap(
+        path,
+        event_listeners,
+        password=password,
+        lazy=True,
+        pages=pages,
+        float_mode=float_mode,
+    )
+    return event_listeners
+
+
+class ParallelPageProcessor:
+    """
+    This class processes the Page(s) of a PDF Document in parallel (across a pool of processes),
+    merging the results of the EventListener(s) back together (in page order).
+    Every worker process memory-maps the same file, and only reads the Page(s) it needs to process.
+    The EventListener(s) need to be picklable, and need to implement merge (see EventListener.merge),
+    e.g. SimpleTextExtraction, RegularExpressionTextExtraction and SimpleImageExtraction.
+    """
+
+    @staticmethod
+    def process(
+        path: typing.Union[str, pathlib.Path],
+        event_listeners: typing.List[EventListener],
+        pages: typing.Optional[typing.Iterable[int]] = None,
+        password: typing.Optional[str] = None,
+        max_workers: typing.Optional[int] = None,
+        float_mode: bool = False,
+    ) -> typing.List[EventListener]:
+        """
+        This function processes the Page(s) of the PDF at the given path (all Page(s), or only the given pages),
+        sending the events of every Page to (a copy of) the given EventListener(s) in a worker process.
+        The results are then merged back into the given EventListener(s), which are returned.
+        As with PDF.loads, the results of each Page are stored under its (actual) page number in the EventListener(s).
+        When float_mode is True, the content of each Page is processed using floats (see PDF.loads).
+        """
+        # determine which pages need to be processed
+        if pages is None:
+            number_of_pages: int = int(
+                PDF.loads_mmap(path, password=password, lazy=True)
+                .get_document_info()
+                .get_number_of_pages()
+                or 0
+            )
+            pages = range(0, number_of_pages)
+        pages = [x for x in pages]
+        if len(pages) == 0:
+            return event_listeners
+
+        # split pages into (contiguous) chunks, one per worker
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(pages)))
+        chunk_size: int = math.ceil(len(pages) / max_workers)
+
+        # process each chunk
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures: typing.List[Future] = [
+                executor.submit(
+                    _process_pages,
+                    path,
+                    pages[i : i + chunk_size],
+                    [copy.deepcopy(l) for l in event_listeners],
+                    password,
+                    float_mode,
+                )
+                for i in range(0, len(pages), chunk_size)
+            ]
+
+            # merge (in page order)
+            for f in futures:
+                for l, partial_result in zip(event_listeners, f.result()):
+                    assert l.merge(
+                        partial_result
+                    ), "ParallelPageProcessor requires EventListener(s) that implement merge"
+
+        # return
+        return event_listeners
@@ -70,7 +70,12 @@ class TableDetectionByLines(EventListener):
 
         # BeginPageEvent
         if isinstance(event, BeginPageEvent):
-            self._current_page_number += 1
+            page_number: typing.Optional[int] = event.get_page_number()
+            self._current_page_number = (
+                page_number
+                if page_number is not None
+                else self._current_page_number + 1
+            )
             self._lines_per_page[self._current_page_number] = []
             self._tables_per_page[self._current_page_number] = []
             self._text_render_events_per_page[self._current_page_number] = []
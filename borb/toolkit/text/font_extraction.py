@@ -30,7 +30,10 @@ class FontExtraction(EventListener):
     def _begin_page(self, event: BeginPageEvent):
 
         # update page number
-        self._current_page += 1
+        page_number: typing.Optional[int] = event.get_page_number()
+        self._current_page = (
+            page_number if page_number is not None else self._current_page + 1
+        )
         self._fonts_per_page[self._current_page] = []
 
         # get page
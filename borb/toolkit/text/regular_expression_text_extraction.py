@@ -83,6 +83,24 @@ class PDFMatch:
             out.append(Rectangle(min_x, min_y, max_x - min_x, max_y - min_y))
         return out
 
+    def __getstate__(self):
+        # re.Match objects can not be pickled,
+        # store the regular expression, the string and the start of the match instead
+        state = self.__dict__.copy()
+        state["_re_match"] = (
+            self._re_match.re,
+            self._re_match.string,
+            self._re_match.start(),
+            self._re_match.endpos,
+        )
+        return state
+
+    def __setstate__(self, state):
+        # re-match the regular expression at the (known) start of the match
+        pattern, string, start, endpos = state["_re_match"]
+        state["_re_match"] = pattern.match(string, start, endpos)
+        self.__dict__.update(state)
+
     def expand(self, template: typing.AnyStr) -> typing.AnyStr:
         """
         Returns one or more subgroups of the match. If there is a single argument, the result is a single string;
@@ -174,10 +192,26 @@ class RegularExpressionTextExtraction(EventListener):
         if isinstance(event, ChunkOfTextRenderEvent):
             self._render_text(event)
         if isinstance(event, BeginPageEvent):
-            self._begin_page(event.get_page())
+            self._begin_page(event.get_page(), event.get_page_number())
         if isinstance(event, EndPageEvent):
             self._end_page(event.get_page())
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_text_render_info_events_per_page"] = {}
+        return state
+
+    def merge(self, other: "EventListener") -> bool:
+        """
+        This method merges the (per page) results of another RegularExpressionTextExtraction into this RegularExpressionTextExtraction
+        """
+        if not isinstance(other, RegularExpressionTextExtraction):
+            return False
+        self._matches_per_page.update(other._matches_per_page)
+        self._text_per_page.update(other._text_per_page)
+        self._current_page = max(self._current_page, other._current_page)
+        return True
+
     def _render_text(self, text_render_info: ChunkOfTextRenderEvent):
 
         # init if needed
@@ -188,8 +222,10 @@ class RegularExpressionTextExtraction(EventListener):
         for e in text_render_info.split_on_glyphs():
             self._text_render_info_events_per_page[self._current_page].append(e)
 
-    def _begin_page(self, page: Page):
-        self._current_page += 1
+    def _begin_page(self, page: Page, page_number: typing.Optional[int] = None):
+        self._current_page = (
+            page_number if page_number is not None else self._current_page + 1
+        )
 
     def _end_page(self, page: Page):
 
@@ -250,7 +286,7 @@ class RegularExpressionTextExtraction(EventListener):
             # add space if needed
             delta = abs(last_baseline_right - chunk_of_text_bounding_box.get_x())
             space_width = round(t.get_space_character_width_estimate_in_user_space(), 1)
-            text += " " if (space_width * Decimal(0.90) < delta) else ""
+            text += " " if (Decimal(space_width) * Decimal(0.90) < delta) else ""
 
             # normal append
             text += t.get_text()
@@ -38,7 +38,12 @@ class SimpleLineOfTextExtraction(EventListener):
             self._chunks_of_text.append(event)
         if isinstance(event, BeginPageEvent):
             self._current_page = event.get_page()
-            self._current_page_number += 1
+            page_number: typing.Optional[int] = event.get_page_number()
+            self._current_page_number = (
+                page_number
+                if page_number is not None
+                else self._current_page_number + 1
+            )
             self._chunks_of_text = []
         if isinstance(event, EndPageEvent):
             self._end_page(event.get_page())
@@ -34,10 +34,25 @@ class SimpleTextExtraction(EventListener):
         if isinstance(event, ChunkOfTextRenderEvent):
             self._render_text(event)
         if isinstance(event, BeginPageEvent):
-            self._begin_page(event.get_page())
+            self._begin_page(event.get_page(), event.get_page_number())
         if isinstance(event, EndPageEvent):
             self._end_page(event.get_page())
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_text_render_info_per_page"] = {}
+        return state
+
+    def merge(self, other: "EventListener") -> bool:
+        """
+        This method merges the (per page) results of another SimpleTextExtraction into this SimpleTextExtraction
+        """
+        if not isinstance(other, SimpleTextExtraction):
+            return False
+        self._text_per_page.update(other._text_per_page)
+        self._current_page = max(self._current_page, other._current_page)
+        return True
+
     def get_text_for_page(self, page_nr: int) -> str:
         """
         This function returns all text on a given page
@@ -53,8 +68,10 @@ class SimpleTextExtraction(EventListener):
         # append TextRenderInfo
         self._text_render_info_per_page[self._current_page].append(text_render_info)
 
-    def _begin_page(self, page: Page):
-        self._current_page += 1
+    def _begin_page(self, page: Page, page_number: typing.Optional[int] = None):
+        self._current_page = (
+            page_number if page_number is not None else self._current_page + 1
+        )
 
     def _end_page(self, page: Page):
 
@@ -101,7 +118,7 @@ class SimpleTextExtraction(EventListener):
             # add space if needed
             delta = abs(last_baseline_right - t.get_baseline().x)
             space_width = round(t.get_space_character_width_estimate_in_user_space(), 1)
-            text += " " if (space_width * Decimal(0.90) < delta) else ""
+            text += " " if (Decimal(space_width) * Decimal(0.90) < delta) else ""
 
             # normal append
             text += t._text
@@ -0,0 +1,90 @@
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from borb.pdf.canvas.geometry.matrix import Matrix
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.document.document import Document
+from borb.pdf.pdf import PDF
+from borb.toolkit.image.simple_image_extraction import SimpleImageExtraction
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestFloatMode(unittest.TestCase):
+    """
+    This test checks whether processing the content of a Page in float mode
+    yields the same results as processing it using Decimal objects.
+    The timings are in benchmarks/float_mode_benchmark.py
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        # find (text-heavy) input
+        p: Path = Path(__file__).parent
+        while "tests" != p.name:
+            p = p.parent
+        self.input_file: Path = p / "pdf" / "trailer" / "input_001.pdf"
+        self.input_file_with_images: Path = p / "toolkit" / "image" / "input_001.pdf"
+
+    @staticmethod
+    def _process(doc: Document, float_mode: bool) -> SimpleTextExtraction:
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        for i in range(0, int(doc.get_document_info().get_number_of_pages())):
+            doc.get_page(i).process([l], float_mode=float_mode, page_number=i)
+        return l
+
+    def test_matrix_multiplication_in_float_mode(self):
+        m0 = Matrix.matrix_from_six_values(1.0, 0.0, 0.0, 1.0, 121.0, 613.0)
+        m1 = Matrix.identity_matrix(float_mode=True)
+        m1[2][0] = -7.0
+        m1[2][1] = -10.0
+        m2 = m0.mul(m1)
+        assert all([isinstance(x, float) for row in m2.mtx for x in row])
+        assert m2[2][0] == 114.0
+        assert m2[2][1] == 603.0
+        assert m2.cross(1.0, 1.0, 1) == (115.0, 604.0, 1.0)
+
+        # Decimal matrices are unaffected
+        m3 = Matrix.identity_matrix().mul(Matrix.identity_matrix())
+        assert all([isinstance(x, Decimal) for row in m3.mtx for x in row])
+
+        # Rectangle works on floats as well
+        r = Rectangle(1.0, 2.0, 10.0, 20.0).grow(1.5)
+        assert (r.get_x(), r.get_y(), r.get_width(), r.get_height()) == (
+            -0.5,
+            0.5,
+            13.0,
+            23.0,
+        )
+
+    def test_extract_text_in_float_mode_expect_same_text(self):
+        with open(self.input_file, "rb") as pdf_file_handle:
+            doc = PDF.loads(pdf_file_handle)
+
+        # process in Decimal mode and float mode
+        l0: SimpleTextExtraction = TestFloatMode._process(doc, float_mode=False)
+        l1: SimpleTextExtraction = TestFloatMode._process(doc, float_mode=True)
+
+        # check text
+        assert len(l0._text_per_page) > 0
+        for page_nr, text in l0._text_per_page.items():
+            assert l1.get_text_for_page(page_nr) == text
+
+    def test_extract_text_and_images_in_float_mode_using_pdf_loads(self):
+        l0: SimpleTextExtraction = SimpleTextExtraction()
+        l1: SimpleImageExtraction = SimpleImageExtraction()
+        with open(self.input_file_with_images, "rb") as pdf_file_handle:
+            PDF.loads(pdf_file_handle, [l0, l1])
+        l2: SimpleTextExtraction = SimpleTextExtraction()
+        l3: SimpleImageExtraction = SimpleImageExtraction()
+        with open(self.input_file_with_images, "rb") as pdf_file_handle:
+            PDF.loads(pdf_file_handle, [l2, l3], float_mode=True)
+
+        # check text
+        assert l0.get_text_for_page(0) == l2.get_text_for_page(0)
+
+        # check images
+        assert len(l1.get_images_for_page(0)) == 3
+        assert [x.size for x in l1.get_images_for_page(0)] == [
+            x.size for x in l3.get_images_for_page(0)
+        ]
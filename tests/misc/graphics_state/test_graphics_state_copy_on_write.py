@@ -0,0 +1,65 @@
+import copy
+import io
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Dictionary, Name
+from borb.pdf.canvas.canvas import Canvas
+from borb.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from borb.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
+from borb.pdf.canvas.color.color import RGBColor
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.page.page import Page
+
+
+class TestGraphicsStateCopyOnWrite(unittest.TestCase):
+    """
+    This test checks whether the (copy-on-write) copy of CanvasGraphicsState (used by the q operator)
+    shares its values, while still isolating the text matrix (which is modified in-place).
+    """
+
+    def test_copy_shares_font_and_color_space(self):
+        gs0: CanvasGraphicsState = CanvasGraphicsState()
+        gs0.font = StandardType1Font("Helvetica")
+        gs0.non_stroke_color_space = Name("DeviceRGB")
+        gs0.non_stroke_color = RGBColor(Decimal(1), Decimal(0), Decimal(0))
+        gs1: CanvasGraphicsState = copy.copy(gs0)
+        assert gs1.font is gs0.font
+        assert gs1.non_stroke_color_space is gs0.non_stroke_color_space
+        assert gs1.non_stroke_color is gs0.non_stroke_color
+        assert gs1.ctm is gs0.ctm
+
+    def test_copy_isolates_text_matrix(self):
+        gs0: CanvasGraphicsState = CanvasGraphicsState()
+        gs1: CanvasGraphicsState = copy.copy(gs0)
+        gs0.get_writable_text_matrix()[2][0] += Decimal(10)
+        gs0.get_writable_text_matrix()[2][0] += Decimal(10)
+        assert gs0.text_matrix[2][0] == Decimal(20)
+        assert gs1.text_matrix[2][0] == Decimal(0)
+        gs1.get_writable_text_matrix()[2][0] -= Decimal(5)
+        assert gs0.text_matrix[2][0] == Decimal(20)
+        assert gs1.text_matrix[2][0] == Decimal(-5)
+
+    def test_push_and_pop_graphics_state(self):
+        page: Page = Page()
+        page[Name("Resources")] = Dictionary()
+        canvas: Canvas = Canvas()
+        CanvasStreamProcessor(page, canvas, []).read(
+            io.BytesIO(b"q 1 0 0 1 10 20 cm q 2 0 0 2 0 0 cm Q 1 0 0 RG Q")
+        )
+        assert canvas.graphics_state.ctm[2][0] == Decimal(0)
+        assert canvas.graphics_state.ctm[2][1] == Decimal(0)
+        assert canvas.graphics_state.stroke_color.red == Decimal(0)
+        assert len(canvas.graphics_state_stack) == 0
+
+    def test_push_and_pop_graphics_state_many_times(self):
+        page: Page = Page()
+        page[Name("Resources")] = Dictionary()
+        canvas: Canvas = Canvas()
+        font: StandardType1Font = StandardType1Font("Helvetica")
+        canvas.graphics_state.font = font
+        content: bytes = b"q 1 0 0 1 10 20 cm 0.5 g Q\n" * 1000
+        CanvasStreamProcessor(page, canvas, []).read(io.BytesIO(content))
+        assert canvas.graphics_state.ctm[2][0] == Decimal(0)
+        assert canvas.graphics_state.font is font
+        assert len(canvas.graphics_state_stack) == 0
@@ -0,0 +1,224 @@
+import io
+import typing
+import unittest
+from pathlib import Path
+
+from borb.io.read.tokenize.low_level_tokenizer import (
+    LowLevelTokenizer,
+    Token,
+    TokenType,
+)
+from borb.pdf.pdf import PDF
+
+
+class CharByCharLowLevelTokenizer(LowLevelTokenizer):
+    """
+    This is the (previous) implementation of LowLevelTokenizer,
+    it reads its io_source one character at a time.
+    """
+
+    def __init__(self, io_source):
+        super().__init__(io_source)
+        self._is_delimiter = set("\x00\t\n\x0c\r %()/<>[]").__contains__
+        self._is_whitespace = set("\x00\t\n\x0c\r ").__contains__
+
+    def next_token(self) -> typing.Optional[Token]:
+        ch = self._next_char()
+        if len(ch) == 0:
+            return None
+        while len(ch) > 0 and self._is_whitespace(ch):
+            ch = self._next_char()
+        if ch == "[":
+            return Token(self._io_source.tell() - 1, TokenType.START_ARRAY, "[")
+        if ch == "]":
+            return Token(self._io_source.tell() - 1, TokenType.END_ARRAY, "]")
+        if ch == "/":
+            out_str = "/"
+            out_pos = self._io_source.tell() - 1
+            while True:
+                ch = self._next_char()
+                if len(ch) == 0:
+                    break
+                if self._is_delimiter(ch):
+                    break
+                out_str += ch
+            if len(ch) != 0:
+                self._prev_char()
+            return Token(out_pos, TokenType.NAME, out_str)
+        if ch == ">":
+            out_pos = self._io_source.tell() - 1
+            ch = self._next_char()
+            assert ch == ">"
+            return Token(out_pos, TokenType.END_DICT, ">>")
+        if ch == "%":
+            out_str = ""
+            out_pos = self._io_source.tell() - 1
+            while len(ch) != 0 and ch != "\r" and ch != "\n":
+                out_str += ch
+                ch = self._next_char()
+            if len(ch) != 0:
+                self._prev_char()
+            return Token(out_pos, TokenType.COMMENT, out_str)
+        if ch == "<":
+            out_pos = self._io_source.tell() - 1
+            ch = self._next_char()
+            if ch == "<":
+                return Token(out_pos, TokenType.START_DICT, "<<")
+            if ch == ">":
+                return Token(out_pos, TokenType.HEX_STRING, "<>")
+            out_str = "<" + ch
+            while True:
+                ch = self._next_char()
+                if len(ch) == 0:
+                    break
+                out_str += ch
+                if ch == ">":
+                    break
+            return Token(out_pos, TokenType.HEX_STRING, out_str)
+        if ch in "-+.0123456789":
+            out_str = ""
+            out_pos = self._io_source.tell() - 1
+            while len(ch) != 0 and ch in "-+.0123456789":
+                out_str += ch
+                ch = self._next_char()
+            if len(ch) != 0:
+                self._prev_char()
+            return Token(out_pos, TokenType.NUMBER, out_str)
+        if ch == "(":
+            bracket_nesting_level = 1
+            out_str = "("
+            out_pos = self._io_source.tell() - 1
+            while True:
+                ch = self._next_char()
+                if len(ch) == 0:
+                    break
+                if ch == "\\":
+                    ch = self._next_char()
+                    out_str += "\\" + ch
+                    continue
+                if ch == "(":
+                    bracket_nesting_level += 1
+                if ch == ")":
+                    bracket_nesting_level -= 1
+                out_str += ch
+                if bracket_nesting_level == 0:
+                    break
+            assert len(ch) != 0
+            return Token(out_pos, TokenType.STRING, out_str)
+        out_str = ""
+        out_pos = self._io_source.tell() - 1
+        while len(ch) != 0 and not self._is_delimiter(ch):
+            out_str += ch
+            ch = self._next_char()
+        if len(ch) != 0:
+            self._prev_char()
+        return Token(out_pos, TokenType.OTHER, out_str)
+
+
+class TestBufferedTokenizer(unittest.TestCase):
+    """
+    This test checks whether LowLevelTokenizer (which reads its io_source in blocks)
+    yields the same tokens as the (previous) implementation that reads one character at a time.
+    The timings are in benchmarks/tokenizer_benchmark.py
+    """
+
+    CONTENT_STREAMS: typing.Optional[typing.List[bytes]] = None
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        # find output dir
+        p: Path = Path(__file__).parent
+        while "output" not in [x.stem for x in p.iterdir() if x.is_dir()]:
+            p = p.parent
+        p = p / "output"
+        self.output_dir = Path(p, Path(__file__).stem.replace(".py", ""))
+        if not self.output_dir.exists():
+            self.output_dir.mkdir()
+
+        # find corpus (all input documents of the test suite)
+        p = Path(__file__).parent
+        while "tests" != p.name:
+            p = p.parent
+        self.corpus: typing.List[Path] = sorted(
+            [x for x in p.glob("**/input_*.pdf") if "output" not in x.parts]
+        )
+
+    def _get_content_streams(self) -> typing.List[bytes]:
+        if TestBufferedTokenizer.CONTENT_STREAMS is not None:
+            return TestBufferedTokenizer.CONTENT_STREAMS
+        content_streams: typing.List[bytes] = []
+        for pdf_path in self.corpus:
+            with open(pdf_path, "rb") as pdf_file_handle:
+                doc = PDF.loads(pdf_file_handle)
+            for i in range(0, int(doc.get_document_info().get_number_of_pages())):
+                content_streams.append(doc.get_page(i)["Contents"]["DecodedBytes"])
+        TestBufferedTokenizer.CONTENT_STREAMS = content_streams
+        return content_streams
+
+    @staticmethod
+    def _tokenize(tokenizer: LowLevelTokenizer) -> typing.List[Token]:
+        out: typing.List[Token] = []
+        while True:
+            t: typing.Optional[Token] = tokenizer.next_token()
+            if t is None:
+                break
+            out.append(t)
+            if len(t.get_text()) == 0:
+                break
+        return out
+
+    @staticmethod
+    def _assert_tokens_equal(ts0: typing.List[Token], ts1: typing.List[Token]):
+        assert len(ts0) == len(ts1)
+        for t0, t1 in zip(ts0, ts1):
+            assert t0.get_byte_offset() == t1.get_byte_offset()
+            assert t0.get_token_type() == t1.get_token_type()
+            assert t0.get_text() == t1.get_text()
+
+    def test_tokenize_content_streams_expect_same_tokens(self):
+        for content_stream in self._get_content_streams():
+            self._assert_tokens_equal(
+                self._tokenize(CharByCharLowLevelTokenizer(io.BytesIO(content_stream))),
+                self._tokenize(LowLevelTokenizer(io.BytesIO(content_stream))),
+            )
+
+    def test_tokenize_file_using_small_read_ahead_buffer_expect_same_tokens(self):
+        content_stream: bytes = b"".join(self._get_content_streams())
+        with open(self.output_dir / "content_stream.bin", "wb") as file_handle:
+            file_handle.write(content_stream)
+
+        prev_read_ahead_size: int = LowLevelTokenizer.READ_AHEAD_SIZE
+        LowLevelTokenizer.READ_AHEAD_SIZE = 7
+        try:
+            with open(self.output_dir / "content_stream.bin", "rb") as file_handle:
+                ts1 = self._tokenize(LowLevelTokenizer(file_handle))
+        finally:
+            LowLevelTokenizer.READ_AHEAD_SIZE = prev_read_ahead_size
+        self._assert_tokens_equal(
+            self._tokenize(CharByCharLowLevelTokenizer(io.BytesIO(content_stream))),
+            ts1,
+        )
+
+    def test_tokenize_edge_cases_expect_same_tokens(self):
+        for s in [
+            b"",
+            b"   ",
+            b"/Name",
+            b"/Name/Other [1 2.5 -3]",
+            b"<< /Type /Page >>",
+            b"<> <4142> <41",
+            b"(a (nested) string) (escaped \\) paren) (",
+            b"%comment\r\n1 0 obj\nendobj % trailing",
+            b"BT /F1 12 Tf (Hello) Tj ET",
+            b"endcmap end end\n",
+            b") )",
+        ]:
+            try:
+                ts0 = self._tokenize(CharByCharLowLevelTokenizer(io.BytesIO(s)))
+            except AssertionError:
+                with self.assertRaises(AssertionError):
+                    self._tokenize(LowLevelTokenizer(io.BytesIO(s)))
+                continue
+            self._assert_tokens_equal(
+                ts0, self._tokenize(LowLevelTokenizer(io.BytesIO(s)))
+            )
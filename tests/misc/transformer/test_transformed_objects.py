@@ -0,0 +1,50 @@
+import io
+import unittest
+
+from borb.io.read.any_object_transformer import AnyObjectTransformer
+from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from borb.io.read.transformer import ReadTransformerState
+from borb.io.read.types import Decimal, Dictionary, Function, Name
+
+
+class TestTransformedObjects(unittest.TestCase):
+    """
+    This test checks whether the ReadTransformerState keeps track of the objects that have been transformed,
+    without returning (or keeping) objects that were transformed into another object.
+    """
+
+    @staticmethod
+    def _build_state() -> ReadTransformerState:
+        src: io.BytesIO = io.BytesIO(b"")
+        return ReadTransformerState(source=src, tokenizer=HighLevelTokenizer(src))
+
+    def test_object_transformed_in_place_is_not_transformed_again(self):
+        t: AnyObjectTransformer = AnyObjectTransformer()
+        context: ReadTransformerState = TestTransformedObjects._build_state()
+        d: Dictionary = Dictionary()
+        d[Name("A")] = Decimal(1)
+        assert t.transform(d, None, context) is d
+        assert id(d) in context.transformed_objects_by_id
+        assert t.transform(d, None, context) is d
+
+    def test_object_transformed_into_another_object_is_transformed_again(self):
+        t: AnyObjectTransformer = AnyObjectTransformer()
+        context: ReadTransformerState = TestTransformedObjects._build_state()
+        d: Dictionary = Dictionary()
+        d[Name("FunctionType")] = Decimal(2)
+        d[Name("N")] = Decimal(1)
+        f0 = t.transform(d, Dictionary(), context)
+        assert isinstance(f0, Function)
+        assert id(d) not in context.transformed_objects_by_id
+
+        # the (raw) Dictionary is never returned as-is
+        f1 = t.transform(d, Dictionary(), context)
+        assert isinstance(f1, Function)
+
+    def test_object_that_contains_itself(self):
+        t: AnyObjectTransformer = AnyObjectTransformer()
+        context: ReadTransformerState = TestTransformedObjects._build_state()
+        d: Dictionary = Dictionary()
+        d[Name("Self")] = d
+        assert t.transform(d, None, context) is d
+        assert d["Self"] is d
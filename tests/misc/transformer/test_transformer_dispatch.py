@@ -0,0 +1,102 @@
+import io
+import typing
+import unittest
+import xml.etree.ElementTree as ET
+
+from PIL import Image  # type: ignore [import]
+
+from borb.io.read.any_object_transformer import (
+    AnyObjectTransformer as ReadAnyObjectTransformer,
+)
+from borb.io.read.types import (
+    Boolean,
+    Decimal,
+    Dictionary,
+    HexadecimalString,
+    List,
+    Name,
+    Reference,
+    Stream,
+    String,
+)
+from borb.io.write.any_object_transformer import (
+    AnyObjectTransformer as WriteAnyObjectTransformer,
+)
+from borb.pdf.document.document import Document
+
+
+class TestTransformerDispatch(unittest.TestCase):
+    """
+    This test checks whether the (type-based) selection of child transformers
+    selects the same child transformer as calling can_be_transformed on every child transformer.
+    """
+
+    @staticmethod
+    def _build_dictionary(
+        entries: typing.Dict[str, typing.Any], d: typing.Optional[Dictionary] = None
+    ) -> Dictionary:
+        d = d if d is not None else Dictionary()
+        for k, v in entries.items():
+            d[Name(k)] = v
+        return d
+
+    def _get_objects(self) -> typing.List[typing.Any]:
+        return [
+            io.BytesIO(b"%PDF-1.7"),
+            Decimal(1),
+            Name("Foo"),
+            String("Lorem Ipsum"),
+            HexadecimalString("00FF"),
+            Reference(object_number=1),
+            Boolean(True),
+            List(),
+            Dictionary(),
+            Document(),
+            self._build_dictionary({"Type": Name("Catalog")}),
+            self._build_dictionary({"Type": Name("Pages")}),
+            self._build_dictionary({"Type": Name("Page")}),
+            self._build_dictionary({"Type": Name("Font")}),
+            self._build_dictionary({"FunctionType": Decimal(2)}),
+            Stream(),
+            self._build_dictionary(
+                {"Subtype": Name("Image"), "Filter": Name("DCTDecode")}, Stream()
+            ),
+            self._build_dictionary(
+                {"Type": Name("Metadata"), "Subtype": Name("XML")}, Stream()
+            ),
+            Image.new("RGB", (10, 10)),
+            ET.Element("xmp"),
+            None,
+        ]
+
+    def test_read_transformer_dispatch(self):
+        t = ReadAnyObjectTransformer()
+        for o in self._get_objects():
+            c0 = next((c for c in t.get_children() if c.can_be_transformed(o)), None)
+            c1 = next(
+                (
+                    c
+                    for c in t._get_children_for_type(type(o))
+                    if c.can_be_transformed(o)
+                ),
+                None,
+            )
+            assert c0 is c1, "%s is not dispatched to %s" % (type(o), type(c0))
+
+    def test_write_transformer_dispatch(self):
+        t = WriteAnyObjectTransformer()
+        for o in self._get_objects():
+            c0 = next((c for c in t._handlers if c.can_be_transformed(o)), None)
+            c1 = next(
+                (
+                    c
+                    for c in t._get_handlers_for_type(type(o))
+                    if c.can_be_transformed(o)
+                ),
+                None,
+            )
+            assert c0 is c1, "%s is not dispatched to %s" % (type(o), type(c0))
+
+
+if __name__ == "__main__":
+    unittest.main()
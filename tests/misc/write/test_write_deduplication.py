@@ -0,0 +1,116 @@
+import io
+import re
+import typing
+import unittest
+import weakref
+from pathlib import Path
+
+from borb.io.read.types import Decimal, Dictionary, List, Name, String
+from borb.io.write.transformer import Transformer, WriteTransformerState
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+
+class TestWriteDeduplication(unittest.TestCase):
+    """
+    This test checks whether identical objects are only written once,
+    including when many (different) objects have the same keys.
+    """
+
+    @staticmethod
+    def _count_objects(bts: bytes) -> int:
+        return len(re.findall(rb"\d+ 0 obj", bts))
+
+    def test_write_document_with_2000_objects_with_the_same_keys(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        values: List = List()
+        for i in range(0, 2000):
+            d: Dictionary = Dictionary()
+            d[Name("Value")] = Decimal(i % 1000)
+            values.append(d)
+        page[Name("Values")] = values
+
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # every value occurs twice, but is only written once
+        assert b"/Size %d" % (1000 + 6) in out.getvalue()
+        assert b"[6 0 R 7 0 R" in out.getvalue()
+        assert b"1004 0 R 1005 0 R 6 0 R 7 0 R" in out.getvalue()
+
+    def test_concat_document_with_itself(self):
+        input_file: Path = (
+            Path(__file__).parent.parent.parent
+            / "pdf"
+            / "document"
+            / "concat"
+            / "input_001.pdf"
+        )
+
+        # write document once
+        with open(input_file, "rb") as in_file_handle:
+            doc: Document = PDF.loads(in_file_handle)
+        out_001: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_001, doc)
+
+        # write document (read 3 times) to a new Document
+        doc = Document()
+        for _ in range(0, 3):
+            with open(input_file, "rb") as in_file_handle:
+                doc.append_document(PDF.loads(in_file_handle))
+        out_003: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_003, doc)
+
+        # fonts, images, color spaces, etc are shared among the copies
+        n_001: int = TestWriteDeduplication._count_objects(out_001.getvalue())
+        n_003: int = TestWriteDeduplication._count_objects(out_003.getvalue())
+        assert n_003 < n_001 + 6
+        assert len(out_003.getvalue()) < len(out_001.getvalue()) * 1.1
+
+        # read back
+        out_003.seek(0)
+        doc = PDF.loads(out_003)
+        assert int(doc.get_document_info().get_number_of_pages()) == 3
+
+    def test_identical_annotations_are_not_shared(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        annots: List = List()
+        for _ in range(0, 2):
+            d: Dictionary = Dictionary()
+            d[Name("Type")] = Name("Annot")
+            d[Name("Subtype")] = Name("Widget")
+            d[Name("FT")] = Name("Tx")
+            d[Name("T")] = String("field")
+            annots.append(d)
+        page[Name("Annots")] = annots
+
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # every annotation is written (and referred to by /Annots)
+        assert len(re.findall(rb"/Subtype /Widget", out.getvalue())) == 2
+        m: typing.Optional[re.Match] = re.search(
+            rb"obj\n\[(\d+) 0 R (\d+) 0 R\]", out.getvalue()
+        )
+        assert m is not None
+        assert m.group(1) != m.group(2)
+
+    def test_memoized_digest_of_another_object_is_not_used(self):
+        d: Dictionary = Dictionary()
+        d[Name("Value")] = Decimal(1)
+        other: Dictionary = Dictionary()
+        other[Name("Value")] = Decimal(2)
+
+        # memoized digests are keyed by id, an entry that refers to another object (with the same id) is ignored
+        context: WriteTransformerState = WriteTransformerState()
+        digest: typing.Optional[bytes] = Transformer()._get_structural_digest(
+            d, context
+        )
+        assert digest is not None
+        context.structural_digests_by_id[id(d)] = (weakref.ref(other), b"")
+        assert Transformer()._get_structural_digest(d, context) == digest
@@ -0,0 +1,217 @@
+import io
+import re
+import unittest
+import zlib
+from decimal import Decimal
+
+from borb.io.read.types import Decimal as bDecimal
+from borb.io.read.types import Dictionary, List, Name, Stream
+from borb.pdf.canvas.color.color import HexColor
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.annotation.circle_annotation import CircleAnnotation
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+
+class TestWriteIncrementalUpdate(unittest.TestCase):
+    """
+    This test checks whether a Document can be written as an incremental update,
+    appending only the objects that were added (or modified) to the original bytes.
+    """
+
+    @staticmethod
+    def _build_document(number_of_pages: int) -> bytes:
+        doc: Document = Document()
+        for i in range(0, number_of_pages):
+            page: Page = Page()
+            doc.append_page(page)
+            content_stream: Stream = Stream()
+            content_stream[Name("DecodedBytes")] = b"q %d 0 0 %d 0 0 cm Q" % (i, i)
+            content_stream[Name("Bytes")] = zlib.compress(
+                content_stream["DecodedBytes"], 9
+            )
+            content_stream[Name("Filter")] = Name("FlateDecode")
+            content_stream[Name("Length")] = bDecimal(len(content_stream["Bytes"]))
+            page[Name("Contents")] = content_stream
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+        return out.getvalue()
+
+    @staticmethod
+    def _build_annotation(color: str) -> CircleAnnotation:
+        return CircleAnnotation(
+            bounding_box=Rectangle(Decimal(100), Decimal(100), Decimal(64), Decimal(64)),
+            stroke_color=HexColor(color),
+            fill_color=HexColor(color),
+        )
+
+    @staticmethod
+    def _count_objects(bts: bytes) -> int:
+        return len(re.findall(rb"\d+ \d+ obj", bts))
+
+    def test_write_incremental_update(self):
+        bts_001: bytes = TestWriteIncrementalUpdate._build_document(100)
+
+        # modify one Page
+        doc: Document = PDF.loads(io.BytesIO(bts_001))
+        doc.get_page(50).append_annotation(
+            TestWriteIncrementalUpdate._build_annotation("0B3954")
+        )
+
+        # write (full)
+        out_001: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_001, doc)
+
+        # write (incremental update)
+        doc = PDF.loads(io.BytesIO(bts_001))
+        doc.get_page(50).append_annotation(
+            TestWriteIncrementalUpdate._build_annotation("0B3954")
+        )
+        out_002: io.BytesIO = io.BytesIO()
+        out_002.write(bts_001)
+        PDF.dumps(out_002, doc, incremental_update=True)
+        bts_002: bytes = out_002.getvalue()
+
+        # the original bytes are kept as-is
+        # only the /Page, its /Annots (and their objects) and the /Info Dictionary are appended
+        assert bts_002.startswith(bts_001)
+        assert b"/Prev %d" % int(
+            re.findall(rb"startxref\n(\d+)", bts_001)[-1]
+        ) in bts_002[len(bts_001) :]
+        assert TestWriteIncrementalUpdate._count_objects(bts_002[len(bts_001) :]) < 10
+        assert len(bts_002) - len(bts_001) < len(out_001.getvalue()) * 0.1
+
+        # read back
+        doc = PDF.loads(io.BytesIO(bts_002))
+        assert int(doc.get_document_info().get_number_of_pages()) == 100
+        assert "Annots" not in doc.get_page(49)
+        assert len(doc.get_page(50)["Annots"]) == 1
+        assert doc.get_page(50)["Annots"][0]["Subtype"] == "Circle"
+        assert doc.get_page(51)["Contents"]["DecodedBytes"] == b"q 51 0 0 51 0 0 cm Q"
+
+    def test_write_incremental_update_twice(self):
+        bts_001: bytes = TestWriteIncrementalUpdate._build_document(10)
+
+        # modify one Page, and write an incremental update
+        # the Document is read lazily, the other Page(s) need not be read at all
+        doc: Document = PDF.loads(io.BytesIO(bts_001), lazy=True)
+        doc.get_page(2).append_annotation(
+            TestWriteIncrementalUpdate._build_annotation("0B3954")
+        )
+        out: io.BytesIO = io.BytesIO()
+        out.write(bts_001)
+        PDF.dumps(out, doc, incremental_update=True)
+        bts_002: bytes = out.getvalue()
+
+        # modify another Page, and write another incremental update (using object streams)
+        doc.get_page(7).append_annotation(
+            TestWriteIncrementalUpdate._build_annotation("f1cd2e")
+        )
+        PDF.dumps(out, doc, incremental_update=True, use_object_streams=True)
+        bts_003: bytes = out.getvalue()
+        assert bts_003.startswith(bts_002)
+        assert b"/Type /XRef" in bts_003[len(bts_002) :]
+
+        # read back
+        doc = PDF.loads(io.BytesIO(bts_003))
+        assert int(doc.get_document_info().get_number_of_pages()) == 10
+        assert [len(doc.get_page(i).get("Annots", [])) for i in range(0, 10)] == [
+            0,
+            0,
+            1,
+            0,
+            0,
+            0,
+            0,
+            1,
+            0,
+            0,
+        ]
+
+    def test_every_mutation_of_a_dictionary_is_tracked(self):
+        for mutate in [
+            lambda d: d.__setitem__(Name("B"), bDecimal(2)),
+            lambda d: d.__delitem__(Name("A")),
+            lambda d: d.__ior__({Name("B"): bDecimal(2)}),
+            lambda d: d.clear(),
+            lambda d: d.pop(Name("A")),
+            lambda d: d.popitem(),
+            lambda d: d.setdefault(Name("B"), bDecimal(2)),
+            lambda d: d.update({Name("B"): bDecimal(2)}),
+        ]:
+            d: Dictionary = Dictionary()
+            d[Name("A")] = bDecimal(1)
+            d.set_is_modified(False)
+            mutate(d)
+            assert d.is_modified()
+
+        # reading is not a mutation
+        d = Dictionary()
+        d[Name("A")] = bDecimal(1)
+        d.set_is_modified(False)
+        d.setdefault(Name("A"), bDecimal(2))
+        d.pop(Name("B"), None)
+        d.get(Name("A"))
+        assert not d.is_modified()
+
+    def test_every_mutation_of_a_list_is_tracked(self):
+        for mutate in [
+            lambda l: l.__setitem__(0, bDecimal(3)),
+            lambda l: l.__delitem__(0),
+            lambda l: l.__iadd__([bDecimal(3)]),
+            lambda l: l.__imul__(2),
+            lambda l: l.append(bDecimal(3)),
+            lambda l: l.clear(),
+            lambda l: l.extend([bDecimal(3)]),
+            lambda l: l.insert(0, bDecimal(3)),
+            lambda l: l.pop(),
+            lambda l: l.remove(bDecimal(1)),
+            lambda l: l.reverse(),
+            lambda l: l.sort(),
+        ]:
+            l: List = List()
+            l.append(bDecimal(2))
+            l.append(bDecimal(1))
+            l.set_is_modified(False)
+            mutate(l)
+            assert l.is_modified()
+
+    def test_write_incremental_update_after_dictionary_update(self):
+        bts_001: bytes = TestWriteIncrementalUpdate._build_document(3)
+
+        # modify one Page using dict.update
+        doc: Document = PDF.loads(io.BytesIO(bts_001))
+        doc.get_page(1).update({Name("Rotate"): bDecimal(90)})
+        assert doc.get_page(1).is_modified()
+
+        # write (incremental update)
+        out: io.BytesIO = io.BytesIO()
+        out.write(bts_001)
+        PDF.dumps(out, doc, incremental_update=True)
+
+        # read back
+        doc = PDF.loads(io.BytesIO(out.getvalue()))
+        assert doc.get_page(1)["Rotate"] == 90
+        assert "Rotate" not in doc.get_page(0)
+
+    def test_write_incremental_update_requires_a_valid_xref(self):
+        # a PDF whose startxref points to the wrong byte offset is read by rebuilding its XREF
+        bts_001: bytes = re.sub(
+            rb"startxref\n\d+",
+            b"startxref\n17",
+            TestWriteIncrementalUpdate._build_document(3),
+        )
+        doc: Document = PDF.loads(io.BytesIO(bts_001))
+        assert int(doc.get_document_info().get_number_of_pages()) == 3
+
+        # an incremental update would have no (valid) /Prev to refer to
+        out: io.BytesIO = io.BytesIO()
+        out.write(bts_001)
+        with self.assertRaises(AssertionError):
+            PDF.dumps(out, doc, incremental_update=True)
+        assert out.getvalue() == bts_001
+
+        # a Document that was not read can not be written as an incremental update either
+        with self.assertRaises(AssertionError):
+            PDF.dumps(io.BytesIO(), Document(), incremental_update=True)
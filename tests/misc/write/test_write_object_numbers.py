@@ -0,0 +1,39 @@
+import io
+import re
+import unittest
+
+from borb.io.read.types import Decimal, Dictionary, List, Name
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+
+class TestWriteObjectNumbers(unittest.TestCase):
+    """
+    This test builds a Document with a number of (tiny) indirect objects,
+    and checks whether object numbers are assigned without gaps, when it is written.
+    The timings (on Documents with up to 100000 objects) are in benchmarks/write_benchmark.py
+    """
+
+    @staticmethod
+    def _build_document(number_of_objects: int) -> Document:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        values: List = List()
+        for i in range(0, number_of_objects):
+            d: Dictionary = Dictionary()
+            d[Name("Value%d" % i)] = Decimal(i)
+            values.append(d)
+        page[Name("Values")] = values
+        return doc
+
+    def test_write_document_with_1000_objects(self):
+        doc: Document = TestWriteObjectNumbers._build_document(1000)
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # check the output (object numbers are assigned without gaps)
+        object_numbers = [int(x) for x in re.findall(rb"(\d+) 0 obj", out.getvalue())]
+        assert sorted(object_numbers) == [x for x in range(1, 1000 + 6)]
+        assert b"/Size %d" % (1000 + 6) in out.getvalue()
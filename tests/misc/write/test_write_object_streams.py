@@ -0,0 +1,94 @@
+import io
+import unittest
+import zlib
+
+from borb.io.read.types import Decimal, Dictionary, List, Name, Stream
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+
+class TestWriteObjectStreams(unittest.TestCase):
+    """
+    This test checks whether a Document can be written (and read back) using object streams,
+    and a cross-reference stream.
+    """
+
+    @staticmethod
+    def _build_document(number_of_objects: int) -> Document:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+
+        # content
+        content_stream: Stream = Stream()
+        content_stream[Name("DecodedBytes")] = b"q Q"
+        content_stream[Name("Bytes")] = zlib.compress(b"q Q", 9)
+        content_stream[Name("Filter")] = Name("FlateDecode")
+        content_stream[Name("Length")] = Decimal(len(content_stream["Bytes"]))
+        page[Name("Contents")] = content_stream
+
+        # (small) objects
+        values: List = List()
+        for i in range(0, number_of_objects):
+            d: Dictionary = Dictionary()
+            d[Name("Type")] = Name("Value")
+            d[Name("Value")] = Decimal(i)
+            values.append(d)
+        page[Name("Values")] = values
+        return doc
+
+    def test_write_document_with_object_streams(self):
+
+        # write
+        out_001: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_001, TestWriteObjectStreams._build_document(1000))
+        out_002: io.BytesIO = io.BytesIO()
+        PDF.dumps(
+            out_002,
+            TestWriteObjectStreams._build_document(1000),
+            use_object_streams=True,
+        )
+        print(
+            "bytes: %d (xref table), %d (xref stream)"
+            % (len(out_001.getvalue()), len(out_002.getvalue()))
+        )
+
+        # check output
+        assert b"/Type /XRef" in out_002.getvalue()
+        assert b"/Type /ObjStm" in out_002.getvalue()
+        assert b"\nxref\n" not in out_002.getvalue()
+        assert len(out_002.getvalue()) < len(out_001.getvalue()) * 0.5
+
+        # read back
+        out_002.seek(0)
+        doc: Document = PDF.loads(out_002)
+        assert int(doc.get_document_info().get_number_of_pages()) == 1
+        values: List = doc.get_page(0)["Values"]
+        assert len(values) == 1000
+        for i in range(0, 1000):
+            assert values[i]["Value"] == i
+
+    def test_write_document_with_object_streams_twice(self):
+
+        # write
+        out_001: io.BytesIO = io.BytesIO()
+        PDF.dumps(
+            out_001,
+            TestWriteObjectStreams._build_document(10),
+            use_object_streams=True,
+        )
+
+        # read back, and write again (with an xref table)
+        out_001.seek(0)
+        doc: Document = PDF.loads(out_001)
+        out_002: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_002, doc)
+        assert b"\nxref\n" in out_002.getvalue()
+
+        # read back
+        out_002.seek(0)
+        doc = PDF.loads(out_002)
+        assert [int(x["Value"]) for x in doc.get_page(0)["Values"]] == [
+            i for i in range(0, 10)
+        ]
@@ -0,0 +1,116 @@
+import io
+import tracemalloc
+import unittest
+import zlib
+from pathlib import Path
+
+from borb.io.read.types import Decimal, Name, Stream
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.heading import Heading
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.pdf.streaming_pdf_writer import StreamingPDFWriter
+
+
+class TestWriteStreaming(unittest.TestCase):
+    """
+    This test checks whether a Document can be written one Page at a time (using a StreamingPDFWriter),
+    and whether doing so keeps (a lot) less in memory than building the Document and writing it using PDF.dumps
+    """
+
+    @staticmethod
+    def _build_page(page_number: int) -> Page:
+        page: Page = Page()
+        content_stream: Stream = Stream()
+        content_stream[Name("DecodedBytes")] = (
+            b"BT /F1 12 Tf 72 720 Td (page %d) Tj ET\n" % page_number
+        ) * 200
+        content_stream[Name("Bytes")] = zlib.compress(content_stream["DecodedBytes"], 9)
+        content_stream[Name("Filter")] = Name("FlateDecode")
+        content_stream[Name("Length")] = Decimal(len(content_stream["Bytes"]))
+        page[Name("Contents")] = content_stream
+        return page
+
+    def test_write_document_page_by_page(self):
+
+        # write (PDF.dumps)
+        tracemalloc.start()
+        out_001: io.BytesIO = io.BytesIO()
+        doc: Document = Document()
+        for i in range(0, 1000):
+            doc.append_page(TestWriteStreaming._build_page(i))
+        PDF.dumps(out_001, doc)
+        peak_001: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        doc = None
+
+        # write (StreamingPDFWriter)
+        tracemalloc.start()
+        out_002: io.BytesIO = io.BytesIO()
+        with StreamingPDFWriter(out_002) as writer:
+            for i in range(0, 1000):
+                writer.append_page(TestWriteStreaming._build_page(i))
+        peak_002: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # check output
+        assert len(out_001.getvalue()) == len(out_002.getvalue())
+        assert peak_002 < peak_001 * 0.25
+
+        # read back
+        out_002.seek(0)
+        doc = PDF.loads(out_002)
+        assert int(doc.get_document_info().get_number_of_pages()) == 1000
+        for i in [0, 500, 999]:
+            assert doc.get_page(i)["Contents"]["DecodedBytes"].startswith(
+                b"BT /F1 12 Tf 72 720 Td (page %d) Tj ET\n" % i
+            )
+
+    def test_write_document_with_layout_page_by_page(self):
+
+        # every Page is laid out after having been appended
+        out: io.BytesIO = io.BytesIO()
+        with StreamingPDFWriter(out) as writer:
+            for i in range(0, 10):
+                page: Page = Page()
+                writer.append_page(page)
+                layout: SingleColumnLayout = SingleColumnLayout(page)
+                layout.add(Heading("Chapter %d" % i))
+                layout.add(Paragraph("Lorem ipsum dolor sit amet"))
+
+        # the /Font is shared among all Page(s), and only written once
+        assert out.getvalue().count(b"/Type /Font") == 1
+
+        # read back
+        out.seek(0)
+        doc: Document = PDF.loads(out)
+        assert int(doc.get_document_info().get_number_of_pages()) == 10
+        assert int(doc["XRef"]["Trailer"]["Root"]["Outlines"]["Count"]) == 10
+
+    def test_write_pages_of_other_documents_page_by_page(self):
+        input_file: Path = (
+            Path(__file__).parent.parent.parent
+            / "pdf"
+            / "document"
+            / "concat"
+            / "input_001.pdf"
+        )
+
+        # the Page(s) (and the objects they use) were read from another Document, and have a Reference already
+        out: io.BytesIO = io.BytesIO()
+        with StreamingPDFWriter(out) as writer:
+            for _ in range(0, 3):
+                with open(input_file, "rb") as in_file_handle:
+                    writer.append_page(PDF.loads(in_file_handle).get_page(0))
+
+        # read back
+        out.seek(0)
+        doc: Document = PDF.loads(out)
+        assert int(doc.get_document_info().get_number_of_pages()) == 3
+        for i in range(0, 3):
+            assert (
+                doc.get_page(i)["Contents"]["DecodedBytes"]
+                == doc.get_page(0)["Contents"]["DecodedBytes"]
+            )
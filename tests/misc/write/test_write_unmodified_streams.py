@@ -0,0 +1,88 @@
+import io
+import unittest
+import zlib
+
+from borb.io.read.types import Decimal, Name, Stream
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+
+class TestWriteUnmodifiedStreams(unittest.TestCase):
+    """
+    This test checks whether Stream objects that were read (and not modified)
+    are written without (re-)compressing them.
+    """
+
+    @staticmethod
+    def _build_document() -> Document:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+
+        # content
+        content_stream: Stream = Stream()
+        content_stream[Name("DecodedBytes")] = b"q Q"
+        content_stream[Name("Bytes")] = zlib.compress(b"q Q", 9)
+        content_stream[Name("Filter")] = Name("FlateDecode")
+        content_stream[Name("Length")] = Decimal(len(content_stream["Bytes"]))
+        page[Name("Contents")] = content_stream
+
+        # data
+        data_stream: Stream = Stream()
+        data_stream[Name("DecodedBytes")] = b"".join(
+            [b"%d %d %d\n" % (i, i * i, i % 7) for i in range(0, 1000)]
+        )
+        data_stream[Name("Bytes")] = zlib.compress(data_stream["DecodedBytes"], 9)
+        data_stream[Name("Filter")] = Name("FlateDecode")
+        data_stream[Name("Length")] = Decimal(len(data_stream["Bytes"]))
+        page[Name("Data")] = data_stream
+        return doc
+
+    def test_write_unmodified_stream(self):
+        doc: Document = TestWriteUnmodifiedStreams._build_document()
+        out_001: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_001, doc)
+
+        # read
+        out_001.seek(0)
+        doc = PDF.loads(out_001)
+        data_stream: Stream = doc.get_page(0)["Data"]
+        assert not data_stream.is_modified()
+
+        # change the /DecodedBytes behind the back of the Stream,
+        # a Stream that is (re-)compressed would be written with these bytes
+        decoded_bytes: bytes = data_stream["DecodedBytes"]
+        dict.__setitem__(data_stream, Name("DecodedBytes"), b"0 0 0\n")
+
+        # write (without modifying)
+        out_002: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_002, doc)
+
+        # the /Bytes are written as-is
+        assert data_stream["Bytes"] in out_002.getvalue()
+        out_002.seek(0)
+        doc = PDF.loads(out_002)
+        assert doc.get_page(0)["Data"]["DecodedBytes"] == decoded_bytes
+
+    def test_write_modified_stream(self):
+        doc: Document = TestWriteUnmodifiedStreams._build_document()
+        out_001: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_001, doc)
+
+        # read
+        out_001.seek(0)
+        doc = PDF.loads(out_001)
+        data_stream: Stream = doc.get_page(0)["Data"]
+        data_stream[Name("DecodedBytes")] = b"0 0 0\n"
+        assert data_stream.is_modified()
+
+        # write
+        out_002: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_002, doc)
+        assert zlib.compress(b"0 0 0\n", 9) in out_002.getvalue()
+
+        # read
+        out_002.seek(0)
+        doc = PDF.loads(out_002)
+        assert doc.get_page(0)["Data"]["DecodedBytes"] == b"0 0 0\n"
@@ -0,0 +1,130 @@
+import io
+import typing
+import unittest
+from pathlib import Path
+
+from borb.io.filter.stream_decode_util import decode_stream
+from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from borb.io.read.types import AnyPDFType, Reference
+from borb.pdf.document.document import Document
+from borb.pdf.pdf import PDF
+from borb.pdf.xref.stream_xref import StreamXREF
+from borb.pdf.xref.xref import XREF
+
+
+class TestObjectStreamCache(unittest.TestCase):
+    """
+    This test checks whether objects that are stored in an object stream (/ObjStm)
+    are looked up correctly, when the (decoded) object streams are cached.
+    """
+
+    @staticmethod
+    def _to_python(obj: typing.Any) -> typing.Any:
+        if isinstance(obj, dict):
+            return {str(k): TestObjectStreamCache._to_python(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [TestObjectStreamCache._to_python(v) for v in obj]
+        if isinstance(obj, Reference):
+            return ("R", obj.object_number, obj.generation_number)
+        return type(obj).__name__, str(obj)
+
+    @staticmethod
+    def _read_object_from_object_stream(
+        xref: XREF,
+        reference: Reference,
+        src: io.BufferedIOBase,
+        tok: HighLevelTokenizer,
+    ) -> typing.Optional[AnyPDFType]:
+        # this is the (previous) implementation,
+        # which reads all objects in the object stream, up until the requested object
+        assert reference.parent_stream_object_number is not None
+        assert reference.index_in_parent_stream is not None
+        stream_object = xref.get_object(
+            int(reference.parent_stream_object_number), src, tok
+        )
+        if "DecodedBytes" not in stream_object:
+            stream_object = decode_stream(stream_object)
+        stream_tok = HighLevelTokenizer(
+            io.BytesIO(stream_object["DecodedBytes"][int(stream_object["First"]) :])
+        )
+        return [
+            stream_tok.read_object()
+            for _ in range(0, int(reference.index_in_parent_stream) + 1)
+        ][-1]
+
+    def test_get_object_from_object_stream(self):
+        input_file: Path = (
+            Path(__file__).parent.parent.parent / "pdf" / "trailer" / "input_001.pdf"
+        )
+        with open(input_file, "rb") as src:
+            tok = HighLevelTokenizer(src)
+            xref: XREF = StreamXREF()
+            xref.set_parent(Document())
+            xref.read(src, tok)
+            references: typing.List[Reference] = [
+                x for x in xref._entries if x.parent_stream_object_number is not None
+            ]
+            assert len(references) > 0
+
+            # current implementation
+            objs = [xref.get_object(x, src, tok) for x in references]
+
+            # previous implementation
+            expected_objs = [
+                self._read_object_from_object_stream(xref, x, src, tok)
+                for x in references
+            ]
+
+            for obj, expected_obj in zip(objs, expected_objs):
+                assert obj is not None
+                assert self._to_python(obj) == self._to_python(expected_obj)
+
+    def test_object_stream_cache_is_bounded(self):
+        input_file: Path = (
+            Path(__file__).parent.parent.parent / "pdf" / "trailer" / "input_001.pdf"
+        )
+        prev_object_stream_cache_size: int = XREF.OBJECT_STREAM_CACHE_SIZE
+        XREF.OBJECT_STREAM_CACHE_SIZE = 0
+        try:
+            with open(input_file, "rb") as src:
+                tok = HighLevelTokenizer(src)
+                xref: XREF = StreamXREF()
+                xref.set_parent(Document())
+                xref.read(src, tok)
+                references: typing.List[Reference] = [
+                    x
+                    for x in xref._entries
+                    if x.parent_stream_object_number is not None
+                ]
+                for x in references:
+                    obj = xref.get_object(x, src, tok)
+                    assert obj is not None
+                    assert self._to_python(obj) == self._to_python(
+                        self._read_object_from_object_stream(xref, x, src, tok)
+                    )
+                    assert len(xref._object_stream_cache) == 0
+        finally:
+            XREF.OBJECT_STREAM_CACHE_SIZE = prev_object_stream_cache_size
+
+    def test_evicted_object_streams_are_not_cached(self):
+        input_file: Path = (
+            Path(__file__).parent.parent.parent / "pdf" / "trailer" / "input_001.pdf"
+        )
+        prev_object_stream_cache_size: int = XREF.OBJECT_STREAM_CACHE_SIZE
+        XREF.OBJECT_STREAM_CACHE_SIZE = 1
+        try:
+            with open(input_file, "rb") as src:
+                doc: Document = PDF.loads(src)
+            xref: XREF = doc["XRef"]
+            object_stream_numbers: typing.Set[int] = {
+                int(x.parent_stream_object_number)
+                for x in xref._entries
+                if x.parent_stream_object_number is not None
+            }
+            assert len(object_stream_numbers) > 1
+
+            # only the (decoded) object stream(s) in the LRU cache are kept in memory
+            assert len(xref._object_stream_cache) == 1
+            assert len([x for x in object_stream_numbers if x in xref._cache]) <= 1
+        finally:
+            XREF.OBJECT_STREAM_CACHE_SIZE = prev_object_stream_cache_size
@@ -0,0 +1,67 @@
+import io
+import re
+import unittest
+
+from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.pdf.xref.stream_xref import StreamXREF
+
+
+class TestReadXREF(unittest.TestCase):
+    """
+    This test checks whether the (most recent) cross-reference section of a PDF is found,
+    and whether cross-reference streams with more than one subsection are read correctly.
+    """
+
+    def test_read_most_recent_startxref(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        SingleColumnLayout(page).add(Paragraph("Hello World!"))
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+        bts: bytes = out.getvalue()
+
+        # append a (small) revision that replaces the /Info dictionary,
+        # its startxref is less than 1 KB away from the original one
+        size: int = int(re.findall(rb"/Size (\d+)", bts)[-1])
+        root: bytes = re.findall(rb"/Root (\d+ \d+ R)", bts)[-1]
+        prev: bytes = re.findall(rb"startxref\n(\d+)", bts)[-1]
+        revision: bytes = b"\n%d 0 obj\n<< /Title (Revised) >>\nendobj\n" % size
+        start_of_xref: int = len(bts) + revision.find(b"%d 0 obj" % size)
+        revision += b"xref\n%d 1\n%010d 00000 n\r\n" % (size, start_of_xref)
+        revision += b"trailer\n<< /Size %d /Root %s /Info %d 0 R /Prev %s >>\n" % (
+            size + 1,
+            root,
+            size,
+            prev,
+        )
+        revision += b"startxref\n%d\n%%%%EOF" % (len(bts) + revision.find(b"xref\n"))
+        bts += revision
+
+        # read
+        doc = PDF.loads(io.BytesIO(bts))
+        assert doc.get_document_info().get_title() == "Revised"
+        assert int(doc.get_document_info().get_number_of_pages()) == 1
+
+    def test_read_xref_stream_with_multiple_subsections(self):
+        # /Index [0 1 10 3] defines object 0 and objects 10, 11, 12
+        # their entries are stored one after the other
+        entries: bytes = bytes([0, 0, 255, 1, 10, 0, 1, 20, 0, 1, 30, 0])
+        src: io.BytesIO = io.BytesIO(
+            b"12 0 obj\n<< /Type /XRef /Size 13 /Index [0 1 10 3] /W [1 1 1] /Length %d >>\nstream\n"
+            % len(entries)
+            + entries
+            + b"\nendstream\nendobj\n"
+        )
+        xref: StreamXREF = StreamXREF()
+        xref.read(src, HighLevelTokenizer(src), initial_offset=0)
+        assert [
+            (int(r.object_number), r.byte_offset)
+            for r in xref._entries
+            if r.object_number is not None and r.object_number > 0
+        ] == [(10, 10), (11, 20), (12, 30)]
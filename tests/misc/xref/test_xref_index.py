@@ -0,0 +1,128 @@
+import io
+import random
+import typing
+import unittest
+
+from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from borb.io.read.types import Reference
+from borb.pdf.pdf import PDF
+from borb.pdf.xref.plaintext_xref import PlainTextXREF
+from borb.pdf.xref.xref import XREF
+
+
+class TestXREFIndex(unittest.TestCase):
+    """
+    This test builds a synthetic PDF with a number of (tiny) objects,
+    and checks whether objects are looked up (by object number and by Reference) in the XREF index.
+    The timings (on a PDF with 100000 objects) are in benchmarks/xref_benchmark.py
+    """
+
+    NUMBER_OF_OBJECTS: int = 1000
+
+    @staticmethod
+    def _build_pdf(number_of_objects: int) -> bytes:
+        out = io.BytesIO()
+        byte_offsets: typing.Dict[int, int] = {}
+
+        def write_object(object_number: int, object_bytes: bytes):
+            byte_offsets[object_number] = out.tell()
+            out.write(b"%d 0 obj\n%s\nendobj\n" % (object_number, object_bytes))
+
+        # catalog, pages, page, content stream and an array that refers to all other objects
+        out.write(b"%PDF-1.7\n")
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R /Values 5 0 R >>")
+        write_object(2, b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>")
+        write_object(
+            3,
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>",
+        )
+        write_object(4, b"<< /Length 0 >>\nstream\n\nendstream")
+        write_object(
+            5,
+            b"["
+            + b" ".join([b"%d 0 R" % i for i in range(6, 6 + number_of_objects)])
+            + b"]",
+        )
+        for i in range(6, 6 + number_of_objects):
+            write_object(i, b"%d" % i)
+
+        # xref
+        start_of_xref: int = out.tell()
+        size: int = 6 + number_of_objects
+        out.write(b"xref\n0 %d\n0000000000 65535 f\r\n" % size)
+        for i in range(1, size):
+            out.write(b"%010d 00000 n\r\n" % byte_offsets[i])
+
+        # trailer
+        out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\n" % size)
+        out.write(b"startxref\n%d\n%%%%EOF" % start_of_xref)
+        return out.getvalue()
+
+    def test_read_document_with_many_objects(self):
+        pdf_bytes: bytes = self._build_pdf(TestXREFIndex.NUMBER_OF_OBJECTS)
+
+        doc = PDF.loads(io.BytesIO(pdf_bytes))
+
+        # check document
+        assert doc.get_document_info().get_number_of_pages() == 1
+        assert len(doc["XRef"]) == TestXREFIndex.NUMBER_OF_OBJECTS + 6
+        values = doc["XRef"]["Trailer"]["Root"]["Values"]
+        assert len(values) == TestXREFIndex.NUMBER_OF_OBJECTS
+        for i in [0, 1, TestXREFIndex.NUMBER_OF_OBJECTS - 1]:
+            assert int(values[i]) == i + 6
+
+    def test_merge_xref_with_many_entries(self):
+        xref_001: XREF = XREF()
+        xref_002: XREF = XREF()
+        for i in range(0, TestXREFIndex.NUMBER_OF_OBJECTS):
+            xref_001.append(Reference(object_number=i, byte_offset=i))
+            xref_002.append(
+                Reference(
+                    object_number=i + TestXREFIndex.NUMBER_OF_OBJECTS // 2,
+                    byte_offset=-i,
+                )
+            )
+
+        xref_001.merge(xref_002)
+
+        # entries that were already present are not replaced
+        assert len(xref_001) == TestXREFIndex.NUMBER_OF_OBJECTS * 3 // 2
+        for r in xref_001._entries:
+            assert r.object_number is not None
+            if r.object_number < TestXREFIndex.NUMBER_OF_OBJECTS:
+                assert r.byte_offset == r.object_number
+            else:
+                assert r.byte_offset is not None
+                assert (
+                    -r.byte_offset
+                    == r.object_number - TestXREFIndex.NUMBER_OF_OBJECTS // 2
+                )
+
+    def test_get_object(self):
+        src = io.BytesIO(self._build_pdf(TestXREFIndex.NUMBER_OF_OBJECTS))
+        tok = HighLevelTokenizer(src)
+        xref: XREF = PlainTextXREF().read(src, tok)
+        assert len(xref) == TestXREFIndex.NUMBER_OF_OBJECTS + 6
+
+        # look up random objects, by object number and by Reference
+        random.seed(2021)
+        object_numbers: typing.List[int] = [
+            random.randint(6, TestXREFIndex.NUMBER_OF_OBJECTS + 5)
+            for _ in range(0, 1000)
+        ]
+        for i in object_numbers:
+            assert int(xref.get_object(i, src, tok)) == i
+            assert int(xref.get_object(Reference(object_number=i), src, tok)) == i
+
+        # unknown objects
+        assert (
+            xref.get_object(TestXREFIndex.NUMBER_OF_OBJECTS + 6, src, tok) is None
+        )
+        assert (
+            xref.get_object(
+                Reference(object_number=TestXREFIndex.NUMBER_OF_OBJECTS + 6),
+                src,
+                tok,
+            )
+            is None
+        )
@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from borb.io.read.types import Name
+from borb.pdf.canvas.font.font_cache import FontCache
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+
+
+class TestFontCache(unittest.TestCase):
+    """
+    This test checks whether (parsed) fonts are cached (per process),
+    and whether the cache is bounded and invalidated when a font file is modified.
+    """
+
+    def setUp(self) -> None:
+        FontCache.clear()
+
+    def tearDown(self) -> None:
+        FontCache.clear()
+
+    def test_standard_14_font_is_parsed_once(self):
+
+        # first StandardType1Font parses the AFM file
+        StandardType1Font("Helvetica")
+
+        # all others are taken from the cache
+        for _ in range(0, 100):
+            StandardType1Font("Helvetica")
+        assert FontCache.get_number_of_misses() == 1
+        assert FontCache.get_number_of_hits() == 100
+        assert FontCache.get_hit_ratio() == 100 / 101
+        assert StandardType1Font("Helvetica").get_width(65) == 667
+
+    def test_true_type_font_is_parsed_once(self):
+        font_path: Path = Path(__file__).parent / "Ubuntu-Light.ttf"
+        font_001 = TrueTypeFont.true_type_font_from_file(font_path)
+        font_002 = TrueTypeFont.true_type_font_from_file(font_path)
+        assert FontCache.get_number_of_misses() == 1
+        assert FontCache.get_number_of_hits() == 1
+
+        # every call returns a copy (that can be modified, and written, independently)
+        assert font_001 == font_002
+        assert font_001 is not font_002
+        assert font_001["DescendantFonts"] is not font_002["DescendantFonts"]
+        font_001[Name("BaseFont")] = Name("Lorem")
+        assert font_002["BaseFont"] == "Ubuntu-Light"
+        assert font_002.unicode_to_character_identifier("A") is not None
+
+    def test_modified_true_type_font_is_parsed_again(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            font_path: Path = Path(temp_dir) / "font.ttf"
+            shutil.copy(Path(__file__).parent / "Jsfont-Regular.ttf", font_path)
+            TrueTypeFont.true_type_font_from_file(font_path)
+            TrueTypeFont.true_type_font_from_file(font_path)
+            assert FontCache.get_number_of_misses() == 1
+
+            # modify the font file
+            shutil.copy(Path(__file__).parent / "Pacifico-Regular.ttf", font_path)
+            os.utime(font_path, ns=(0, 0))
+            font = TrueTypeFont.true_type_font_from_file(font_path)
+            assert FontCache.get_number_of_misses() == 2
+            assert font["BaseFont"] == "Pacifico-Regular"
+
+    def test_cache_is_bounded(self):
+        prev_max_number_of_fonts: int = FontCache.MAX_NUMBER_OF_FONTS
+        try:
+            FontCache.MAX_NUMBER_OF_FONTS = 2
+            for font_name in ["Helvetica", "Courier", "Times-Roman", "Helvetica"]:
+                StandardType1Font(font_name)
+            assert FontCache.get_number_of_entries() == 2
+            assert FontCache.get_number_of_evictions() == 2
+            assert FontCache.get_number_of_misses() == 4
+        finally:
+            FontCache.MAX_NUMBER_OF_FONTS = prev_max_number_of_fonts
@@ -0,0 +1,46 @@
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.glyph_line import GlyphLine
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+
+
+class TestGlyphLineMeasure(unittest.TestCase):
+    """
+    This test checks whether GlyphLine.measure returns the same width as GlyphLine.from_str(...).get_width_in_text_space().
+    The timings are in benchmarks/glyph_line_measure_benchmark.py
+    """
+
+    TEXT: str = (
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
+        "sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. "
+        "Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris."
+    )
+
+    def _check_font(self, font: Font):
+        for font_size in [Decimal(12), Decimal(9.5), Decimal(20)]:
+            for i in range(0, len(TestGlyphLineMeasure.TEXT), 7):
+                s: str = TestGlyphLineMeasure.TEXT[i:]
+                assert (
+                    GlyphLine.measure(s, font, font_size)
+                    == GlyphLine.from_str(s, font, font_size).get_width_in_text_space()
+                )
+
+    def test_measure_standard_type_1_font(self):
+        font: Font = StandardType1Font("Helvetica")
+        assert font.get_width(65) == 667
+        assert font.get_width(-1) == 0
+        self._check_font(font)
+
+    def test_measure_true_type_font(self):
+        self._check_font(
+            TrueTypeFont.true_type_font_from_file(
+                Path(__file__).parent / "Ubuntu-Light.ttf"
+            )
+        )
+
+    def test_measure_empty_text(self):
+        assert GlyphLine.measure("", StandardType1Font("Helvetica"), Decimal(12)) == 0
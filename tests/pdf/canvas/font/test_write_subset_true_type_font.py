@@ -0,0 +1,103 @@
+import io
+import typing
+import unittest
+from pathlib import Path
+
+from borb.pdf.canvas.font.composite_font.font_type_0 import Type0Font
+from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestWriteSubsetTrueTypeFont(unittest.TestCase):
+    """
+    This test checks whether a font (loaded from a .ttf file) is subset (to the characters that are used) when it is written,
+    and whether the text can still be extracted from the output.
+    """
+
+    @staticmethod
+    def _build_document(font_file: str, texts: list) -> Document:
+        doc: Document = Document()
+        for t in texts:
+            page: Page = Page()
+            doc.append_page(page)
+            font: Font = TrueTypeFont.true_type_font_from_file(
+                Path(__file__).parent / font_file
+            )
+            SingleColumnLayout(page).add(Paragraph(t, font=font))
+        return doc
+
+    @staticmethod
+    def _write_and_read(
+        font_file: str, texts: list, subset_fonts: bool
+    ) -> typing.Tuple[bytes, Document, SimpleTextExtraction]:
+        doc: Document = TestWriteSubsetTrueTypeFont._build_document(font_file, texts)
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc, subset_fonts=subset_fonts)
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        out.seek(0)
+        doc = PDF.loads(out, [l])
+        return out.getvalue(), doc, l
+
+    def test_write_subset_type_0_font(self):
+        bts_001, _, _ = TestWriteSubsetTrueTypeFont._write_and_read(
+            "Ubuntu-Light.ttf", ["Hello World!"], subset_fonts=False
+        )
+        bts_002, doc, l = TestWriteSubsetTrueTypeFont._write_and_read(
+            "Ubuntu-Light.ttf", ["Hello World!"], subset_fonts=True
+        )
+        assert len(bts_002) < len(bts_001) * 0.1
+
+        # check font
+        font: Font = doc.get_page(0)["Resources"]["Font"]["F1"]
+        assert isinstance(font, Type0Font)
+        assert str(font["BaseFont"]).endswith("+Ubuntu-Light")
+        assert len(str(font["BaseFont"])) == len("ABCDEF+Ubuntu-Light")
+        assert len(font["DescendantFonts"][0]["W"]) == 2 * len(set("Hello World!"))
+
+        # check text
+        assert l.get_text_for_page(0) == "Hello World!"
+
+    def test_write_subset_true_type_font(self):
+        bts_001, _, _ = TestWriteSubsetTrueTypeFont._write_and_read(
+            "Jsfont-Regular.ttf", ["Hello World!"], subset_fonts=False
+        )
+        bts_002, doc, l = TestWriteSubsetTrueTypeFont._write_and_read(
+            "Jsfont-Regular.ttf", ["Hello World!"], subset_fonts=True
+        )
+        assert len(bts_002) < len(bts_001)
+
+        # check font
+        font: Font = doc.get_page(0)["Resources"]["Font"]["F1"]
+        assert isinstance(font, TrueTypeFont)
+        assert "+" in str(font["BaseFont"])
+        assert len(font["Widths"]) == int(font["LastChar"]) - int(font["FirstChar"]) + 1
+
+        # check text
+        assert l.get_text_for_page(0) == "Hello World!"
+
+    def test_write_subset_font_used_with_different_characters(self):
+
+        # the same font file is loaded (and used) on every Page
+        # every Page uses other characters, the fonts should thus not be shared
+        _, doc, l = TestWriteSubsetTrueTypeFont._write_and_read(
+            "Ubuntu-Light.ttf", ["Lorem", "Ipsum", "Dolor"], subset_fonts=True
+        )
+        for i, t in enumerate(["Lorem", "Ipsum", "Dolor"]):
+            assert l.get_text_for_page(i) == t
+        assert (
+            len(
+                set(
+                    [
+                        str(doc.get_page(i)["Resources"]["Font"]["F1"]["BaseFont"])
+                        for i in range(0, 3)
+                    ]
+                )
+            )
+            == 3
+        )
@@ -0,0 +1,108 @@
+import io
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable as Table,
+)
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestWritePageContentStreamBuffer(unittest.TestCase):
+    """
+    This test checks whether the content stream of a Page is built (during layout) without being compressed,
+    and whether it is compressed (once) when the Document is written.
+    """
+
+    @staticmethod
+    def _build_document() -> Document:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        SingleColumnLayout(page).add(Paragraph("Lorem ipsum"))
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+        return PDF.loads(io.BytesIO(out.getvalue()))
+
+    @staticmethod
+    def _get_text(bts: bytes) -> str:
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(bts), [l])
+        return l.get_text_for_page(0)
+
+    def test_write_table_with_500_cells(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+
+        # layout
+        t: Table = Table(number_of_rows=50, number_of_columns=10)
+        for i in range(0, 500):
+            t.add(Paragraph(str(i), font_size=Decimal(5)))
+        SingleColumnLayout(page).add(t)
+
+        # the content stream is not compressed during layout
+        assert "Bytes" not in page["Contents"]
+
+        # write
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+        assert len(out.getvalue()) < len(page["Contents"]["DecodedBytes"])
+
+        # read back
+        doc_002: Document = PDF.loads(io.BytesIO(out.getvalue()))
+        assert doc_002.get_page(0)["Contents"]["DecodedBytes"] == bytes(
+            page["Contents"]["DecodedBytes"]
+        )
+        assert doc_002.get_page(0)["Contents"]["Filter"] == "FlateDecode"
+        text: str = TestWritePageContentStreamBuffer._get_text(out.getvalue())
+        for i in [0, 250, 499]:
+            assert str(i) in text
+
+    def test_write_layout_on_existing_page(self):
+        doc: Document = TestWritePageContentStreamBuffer._build_document()
+        Paragraph("Dolor sit amet").layout(
+            doc.get_page(0),
+            Rectangle(Decimal(59), Decimal(400), Decimal(200), Decimal(100)),
+        )
+
+        # write
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # read back
+        text: str = TestWritePageContentStreamBuffer._get_text(out.getvalue())
+        assert "Lorem ipsum" in text
+        assert "Dolor sit amet" in text
+
+    def test_write_layout_on_existing_page_incremental_update(self):
+        doc: Document = TestWritePageContentStreamBuffer._build_document()
+        out_001: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_001, doc)
+        bts_001: bytes = out_001.getvalue()
+
+        # layout on a Page that was read, and write an incremental update
+        doc = PDF.loads(io.BytesIO(bts_001))
+        Paragraph("Dolor sit amet").layout(
+            doc.get_page(0),
+            Rectangle(Decimal(59), Decimal(400), Decimal(200), Decimal(100)),
+        )
+        out_002: io.BytesIO = io.BytesIO()
+        out_002.write(bts_001)
+        PDF.dumps(out_002, doc, incremental_update=True)
+        assert "Dolor sit amet" in TestWritePageContentStreamBuffer._get_text(
+            out_002.getvalue()
+        )
+
+        # the (same) Document can still be written in full
+        out_003: io.BytesIO = io.BytesIO()
+        PDF.dumps(out_003, doc)
+        assert "Dolor sit amet" in TestWritePageContentStreamBuffer._get_text(
+            out_003.getvalue()
+        )
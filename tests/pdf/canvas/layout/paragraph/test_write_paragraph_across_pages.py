@@ -0,0 +1,243 @@
+import io
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.font.glyph_line import GlyphLine
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.hyphenation.hyphenation import Hyphenation
+from borb.pdf.canvas.layout.layout_element import Alignment, LayoutElement
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import (
+    MultiColumnLayout,
+    SingleColumnLayout,
+)
+from borb.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
+from borb.pdf.canvas.layout.text.chunks_of_text import HeterogeneousParagraph
+from borb.pdf.canvas.layout.text.codeblock import CodeBlock
+from borb.pdf.canvas.layout.text.heading import Heading
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class CountingParagraph(Paragraph):
+    """
+    This Paragraph counts how often its text is broken into lines
+    """
+
+    def __init__(self, text: str, **kwargs):
+        super(CountingParagraph, self).__init__(text, **kwargs)
+        self.number_of_line_breaking_passes: int = 0
+
+    def _split_text_without_cache(self, bounding_box: Rectangle) -> typing.List[str]:
+        self.number_of_line_breaking_passes += 1
+        return super(CountingParagraph, self)._split_text_without_cache(bounding_box)
+
+
+class TestWriteParagraphAcrossPages(unittest.TestCase):
+    """
+    This test checks whether a Paragraph (HeterogeneousParagraph, CodeBlock) that does not fit in the remaining space
+    is split (between two lines of text) across columns and pages, respecting widows and orphans,
+    and whether its text is broken into lines only once.
+    The timings (of Paragraphs with up to 20000 words) are in benchmarks/paragraph_across_pages_benchmark.py
+    """
+
+    @staticmethod
+    def _get_text(number_of_words: int) -> str:
+        return " ".join(
+            [
+                "w%d" % i if i % 5 == 0 else ["lorem", "ipsum", "dolor", "sit"][i % 4]
+                for i in range(0, number_of_words)
+            ]
+        )
+
+    @staticmethod
+    def _write_and_read(
+        layout_elements: typing.List[LayoutElement], number_of_columns: int = 1
+    ) -> typing.List[str]:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        layout: MultiColumnLayout = (
+            SingleColumnLayout(page)
+            if number_of_columns == 1
+            else MultiColumnLayout(page, number_of_columns=number_of_columns)
+        )
+        for e in layout_elements:
+            layout.add(e)
+
+        # write
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # read back
+        out.seek(0)
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        PDF.loads(out, [l])
+        return [
+            l.get_text_for_page(i)
+            for i in range(0, int(doc.get_document_info().get_number_of_pages()))
+        ]
+
+    def test_write_paragraph_across_pages(self):
+        p: CountingParagraph = CountingParagraph(
+            TestWriteParagraphAcrossPages._get_text(5000),
+            text_alignment=Alignment.JUSTIFIED,
+        )
+        texts: typing.List[str] = TestWriteParagraphAcrossPages._write_and_read(
+            [Paragraph("Lorem ipsum"), p]
+        )
+        assert len(texts) > 1
+
+        # every (numbered) word is present (exactly once, in order)
+        words: typing.List[str] = [
+            w for s in texts for w in s.split() if w.startswith("w")
+        ]
+        assert words == ["w%d" % i for i in range(0, 5000, 5)]
+
+        # the text was broken into lines only once
+        assert p.number_of_line_breaking_passes == 1
+
+    def test_write_paragraph_across_columns(self):
+        texts: typing.List[str] = TestWriteParagraphAcrossPages._write_and_read(
+            [Paragraph(TestWriteParagraphAcrossPages._get_text(500))],
+            number_of_columns=2,
+        )
+        assert len(texts) == 1
+
+    def test_write_heterogeneous_paragraph_across_pages(self):
+        texts: typing.List[str] = TestWriteParagraphAcrossPages._write_and_read(
+            [
+                HeterogeneousParagraph(
+                    [
+                        ChunkOfText(
+                            w + " ",
+                            font="Helvetica-Bold" if i % 3 == 0 else "Helvetica",
+                        )
+                        for i, w in enumerate(
+                            TestWriteParagraphAcrossPages._get_text(2000).split(" ")
+                        )
+                    ]
+                )
+            ]
+        )
+        assert len(texts) > 1
+        words: typing.List[str] = [
+            w for s in texts for w in s.split() if w.startswith("w")
+        ]
+        assert words == ["w%d" % i for i in range(0, 2000, 5)]
+
+    def test_write_codeblock_across_pages(self):
+        texts: typing.List[str] = TestWriteParagraphAcrossPages._write_and_read(
+            [CodeBlock("\n".join(["x_%d = %d" % (i, i) for i in range(0, 200)]))]
+        )
+        assert len(texts) > 1
+        words: typing.List[str] = [
+            w for s in texts for w in s.split() if w.startswith("x_")
+        ]
+        assert words == ["x_%d" % i for i in range(0, 200)]
+
+    def test_split_respects_widows_and_orphans(self):
+        available_box: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(200), Decimal(600)
+        )
+        for orphans, widows in [(1, 1), (2, 2), (3, 2)]:
+            p: Paragraph = Paragraph(
+                TestWriteParagraphAcrossPages._get_text(40),
+                orphans=orphans,
+                widows=widows,
+            )
+            number_of_lines: int = len(p._get_lines_of_text(available_box))
+            line_height: Decimal = p.measure(available_box).get_height() / Decimal(
+                number_of_lines
+            )
+            for n in range(0, number_of_lines):
+                box: Rectangle = Rectangle(
+                    available_box.x,
+                    available_box.y,
+                    available_box.width,
+                    line_height * (Decimal(n) + Decimal(0.5)),
+                )
+                parts: typing.Optional[
+                    typing.Tuple[LayoutElement, LayoutElement]
+                ] = p.split(box)
+                if n < orphans:
+                    assert parts is None
+                    continue
+                assert isinstance(parts[0], Paragraph)
+                assert isinstance(parts[1], Paragraph)
+                assert parts[0].measure(box).get_y() >= box.get_y()
+                lines_001: typing.List[str] = parts[0]._get_lines_of_text(box)
+                lines_002: typing.List[str] = parts[1]._get_lines_of_text(box)
+                assert len(lines_001) == min(n, number_of_lines - widows)
+                assert lines_001 + lines_002 == p._get_lines_of_text(box)
+
+    def test_split_by_default_allows_a_single_line(self):
+        p: Paragraph = Paragraph(TestWriteParagraphAcrossPages._get_text(40))
+        box: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(200), Decimal(12 * 1.2 * 1.5)
+        )
+        parts: typing.Optional[typing.Tuple[LayoutElement, LayoutElement]] = p.split(
+            box
+        )
+        assert parts is not None
+        assert len(parts[0]._get_lines_of_text(box)) == 1
+        assert (
+            len(parts[1]._get_lines_of_text(box)) == len(p._get_lines_of_text(box)) - 1
+        )
+
+    def test_split_parts_are_broken_into_lines_again_in_a_box_of_a_different_width(
+        self,
+    ):
+        text: str = TestWriteParagraphAcrossPages._get_text(200)
+        box_001: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(200), Decimal(100)
+        )
+        box_002: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(400), Decimal(600)
+        )
+
+        # Paragraph
+        p: Paragraph = Paragraph(text, hyphenation=Hyphenation("en-gb"))
+        parts: typing.Optional[typing.Tuple[LayoutElement, LayoutElement]] = p.split(
+            box_001
+        )
+        assert parts is not None
+        lines_001: typing.List[str] = parts[0]._get_lines_of_text(box_001)
+        lines_002: typing.List[str] = parts[1]._get_lines_of_text(box_002)
+        assert len(lines_002) < len(p._get_lines_of_text(box_001)) - len(lines_001)
+        for l in lines_002:
+            assert GlyphLine.measure(
+                l, StandardType1Font("Helvetica"), Decimal(12)
+            ) <= box_002.width + Decimal(0.01)
+        assert " ".join(lines_001 + lines_002).replace("- ", "") == text
+
+        # HeterogeneousParagraph
+        hp: HeterogeneousParagraph = HeterogeneousParagraph(
+            [ChunkOfText(w + " ") for w in text.split(" ")]
+        )
+        parts = hp.split(box_001)
+        assert parts is not None
+        lines_of_chunks_001 = parts[0]._get_lines_of_chunks(box_001)
+        lines_of_chunks_002 = parts[1]._get_lines_of_chunks(box_002)
+        assert len(lines_of_chunks_002) < len(hp._get_lines_of_chunks(box_001)) - len(
+            lines_of_chunks_001
+        )
+        assert [
+            c.get_text().strip()
+            for l, _ in lines_of_chunks_001 + lines_of_chunks_002
+            for c in l
+        ] == text.split(" ")
+
+    def test_split_returns_none_if_paragraph_fits(self):
+        available_box: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(476), Decimal(600)
+        )
+        assert Paragraph("Lorem ipsum dolor sit amet").split(available_box) is None
+        assert (
+            Heading(TestWriteParagraphAcrossPages._get_text(2000)).split(available_box)
+            is None
+        )
@@ -0,0 +1,146 @@
+import io
+import random
+import typing
+import unittest
+
+from borb.io.read.types import Decimal
+from borb.pdf.canvas.font.glyph_line import GlyphLine
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.hyphenation.hyphenation import Hyphenation
+from borb.pdf.canvas.layout.layout_element import Alignment
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+WORDS: typing.List[str] = """
+lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore magna
+aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo consequat duis aute
+irure in reprehenderit voluptate velit esse cillum fugiat nulla pariatur excepteur sint occaecat cupidatat non
+proident sunt culpa qui officia deserunt mollit anim id est laborum
+""".split()
+
+
+class TestWriteParagraphLineBreaking(unittest.TestCase):
+    """
+    This test breaks body text into lines,
+    using both the first-fit and the optimal-fit (Knuth-Plass) line breaking algorithm,
+    and checks whether the lines are correct.
+    The timings (on 100 pages worth of body text) are in benchmarks/line_breaking_benchmark.py
+    """
+
+    @staticmethod
+    def _get_texts(number_of_paragraphs: int) -> typing.List[str]:
+        random.seed(0)
+        return [
+            " ".join([random.choice(WORDS) for _ in range(0, 100)])
+            for _ in range(0, number_of_paragraphs)
+        ]
+
+    @staticmethod
+    def _get_mean_squared_space_per_space(
+        paragraphs: typing.List[typing.List[str]], width: Decimal
+    ) -> float:
+        # the last line of every (justified) Paragraph is not stretched
+        space_per_space: typing.List[float] = [
+            float(
+                width
+                - GlyphLine.measure(l, StandardType1Font("Helvetica"), Decimal(12))
+            )
+            / max(l.count(" "), 1)
+            for lines_of_text in paragraphs
+            for l in lines_of_text[:-1]
+        ]
+        return sum([x**2 for x in space_per_space]) / max(len(space_per_space), 1)
+
+    def test_split_body_text(self):
+
+        # the width of a SingleColumnLayout on an A4 Page
+        bounding_box: Rectangle = Rectangle(
+            Decimal(0), Decimal(0), Decimal(595 * 0.8), Decimal(842 * 0.8)
+        )
+
+        texts: typing.List[str] = TestWriteParagraphLineBreaking._get_texts(20)
+        mean_squared_space_per_space: typing.Dict[bool, float] = {}
+        for optimal_line_breaking in [False, True]:
+
+            # break every Paragraph into lines
+            paragraphs: typing.List[typing.List[str]] = [
+                Paragraph(
+                    t,
+                    text_alignment=Alignment.JUSTIFIED,
+                    optimal_line_breaking=optimal_line_breaking,
+                )._split_text(bounding_box)
+                for t in texts
+            ]
+
+            # every word is kept (in order), and every line fits
+            for t, lines_of_text in zip(texts, paragraphs):
+                assert " ".join(lines_of_text) == t
+                for l in lines_of_text:
+                    assert GlyphLine.measure(
+                        l, StandardType1Font("Helvetica"), Decimal(12)
+                    ) <= bounding_box.width + Decimal(0.01)
+
+            mean_squared_space_per_space[optimal_line_breaking] = (
+                TestWriteParagraphLineBreaking._get_mean_squared_space_per_space(
+                    paragraphs, bounding_box.width
+                )
+            )
+
+        # optimal-fit spreads the space more evenly
+        assert mean_squared_space_per_space[True] < mean_squared_space_per_space[False]
+
+    def test_write_paragraph_optimal_line_breaking(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        layout: SingleColumnLayout = SingleColumnLayout(page)
+        for t in TestWriteParagraphLineBreaking._get_texts(3):
+            layout.add(
+                Paragraph(
+                    t,
+                    text_alignment=Alignment.JUSTIFIED,
+                    optimal_line_breaking=True,
+                )
+            )
+
+        # read back
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+        out.seek(0)
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        PDF.loads(out, [l])
+        assert (
+            l.get_text_for_page(0).split()
+            == " ".join(TestWriteParagraphLineBreaking._get_texts(3)).split()
+        )
+
+    def test_split_text_with_hyphenation(self):
+        bounding_box: Rectangle = Rectangle(
+            Decimal(0), Decimal(0), Decimal(150), Decimal(1000)
+        )
+        for optimal_line_breaking in [False, True]:
+            for t in TestWriteParagraphLineBreaking._get_texts(10):
+                lines_of_text: typing.List[str] = Paragraph(
+                    t,
+                    text_alignment=Alignment.JUSTIFIED,
+                    optimal_line_breaking=optimal_line_breaking,
+                    hyphenation=Hyphenation("en-gb"),
+                )._split_text(bounding_box)
+                assert " ".join(lines_of_text).replace("- ", "") == t
+
+    def test_split_text_respects_newlines(self):
+        bounding_box: Rectangle = Rectangle(
+            Decimal(0), Decimal(0), Decimal(100), Decimal(1000)
+        )
+        for optimal_line_breaking in [False, True]:
+            assert Paragraph(
+                "Lorem\n\nipsum dolor\n",
+                respect_newlines_in_text=True,
+                text_alignment=Alignment.JUSTIFIED,
+                optimal_line_breaking=optimal_line_breaking,
+            )._split_text(bounding_box) == ["Lorem", "", "ipsum dolor"]
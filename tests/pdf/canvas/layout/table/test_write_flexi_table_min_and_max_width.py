@@ -0,0 +1,136 @@
+import io
+import random
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.list.unordered_list import UnorderedList
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.table import TableCell
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+WORDS: typing.List[str] = """
+lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore magna
+aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo consequat
+""".split()
+
+
+class OpaqueParagraph(Paragraph):
+    """
+    This Paragraph does not calculate its own min-content width
+    """
+
+    def _calculate_min_content_width_without_padding(self) -> typing.Optional[Decimal]:
+        return None
+
+
+class TestWriteFlexiTableMinAndMaxWidth(unittest.TestCase):
+    """
+    This test checks whether the minimum and maximum width of a TableCell are calculated (without repeated layout),
+    and whether the minimum width is the smallest width the content fits in.
+    """
+
+    @staticmethod
+    def _get_texts(n: int) -> typing.List[str]:
+        random.seed(0)
+        return [
+            " ".join([random.choice(WORDS) for _ in range(0, random.randint(1, 8))])
+            for _ in range(0, n)
+        ]
+
+    def test_min_width_is_smallest_width(self):
+        for i, s in enumerate(TestWriteFlexiTableMinAndMaxWidth._get_texts(100)):
+            t: TableCell = TableCell(
+                Paragraph(s, font_size=Decimal(8 + i % 5)),
+                padding_left=Decimal(i % 3),
+                padding_right=Decimal(1),
+            )
+            t.calculate_min_and_max_width()
+            assert t._min_width is not None
+            assert t._max_width is not None
+            assert t._min_width <= t._max_width
+
+            # the content fits in the minimum width
+            bb: Rectangle = t.measure(
+                Rectangle(Decimal(0), Decimal(0), t._min_width, Decimal(2048))
+            )
+            assert bb.get_width() <= t._min_width + Decimal(0.01)
+
+            # the content does not fit in anything less than the minimum width
+            bb = t.measure(
+                Rectangle(
+                    Decimal(0), Decimal(0), t._min_width - Decimal(1), Decimal(2048)
+                )
+            )
+            assert bb.get_width() > t._min_width - Decimal(1)
+
+    def test_min_width_without_min_content_width(self):
+        t: TableCell = TableCell(
+            UnorderedList().add(Paragraph("Lorem")).add(Paragraph("ipsum dolor"))
+        )
+        assert t._calculate_min_content_width() is None
+        t.calculate_min_and_max_width()
+        assert t._min_width is not None
+        assert t._max_width is not None
+        assert t._min_width <= t._max_width
+
+    def test_calculate_min_and_max_width_of_2000_cells(self):
+        texts: typing.List[str] = TestWriteFlexiTableMinAndMaxWidth._get_texts(2000)
+
+        # min-content width
+        delta_001: float = time.time()
+        cells_001: typing.List[TableCell] = [TableCell(Paragraph(s)) for s in texts]
+        for t in cells_001:
+            t.calculate_min_and_max_width()
+        delta_001 = time.time() - delta_001
+
+        # binary search (on a subset of the cells)
+        delta_002: float = time.time()
+        cells_002: typing.List[TableCell] = [
+            TableCell(OpaqueParagraph(s)) for s in texts[0:200]
+        ]
+        for t in cells_002:
+            t.calculate_min_and_max_width()
+        delta_002 = (time.time() - delta_002) * 10
+        print(
+            "2000 cells: %f s (min-content width), %f s (binary search, estimated)"
+            % (delta_001, delta_002)
+        )
+        assert delta_001 < delta_002
+
+        # the maximum width does not depend on the method
+        for t0, t1 in zip(cells_001, cells_002):
+            assert t0._max_width == t1._max_width
+            assert t0._min_width is not None
+            assert t1._min_width is not None
+            assert t0._min_width <= t1._min_width
+
+    def test_write_flexi_table_with_min_content_width(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        texts: typing.List[str] = TestWriteFlexiTableMinAndMaxWidth._get_texts(40)
+        t: FlexibleColumnWidthTable = FlexibleColumnWidthTable(
+            number_of_rows=10, number_of_columns=4
+        )
+        for s in texts:
+            t.add(Paragraph(s))
+        t.set_padding_on_all_cells(Decimal(2), Decimal(2), Decimal(2), Decimal(2))
+        SingleColumnLayout(page).add(t)
+
+        # read back
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+        out.seek(0)
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        PDF.loads(out, [l])
+        assert sorted(l.get_text_for_page(0).split()) == sorted(" ".join(texts).split())
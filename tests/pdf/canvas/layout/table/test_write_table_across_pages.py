@@ -0,0 +1,209 @@
+import io
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.color.color import HexColor
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.forms.check_box import CheckBox
+from borb.pdf.canvas.layout.forms.country_drop_down_list import (
+    CountryDropDownList,
+)
+from borb.pdf.canvas.layout.forms.drop_down_list import DropDownList
+from borb.pdf.canvas.layout.forms.push_button import PushButton
+from borb.pdf.canvas.layout.forms.text_field import TextField
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import (
+    MultiColumnLayout,
+    SingleColumnLayout,
+)
+from borb.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.table import Table, TableCell
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestWriteTableAcrossPages(unittest.TestCase):
+    """
+    This test checks whether a Table that does not fit on a single Page is split (between rows) across Pages,
+    and whether its header rows are repeated on every Page.
+    The timings (of Tables with up to 1000 rows) are in benchmarks/table_across_pages_benchmark.py
+    """
+
+    @staticmethod
+    def _build_table(table_class: typing.Type[Table], number_of_rows: int) -> Table:
+        t: Table = table_class(
+            number_of_rows=number_of_rows + 1,
+            number_of_columns=3,
+            number_of_header_rows=1,
+        )
+        t.add(Paragraph("Key", font="Helvetica-Bold"))
+        t.add(Paragraph("Name", font="Helvetica-Bold"))
+        t.add(Paragraph("Value", font="Helvetica-Bold"))
+        for i in range(0, number_of_rows):
+            t.add(Paragraph("K%d" % i))
+            t.add(Paragraph("row %d" % i))
+            t.add(Paragraph(" ".join(["lorem ipsum"] * (1 + i % 3))))
+        t.set_padding_on_all_cells(Decimal(2), Decimal(2), Decimal(2), Decimal(2))
+        return t
+
+    @staticmethod
+    def _write_and_read_table(
+        table_class: typing.Type[Table], number_of_rows: int
+    ) -> typing.List[str]:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        SingleColumnLayout(page).add(
+            TestWriteTableAcrossPages._build_table(table_class, number_of_rows)
+        )
+
+        # write
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # read back
+        out.seek(0)
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        PDF.loads(out, [l])
+        return [
+            l.get_text_for_page(i)
+            for i in range(0, int(doc.get_document_info().get_number_of_pages()))
+        ]
+
+    def _check_table_across_pages(self, table_class: typing.Type[Table]):
+        texts: typing.List[str] = TestWriteTableAcrossPages._write_and_read_table(
+            table_class, 200
+        )
+        assert len(texts) > 1
+
+        # the header row is repeated on every Page
+        for s in texts:
+            assert s.startswith("Key Name Value")
+
+        # every row is present (exactly once, in order)
+        keys: typing.List[str] = [
+            w for s in texts for w in s.split() if w.startswith("K") and w != "Key"
+        ]
+        assert keys == ["K%d" % i for i in range(0, 200)]
+
+    def test_write_fixed_column_width_table_across_pages(self):
+        self._check_table_across_pages(FixedColumnWidthTable)
+
+    def test_write_flexible_column_width_table_across_pages(self):
+        self._check_table_across_pages(FlexibleColumnWidthTable)
+
+    def test_write_table_across_columns(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        MultiColumnLayout(page, number_of_columns=2).add(
+            TestWriteTableAcrossPages._build_table(FixedColumnWidthTable, 30)
+        )
+        assert int(doc.get_document_info().get_number_of_pages()) == 1
+
+        # write
+        out: io.BytesIO = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # read back
+        out.seek(0)
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        PDF.loads(out, [l])
+        assert l.get_text_for_page(0).count("Key Name Value") == 2
+
+    def test_split_returns_none_if_table_fits(self):
+        t: Table = TestWriteTableAcrossPages._build_table(FixedColumnWidthTable, 5)
+        assert (
+            t.split(Rectangle(Decimal(59), Decimal(84), Decimal(476), Decimal(600)))
+            is None
+        )
+
+    def test_split_does_not_split_row_span(self):
+        t: Table = FixedColumnWidthTable(
+            number_of_rows=5, number_of_columns=2, number_of_header_rows=1
+        )
+        t.add(Paragraph("Header 1"))
+        t.add(Paragraph("Header 2"))
+        t.add(Paragraph("1"))
+        t.add(Paragraph("2"))
+        t.add(TableCell(Paragraph("3"), row_span=3))
+        for s in ["4", "5", "6"]:
+            t.add(Paragraph(s))
+
+        # the available box only has room for 3 rows, the last 3 rows can not be split
+        bb: Rectangle = t.measure(
+            Rectangle(Decimal(59), Decimal(84), Decimal(476), Decimal(600))
+        )
+        row_height: Decimal = bb.get_height() / Decimal(5)
+        parts: typing.Optional[typing.Tuple[Table, Table]] = t.split(  # type: ignore[assignment]
+            Rectangle(Decimal(59), Decimal(84), Decimal(476), row_height * Decimal(3.5))
+        )
+        assert parts is not None
+        assert parts[0]._number_of_rows == 2
+        assert parts[1]._number_of_rows == 4
+
+    def test_split_parts_do_not_share_table_cells(self):
+        t: Table = TestWriteTableAcrossPages._build_table(FixedColumnWidthTable, 20)
+        parts: typing.Optional[typing.Tuple[Table, Table]] = t.split(  # type: ignore[assignment]
+            Rectangle(Decimal(59), Decimal(84), Decimal(476), Decimal(100))
+        )
+        assert parts is not None
+        assert all(
+            [
+                tc_001 is not tc_002
+                for tc_001 in parts[0]._content
+                for tc_002 in parts[1]._content
+            ]
+        )
+
+        # laying out one part does not change the (header) TableCell objects of the other part
+        page: Page = Page()
+        Document().append_page(page)
+        parts[0].layout(
+            page, Rectangle(Decimal(59), Decimal(600), Decimal(476), Decimal(100))
+        )
+        bb: typing.Optional[Rectangle] = parts[0]._content[0].get_bounding_box()
+        assert bb is not None
+        parts[1].layout(
+            page, Rectangle(Decimal(59), Decimal(84), Decimal(476), Decimal(500))
+        )
+        assert parts[0]._content[0].get_bounding_box() is bb
+        assert parts[1]._content[0].get_bounding_box() is not bb
+
+    def test_add_to_full_table_raises_value_error(self):
+        t: Table = TestWriteTableAcrossPages._build_table(FixedColumnWidthTable, 2)
+        with self.assertRaises(ValueError):
+            t.add(Paragraph("K2"))
+
+    def test_write_form_table_on_one_page(self):
+        # form fields are measured (without being laid out), a small form does not need to be split
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        SingleColumnLayout(page).add(
+            FixedColumnWidthTable(number_of_rows=5, number_of_columns=2)
+            .add(Paragraph("Name:"))
+            .add(
+                TextField(
+                    value="Doe", font_color=HexColor("56cbf9"), font_size=Decimal(20)
+                )
+            )
+            .add(Paragraph("Gender:"))
+            .add(DropDownList(possible_values=["Male", "Female", "Other"]))
+            .add(Paragraph("Place of residence:"))
+            .add(CountryDropDownList(value="Belgium"))
+            .add(Paragraph("I consent to receiving promotional emails:"))
+            .add(CheckBox())
+            .add(Paragraph(" "))
+            .add(PushButton("Submit"))
+            .set_padding_on_all_cells(Decimal(2), Decimal(2), Decimal(2), Decimal(2))
+        )
+        assert int(doc.get_document_info().get_number_of_pages()) == 1
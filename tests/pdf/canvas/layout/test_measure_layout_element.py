@@ -0,0 +1,217 @@
+import typing
+import unittest
+from decimal import Decimal
+
+from PIL import Image as PILImage
+
+from borb.pdf.canvas.color.color import HexColor, X11Color
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.image.image import Image
+from borb.pdf.canvas.layout.layout_element import Alignment, LayoutElement
+from borb.pdf.canvas.layout.list.unordered_list import UnorderedList
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.shape.disjoint_shape import DisjointShape
+from borb.pdf.canvas.layout.shape.shape import Shape
+from borb.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from borb.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
+from borb.pdf.canvas.layout.text.chunks_of_text import HeterogeneousParagraph
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.canvas.line_art.line_art_factory import LineArtFactory
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+
+TEXT: str = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
+    "sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."
+)
+
+
+class CountingParagraph(Paragraph):
+    """
+    This Paragraph counts how often it is rendered
+    """
+
+    def __init__(self, text: str, **kwargs):
+        super(CountingParagraph, self).__init__(text, **kwargs)
+        self.number_of_renders: int = 0
+
+    def _do_layout_without_padding(self, page: Page, bounding_box: Rectangle):
+        self.number_of_renders += 1
+        return super(CountingParagraph, self)._do_layout_without_padding(
+            page, bounding_box
+        )
+
+
+class TestMeasureLayoutElement(unittest.TestCase):
+    """
+    This test checks whether LayoutElement.measure returns the same Rectangle as LayoutElement.layout,
+    without rendering anything, and whether every LayoutElement is rendered only once.
+    """
+
+    @staticmethod
+    def _get_layout_elements() -> typing.List[LayoutElement]:
+        layout_elements: typing.List[LayoutElement] = []
+
+        # Paragraph
+        for text_alignment in [
+            Alignment.LEFT,
+            Alignment.CENTERED,
+            Alignment.RIGHT,
+            Alignment.JUSTIFIED,
+        ]:
+            layout_elements.append(
+                Paragraph(
+                    TEXT,
+                    text_alignment=text_alignment,
+                    padding_top=Decimal(5),
+                    padding_left=Decimal(5),
+                    background_color=HexColor("f1cd2e"),
+                )
+            )
+        layout_elements.append(
+            HeterogeneousParagraph(
+                [
+                    ChunkOfText(
+                        w + " ", font="Helvetica-Bold" if i % 3 == 0 else "Helvetica"
+                    )
+                    for i, w in enumerate(TEXT.split(" "))
+                ]
+            )
+        )
+
+        # Image
+        layout_elements.append(
+            Image(
+                PILImage.new("RGB", (64, 32), (255, 0, 0)),
+                horizontal_alignment=Alignment.CENTERED,
+            )
+        )
+
+        # Table
+        fixed_column_width_table: FixedColumnWidthTable = FixedColumnWidthTable(
+            number_of_rows=3, number_of_columns=3
+        )
+        for w in TEXT.split(" ")[0:8]:
+            fixed_column_width_table.add(Paragraph(w))
+        layout_elements.append(fixed_column_width_table)
+        flexible_column_width_table: FlexibleColumnWidthTable = (
+            FlexibleColumnWidthTable(number_of_rows=2, number_of_columns=3)
+        )
+        for w in TEXT.split(" ")[0:6]:
+            flexible_column_width_table.add(Paragraph(w))
+        flexible_column_width_table.set_padding_on_all_cells(
+            Decimal(2), Decimal(2), Decimal(2), Decimal(2)
+        )
+        layout_elements.append(flexible_column_width_table)
+
+        # List
+        unordered_list: UnorderedList = UnorderedList()
+        for s in TEXT.split(",")[0:2]:
+            unordered_list.add(Paragraph(s))
+        unordered_list.add(UnorderedList().add(Paragraph(TEXT)))
+        layout_elements.append(unordered_list)
+
+        # Shape
+        layout_elements.append(
+            Shape(
+                LineArtFactory.flowchart_process(
+                    Rectangle(Decimal(0), Decimal(0), Decimal(100), Decimal(50))
+                ),
+                stroke_color=X11Color("Red"),
+                fill_color=None,
+            )
+        )
+        layout_elements.append(
+            DisjointShape(
+                [
+                    ((Decimal(0), Decimal(0)), (Decimal(500), Decimal(500))),
+                    ((Decimal(0), Decimal(500)), (Decimal(500), Decimal(0))),
+                ],
+                stroke_color=X11Color("Blue"),
+            )
+        )
+        return layout_elements
+
+    def test_measure_matches_layout(self):
+        available_box: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(300), Decimal(600)
+        )
+        for e in TestMeasureLayoutElement._get_layout_elements():
+
+            # measure
+            measured_box: Rectangle = e.measure(available_box)
+
+            # layout
+            page: Page = Page()
+            Document().append_page(page)
+            layout_box: Rectangle = e.layout(page, available_box)
+            assert (
+                measured_box.x,
+                measured_box.y,
+                measured_box.width,
+                measured_box.height,
+            ) == (
+                layout_box.x,
+                layout_box.y,
+                layout_box.width,
+                layout_box.height,
+            ), e.__class__.__name__
+
+    def test_measure_is_memoized(self):
+        p: Paragraph = Paragraph(TEXT * 10, text_alignment=Alignment.JUSTIFIED)
+        available_box: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(300), Decimal(600)
+        )
+        measured_box_001: Rectangle = p.measure(available_box)
+        measured_box_002: Rectangle = p.measure(available_box)
+        assert measured_box_001 is measured_box_002
+
+    def test_set_font_clears_memoized_measure(self):
+        p: Paragraph = Paragraph(TEXT * 10, text_alignment=Alignment.JUSTIFIED)
+        available_box: Rectangle = Rectangle(
+            Decimal(59), Decimal(84), Decimal(300), Decimal(600)
+        )
+        measured_box_001: Rectangle = p.measure(available_box)
+        measured_box_002: Rectangle = p.set_font("Courier").measure(available_box)
+        assert measured_box_001.height < measured_box_002.height
+        assert (
+            measured_box_002.height
+            == Paragraph(TEXT * 10, font="Courier", text_alignment=Alignment.JUSTIFIED)
+            .measure(available_box)
+            .height
+        )
+
+    def test_every_layout_element_is_rendered_once(self):
+        doc: Document = Document()
+        page: Page = Page()
+        doc.append_page(page)
+        layout: SingleColumnLayout = SingleColumnLayout(page)
+
+        # Table
+        paragraphs: typing.List[CountingParagraph] = []
+        t: FixedColumnWidthTable = FixedColumnWidthTable(
+            number_of_rows=20, number_of_columns=5
+        )
+        for i in range(0, 100):
+            p: CountingParagraph = CountingParagraph(
+                "%d %s" % (i, TEXT[0 : i % 30]), font_size=Decimal(6)
+            )
+            paragraphs.append(p)
+            t.add(p)
+        layout.add(t)
+
+        # List
+        l: UnorderedList = UnorderedList()
+        for i in range(0, 10):
+            p = CountingParagraph("%d %s" % (i, TEXT), font_size=Decimal(6))
+            paragraphs.append(p)
+            l.add(p)
+        layout.add(l)
+
+        # check
+        assert all([p.number_of_renders == 1 for p in paragraphs])
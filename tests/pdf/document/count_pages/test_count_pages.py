@@ -24,3 +24,18 @@ class TestCountPages(unittest.TestCase):
         with open(input_file, "rb") as file_handle:
             doc = PDF.loads(file_handle)
             assert doc.get_document_info().get_number_of_pages() == 2
+
+    def test_get_number_of_pages_using_mmap(self):
+
+        input_file: Path = Path(__file__).parent / "input_001.pdf"
+        doc = PDF.loads_mmap(input_file)
+        assert doc.get_document_info().get_number_of_pages() == 2
+
+        # check whether the memory-mapped Document matches the Document read from a file handle
+        with open(input_file, "rb") as file_handle:
+            doc_002 = PDF.loads(file_handle)
+        for i in range(0, 2):
+            assert (
+                doc.get_page(i)["Contents"]["DecodedBytes"]
+                == doc_002.get_page(i)["Contents"]["DecodedBytes"]
+            )
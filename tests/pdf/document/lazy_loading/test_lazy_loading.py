@@ -0,0 +1,153 @@
+import copy
+import io
+import pickle
+import unittest
+from pathlib import Path
+
+from borb.io.read.types import Dictionary, LazyDictionary, LazyList, List, Reference
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestLazyLoading(unittest.TestCase):
+    """
+    This test checks whether a Document that is read lazily
+    matches the Document that is read (eagerly) from the same input.
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.input_file: Path = (
+            Path(__file__).parent.parent.parent / "trailer" / "input_001.pdf"
+        )
+
+    def test_get_number_of_pages_does_not_read_pages(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, lazy=True)
+            assert doc.get_document_info().get_number_of_pages() == 2
+
+            # the Page objects themselves should not have been read
+            kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+            for i in range(0, 2):
+                assert isinstance(list.__getitem__(kids, i), Reference)
+
+    def test_get_page_matches_eager_loading(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc_001 = PDF.loads(file_handle)
+        with open(self.input_file, "rb") as file_handle:
+            doc_002 = PDF.loads(file_handle, lazy=True)
+            assert (
+                doc_001.get_document_info().get_title()
+                == doc_002.get_document_info().get_title()
+            )
+            for i in range(0, 2):
+                page_001 = doc_001.get_page(i)
+                page_002 = doc_002.get_page(i)
+                assert page_002.get_page_info().get_page_number() == i
+                assert (
+                    page_001["Contents"]["DecodedBytes"]
+                    == page_002["Contents"]["DecodedBytes"]
+                )
+                assert sorted([str(x) for x in page_001.keys()]) == sorted(
+                    [str(x) for x in page_002.keys()]
+                )
+
+    def test_extract_text_matches_eager_loading(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_002], lazy=True)
+
+        for i in range(0, 2):
+            assert l_001.get_text_for_page(i) == l_002.get_text_for_page(i)
+
+    def test_write_lazily_read_document(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, lazy=True)
+            out = io.BytesIO()
+            PDF.dumps(out, doc)
+
+        out.seek(0)
+        doc = PDF.loads(out)
+        assert doc.get_document_info().get_number_of_pages() == 2
+
+    def test_eager_loading_does_not_resolve_lazily(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle)
+        kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        assert type(kids) is List
+        assert type(kids[0]) is Page
+        assert type(kids[0]["Resources"]) is Dictionary
+
+    def test_lazy_loading_resolves_references_on_every_access_path(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, lazy=True)
+            kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+            assert isinstance(kids, LazyList)
+
+            # list(...), reversed(...), slicing, concatenation, in and count
+            assert all([isinstance(x, Page) for x in list(kids)])
+            kids = self._reload_kids(file_handle)
+            assert not any([isinstance(x, Reference) for x in reversed(kids)])
+            kids = self._reload_kids(file_handle)
+            assert not any([isinstance(x, Reference) for x in kids[0:2]])
+            kids = self._reload_kids(file_handle)
+            assert not any([isinstance(x, Reference) for x in [] + kids])
+            kids = self._reload_kids(file_handle)
+            assert list.__getitem__(kids, 1) not in kids
+            kids = self._reload_kids(file_handle)
+            assert kids.count(list.__getitem__(kids, 1)) == 0
+
+            # dict(...), {**...}, update(...), popitem, setdefault, copy and |
+            for f in [
+                lambda d: dict(d).values(),
+                lambda d: {**d}.values(),
+                lambda d: TestLazyLoading._update({}, d).values(),
+                lambda d: [d.popitem()[1]],
+                lambda d: [d.setdefault(k) for k in dict.keys(d)],
+                lambda d: d.copy().values(),
+                lambda d: ({} | d).values(),
+                lambda d: (d | {}).values(),
+            ]:
+                page = self._reload_kids(file_handle)[0]
+                ext_g_state = page["Resources"]["ExtGState"]
+                assert isinstance(ext_g_state, LazyDictionary)
+                assert any([isinstance(v, Reference) for v in dict.values(ext_g_state)])
+                assert not any([isinstance(v, Reference) for v in f(ext_g_state)])
+
+    @staticmethod
+    def _update(d0: dict, d1: dict) -> dict:
+        d0.update(d1)
+        return d0
+
+    def _reload_kids(self, file_handle) -> List:
+        file_handle.seek(0)
+        doc = PDF.loads(file_handle, lazy=True)
+        return doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+
+    def test_lazy_loading_copy(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, lazy=True)
+            kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+
+            # copies hold the resolved values, and do not hold on to the function that resolves Reference(s)
+            kids_copy = copy.deepcopy(kids)
+            assert not any([isinstance(x, Reference) for x in list.__iter__(kids_copy)])
+            assert kids_copy._lazy_reference_resolver is None
+            ext_g_state_copy = copy.copy(kids[0]["Resources"]["ExtGState"])
+            assert not any(
+                [isinstance(x, Reference) for x in dict.values(ext_g_state_copy)]
+            )
+            assert ext_g_state_copy._lazy_reference_resolver is None
+            pickle.dumps(kids[0]["Resources"]["ExtGState"])
@@ -0,0 +1,85 @@
+import unittest
+from pathlib import Path
+
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestProcessPage(unittest.TestCase):
+    """
+    This test checks whether Page.process (and the pages argument of PDF.loads)
+    produce the same events as processing every Page while reading the Document.
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.input_file: Path = (
+            Path(__file__).parent.parent.parent / "trailer" / "input_001.pdf"
+        )
+
+    def test_process_page_after_loading(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, [l_001])
+
+        # process each Page (again) with a fresh EventListener
+        for i in range(0, 2):
+            l_002 = SimpleTextExtraction()
+            doc.get_page(i).process([l_002], page_number=i)
+            assert l_002.get_text_for_page(i) == l_001.get_text_for_page(i)
+
+    def test_process_pages_without_page_number(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, [l_001])
+
+        # without a page number, the Page(s) are numbered in the order in which they are processed
+        l_002 = SimpleTextExtraction()
+        doc.get_page(1).process([l_002])
+        doc.get_page(0).process([l_002])
+        assert l_002.get_text_for_page(0) == l_001.get_text_for_page(1)
+        assert l_002.get_text_for_page(1) == l_001.get_text_for_page(0)
+
+    def test_process_selected_pages(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_002], pages=[1, 100])
+
+        # only one Page should have been processed, its results are stored under its own page number
+        assert l_002.get_text_for_page(1) == l_001.get_text_for_page(1)
+        assert l_002.get_text_for_page(0) == ""
+
+    def test_process_selected_pages_lazily(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, [l_002], lazy=True, pages=range(1, 2))
+            assert doc.get_document_info().get_number_of_pages() == 2
+
+        assert l_002.get_text_for_page(1) == l_001.get_text_for_page(1)
+        assert l_002.get_text_for_page(0) == ""
+
+    def test_process_selected_pages_in_reverse_order(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_002], pages=[1, 0])
+
+        for i in range(0, 2):
+            assert len(l_002.get_text_for_page(i)) > 0
+            assert l_002.get_text_for_page(i) == l_001.get_text_for_page(i)
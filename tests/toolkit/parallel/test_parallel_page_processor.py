@@ -0,0 +1,144 @@
+import unittest
+from pathlib import Path
+
+from borb.pdf.canvas.event.event_listener import EventListener
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.image.simple_image_extraction import SimpleImageExtraction
+from borb.toolkit.parallel.parallel_page_processor import ParallelPageProcessor
+from borb.toolkit.text.regular_expression_text_extraction import (
+    RegularExpressionTextExtraction,
+)
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestParallelPageProcessor(unittest.TestCase):
+    """
+    This test checks whether processing the Page(s) of a Document across a pool of processes
+    gives the same results as processing them (sequentially) while reading the Document.
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        # find output dir
+        p: Path = Path(__file__).parent
+        while "output" not in [x.stem for x in p.iterdir() if x.is_dir()]:
+            p = p.parent
+        p = p / "output"
+        self.output_dir = Path(p, Path(__file__).stem.replace(".py", ""))
+        if not self.output_dir.exists():
+            self.output_dir.mkdir()
+        self.input_file: Path = (
+            Path(__file__).parent.parent.parent / "pdf" / "trailer" / "input_001.pdf"
+        )
+
+    def test_extract_text_in_parallel(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = SimpleTextExtraction()
+        ParallelPageProcessor.process(self.input_file, [l_002], max_workers=2)
+
+        for i in range(0, 2):
+            assert len(l_002.get_text_for_page(i)) > 0
+            assert l_001.get_text_for_page(i) == l_002.get_text_for_page(i)
+
+    def _write_document(self, file_name: str) -> Path:
+        doc: Document = Document()
+        for i in range(0, 4):
+            page: Page = Page()
+            doc.append_page(page)
+            layout = SingleColumnLayout(page)
+            layout.add(Paragraph("Page %d" % i))
+            layout.add(
+                Paragraph(
+                    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
+                    "sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."
+                )
+            )
+        output_file: Path = self.output_dir / file_name
+        with open(output_file, "wb") as file_handle:
+            PDF.dumps(file_handle, doc)
+        return output_file
+
+    def test_extract_regular_expression_in_parallel(self):
+
+        input_file: Path = self._write_document("output_001.pdf")
+        l_001 = RegularExpressionTextExtraction("[a-z]+ing|Page [0-9]")
+        with open(input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = RegularExpressionTextExtraction("[a-z]+ing|Page [0-9]")
+        ParallelPageProcessor.process(input_file, [l_002], max_workers=2)
+
+        for i in range(0, 4):
+            ms_001 = l_001.get_matches_for_page(i)
+            ms_002 = l_002.get_matches_for_page(i)
+            assert len(ms_002) == 2
+            assert ms_002[0].group(0) == "Page %d" % i
+            assert [m.group(0) for m in ms_001] == [m.group(0) for m in ms_002]
+            assert [
+                [(r.x, r.y, r.width, r.height) for r in m.get_bounding_boxes()]
+                for m in ms_001
+            ] == [
+                [(r.x, r.y, r.width, r.height) for r in m.get_bounding_boxes()]
+                for m in ms_002
+            ]
+
+    def test_extract_selected_pages_in_parallel(self):
+
+        l_001 = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = SimpleTextExtraction()
+        ParallelPageProcessor.process(self.input_file, [l_002], pages=[1, 0])
+
+        # pages are stored under their own page number
+        for i in range(0, 2):
+            assert len(l_002.get_text_for_page(i)) > 0
+            assert l_002.get_text_for_page(i) == l_001.get_text_for_page(i)
+
+    def test_extract_non_contiguous_pages_in_parallel(self):
+
+        input_file: Path = self._write_document("output_002.pdf")
+        l_001 = RegularExpressionTextExtraction("Page [0-9]")
+        ParallelPageProcessor.process(input_file, [l_001], pages=[3, 0], max_workers=2)
+
+        # pages are stored under their own page number, pages that were not processed have no matches
+        assert [m.group(0) for m in l_001.get_matches_for_page(0)] == ["Page 0"]
+        assert [m.group(0) for m in l_001.get_matches_for_page(3)] == ["Page 3"]
+        assert l_001.get_matches_for_page(1) == []
+        assert l_001.get_matches_for_page(2) == []
+
+    def test_process_requires_event_listeners_that_can_be_merged(self):
+
+        with self.assertRaises(AssertionError):
+            ParallelPageProcessor.process(self.input_file, [EventListener()])
+
+    def test_extract_images_in_parallel(self):
+
+        input_file: Path = Path(__file__).parent.parent / "image" / "input_001.pdf"
+        l_001 = SimpleImageExtraction()
+        with open(input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [l_001])
+
+        l_002 = SimpleImageExtraction()
+        ParallelPageProcessor.process(input_file, [l_002], max_workers=2)
+
+        assert len(l_001.get_images_for_page(0)) > 0
+        assert [x.size for x in l_001.get_images_for_page(0)] == [
+            x.size for x in l_002.get_images_for_page(0)
+        ]
+        assert [x.tobytes() for x in l_001.get_images_for_page(0)] == [
+            x.tobytes() for x in l_002.get_images_for_page(0)
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main()